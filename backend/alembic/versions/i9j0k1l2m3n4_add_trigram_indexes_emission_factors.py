@@ -0,0 +1,71 @@
+"""add pg_trgm GIN indexes for emission factor partial matching
+
+Revision ID: i9j0k1l2m3n4
+Revises: 527b7d06729d
+Create Date: 2026-10-18
+
+Partial lookups on emission_factors (EmissionFactorMapper partial and
+mapping lookups, the activity_name filter of GET /emission-factors and the
+calculator provider's category fallbacks) use ILIKE, which cannot use a
+B-tree index. Trigram GIN indexes let PostgreSQL serve those predicates
+from the index and rank candidates with similarity().
+
+PostgreSQL only; other dialects are left unchanged. If the server does not
+ship pg_trgm the indexes are skipped and lookups keep working unindexed.
+"""
+import logging
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+logger = logging.getLogger("alembic.runtime.migration")
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'i9j0k1l2m3n4'
+down_revision: Union[str, None] = '527b7d06729d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def is_postgresql() -> bool:
+    """Check if running against PostgreSQL."""
+    return op.get_bind().dialect.name == 'postgresql'
+
+
+def pg_trgm_installable() -> bool:
+    """Check if the server ships the pg_trgm extension."""
+    result = op.get_bind().execute(sa.text(
+        "SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'"
+    ))
+    return result.scalar() is not None
+
+
+def upgrade() -> None:
+    if not is_postgresql():
+        return
+
+    if not pg_trgm_installable():
+        logger.warning("pg_trgm not available on this server; skipping trigram indexes")
+        return
+
+    op.execute('CREATE EXTENSION IF NOT EXISTS "pg_trgm"')
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_ef_activity_name_trgm
+        ON emission_factors USING gin (activity_name gin_trgm_ops)
+    """)
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_ef_category_trgm
+        ON emission_factors USING gin (category gin_trgm_ops)
+    """)
+
+
+def downgrade() -> None:
+    if not is_postgresql():
+        return
+
+    # The extension is left installed; other objects may depend on it
+    op.execute("DROP INDEX IF EXISTS idx_ef_category_trgm")
+    op.execute("DROP INDEX IF EXISTS idx_ef_activity_name_trgm")
@@ -0,0 +1,45 @@
+"""add coverage_rollups table for precomputed admin coverage
+
+Revision ID: j0k1l2m3n4o5
+Revises: i9j0k1l2m3n4
+Create Date: 2026-10-18
+
+GET /admin/emission-factors/coverage recomputed every count, distinct
+and average on each request. The rollups table holds those aggregates,
+grouped by source, geography, category and year, and is rebuilt after
+each data sync; refreshed_at records when they were computed.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'j0k1l2m3n4o5'
+down_revision: Union[str, None] = 'i9j0k1l2m3n4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'coverage_rollups',
+        sa.Column('id', sa.String(32), primary_key=True),
+        sa.Column('dimension', sa.String(30), nullable=False),
+        sa.Column('data_source_id', sa.String(32), nullable=True),
+        sa.Column('geography', sa.String(50), nullable=True),
+        sa.Column('category', sa.String(50), nullable=True),
+        sa.Column('reference_year', sa.Integer(), nullable=True),
+        sa.Column('is_active', sa.Boolean(), nullable=True),
+        sa.Column('item_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('quality_sum', sa.Numeric(18, 4), nullable=True),
+        sa.Column('quality_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('refreshed_at', sa.DateTime(timezone=True), nullable=False),
+    )
+    op.create_index('idx_coverage_rollup_refreshed', 'coverage_rollups', ['refreshed_at'])
+
+
+def downgrade() -> None:
+    op.drop_index('idx_coverage_rollup_refreshed', table_name='coverage_rollups')
+    op.drop_table('coverage_rollups')
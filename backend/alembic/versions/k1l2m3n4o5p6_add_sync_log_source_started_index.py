@@ -0,0 +1,35 @@
+"""add (data_source_id, started_at) index on data_sync_logs
+
+Revision ID: k1l2m3n4o5p6
+Revises: j0k1l2m3n4o5
+Create Date: 2026-10-18
+
+GET /admin/sync-logs and the data source endpoints filter sync logs by
+data source and order them by started_at. The composite index serves
+both the filter and the sort, and supersedes the single-column
+idx_sync_log_source index.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'k1l2m3n4o5p6'
+down_revision: Union[str, None] = 'j0k1l2m3n4o5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'idx_sync_log_source_started',
+        'data_sync_logs',
+        ['data_source_id', 'started_at'],
+    )
+    op.drop_index('idx_sync_log_source', table_name='data_sync_logs')
+
+
+def downgrade() -> None:
+    op.create_index('idx_sync_log_source', 'data_sync_logs', ['data_source_id'])
+    op.drop_index('idx_sync_log_source_started', table_name='data_sync_logs')
@@ -8,15 +8,18 @@ This module provides FastAPI dependencies for injecting the calculator,
 domain services, and repositories into API route handlers.
 """
 
+from typing import AsyncGenerator
+
 from fastapi import Depends
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.config import settings
-from backend.database.connection import get_db
+from backend.database.connection import get_async_db, get_db
 from backend.calculator.cache import CachedEmissionFactorProvider
 from backend.calculator.pcf_calculator import PCFCalculator
 from backend.calculator.providers import EmissionFactorProvider
 from backend.calculator.sqlalchemy_provider import SQLAlchemyEmissionFactorProvider
+from backend.utils.metrics import EF_CACHE_LOOKUPS
 
 # Domain layer imports
 from backend.domain.services.product_service import ProductService
@@ -40,10 +43,19 @@ from backend.infrastructure.repositories.sqlalchemy_calculation_repository impor
 
 async def get_ef_provider(
     session=Depends(get_db),
-) -> EmissionFactorProvider:
+) -> AsyncGenerator[EmissionFactorProvider, None]:
     sql_provider = SQLAlchemyEmissionFactorProvider(session)
     ttl = getattr(settings, "emission_factor_cache_ttl", 300)
-    return CachedEmissionFactorProvider(sql_provider, ttl_seconds=ttl)
+    provider = CachedEmissionFactorProvider(sql_provider, ttl_seconds=ttl)
+    try:
+        yield provider
+    finally:
+        # Fold this request's cache hits/misses into /metrics
+        cache_metrics = provider.get_metrics()
+        if cache_metrics["hits"]:
+            EF_CACHE_LOOKUPS.inc(cache_metrics["hits"], result="hit")
+        if cache_metrics["misses"]:
+            EF_CACHE_LOOKUPS.inc(cache_metrics["misses"], result="miss")
 
 
 async def get_calculator(
@@ -57,14 +69,17 @@ async def get_calculator(
 # ============================================================================
 
 
+# The repositories await their session, so they are bound to AsyncSession
+
+
 def get_product_repository(
-    session: Session = Depends(get_db),
+    session: AsyncSession = Depends(get_async_db),
 ) -> ProductRepository:
     return SQLAlchemyProductRepository(session)
 
 
 def get_calculation_repository(
-    session: Session = Depends(get_db),
+    session: AsyncSession = Depends(get_async_db),
 ) -> CalculationRepository:
     return SQLAlchemyCalculationRepository(session)
 
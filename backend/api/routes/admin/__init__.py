@@ -8,6 +8,7 @@ Combines all admin sub-routers into a single admin router:
 - Data sources management
 - Sync logs viewing
 - Coverage statistics
+- Request profiles
 
 All routes are prefixed with /admin and require admin role.
 """
@@ -17,6 +18,7 @@ from fastapi import APIRouter, Depends
 from backend.api.routes.admin.data_sources import router as data_sources_router
 from backend.api.routes.admin.sync_logs import router as sync_logs_router
 from backend.api.routes.admin.coverage import router as coverage_router
+from backend.api.routes.admin.profiles import router as profiles_router
 from backend.auth.dependencies import require_admin
 
 # Create combined admin router
@@ -31,5 +33,6 @@ router = APIRouter(
 router.include_router(data_sources_router)
 router.include_router(sync_logs_router)
 router.include_router(coverage_router)
+router.include_router(profiles_router)
 
 __all__ = ["router"]
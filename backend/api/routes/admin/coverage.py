@@ -6,21 +6,32 @@ TASK-API-P5-001: Admin Data Sources Endpoints
 Endpoints:
 - GET /admin/emission-factors/coverage - Get coverage statistics
 
+The report is derived from precomputed coverage rollups (see
+backend.services.coverage_rollups), refreshed after each data sync.
+
 Contract Reference: phase5-contracts/admin-coverage-contract.yaml
 """
 
-import uuid
 from datetime import datetime, timezone
-from typing import Optional, Dict, List
+from typing import Optional, Dict, Iterable, List, Tuple
 from collections import defaultdict
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import func, distinct
 from sqlalchemy.orm import Session
 
-from backend.database.connection import get_db
-from backend.models import DataSource, EmissionFactor, Product, ProductCategory
+from backend.database.connection import get_read_db
+from backend.models import CoverageRollup, DataSource, ProductCategory
 from backend.api.utils.error_responses import create_error_dict
+from backend.services.coverage_rollups import (
+    ACTIVITIES,
+    ACTIVITIES_TOTAL,
+    FACTORS,
+    PRODUCT_CATEGORIES,
+    PRODUCT_GEOGRAPHIES,
+    latest_data_change_at,
+    load_coverage_rollups,
+    refresh_coverage_rollups,
+)
 from backend.schemas.admin import (
     GroupByEnum,
     CoverageResponse,
@@ -86,123 +97,85 @@ def get_geography_name(code: str) -> str:
 # ============================================================================
 
 
-# ============================================================================
-# API Endpoints
-# ============================================================================
-
-
-@router.get(
-    "/emission-factors/coverage",
-    response_model=CoverageResponse,
-    status_code=status.HTTP_200_OK,
-    summary="Get emission factor coverage",
-    description="Get emission factor coverage statistics by data source, geography, and product category.",
-)
-def get_coverage(
-    group_by: GroupByEnum = Query(
-        GroupByEnum.source, description="Primary grouping dimension"
-    ),
-    data_source_id: Optional[str] = Query(
-        None, description="Filter to specific data source"
-    ),
-    include_inactive: bool = Query(
-        False, description="Include inactive emission factors in counts"
-    ),
-    db: Session = Depends(get_db),
+def _average_quality(cells: Iterable[CoverageRollup]) -> Optional[float]:
+    """Average data quality rating over rollup cells."""
+    quality_sum = 0
+    quality_count = 0
+    for cell in cells:
+        if cell.quality_count:
+            quality_sum += cell.quality_sum or 0
+            quality_count += cell.quality_count
+    avg_quality = quality_sum / quality_count if quality_count else None
+    return float(avg_quality) if avg_quality else None
+
+
+def build_coverage_response(
+    rollups: List[CoverageRollup],
+    source_names: Dict[str, str],
+    categories: List[Tuple[str, str, str]],
+    data_source_id: Optional[str] = None,
+    include_inactive: bool = False,
+    current_year: Optional[int] = None,
 ) -> CoverageResponse:
     """
-    Get emission factor coverage statistics.
+    Build the coverage report from rollup cells.
 
-    Query Parameters:
-    - group_by: Primary grouping dimension (source, geography, category, year)
-    - data_source_id: Filter to specific data source
-    - include_inactive: Include inactive emission factors (default: false)
+    Args:
+        rollups: Newest set of coverage rollups
+        source_names: Data source ID -> name
+        categories: (id, name, code) of product categories
+        data_source_id: Restrict factor counts to one data source
+        include_inactive: Include inactive emission factors in counts
+        current_year: Year used for outdated factor detection (default: now)
 
     Returns:
-    - summary: Overall coverage summary
-    - by_source: Coverage breakdown by data source
-    - by_geography: Coverage breakdown by geography
-    - by_category: Coverage breakdown by product category
-    - gaps: Identified coverage gaps
+        CoverageResponse (refreshed_at and stale are left to the caller)
     """
-    # Validate data_source_id if provided
-    if data_source_id:
-        data_source = (
-            db.query(DataSource)
-            .filter(DataSource.id == data_source_id)
-            .first()
-        )
-        if not data_source:
-            raise HTTPException(
-                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-                detail=create_error_dict(
-                    code="INVALID_DATA_SOURCE",
-                    message="Data source not found",
-                    details=[
-                        {"field": "data_source_id", "message": f"No data source exists with ID {data_source_id}"}
-                    ],
-                ),
-            )
-
-    # Build base query for emission factors
-    base_query = db.query(EmissionFactor)
-    if data_source_id:
-        base_query = base_query.filter(EmissionFactor.data_source_id == data_source_id)
-    if not include_inactive:
-        base_query = base_query.filter(EmissionFactor.is_active == True)
+    by_dimension: Dict[str, List[CoverageRollup]] = defaultdict(list)
+    for cell in rollups:
+        by_dimension[cell.dimension].append(cell)
+
+    factor_cells = by_dimension[FACTORS]
+    active_cells = [c for c in factor_cells if c.is_active is True]
+    scoped = [
+        c for c in factor_cells
+        if data_source_id is None or c.data_source_id == data_source_id
+    ]
+    base = [c for c in scoped if include_inactive or c.is_active is True]
 
     # ============================================================================
     # Summary Statistics
     # ============================================================================
 
-    total_emission_factors = base_query.count()
+    total_emission_factors = sum(c.item_count for c in base)
+    active_emission_factors = sum(c.item_count for c in scoped if c.is_active is True)
 
-    active_query = db.query(EmissionFactor)
+    activity_filter = None if include_inactive else True
     if data_source_id:
-        active_query = active_query.filter(EmissionFactor.data_source_id == data_source_id)
-    active_emission_factors = active_query.filter(EmissionFactor.is_active == True).count()
-
-    unique_activities = (
-        base_query
-        .with_entities(EmissionFactor.activity_name)
-        .distinct()
-        .count()
-    )
-
-    geographies_covered = (
-        base_query
-        .with_entities(EmissionFactor.geography)
-        .distinct()
-        .count()
+        activity_rows = [
+            c for c in by_dimension[ACTIVITIES]
+            if c.data_source_id == data_source_id and c.is_active is activity_filter
+        ]
+    else:
+        activity_rows = [
+            c for c in by_dimension[ACTIVITIES_TOTAL] if c.is_active is activity_filter
+        ]
+    unique_activities = sum(c.item_count for c in activity_rows)
+
+    geographies_covered = len({c.geography for c in base})
+    emission_factor_categories = {c.category for c in base if c.category}
+
+    # Simple heuristic: category name or code appears in emission factor categories
+    categories_with_factors = sum(
+        1 for _, name, code in categories
+        if name in emission_factor_categories or code in emission_factor_categories
     )
+    categories_without_factors = len(categories) - categories_with_factors
 
-    # Average quality rating
-    avg_quality = base_query.with_entities(
-        func.avg(EmissionFactor.data_quality_rating)
-    ).scalar()
-
-    # Categories analysis
-    all_categories = db.query(ProductCategory).all()
-    emission_factor_categories = set(
-        row[0] for row in base_query.with_entities(EmissionFactor.category).distinct().all()
-        if row[0]
-    )
-
-    # Count categories with and without factors
-    categories_with_factors = 0
-    categories_without_factors = 0
-
-    for cat in all_categories:
-        # Check if any products in this category have matching factors
-        # Simple heuristic: check if category name appears in emission factor categories
-        if cat.name in emission_factor_categories or cat.code in emission_factor_categories:
-            categories_with_factors += 1
-        else:
-            categories_without_factors += 1
-
-    # Calculate coverage percentage
-    total_products = db.query(Product).count()
-    products_with_factors = 0  # Would require matching logic
+    products_by_category = {
+        c.category: c.item_count for c in by_dimension[PRODUCT_CATEGORIES]
+    }
+    total_products = sum(products_by_category.values())
     coverage_percentage = 0.0
     if total_products > 0 and total_emission_factors > 0:
         # Simplified calculation: assume some coverage if factors exist
@@ -215,126 +188,79 @@ def get_coverage(
         geographies_covered=geographies_covered,
         categories_with_factors=categories_with_factors,
         categories_without_factors=categories_without_factors,
-        average_quality_rating=float(avg_quality) if avg_quality else None,
+        average_quality_rating=_average_quality(base),
         coverage_percentage=round(coverage_percentage, 1),
     )
 
+    def percentage_of_total(count: int) -> float:
+        return round(count / total_emission_factors * 100, 1) if total_emission_factors > 0 else 0
+
     # ============================================================================
     # Coverage by Source
     # ============================================================================
 
-    by_source: List[CoverageBySource] = []
+    source_cells: Dict[Optional[str], List[CoverageRollup]] = defaultdict(list)
+    for cell in base:
+        source_cells[cell.data_source_id].append(cell)
 
-    # Get all data sources with factors
-    source_stats = (
-        db.query(
-            EmissionFactor.data_source_id,
-            func.count(EmissionFactor.id).label("total"),
-            func.count(EmissionFactor.id).filter(EmissionFactor.is_active == True).label("active"),
-            func.avg(EmissionFactor.data_quality_rating).filter(EmissionFactor.is_active == True).label("avg_quality"),
-            func.min(EmissionFactor.reference_year).filter(EmissionFactor.is_active == True).label("min_year"),
-            func.max(EmissionFactor.reference_year).filter(EmissionFactor.is_active == True).label("max_year"),
-        )
-    )
-
-    if data_source_id:
-        source_stats = source_stats.filter(EmissionFactor.data_source_id == data_source_id)
-    if not include_inactive:
-        source_stats = source_stats.filter(EmissionFactor.is_active == True)
-
-    source_stats = source_stats.group_by(EmissionFactor.data_source_id).all()
-
-    for row in source_stats:
-        source_id = row[0]
-        total = row[1]
-        active = row[2]
-        avg_qual = row[3]
-        min_year = row[4]
-        max_year = row[5]
+    by_source: List[CoverageBySource] = []
+    for source_id, cells in source_cells.items():
+        total = sum(c.item_count for c in cells)
+        source_active = [c for c in cells if c.is_active is True]
+        years = [c.reference_year for c in source_active if c.reference_year is not None]
 
-        # Get source name
         if source_id:
-            source = db.query(DataSource).filter(DataSource.id == source_id).first()
-            source_name = source.name if source else "Unknown"
+            source_name = source_names.get(source_id, "Unknown")
         else:
             source_name = "Legacy/Unlinked"
 
-        # Get geographies for this source
-        geos = (
-            db.query(EmissionFactor.geography)
-            .filter(EmissionFactor.data_source_id == source_id)
-            .filter(EmissionFactor.is_active == True)
-            .distinct()
-            .all()
-        )
-        geographies = [g[0] for g in geos if g[0]]
-
-        # Calculate percentage
-        percentage = (total / total_emission_factors * 100) if total_emission_factors > 0 else 0
+        geographies = sorted({
+            c.geography for c in active_cells
+            if c.data_source_id == source_id and c.geography
+        })
 
         by_source.append(
             CoverageBySource(
                 source_id=source_id,
                 source_name=source_name,
                 total_factors=total,
-                active_factors=active or 0,
-                percentage_of_total=round(percentage, 1),
+                active_factors=sum(c.item_count for c in source_active),
+                percentage_of_total=percentage_of_total(total),
                 geographies=geographies,
-                average_quality=float(avg_qual) if avg_qual else None,
-                year_range=YearRange(min=min_year, max=max_year),
+                average_quality=_average_quality(source_active),
+                year_range=YearRange(
+                    min=min(years) if years else None,
+                    max=max(years) if years else None,
+                ),
             )
         )
 
+    by_source.sort(key=lambda x: x.total_factors, reverse=True)
+
     # ============================================================================
     # Coverage by Geography
     # ============================================================================
 
-    by_geography: List[CoverageByGeography] = []
-
-    geo_stats = (
-        db.query(
-            EmissionFactor.geography,
-            func.count(EmissionFactor.id).label("total"),
-        )
-    )
-
-    if data_source_id:
-        geo_stats = geo_stats.filter(EmissionFactor.data_source_id == data_source_id)
-    if not include_inactive:
-        geo_stats = geo_stats.filter(EmissionFactor.is_active == True)
-
-    geo_stats = geo_stats.group_by(EmissionFactor.geography).all()
-
-    for row in geo_stats:
-        geo_code = row[0]
-        total = row[1]
-
-        if not geo_code:
-            continue
-
-        # Get sources covering this geography
-        sources_query = (
-            db.query(DataSource.name)
-            .join(EmissionFactor, EmissionFactor.data_source_id == DataSource.id)
-            .filter(EmissionFactor.geography == geo_code)
-            .filter(EmissionFactor.is_active == True)
-            .distinct()
-            .all()
-        )
-        sources = [s[0] for s in sources_query]
-
-        # Calculate percentage
-        percentage = (total / total_emission_factors * 100) if total_emission_factors > 0 else 0
-
-        by_geography.append(
-            CoverageByGeography(
-                geography=geo_code,
-                geography_name=get_geography_name(geo_code),
-                total_factors=total,
-                sources=sources,
-                percentage_of_total=round(percentage, 1),
-            )
+    geography_totals: Dict[str, int] = defaultdict(int)
+    for cell in base:
+        if cell.geography:
+            geography_totals[cell.geography] += cell.item_count
+
+    geography_sources: Dict[str, set] = defaultdict(set)
+    for cell in active_cells:
+        if cell.geography and cell.data_source_id in source_names:
+            geography_sources[cell.geography].add(source_names[cell.data_source_id])
+
+    by_geography: List[CoverageByGeography] = [
+        CoverageByGeography(
+            geography=geo_code,
+            geography_name=get_geography_name(geo_code),
+            total_factors=total,
+            sources=sorted(geography_sources[geo_code]),
+            percentage_of_total=percentage_of_total(total),
         )
+        for geo_code, total in geography_totals.items()
+    ]
 
     # Sort by total_factors descending
     by_geography.sort(key=lambda x: x.total_factors, reverse=True)
@@ -343,26 +269,19 @@ def get_coverage(
     # Coverage by Category
     # ============================================================================
 
+    active_by_category: Dict[str, int] = defaultdict(int)
+    for cell in active_cells:
+        if cell.category:
+            active_by_category[cell.category] += cell.item_count
+
     by_category: List[CoverageByCategory] = []
 
-    for cat in all_categories[:100]:  # Limit to 100 categories for performance
-        # Count products in this category
-        products_count = (
-            db.query(Product)
-            .filter(Product.category_id == cat.id)
-            .count()
-        )
+    for category_id, name, code in categories[:100]:  # Limit to 100 categories
+        products_count = products_by_category.get(category_id, 0)
 
-        # Count factors that might apply to this category
+        # Factors whose category matches the product category name
         # This is a simplified check - would need proper category mapping
-        factors_available = (
-            db.query(EmissionFactor)
-            .filter(
-                EmissionFactor.category == cat.name,
-                EmissionFactor.is_active == True,
-            )
-            .count()
-        )
+        factors_available = active_by_category.get(name, 0)
 
         # For now, use a heuristic for products with factors
         products_with_factors = min(products_count, factors_available) if factors_available > 0 else 0
@@ -380,9 +299,9 @@ def get_coverage(
 
         by_category.append(
             CoverageByCategory(
-                category_id=cat.id,
-                category_name=cat.name,
-                category_code=cat.code,
+                category_id=category_id,
+                category_name=name,
+                category_code=code,
                 products_count=products_count,
                 products_with_factors=products_with_factors,
                 coverage_percentage=round(coverage_pct, 1),
@@ -396,30 +315,11 @@ def get_coverage(
     # ============================================================================
 
     # Missing geographies - geographies with products but no factors
-    product_geos = (
-        db.query(Product.country_of_origin)
-        .filter(Product.country_of_origin.isnot(None))
-        .distinct()
-        .all()
-    )
-    product_geo_set = set(g[0] for g in product_geos if g[0])
-
-    factor_geos = set(g.geography for g in by_geography)
-
-    missing_geographies: List[MissingGeography] = []
-    for geo in product_geo_set - factor_geos:
-        products_affected = (
-            db.query(Product)
-            .filter(Product.country_of_origin == geo)
-            .count()
-        )
-        if products_affected > 0:
-            missing_geographies.append(
-                MissingGeography(
-                    geography=geo,
-                    products_affected=products_affected,
-                )
-            )
+    missing_geographies: List[MissingGeography] = [
+        MissingGeography(geography=cell.geography, products_affected=cell.item_count)
+        for cell in by_dimension[PRODUCT_GEOGRAPHIES]
+        if cell.geography not in geography_totals and cell.item_count > 0
+    ]
 
     # Missing categories - categories with products but no factors
     missing_categories: List[MissingCategory] = [
@@ -433,32 +333,25 @@ def get_coverage(
     ]
 
     # Outdated factors - factors with reference year > 3 years old
-    current_year = datetime.now().year
+    if current_year is None:
+        current_year = datetime.now().year
     outdated_threshold = current_year - 3
 
-    outdated_by_source = (
-        db.query(
-            DataSource.name,
-            func.count(EmissionFactor.id).label("count"),
-            func.min(EmissionFactor.reference_year).label("oldest_year"),
-        )
-        .join(EmissionFactor, EmissionFactor.data_source_id == DataSource.id)
-        .filter(
-            EmissionFactor.is_active == True,
-            EmissionFactor.reference_year < outdated_threshold,
-        )
-        .group_by(DataSource.name)
-        .all()
-    )
+    outdated: Dict[str, Tuple[int, int]] = {}
+    for cell in active_cells:
+        if (
+            cell.data_source_id in source_names
+            and cell.reference_year is not None
+            and cell.reference_year < outdated_threshold
+        ):
+            name = source_names[cell.data_source_id]
+            count, oldest = outdated.get(name, (0, cell.reference_year))
+            outdated[name] = (count + cell.item_count, min(oldest, cell.reference_year))
 
     outdated_factors: List[OutdatedFactors] = [
-        OutdatedFactors(
-            source_name=row[0],
-            count=row[1],
-            oldest_year=row[2],
-        )
-        for row in outdated_by_source
-        if row[1] > 0
+        OutdatedFactors(source_name=name, count=count, oldest_year=oldest)
+        for name, (count, oldest) in outdated.items()
+        if count > 0
     ]
 
     gaps = CoverageGaps(
@@ -474,3 +367,92 @@ def get_coverage(
         by_category=by_category,
         gaps=gaps,
     )
+
+
+# ============================================================================
+# API Endpoints
+# ============================================================================
+
+
+@router.get(
+    "/emission-factors/coverage",
+    response_model=CoverageResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Get emission factor coverage",
+    description="Get emission factor coverage statistics by data source, geography, and product category.",
+)
+def get_coverage(
+    group_by: GroupByEnum = Query(
+        GroupByEnum.source, description="Primary grouping dimension"
+    ),
+    data_source_id: Optional[str] = Query(
+        None, description="Filter to specific data source"
+    ),
+    include_inactive: bool = Query(
+        False, description="Include inactive emission factors in counts"
+    ),
+    refresh: bool = Query(
+        False, description="Recompute coverage rollups before answering"
+    ),
+    db: Session = Depends(get_read_db),
+) -> CoverageResponse:
+    """
+    Get emission factor coverage statistics.
+
+    Query Parameters:
+    - group_by: Primary grouping dimension (source, geography, category, year)
+    - data_source_id: Filter to specific data source
+    - include_inactive: Include inactive emission factors (default: false)
+    - refresh: Recompute rollups first (default: false)
+
+    Returns:
+    - summary: Overall coverage summary
+    - by_source: Coverage breakdown by data source
+    - by_geography: Coverage breakdown by geography
+    - by_category: Coverage breakdown by product category
+    - gaps: Identified coverage gaps
+    - refreshed_at: When the underlying rollups were computed
+    - stale: Whether factors changed or a data sync completed after refreshed_at
+    """
+    source_names: Dict[str, str] = dict(db.query(DataSource.id, DataSource.name).all())
+
+    # Validate data_source_id if provided
+    if data_source_id and data_source_id not in source_names:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=create_error_dict(
+                code="INVALID_DATA_SOURCE",
+                message="Data source not found",
+                details=[
+                    {"field": "data_source_id", "message": f"No data source exists with ID {data_source_id}"}
+                ],
+            ),
+        )
+
+    rollups = [] if refresh else load_coverage_rollups(db)
+    if not rollups:
+        refresh_coverage_rollups(db)
+        rollups = load_coverage_rollups(db)
+
+    categories = [
+        tuple(row)
+        for row in db.query(ProductCategory.id, ProductCategory.name, ProductCategory.code).all()
+    ]
+
+    response = build_coverage_response(
+        rollups,
+        source_names,
+        categories,
+        data_source_id=data_source_id,
+        include_inactive=include_inactive,
+    )
+
+    refreshed_at = rollups[0].refreshed_at if rollups else None
+    last_change = latest_data_change_at(db)
+    if refreshed_at and last_change:
+        if refreshed_at.tzinfo is None:
+            refreshed_at = refreshed_at.replace(tzinfo=timezone.utc)
+        response.stale = last_change > refreshed_at
+    response.refreshed_at = refreshed_at
+
+    return response
@@ -19,11 +19,11 @@ import logging
 import threading
 import uuid
 from datetime import datetime, timedelta, timezone
-from typing import Optional, Callable, Type
+from typing import Dict, Iterable, List, Optional, Callable, Tuple, Type
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import func
-from sqlalchemy.orm import Session
+from sqlalchemy import distinct, func, select, true
+from sqlalchemy.orm import Query as OrmQuery, Session, aliased
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 
 from backend.database.connection import get_db
@@ -261,15 +261,38 @@ def set_sync_task_trigger(trigger: Callable) -> None:
 # ============================================================================
 
 
-def get_last_sync_info(db: Session, data_source_id: str) -> Optional[LastSyncInfo]:
-    """Get the most recent sync log for a data source."""
-    last_log = (
-        db.query(DataSyncLog)
-        .filter(DataSyncLog.data_source_id == data_source_id)
+def latest_sync_log_lateral():
+    """
+    LATERAL subquery selecting the most recent sync log of each data source.
+
+    Correlated on DataSource.id; join it with ON TRUE (outer join to keep
+    sources that were never synced).
+    """
+    return (
+        select(DataSyncLog)
+        .where(DataSyncLog.data_source_id == DataSource.id)
         .order_by(DataSyncLog.started_at.desc())
-        .first()
+        .limit(1)
+        .lateral("latest_sync")
     )
 
+
+def query_data_sources_with_last_sync(db: Session) -> OrmQuery:
+    """
+    Query (DataSource, latest DataSyncLog or None) rows in a single statement.
+
+    Args:
+        db: Database session
+
+    Returns:
+        Query that callers can filter on DataSource columns
+    """
+    latest = aliased(DataSyncLog, latest_sync_log_lateral())
+    return db.query(DataSource, latest).outerjoin(latest, true())
+
+
+def to_last_sync_info(last_log: Optional[DataSyncLog]) -> Optional[LastSyncInfo]:
+    """Convert a sync log row to the LastSyncInfo schema."""
     if not last_log:
         return None
 
@@ -286,6 +309,17 @@ def get_last_sync_info(db: Session, data_source_id: str) -> Optional[LastSyncInf
     )
 
 
+def get_last_sync_info(db: Session, data_source_id: str) -> Optional[LastSyncInfo]:
+    """Get the most recent sync log for a data source."""
+    last_log = (
+        db.query(DataSyncLog)
+        .filter(DataSyncLog.data_source_id == data_source_id)
+        .order_by(DataSyncLog.started_at.desc())
+        .first()
+    )
+    return to_last_sync_info(last_log)
+
+
 def get_license_info(data_source: DataSource) -> Optional[DataSourceLicense]:
     """Get license and attribution information for a data source."""
     if not data_source.license_type and not data_source.attribution_text:
@@ -302,73 +336,70 @@ def get_license_info(data_source: DataSource) -> Optional[DataSourceLicense]:
     )
 
 
-def get_data_source_statistics(db: Session, data_source_id: str) -> DataSourceStatistics:
-    """Calculate statistics for a data source."""
-    # Total factors
-    total_factors = (
-        db.query(EmissionFactor)
-        .filter(EmissionFactor.data_source_id == data_source_id)
-        .count()
-    )
+def get_data_source_statistics_map(
+    db: Session,
+    data_source_ids: Iterable[str],
+) -> Dict[str, DataSourceStatistics]:
+    """
+    Calculate statistics for many data sources in one query.
 
-    # Active factors
-    active_factors = (
-        db.query(EmissionFactor)
-        .filter(
-            EmissionFactor.data_source_id == data_source_id,
-            EmissionFactor.is_active == True,
-        )
-        .count()
-    )
+    A single GROUP BY data_source_id aggregate computes every statistic;
+    the active-only figures use FILTER (WHERE is_active) clauses.
 
-    # Average quality rating
-    avg_quality = (
-        db.query(func.avg(EmissionFactor.data_quality_rating))
-        .filter(
-            EmissionFactor.data_source_id == data_source_id,
-            EmissionFactor.is_active == True,
-        )
-        .scalar()
-    )
+    Args:
+        db: Database session
+        data_source_ids: Data sources to compute statistics for
 
-    # Geographies covered
-    geographies_covered = (
-        db.query(EmissionFactor.geography)
-        .filter(
-            EmissionFactor.data_source_id == data_source_id,
-            EmissionFactor.is_active == True,
+    Returns:
+        Dict mapping each requested ID to its statistics (zeros for
+        sources without emission factors)
+    """
+    ids = list(data_source_ids)
+    if not ids:
+        return {}
+
+    active = EmissionFactor.is_active == True  # noqa: E712
+    rows = (
+        db.query(
+            EmissionFactor.data_source_id,
+            func.count(EmissionFactor.id),
+            func.count(EmissionFactor.id).filter(active),
+            func.avg(EmissionFactor.data_quality_rating).filter(active),
+            func.count(distinct(EmissionFactor.geography)).filter(active),
+            func.min(EmissionFactor.reference_year).filter(active),
+            func.max(EmissionFactor.reference_year).filter(active),
         )
-        .distinct()
-        .count()
+        .filter(EmissionFactor.data_source_id.in_(ids))
+        .group_by(EmissionFactor.data_source_id)
+        .all()
     )
 
-    # Year range
-    min_year = (
-        db.query(func.min(EmissionFactor.reference_year))
-        .filter(
-            EmissionFactor.data_source_id == data_source_id,
-            EmissionFactor.is_active == True,
+    statistics = {
+        data_source_id: DataSourceStatistics(
+            total_factors=0,
+            active_factors=0,
+            average_quality=None,
+            geographies_covered=0,
+            oldest_reference_year=None,
+            newest_reference_year=None,
         )
-        .scalar()
-    )
-
-    max_year = (
-        db.query(func.max(EmissionFactor.reference_year))
-        .filter(
-            EmissionFactor.data_source_id == data_source_id,
-            EmissionFactor.is_active == True,
+        for data_source_id in ids
+    }
+    for data_source_id, total, active_count, avg_quality, geographies, min_year, max_year in rows:
+        statistics[data_source_id] = DataSourceStatistics(
+            total_factors=total,
+            active_factors=active_count,
+            average_quality=float(avg_quality) if avg_quality else None,
+            geographies_covered=geographies,
+            oldest_reference_year=min_year,
+            newest_reference_year=max_year,
         )
-        .scalar()
-    )
+    return statistics
 
-    return DataSourceStatistics(
-        total_factors=total_factors,
-        active_factors=active_factors,
-        average_quality=float(avg_quality) if avg_quality else None,
-        geographies_covered=geographies_covered,
-        oldest_reference_year=min_year,
-        newest_reference_year=max_year,
-    )
+
+def get_data_source_statistics(db: Session, data_source_id: str) -> DataSourceStatistics:
+    """Calculate statistics for a data source."""
+    return get_data_source_statistics_map(db, [data_source_id])[data_source_id]
 
 
 def calculate_next_scheduled_sync(
@@ -453,9 +484,12 @@ def list_data_sources(
     - data_sources: List of data sources with details
     - total: Total count
     - summary: Overall summary statistics
+
+    Runs two queries regardless of the number of sources: data sources with
+    their latest sync log (LATERAL join), and one grouped statistics query.
     """
     # Build query
-    query = db.query(DataSource)
+    query = query_data_sources_with_last_sync(db)
 
     # Apply filters
     if is_active is not None:
@@ -465,7 +499,9 @@ def list_data_sources(
         query = query.filter(DataSource.source_type == source_type.value)
 
     # Execute query
-    data_sources = query.all()
+    rows: List[Tuple[DataSource, Optional[DataSyncLog]]] = query.all()
+    data_sources = [ds for ds, _ in rows]
+    statistics = get_data_source_statistics_map(db, [ds.id for ds in data_sources])
 
     # Build response items
     items = []
@@ -474,13 +510,13 @@ def list_data_sources(
     sources_needing_sync = 0
     seven_days_ago = datetime.now(timezone.utc) - timedelta(days=7)
 
-    for ds in data_sources:
+    for ds, last_log in rows:
         # Get statistics
-        stats = get_data_source_statistics(db, ds.id)
+        stats = statistics[ds.id]
         total_emission_factors += stats.total_factors
 
         # Get last sync info
-        last_sync = get_last_sync_info(db, ds.id)
+        last_sync = to_last_sync_info(last_log)
 
         # Check if synced recently
         if last_sync and last_sync.started_at:
@@ -560,14 +596,14 @@ def get_data_source(
     Raises:
     - 404: Data source not found
     """
-    # Query data source
-    data_source = (
-        db.query(DataSource)
+    # Query data source with its latest sync log
+    row = (
+        query_data_sources_with_last_sync(db)
         .filter(DataSource.id == data_source_id)
         .first()
     )
 
-    if not data_source:
+    if not row:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=create_error_dict(
@@ -578,10 +614,11 @@ def get_data_source(
                 ],
             ),
         )
+    data_source, last_log = row
 
     # Get statistics and last sync
     stats = get_data_source_statistics(db, data_source.id)
-    last_sync = get_last_sync_info(db, data_source.id)
+    last_sync = to_last_sync_info(last_log)
     next_sync = calculate_next_scheduled_sync(data_source)
 
     return DataSourceDetailResponse(
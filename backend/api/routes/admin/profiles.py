@@ -0,0 +1,134 @@
+"""
+Admin Request Profiles API Routes.
+
+Endpoints:
+- GET /admin/profiles - List the newest request profiles
+- GET /admin/profiles/{id} - Get a profile with its full SQL query log
+- GET /admin/profiles/{id}/files/{filename} - Download a profile artifact
+  (report.json, stacks.folded, cprofile.prof)
+
+Profiles are recorded by ProfilingMiddleware (PROFILING_ENABLED) and kept
+by the process's ProfileStore, so with several workers on separate hosts
+each host lists its own profiles.
+"""
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import FileResponse
+
+from backend.api.utils.error_responses import create_error_dict
+from backend.schemas.admin import ProfileItem, ProfileListResponse
+from backend.utils.profiling import ProfileStore, get_profile_store
+
+
+# ============================================================================
+# Router Configuration
+# ============================================================================
+
+router = APIRouter(tags=["admin-profiles"])
+
+
+def _not_found(profile_id: str) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail=create_error_dict(
+            code="NOT_FOUND",
+            message="Profile not found",
+            details=[
+                {"field": "id", "message": f"No profile exists with ID {profile_id}"}
+            ],
+        ),
+    )
+
+
+# ============================================================================
+# API Endpoints
+# ============================================================================
+
+
+@router.get(
+    "/profiles",
+    response_model=ProfileListResponse,
+    status_code=status.HTTP_200_OK,
+    summary="List request profiles",
+    description="List the newest request profiles, without their SQL statement lists.",
+)
+def list_profiles(
+    limit: int = Query(50, ge=1, le=500, description="Maximum profiles to return"),
+    store: ProfileStore = Depends(get_profile_store),
+) -> ProfileListResponse:
+    """
+    List the newest request profiles.
+
+    Query Parameters:
+    - limit: Maximum profiles to return (default: 50)
+
+    Returns:
+    - items: Profiles, newest first
+    """
+    return ProfileListResponse(items=store.list(limit=limit))
+
+
+@router.get(
+    "/profiles/{profile_id}",
+    response_model=ProfileItem,
+    status_code=status.HTTP_200_OK,
+    summary="Get request profile",
+    description="Get a request profile including every logged SQL statement.",
+    responses={
+        404: {"description": "Profile not found"},
+    },
+)
+def get_profile(
+    profile_id: str,
+    store: ProfileStore = Depends(get_profile_store),
+) -> ProfileItem:
+    """
+    Get a request profile.
+
+    Path Parameters:
+    - profile_id: Profile identifier (X-Profile-Id response header)
+
+    Raises:
+    - 404: Profile not found
+    """
+    report = store.report(profile_id)
+    if report is None:
+        raise _not_found(profile_id)
+    return ProfileItem(**report)
+
+
+@router.get(
+    "/profiles/{profile_id}/files/{filename}",
+    status_code=status.HTTP_200_OK,
+    summary="Download profile artifact",
+    description=(
+        "Download report.json, stacks.folded (flamegraph.pl / speedscope) "
+        "or cprofile.prof (pstats / snakeviz)."
+    ),
+    responses={
+        404: {"description": "Profile or file not found"},
+    },
+)
+def download_profile_file(
+    profile_id: str,
+    filename: str,
+    store: ProfileStore = Depends(get_profile_store),
+) -> FileResponse:
+    """
+    Download a profile artifact.
+
+    Path Parameters:
+    - profile_id: Profile identifier
+    - filename: report.json, stacks.folded or cprofile.prof
+
+    Raises:
+    - 404: Profile or file not found
+    """
+    path = store.path(profile_id, filename)
+    if path is None:
+        raise _not_found(profile_id)
+    return FileResponse(
+        path,
+        media_type="application/octet-stream",
+        filename=f"profile-{profile_id}-{filename}",
+    )
@@ -12,11 +12,11 @@ Contract Reference: phase5-contracts/admin-sync-logs-contract.yaml
 
 import uuid
 from datetime import datetime, date, timezone
-from typing import Optional
+from typing import List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy import func, and_
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 
 from backend.database.connection import get_db
 from backend.models import DataSource, DataSyncLog
@@ -90,6 +90,91 @@ def sync_log_to_item(log: DataSyncLog) -> SyncLogItem:
     )
 
 
+def sync_log_filters(
+    data_source_id: Optional[str] = None,
+    status_filter: Optional[SyncStatusEnum] = None,
+    sync_type: Optional[SyncTypeEnum] = None,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    has_errors: Optional[bool] = None,
+) -> List:
+    """Build the WHERE conditions shared by the listing and its summary."""
+    conditions = []
+
+    if data_source_id:
+        conditions.append(DataSyncLog.data_source_id == data_source_id)
+
+    if status_filter:
+        conditions.append(DataSyncLog.status == status_filter.value)
+
+    if sync_type:
+        conditions.append(DataSyncLog.sync_type == sync_type.value)
+
+    if start_date:
+        start_datetime = datetime.combine(start_date, datetime.min.time())
+        conditions.append(DataSyncLog.started_at >= start_datetime)
+
+    if end_date:
+        end_datetime = datetime.combine(end_date, datetime.max.time())
+        conditions.append(DataSyncLog.started_at <= end_datetime)
+
+    if has_errors is True:
+        conditions.append(DataSyncLog.records_failed > 0)
+    elif has_errors is False:
+        conditions.append(DataSyncLog.records_failed == 0)
+
+    return conditions
+
+
+def duration_seconds_expr(dialect_name: str):
+    """SQL expression for completed_at - started_at in seconds."""
+    if dialect_name == "sqlite":
+        return (
+            func.julianday(DataSyncLog.completed_at) - func.julianday(DataSyncLog.started_at)
+        ) * 86400
+    return func.extract("epoch", DataSyncLog.completed_at - DataSyncLog.started_at)
+
+
+def summarize_sync_logs(db: Session, conditions: List) -> SyncLogsSummary:
+    """
+    Compute the sync log summary in a single aggregate query.
+
+    Args:
+        db: Database session
+        conditions: Filters from sync_log_filters()
+
+    Returns:
+        SyncLogsSummary over all logs matching the filters
+    """
+    completed = DataSyncLog.status == "completed"
+    duration = duration_seconds_expr(db.get_bind().dialect.name)
+
+    row = (
+        db.query(
+            func.count(DataSyncLog.id),
+            func.count(DataSyncLog.id).filter(completed),
+            func.count(DataSyncLog.id).filter(DataSyncLog.status == "failed"),
+            func.coalesce(func.sum(DataSyncLog.records_processed), 0),
+            func.coalesce(func.sum(DataSyncLog.records_failed), 0),
+            func.avg(duration).filter(completed, DataSyncLog.completed_at.isnot(None)),
+        )
+        .filter(*conditions)
+        .one()
+    )
+    total, completed_syncs, failed_syncs, processed, failed, average_duration = row
+
+    return SyncLogsSummary(
+        total_syncs=total,
+        completed_syncs=completed_syncs,
+        failed_syncs=failed_syncs,
+        total_records_processed=int(processed),
+        total_records_failed=int(failed),
+        average_duration_seconds=(
+            float(average_duration) if average_duration is not None else None
+        ),
+    )
+
+
 # ============================================================================
 # API Endpoints
 # ============================================================================
@@ -156,11 +241,27 @@ def list_sync_logs(
     - limit/offset: Applied pagination
     - has_more: Whether more results exist
     - summary: Summary of filtered results
+
+    Runs two queries regardless of filters: one aggregate for the summary
+    and total, and one for the page (with data sources joined).
     """
-    # Validate data_source_id if provided
-    if data_source_id:
+    conditions = sync_log_filters(
+        data_source_id=data_source_id,
+        status_filter=status_filter,
+        sync_type=sync_type,
+        start_date=start_date,
+        end_date=end_date,
+        has_errors=has_errors,
+    )
+
+    # Summary and total come from one aggregate query over the same filters
+    summary = summarize_sync_logs(db, conditions)
+    total = summary.total_syncs
+
+    # Validate data_source_id only when nothing matched
+    if data_source_id and total == 0:
         data_source = (
-            db.query(DataSource)
+            db.query(DataSource.id)
             .filter(DataSource.id == data_source_id)
             .first()
         )
@@ -176,123 +277,26 @@ def list_sync_logs(
                 ),
             )
 
-    # Build base query
-    query = db.query(DataSyncLog)
-
-    # Apply filters
-    if data_source_id:
-        query = query.filter(DataSyncLog.data_source_id == data_source_id)
-
-    if status_filter:
-        query = query.filter(DataSyncLog.status == status_filter.value)
-
-    if sync_type:
-        query = query.filter(DataSyncLog.sync_type == sync_type.value)
-
-    if start_date:
-        start_datetime = datetime.combine(start_date, datetime.min.time())
-        query = query.filter(DataSyncLog.started_at >= start_datetime)
-
-    if end_date:
-        end_datetime = datetime.combine(end_date, datetime.max.time())
-        query = query.filter(DataSyncLog.started_at <= end_datetime)
-
-    if has_errors is True:
-        query = query.filter(DataSyncLog.records_failed > 0)
-    elif has_errors is False:
-        query = query.filter(DataSyncLog.records_failed == 0)
-
-    # Get total count before pagination
-    total = query.count()
+    # Page query loads each log's data source in the same statement
+    query = (
+        db.query(DataSyncLog)
+        .options(joinedload(DataSyncLog.data_source))
+        .filter(*conditions)
+    )
 
-    # Apply sorting
+    # Apply sorting (id breaks ties so pages are stable)
     sort_column = getattr(DataSyncLog, sort_by.value)
     if sort_order == SortOrderEnum.desc:
-        query = query.order_by(sort_column.desc())
+        query = query.order_by(sort_column.desc(), DataSyncLog.id)
     else:
-        query = query.order_by(sort_column.asc())
+        query = query.order_by(sort_column.asc(), DataSyncLog.id)
 
     # Apply pagination
-    logs = query.offset(offset).limit(limit).all()
+    logs = query.offset(offset).limit(limit).all() if total else []
 
     # Convert to response items
     items = [sync_log_to_item(log) for log in logs]
 
-    # Calculate summary
-    # Use the same filtered query for summary stats
-    summary_query = db.query(DataSyncLog)
-    if data_source_id:
-        summary_query = summary_query.filter(DataSyncLog.data_source_id == data_source_id)
-    if status_filter:
-        summary_query = summary_query.filter(DataSyncLog.status == status_filter.value)
-    if sync_type:
-        summary_query = summary_query.filter(DataSyncLog.sync_type == sync_type.value)
-    if start_date:
-        start_datetime = datetime.combine(start_date, datetime.min.time())
-        summary_query = summary_query.filter(DataSyncLog.started_at >= start_datetime)
-    if end_date:
-        end_datetime = datetime.combine(end_date, datetime.max.time())
-        summary_query = summary_query.filter(DataSyncLog.started_at <= end_datetime)
-    if has_errors is True:
-        summary_query = summary_query.filter(DataSyncLog.records_failed > 0)
-    elif has_errors is False:
-        summary_query = summary_query.filter(DataSyncLog.records_failed == 0)
-
-    total_syncs = summary_query.count()
-
-    completed_syncs = summary_query.filter(DataSyncLog.status == "completed").count()
-
-    failed_syncs = summary_query.filter(DataSyncLog.status == "failed").count()
-
-    total_records_processed = (
-        db.query(func.sum(DataSyncLog.records_processed))
-        .filter(
-            *([DataSyncLog.data_source_id == data_source_id] if data_source_id else []),
-            *([DataSyncLog.status == status_filter.value] if status_filter else []),
-            *([DataSyncLog.sync_type == sync_type.value] if sync_type else []),
-        )
-        .scalar() or 0
-    )
-
-    total_records_failed = (
-        db.query(func.sum(DataSyncLog.records_failed))
-        .filter(
-            *([DataSyncLog.data_source_id == data_source_id] if data_source_id else []),
-            *([DataSyncLog.status == status_filter.value] if status_filter else []),
-            *([DataSyncLog.sync_type == sync_type.value] if sync_type else []),
-        )
-        .scalar() or 0
-    )
-
-    # Calculate average duration for completed syncs
-    completed_logs = (
-        summary_query
-        .filter(
-            DataSyncLog.status == "completed",
-            DataSyncLog.completed_at.isnot(None),
-        )
-        .all()
-    )
-
-    average_duration = None
-    if completed_logs:
-        durations = [
-            (log.completed_at - log.started_at).total_seconds()
-            for log in completed_logs
-            if log.completed_at and log.started_at
-        ]
-        if durations:
-            average_duration = sum(durations) / len(durations)
-
-    summary = SyncLogsSummary(
-        total_syncs=total_syncs,
-        completed_syncs=completed_syncs,
-        failed_syncs=failed_syncs,
-        total_records_processed=total_records_processed,
-        total_records_failed=total_records_failed,
-        average_duration_seconds=average_duration,
-    )
-
     return SyncLogsListResponse(
         items=items,
         total=total,
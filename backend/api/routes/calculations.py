@@ -5,6 +5,10 @@ TASK-BE-P5-010: Fix Backend Test Failures - Add enum validation for calculation_
 TASK-FE-P8-003: Added breakdown field to response for expandable items
 TASK-API-P7-027: Align API contract types - change 'processing'/'running' to 'in_progress'
 TASK-BE-P7-018: Added JWT authentication (user role required)
+Async handlers: `async_router` serves the same endpoints through
+CalculationService when settings.ASYNC_ROUTES is enabled (see main.py)
+Background calculations record per-phase durations (bom_fetch,
+ef_resolution, compute, persist) and outcomes for /metrics
 
 Endpoints:
 - POST /api/v1/calculate - Start async PCF calculation (returns 202 Accepted)
@@ -19,21 +23,39 @@ This module implements the async calculation pattern:
 
 import logging
 import re
-from typing import Optional
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 from datetime import datetime, UTC
 
 from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks
+from sqlalchemy import lambda_stmt, select
 from sqlalchemy.orm import Session
-
-from backend.database.connection import get_db
-from backend.models import Product, PCFCalculation, generate_uuid
+from sqlalchemy.sql.lambdas import StatementLambdaElement
+
+from backend.database.connection import get_db, get_read_db
+from backend.models import (
+    BillOfMaterials,
+    EmissionFactor,
+    Product,
+    PCFCalculation,
+    generate_uuid,
+)
 from backend.models.user import User
-from backend.auth.dependencies import get_optional_user, get_current_active_user
+from backend.auth.dependencies import (
+    get_optional_user,
+    get_optional_user_async,
+    get_current_active_user,
+)
+from backend.api.dependencies import get_calculation_service
+from backend.domain.entities.calculation import Calculation
+from backend.domain.entities.errors import CalculationNotFoundError, ProductNotFoundError
+from backend.domain.services.calculation_service import CalculationService
 from backend.schemas import (
     CalculationRequest,
     CalculationStartResponse,
     CalculationStatusResponse,
 )
+from backend.utils.metrics import CALCULATIONS, CALCULATION_PHASE_DURATION
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -45,6 +67,186 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/v1", tags=["calculations"])
 
+# Async (AsyncSession) handlers for the same endpoints, used when
+# settings.ASYNC_ROUTES is enabled
+async_router = APIRouter(prefix="/api/v1", tags=["calculations"])
+
+
+# ============================================================================
+# Calculation Helpers (shared by sync and async paths)
+# ============================================================================
+
+def calculation_by_id(calculation_id: str) -> StatementLambdaElement:
+    """Cached, parameterized lookup of a calculation by ID (status polling)."""
+    return lambda_stmt(
+        lambda: select(PCFCalculation).where(PCFCalculation.id == calculation_id)
+    )
+
+
+def fallback_factor_names(child_product: Product) -> List[str]:
+    """
+    Activity names tried, in order, when a BOM item has no emission_factor_id.
+
+    Args:
+        child_product: BOM component product
+
+    Returns:
+        Candidate activity names (lowercase name, normalized code, underscored name)
+    """
+    name_lower = child_product.name.lower()
+    code_normalized = re.sub(r"_?\d+$", "", child_product.code.lower().replace("-", "_"))
+    name_underscored = name_lower.replace(" ", "_")
+    return [name_lower, code_normalized, name_underscored]
+
+
+def unmatched_factor_names(bom_rows: Iterable[Tuple]) -> List[str]:
+    """Fallback activity names needed for BOM rows without a linked factor."""
+    names = set()
+    for _bom_item, ef, child_product in bom_rows:
+        if ef is None and child_product:
+            names.update(fallback_factor_names(child_product))
+    return sorted(names)
+
+
+def compute_calculation_totals(
+    bom_rows: Iterable[Tuple],
+    ef_by_name: Dict[str, EmissionFactor],
+) -> Dict[str, Any]:
+    """
+    Calculate CO2e totals for (BillOfMaterials, EmissionFactor, Product) rows.
+
+    Args:
+        bom_rows: BOM items joined with their linked factor (or None) and child product
+        ef_by_name: Emission factors by activity_name for fallback matching
+
+    Returns:
+        Dict with total_co2e, materials_co2e, energy_co2e, transport_co2e and breakdown
+    """
+    total_co2e = 0.0
+    materials_co2e = 0.0
+    energy_co2e = 0.0
+    transport_co2e = 0.0
+    breakdown = {}
+
+    for bom_item, ef, child_product in bom_rows:
+        quantity = float(bom_item.quantity or 0)
+
+        # If no direct emission_factor_id link, fall back to name matching
+        if ef is None and child_product:
+            for name in fallback_factor_names(child_product):
+                ef = ef_by_name.get(name)
+                if ef:
+                    break
+
+        factor_value = float(ef.co2e_factor if ef and ef.co2e_factor else 0)
+        component_co2e = quantity * factor_value
+
+        component_name = child_product.name if child_product else "Unknown"
+        breakdown[component_name] = round(component_co2e, 6)
+        total_co2e += component_co2e
+
+        # Categorize by component name heuristics
+        name_lower = component_name.lower()
+        if "electricity" in name_lower or "energy" in name_lower or "grid" in name_lower:
+            energy_co2e += component_co2e
+        elif "transport" in name_lower or "truck" in name_lower or "ship" in name_lower:
+            transport_co2e += component_co2e
+        else:
+            materials_co2e += component_co2e
+
+    return {
+        "total_co2e": total_co2e,
+        "materials_co2e": materials_co2e,
+        "energy_co2e": energy_co2e,
+        "transport_co2e": transport_co2e,
+        "breakdown": breakdown,
+    }
+
+
+def apply_calculation_results(
+    calculation: PCFCalculation,
+    totals: Dict[str, Any],
+    elapsed_ms: int,
+) -> None:
+    """Mark a calculation completed and store its computed totals."""
+    calculation.status = "completed"
+    calculation.total_co2e_kg = round(totals["total_co2e"], 6)
+    calculation.materials_co2e = round(totals["materials_co2e"], 6)
+    calculation.energy_co2e = round(totals["energy_co2e"], 6)
+    calculation.transport_co2e = round(totals["transport_co2e"], 6)
+    calculation.calculation_time_ms = elapsed_ms
+    calculation.calculation_method = "SQL_DirectCalculation"
+
+    # Store detailed breakdown in JSON field
+    calculation.breakdown = totals["breakdown"]
+
+
+def mark_calculation_failed(calculation: PCFCalculation, error_message: str) -> None:
+    """Mark a calculation failed, recording the error in its metadata."""
+    calculation.status = "failed"
+    if not calculation.calculation_metadata:
+        calculation.calculation_metadata = {}
+    calculation.calculation_metadata["error_message"] = error_message
+
+
+def new_calculation(calc_id: str, request: CalculationRequest) -> PCFCalculation:
+    """Initial pending calculation record for a calculation request."""
+    return PCFCalculation(
+        id=calc_id,
+        product_id=request.product_id,
+        calculation_type=request.calculation_type,  # Use enum value
+        status="pending",
+        total_co2e_kg=0.0,  # Placeholder until calculation completes
+        created_at=datetime.now(UTC)
+    )
+
+
+def build_calculation_status_response(
+    calculation: Union[PCFCalculation, Calculation],
+) -> CalculationStatusResponse:
+    """
+    Build the status response for a calculation record.
+
+    Args:
+        calculation: PCFCalculation record or Calculation domain entity
+
+    Returns:
+        CalculationStatusResponse with results (completed) or error (failed)
+    """
+    # Map internal status values to frontend-compatible values
+    # TASK-API-P7-027: Ensure 'running' and 'processing' are mapped to 'in_progress'
+    status_value = calculation.status
+    if status_value in ("running", "processing"):
+        status_value = "in_progress"
+
+    # Build response based on status
+    response_data = {
+        "calculation_id": calculation.id,
+        "status": status_value,
+        "product_id": calculation.product_id,
+        "created_at": calculation.created_at.isoformat() if calculation.created_at else None
+    }
+
+    # Add result fields if completed
+    if calculation.status == "completed":
+        response_data.update({
+            "total_co2e_kg": float(calculation.total_co2e_kg) if calculation.total_co2e_kg else 0.0,
+            "materials_co2e": float(calculation.materials_co2e) if calculation.materials_co2e else None,
+            "energy_co2e": float(calculation.energy_co2e) if calculation.energy_co2e else None,
+            "transport_co2e": float(calculation.transport_co2e) if calculation.transport_co2e else None,
+            "calculation_time_ms": calculation.calculation_time_ms,
+            # TASK-FE-P8-003: Include breakdown for expandable items in frontend
+            "breakdown": calculation.breakdown if calculation.breakdown else None
+        })
+
+    # Add error message if failed
+    if calculation.status == "failed":
+        response_data["error_message"] = calculation.error_message or "Calculation failed"
+
+    logger.debug(f"Returning status for calculation {calculation.id}: {status_value}")
+
+    return CalculationStatusResponse(**response_data)
+
 
 # ============================================================================
 # Background Task Functions
@@ -77,16 +279,14 @@ def execute_calculation(
         product_id: UUID of product to calculate
         calculation_type: Type of calculation
     """
-    import time
     from backend.database.connection import SessionLocal
-    from backend.models import BillOfMaterials, EmissionFactor
 
     start_time = time.time()
     db_session = SessionLocal()
 
     try:
         # Update status to 'in_progress'
-        calculation = db_session.query(PCFCalculation).filter_by(id=calculation_id).first()
+        calculation = db_session.scalars(calculation_by_id(calculation_id)).first()
 
         if not calculation:
             logger.error(f"Calculation {calculation_id} not found in database")
@@ -97,112 +297,169 @@ def execute_calculation(
 
         logger.info(f"Starting calculation {calculation_id} for product {product_id}")
 
-        # Verify product exists
-        product = db_session.query(Product).filter_by(id=product_id).first()
-
-        if not product:
-            raise ValueError(f"Product {product_id} not found")
-
-        # Query BOM items joined with emission factors from PostgreSQL
-        bom_rows = (
-            db_session.query(
-                BillOfMaterials,
-                EmissionFactor,
-                Product,
+        with CALCULATION_PHASE_DURATION.time(phase="bom_fetch"):
+            # Verify product exists
+            product = db_session.query(Product).filter_by(id=product_id).first()
+
+            if not product:
+                raise ValueError(f"Product {product_id} not found")
+
+            # Query BOM items joined with emission factors from PostgreSQL
+            bom_rows = (
+                db_session.query(
+                    BillOfMaterials,
+                    EmissionFactor,
+                    Product,
+                )
+                .join(Product, Product.id == BillOfMaterials.child_product_id)
+                .outerjoin(EmissionFactor, EmissionFactor.id == BillOfMaterials.emission_factor_id)
+                .filter(BillOfMaterials.parent_product_id == product_id)
+                .all()
             )
-            .join(Product, Product.id == BillOfMaterials.child_product_id)
-            .outerjoin(EmissionFactor, EmissionFactor.id == BillOfMaterials.emission_factor_id)
-            .filter(BillOfMaterials.parent_product_id == product_id)
-            .all()
-        )
 
-        # Build emission factor lookup by activity_name for fallback matching
-        all_efs = db_session.query(EmissionFactor).all()
-        ef_by_name = {ef.activity_name: ef for ef in all_efs}
-
-        # Calculate CO2e per component
-        total_co2e = 0.0
-        materials_co2e = 0.0
-        energy_co2e = 0.0
-        transport_co2e = 0.0
-        breakdown = {}
-
-        for bom_item, ef, child_product in bom_rows:
-            quantity = float(bom_item.quantity or 0)
-
-            # If no direct emission_factor_id link, fall back to name matching
-            if ef is None and child_product:
-                name_lower = child_product.name.lower()
-                code_normalized = re.sub(r"_?\d+$", "", child_product.code.lower().replace("-", "_"))
-                name_underscored = name_lower.replace(" ", "_")
-                ef = ef_by_name.get(name_lower) or ef_by_name.get(code_normalized) or ef_by_name.get(name_underscored)
-
-            factor_value = float(ef.co2e_factor if ef and ef.co2e_factor else 0)
-            component_co2e = quantity * factor_value
-
-            component_name = child_product.name if child_product else "Unknown"
-            breakdown[component_name] = round(component_co2e, 6)
-            total_co2e += component_co2e
-
-            # Categorize by component name heuristics
-            name_lower = component_name.lower()
-            if "electricity" in name_lower or "energy" in name_lower or "grid" in name_lower:
-                energy_co2e += component_co2e
-            elif "transport" in name_lower or "truck" in name_lower or "ship" in name_lower:
-                transport_co2e += component_co2e
-            else:
-                materials_co2e += component_co2e
+        with CALCULATION_PHASE_DURATION.time(phase="ef_resolution"):
+            # Emission factor lookup by activity_name for fallback matching,
+            # limited to the names unlinked BOM items can match
+            fallback_names = unmatched_factor_names(bom_rows)
+            ef_by_name = {}
+            if fallback_names:
+                ef_by_name = {
+                    ef.activity_name: ef
+                    for ef in db_session.query(EmissionFactor)
+                    .filter(EmissionFactor.activity_name.in_(fallback_names))
+                }
+
+        with CALCULATION_PHASE_DURATION.time(phase="compute"):
+            totals = compute_calculation_totals(bom_rows, ef_by_name)
 
         # Calculate execution time
         elapsed_ms = int((time.time() - start_time) * 1000)
 
-        # Update calculation record with results
-        calculation.status = "completed"
-        calculation.total_co2e_kg = round(total_co2e, 6)
-        calculation.materials_co2e = round(materials_co2e, 6)
-        calculation.energy_co2e = round(energy_co2e, 6)
-        calculation.transport_co2e = round(transport_co2e, 6)
-        calculation.calculation_time_ms = elapsed_ms
-        calculation.calculation_method = "SQL_DirectCalculation"
-
-        # Store detailed breakdown in JSON field
-        calculation.breakdown = breakdown
-
-        db_session.commit()
+        with CALCULATION_PHASE_DURATION.time(phase="persist"):
+            # Update calculation record with results
+            apply_calculation_results(calculation, totals, elapsed_ms)
+            db_session.commit()
+        CALCULATIONS.inc(status="completed")
 
         logger.info(
             f"Calculation {calculation_id} completed: "
-            f"{total_co2e:.3f} kg CO2e in {elapsed_ms}ms"
+            f"{totals['total_co2e']:.3f} kg CO2e in {elapsed_ms}ms"
         )
 
     except ValueError as e:
         # Product not found or validation error
         logger.error(f"Calculation {calculation_id} validation error: {e}")
 
-        calculation = db_session.query(PCFCalculation).filter_by(id=calculation_id).first()
+        CALCULATIONS.inc(status="failed")
+        calculation = db_session.scalars(calculation_by_id(calculation_id)).first()
         if calculation:
-            calculation.status = "failed"
-            if not calculation.calculation_metadata:
-                calculation.calculation_metadata = {}
-            calculation.calculation_metadata["error_message"] = str(e)
+            mark_calculation_failed(calculation, str(e))
             db_session.commit()
 
     except Exception as e:
         # Unexpected error
         logger.error(f"Calculation {calculation_id} failed with error: {e}", exc_info=True)
 
-        calculation = db_session.query(PCFCalculation).filter_by(id=calculation_id).first()
+        CALCULATIONS.inc(status="failed")
+        calculation = db_session.scalars(calculation_by_id(calculation_id)).first()
         if calculation:
-            calculation.status = "failed"
-            if not calculation.calculation_metadata:
-                calculation.calculation_metadata = {}
-            calculation.calculation_metadata["error_message"] = f"Calculation error: {str(e)}"
+            mark_calculation_failed(calculation, f"Calculation error: {str(e)}")
             db_session.commit()
 
     finally:
         db_session.close()
 
 
+async def execute_calculation_async(
+    calculation_id: str,
+    product_id: str,
+    calculation_type: str,
+    session_factory=None,
+):
+    """
+    Background task: async variant of execute_calculation.
+
+    Same lifecycle and results as execute_calculation, but all queries run
+    on an AsyncSession so the event loop is never blocked on the database.
+
+    Args:
+        calculation_id: UUID of calculation record
+        product_id: UUID of product to calculate
+        calculation_type: Type of calculation
+        session_factory: Async session factory (defaults to get_async_session)
+    """
+    if session_factory is None:
+        from backend.database.connection import get_async_session
+        session_factory = get_async_session
+
+    start_time = time.time()
+
+    async with session_factory() as db_session:
+        try:
+            calculation = await db_session.get(PCFCalculation, calculation_id)
+
+            if not calculation:
+                logger.error(f"Calculation {calculation_id} not found in database")
+                return
+
+            calculation.status = "in_progress"
+            await db_session.commit()
+
+            logger.info(f"Starting calculation {calculation_id} for product {product_id}")
+
+            with CALCULATION_PHASE_DURATION.time(phase="bom_fetch"):
+                product = await db_session.get(Product, product_id)
+
+                if not product:
+                    raise ValueError(f"Product {product_id} not found")
+
+                result = await db_session.execute(
+                    select(BillOfMaterials, EmissionFactor, Product)
+                    .join(Product, Product.id == BillOfMaterials.child_product_id)
+                    .outerjoin(EmissionFactor, EmissionFactor.id == BillOfMaterials.emission_factor_id)
+                    .where(BillOfMaterials.parent_product_id == product_id)
+                )
+                bom_rows = result.all()
+
+            with CALCULATION_PHASE_DURATION.time(phase="ef_resolution"):
+                fallback_names = unmatched_factor_names(bom_rows)
+                ef_by_name = {}
+                if fallback_names:
+                    factors = await db_session.scalars(
+                        select(EmissionFactor).where(EmissionFactor.activity_name.in_(fallback_names))
+                    )
+                    ef_by_name = {ef.activity_name: ef for ef in factors}
+
+            with CALCULATION_PHASE_DURATION.time(phase="compute"):
+                totals = compute_calculation_totals(bom_rows, ef_by_name)
+            elapsed_ms = int((time.time() - start_time) * 1000)
+
+            with CALCULATION_PHASE_DURATION.time(phase="persist"):
+                apply_calculation_results(calculation, totals, elapsed_ms)
+                await db_session.commit()
+            CALCULATIONS.inc(status="completed")
+
+            logger.info(
+                f"Calculation {calculation_id} completed: "
+                f"{totals['total_co2e']:.3f} kg CO2e in {elapsed_ms}ms"
+            )
+
+        except Exception as e:
+            if isinstance(e, ValueError):
+                logger.error(f"Calculation {calculation_id} validation error: {e}")
+                error_message = str(e)
+            else:
+                logger.error(f"Calculation {calculation_id} failed with error: {e}", exc_info=True)
+                error_message = f"Calculation error: {str(e)}"
+
+            CALCULATIONS.inc(status="failed")
+            await db_session.rollback()
+            calculation = await db_session.get(PCFCalculation, calculation_id)
+            if calculation:
+                mark_calculation_failed(calculation, error_message)
+                await db_session.commit()
+
+
 # ============================================================================
 # API Endpoints
 # ============================================================================
@@ -265,14 +522,7 @@ def start_calculation(
 
     # Create initial calculation record
     try:
-        calculation = PCFCalculation(
-            id=calc_id,
-            product_id=request.product_id,
-            calculation_type=request.calculation_type,  # Use enum value
-            status="pending",
-            total_co2e_kg=0.0,  # Placeholder until calculation completes
-            created_at=datetime.now(UTC)
-        )
+        calculation = new_calculation(calc_id, request)
 
         db.add(calculation)
         db.commit()
@@ -310,7 +560,7 @@ def start_calculation(
 )
 def get_calculation_status(
     calculation_id: str,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: Optional[User] = Depends(get_optional_user),
 ) -> CalculationStatusResponse:
     """
@@ -355,7 +605,7 @@ def get_calculation_status(
     }
     """
     # Query calculation record
-    calculation = db.query(PCFCalculation).filter_by(id=calculation_id).first()
+    calculation = db.scalars(calculation_by_id(calculation_id)).first()
 
     if not calculation:
         raise HTTPException(
@@ -363,42 +613,83 @@ def get_calculation_status(
             detail=f"Calculation not found"
         )
 
-    # Map internal status values to frontend-compatible values
-    # TASK-API-P7-027: Ensure 'running' and 'processing' are mapped to 'in_progress'
-    status_value = calculation.status
-    if status_value in ("running", "processing"):
-        status_value = "in_progress"
+    return build_calculation_status_response(calculation)
 
-    # Build response based on status
-    response_data = {
-        "calculation_id": calculation.id,
-        "status": status_value,
-        "product_id": calculation.product_id,
-        "created_at": calculation.created_at.isoformat() if calculation.created_at else None
-    }
 
-    # Add result fields if completed
-    if calculation.status == "completed":
-        response_data.update({
-            "total_co2e_kg": float(calculation.total_co2e_kg) if calculation.total_co2e_kg else 0.0,
-            "materials_co2e": float(calculation.materials_co2e) if calculation.materials_co2e else None,
-            "energy_co2e": float(calculation.energy_co2e) if calculation.energy_co2e else None,
-            "transport_co2e": float(calculation.transport_co2e) if calculation.transport_co2e else None,
-            "calculation_time_ms": calculation.calculation_time_ms,
-            # TASK-FE-P8-003: Include breakdown for expandable items in frontend
-            "breakdown": calculation.breakdown if calculation.breakdown else None
-        })
+# ============================================================================
+# Async Endpoints (ASYNC_ROUTES)
+# ============================================================================
 
-    # Add error message if failed
-    if calculation.status == "failed":
-        error_msg = None
-        if calculation.calculation_metadata:
-            error_msg = calculation.calculation_metadata.get("error_message")
-        if not error_msg and calculation.input_data:
-            error_msg = calculation.input_data.get("error_message")
+@async_router.post(
+    "/calculate",
+    response_model=CalculationStartResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Start PCF calculation",
+    description="Start async calculation and return immediately with calculation_id for polling"
+)
+async def start_calculation_async(
+    request: CalculationRequest,
+    background_tasks: BackgroundTasks,
+    calculation_service: CalculationService = Depends(get_calculation_service),
+    current_user: Optional[User] = Depends(get_optional_user_async),
+) -> CalculationStartResponse:
+    """Async variant of start_calculation (queues execute_calculation_async)."""
+    logger.info(
+        f"Received calculation request: "
+        f"product_id={request.product_id}, type={request.calculation_type}"
+    )
+
+    try:
+        result = await calculation_service.start_calculation(
+            request.product_id, request.calculation_type
+        )
+    except ProductNotFoundError:
+        logger.warning(f"Calculation requested for nonexistent product: {request.product_id}")
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Product not found: {request.product_id}"
+        )
+    except Exception as e:
+        logger.error(f"Failed to create calculation record: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to start calculation"
+        )
+
+    background_tasks.add_task(
+        execute_calculation_async,
+        result.id,
+        request.product_id,
+        request.calculation_type,
+    )
 
-        response_data["error_message"] = error_msg or "Calculation failed"
+    logger.info(f"Calculation {result.id} queued for background processing")
 
-    logger.debug(f"Returning status for calculation {calculation_id}: {status_value}")
+    return CalculationStartResponse(
+        calculation_id=result.id,
+        status="in_progress"
+    )
 
-    return CalculationStatusResponse(**response_data)
+
+@async_router.get(
+    "/calculations/{calculation_id}",
+    response_model=CalculationStatusResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Get calculation status",
+    description="Poll for calculation status and results"
+)
+async def get_calculation_status_async(
+    calculation_id: str,
+    calculation_service: CalculationService = Depends(get_calculation_service),
+    current_user: Optional[User] = Depends(get_optional_user_async),
+) -> CalculationStatusResponse:
+    """Async variant of get_calculation_status (CalculationService.get_calculation)."""
+    try:
+        calculation = await calculation_service.get_calculation(calculation_id)
+    except CalculationNotFoundError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Calculation not found"
+        )
+
+    return build_calculation_status_response(calculation)
@@ -8,26 +8,52 @@ Endpoints:
 - POST /api/v1/emission-factors - Create emission factor (admin role)
 - PUT /api/v1/emission-factors/{id} - Update emission factor (admin role)
 - DELETE /api/v1/emission-factors/{id} - Delete emission factor (admin role)
+- GET /api/v1/emission-factors/suggest/{name} - Suggest factor for a component
+- POST /api/v1/emission-factors/suggest - Suggest factors for many components
+
+With ASYNC_ROUTES enabled, `async_router` serves the list endpoint from an
+async handler on AsyncSession (see main.py); both handlers run the same
+statements from _list_statements().
 """
 
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from decimal import Decimal
 from fastapi import APIRouter, Depends, HTTPException, Query, Path, status
 from sqlalchemy.orm import Session
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import or_
+from sqlalchemy import Select, func, or_, select
 
 from backend.database.connection import get_db, get_async_db
+from backend.database.trigram import (
+    partial_match_order,
+    trigram_available,
+    trigram_available_async,
+)
 from backend.models import EmissionFactor, DataSource
 from backend.models.user import User
-from backend.auth.dependencies import require_admin, get_optional_user
+from backend.auth.dependencies import (
+    require_admin,
+    get_optional_user,
+    get_optional_user_async,
+)
 from backend.services.data_ingestion.emission_factor_mapper import EmissionFactorMapper
+from backend.services.data_ingestion.emission_factor_index import (
+    get_shared_index,
+    invalidate_shared_index,
+)
+from backend.services.data_ingestion.factor_resolution_cache import (
+    get_resolution_cache,
+)
+from backend.services.coverage_rollups import invalidate_coverage_rollups
 from backend.schemas import (
     EmissionFactorListItemResponse,
     EmissionFactorListResponse,
     EmissionFactorCreateRequest,
     EmissionFactorCreateResponse,
     EmissionFactorUpdateRequest,
+    EmissionFactorSuggestBatchRequest,
+    EmissionFactorSuggestBatchResponse,
+    EmissionFactorSuggestResult,
     DataSourceAttribution,
     AttributionResponse,
 )
@@ -39,6 +65,74 @@ from backend.schemas import (
 
 router = APIRouter(prefix="/api/v1", tags=["emission-factors"])
 
+# Async (AsyncSession) handlers for the same endpoints, used when
+# settings.ASYNC_ROUTES is enabled
+async_router = APIRouter(prefix="/api/v1", tags=["emission-factors"])
+
+
+# ============================================================================
+# Helpers
+# ============================================================================
+
+def _invalidate_factor_caches(db: Session) -> None:
+    """Drop factor index, resolution decisions and coverage rollups after writes."""
+    invalidate_shared_index()
+    get_resolution_cache().invalidate()
+    invalidate_coverage_rollups(db)
+
+
+def _list_filters(
+    data_source: Optional[str],
+    geography: Optional[str],
+    unit: Optional[str],
+    activity_name: Optional[str],
+) -> list:
+    """WHERE conditions for the list endpoint's optional filters."""
+    conditions = []
+    if data_source is not None:
+        conditions.append(EmissionFactor.data_source == data_source)
+
+    if geography is not None:
+        conditions.append(EmissionFactor.geography == geography)
+
+    if unit is not None:
+        conditions.append(EmissionFactor.unit == unit)
+
+    if activity_name is not None:
+        # Case-insensitive partial match
+        conditions.append(EmissionFactor.activity_name.ilike(f"%{activity_name}%"))
+
+    return conditions
+
+
+def _list_statements(
+    limit: int,
+    offset: int,
+    data_source: Optional[str],
+    geography: Optional[str],
+    unit: Optional[str],
+    activity_name: Optional[str],
+    use_trigram: bool,
+) -> Tuple[Select, Select]:
+    """Count and page statements for the list endpoint (sync and async)."""
+    conditions = _list_filters(data_source, geography, unit, activity_name)
+
+    count_stmt = select(func.count(EmissionFactor.id)).where(*conditions)
+    page_stmt = select(EmissionFactor).where(*conditions)
+
+    # Rank partial matches best-first (pg_trgm similarity when available)
+    if activity_name is not None:
+        page_stmt = page_stmt.order_by(
+            *partial_match_order(
+                EmissionFactor.activity_name,
+                activity_name,
+                use_trigram,
+            ),
+            EmissionFactor.id,
+        )
+
+    return count_stmt, page_stmt.offset(offset).limit(limit)
+
 
 # ============================================================================
 # API Endpoints
@@ -70,7 +164,8 @@ def list_emission_factors(
     - data_source: Filter by data source (exact match)
     - geography: Filter by geography (exact match)
     - unit: Filter by unit (exact match)
-    - activity_name: Filter by activity name (case-insensitive partial match)
+    - activity_name: Filter by activity name (case-insensitive partial match,
+      results ranked best match first)
 
     Returns:
     - items: List of emission factors
@@ -78,50 +173,54 @@ def list_emission_factors(
     - limit: Applied limit
     - offset: Applied offset
     """
-    # Build query
-    query = db.query(EmissionFactor)
+    count_stmt, page_stmt = _list_statements(
+        limit, offset, data_source, geography, unit, activity_name,
+        use_trigram=activity_name is not None and trigram_available(db),
+    )
 
-    # Apply filters
-    if data_source is not None:
-        query = query.filter(EmissionFactor.data_source == data_source)
+    # Total count (without pagination), then the requested page
+    total = db.scalar(count_stmt)
+    emission_factors = db.scalars(page_stmt).all()
 
-    if geography is not None:
-        query = query.filter(EmissionFactor.geography == geography)
-
-    if unit is not None:
-        query = query.filter(EmissionFactor.unit == unit)
+    # Convert emission factors to response format
+    items = [_suggestion_response(ef) for ef in emission_factors]
 
-    if activity_name is not None:
-        # Case-insensitive partial match
-        query = query.filter(
-            EmissionFactor.activity_name.ilike(f"%{activity_name}%")
-        )
+    return EmissionFactorListResponse(
+        items=items,
+        total=total,
+        limit=limit,
+        offset=offset
+    )
 
-    # Get total count before pagination
-    total = query.count()
 
-    # Apply pagination
-    emission_factors = query.offset(offset).limit(limit).all()
+@async_router.get(
+    "/emission-factors",
+    response_model=EmissionFactorListResponse,
+    status_code=status.HTTP_200_OK,
+    summary="List emission factors",
+    description="Get paginated list of emission factors with optional filtering"
+)
+async def list_emission_factors_async(
+    limit: int = Query(100, ge=1, le=1000, description="Maximum number of items to return"),
+    offset: int = Query(0, ge=0, description="Number of items to skip"),
+    data_source: Optional[str] = Query(None, description="Filter by data source (EPA, DEFRA, etc.)"),
+    geography: Optional[str] = Query(None, description="Filter by geography (GLO, US, EU, etc.)"),
+    unit: Optional[str] = Query(None, description="Filter by unit (kg, L, kWh, etc.)"),
+    activity_name: Optional[str] = Query(None, description="Filter by activity name (case-insensitive partial match)"),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Optional[User] = Depends(get_optional_user_async),
+) -> EmissionFactorListResponse:
+    """Async variant of list_emission_factors (same statements and response)."""
+    count_stmt, page_stmt = _list_statements(
+        limit, offset, data_source, geography, unit, activity_name,
+        use_trigram=activity_name is not None and await trigram_available_async(db),
+    )
 
-    # Convert emission factors to response format
-    items = [
-        EmissionFactorListItemResponse(
-            id=ef.id,
-            activity_name=ef.activity_name,
-            category=ef.category,
-            co2e_factor=float(ef.co2e_factor),
-            unit=ef.unit,
-            data_source=ef.data_source,
-            geography=ef.geography,
-            reference_year=ef.reference_year,
-            data_quality_rating=float(ef.data_quality_rating) if ef.data_quality_rating else None,
-            created_at=ef.created_at.isoformat() if ef.created_at else ""
-        )
-        for ef in emission_factors
-    ]
+    total = await db.scalar(count_stmt)
+    emission_factors = await db.scalars(page_stmt)
 
     return EmissionFactorListResponse(
-        items=items,
+        items=[_suggestion_response(ef) for ef in emission_factors],
         total=total,
         limit=limit,
         offset=offset
@@ -200,6 +299,7 @@ def create_emission_factor(
 
     db.add(new_emission_factor)
     db.commit()
+    _invalidate_factor_caches(db)
     db.refresh(new_emission_factor)
 
     return EmissionFactorCreateResponse(
@@ -272,6 +372,7 @@ def update_emission_factor(
                     setattr(emission_factor, field, value)
 
     db.commit()
+    _invalidate_factor_caches(db)
     db.refresh(emission_factor)
 
     return EmissionFactorCreateResponse(
@@ -327,6 +428,7 @@ def delete_emission_factor(
 
     db.delete(emission_factor)
     db.commit()
+    _invalidate_factor_caches(db)
 
     return None
 
@@ -369,7 +471,8 @@ async def suggest_emission_factor(
     Returns:
     - Matching emission factor or null if not found
     """
-    mapper = EmissionFactorMapper(db=db)
+    mapper = EmissionFactorMapper(db=db, resolution_cache=get_resolution_cache())
+    mapper.use_index(await get_shared_index(db))
 
     factor = await mapper.get_factor_for_component(
         component_name=component_name,
@@ -380,6 +483,62 @@ async def suggest_emission_factor(
     if not factor:
         return None
 
+    return _suggestion_response(factor)
+
+
+@router.post(
+    "/emission-factors/suggest",
+    response_model=EmissionFactorSuggestBatchResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Suggest emission factors for many components",
+    description="Resolve a batch of BOM component names to emission factors in one request"
+)
+async def suggest_emission_factors_batch(
+    request: EmissionFactorSuggestBatchRequest,
+    db: AsyncSession = Depends(get_async_db)
+) -> EmissionFactorSuggestBatchResponse:
+    """
+    Get suggested emission factors for a batch of components.
+
+    Applies the same matching rules as the single-component endpoint, but
+    resolves every component against the shared in-memory factor index, so
+    the request costs no per-component database queries.
+
+    Request Body:
+    - components: List of {component_name, unit (default "kg"), geography}
+
+    Returns:
+    - One result per requested component, in request order
+    """
+    mapper = EmissionFactorMapper(db=db, resolution_cache=get_resolution_cache())
+    mapper.use_index(await get_shared_index(db))
+
+    keys = [
+        (item.component_name, item.unit, item.geography)
+        for item in request.components
+    ]
+    factors = await mapper.get_factors_for_components(keys)
+
+    results = []
+    for component_name, unit, geography in keys:
+        factor = factors[(component_name, unit, geography)]
+        results.append(EmissionFactorSuggestResult(
+            component_name=component_name,
+            unit=unit,
+            geography=geography,
+            emission_factor=_suggestion_response(factor) if factor else None,
+        ))
+    matched = sum(1 for result in results if result.emission_factor)
+
+    return EmissionFactorSuggestBatchResponse(
+        results=results,
+        matched_count=matched,
+        unmatched_count=len(results) - matched,
+    )
+
+
+def _suggestion_response(factor: EmissionFactor) -> EmissionFactorListItemResponse:
+    """Convert a suggested EmissionFactor to its list item response."""
     return EmissionFactorListItemResponse(
         id=factor.id,
         activity_name=factor.activity_name,
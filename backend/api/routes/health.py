@@ -3,14 +3,27 @@ Health check endpoints for PCF Calculator API.
 
 TASK-BE-P5-001: Celery + Redis Setup
 TASK-DB-P9-001: Database connection pool health check
+Read replica health is included in /health/db when replicas are configured.
+Continuous pool metrics (checkout wait and per-endpoint hold time
+histograms, overflow events, timeouts, adaptive sizing) are summarised in
+/health/db and served in full by /health/db/pool.
 
 This module provides health check endpoints for monitoring:
 - celery_health: Check Celery worker health and broker connectivity
 - database_health: Check database connection pool status
+- readiness: Startup readiness probe; "serving" is independent of the
+  lazily initialized legacy Brightway2 engine, reported alongside
+
+/health/ready is public (load balancers and orchestrators probe it). The
+Celery, database and pool endpoints expose internals and require an admin
+token.
 
 Usage:
-    GET /api/v1/health/celery
-    GET /api/v1/health/db
+    GET /health/ready
+    GET /health/ready?legacy=true
+    GET /health/celery
+    GET /health/db
+    GET /health/db/pool
 
     Response (healthy):
     {
@@ -26,18 +39,86 @@ Usage:
     }
 """
 
+import asyncio
 from typing import Dict, Any
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends, Query, Request, Response, status as http_status
+from sqlalchemy import text
 
+from backend.auth.dependencies import require_admin
+from backend.calculator.pcf_calculator import get_legacy_engine_status
 from backend.core.celery_app import celery_app
-from backend.database.connection import get_pool_status, POOL_CONFIG
+from backend.database.connection import (
+    engine,
+    get_pool_metrics,
+    get_pool_status,
+    get_replica_status,
+    POOL_CONFIG,
+)
 
 
 router = APIRouter(prefix="/health", tags=["health"])
 
 
-@router.get("/celery")
+def _check_database() -> None:
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+
+
+@router.get("/ready")
+async def readiness(
+    request: Request,
+    response: Response,
+    legacy: bool = Query(False, description="Also require the legacy Brightway2 engine to be warm"),
+) -> Dict[str, Any]:
+    """
+    Startup readiness probe.
+
+    The app is "serving" once the startup event has finished and the
+    primary database answers. The /calculate path does not need Brightway2,
+    so the legacy engine (initialized on first legacy use, or in the
+    background with BRIGHTWAY_EAGER_INIT) is reported separately and only
+    gates readiness with ?legacy=true.
+
+    Args:
+        legacy: Require the legacy engine to be warm as well
+
+    Returns:
+        dict: Readiness including:
+            - status: "serving" or "starting" (or "unavailable" when the
+              database check fails)
+            - ready: Whether the requested level is reached (HTTP 200,
+              otherwise 503)
+            - database: "ok" or the error message
+            - legacy_engine: status ("cold", "warming", "warm", "failed",
+              "unavailable"), error and init_seconds
+    """
+    startup_complete = getattr(request.app.state, "startup_complete", False)
+    try:
+        await asyncio.to_thread(_check_database)
+        database = "ok"
+    except Exception as e:
+        database = str(e)
+
+    if database != "ok":
+        serving_status = "unavailable"
+    else:
+        serving_status = "serving" if startup_complete else "starting"
+
+    legacy_engine = get_legacy_engine_status()
+    ready = serving_status == "serving" and (not legacy or legacy_engine["status"] == "warm")
+    if not ready:
+        response.status_code = http_status.HTTP_503_SERVICE_UNAVAILABLE
+
+    return {
+        "status": serving_status,
+        "ready": ready,
+        "database": database,
+        "legacy_engine": legacy_engine,
+    }
+
+
+@router.get("/celery", dependencies=[Depends(require_admin)])
 async def celery_health() -> Dict[str, Any]:
     """
     Check Celery worker health.
@@ -54,8 +135,8 @@ async def celery_health() -> Dict[str, Any]:
             - error: Exception message (if error occurred)
     """
     try:
-        # Ping workers with 1 second timeout
-        ping_response = celery_app.control.ping(timeout=1.0)
+        # Ping workers with 1 second timeout (blocking, so off the event loop)
+        ping_response = await asyncio.to_thread(celery_app.control.ping, timeout=1.0)
 
         if not ping_response:
             return {
@@ -76,7 +157,28 @@ async def celery_health() -> Dict[str, Any]:
         }
 
 
-@router.get("/db")
+def _pool_metrics_summary(metrics: Dict[str, Any]) -> Dict[str, Any]:
+    """Condense get_pool_metrics() for /health/db (no histogram buckets)."""
+    primary = metrics["primary"]
+    wait = primary["wait_seconds"]
+    summary = {
+        "checkouts": primary["checkouts"],
+        "timeouts": primary["timeouts"],
+        "overflow_events": primary["overflow_events"],
+        "wait_seconds": {"p50": wait["p50"], "p95": wait["p95"], "p99": wait["p99"]},
+        "recent": primary["recent"],
+    }
+    adaptive = metrics["adaptive"]
+    if adaptive is not None:
+        summary["adaptive"] = {
+            "pool_size": adaptive["pool_size"],
+            "max_overflow": adaptive["max_overflow"],
+            "adjustments": len(adaptive["adjustments"]),
+        }
+    return summary
+
+
+@router.get("/db", dependencies=[Depends(require_admin)])
 async def database_health() -> Dict[str, Any]:
     """
     Check database connection pool health.
@@ -85,6 +187,8 @@ async def database_health() -> Dict[str, Any]:
     - status: "healthy", "degraded", or "unhealthy"
     - pool: Connection pool metrics
     - config: Pool configuration (for reference)
+    - replicas: Read replica health (empty when none are configured)
+    - metrics: Checkout wait percentiles, overflow events and timeouts
 
     Health Criteria:
     - healthy: checked_out < pool_size + 10, overflow < 10
@@ -98,6 +202,8 @@ async def database_health() -> Dict[str, Any]:
             - status: "healthy", "degraded", or "unhealthy"
             - pool: Current pool metrics
             - config: Pool configuration values
+            - replicas: Per-replica url, healthy and checked_seconds_ago
+            - metrics: Pool metrics summary (see /health/db/pool for histograms)
             - error: Exception message (if error occurred)
     """
     try:
@@ -132,7 +238,9 @@ async def database_health() -> Dict[str, Any]:
                 "pool_timeout": POOL_CONFIG["pool_timeout"],
                 "pool_recycle": POOL_CONFIG["pool_recycle"],
                 "pool_pre_ping": POOL_CONFIG["pool_pre_ping"],
-            }
+            },
+            "replicas": get_replica_status(),
+            "metrics": _pool_metrics_summary(get_pool_metrics()),
         }
 
     except Exception as e:
@@ -140,3 +248,24 @@ async def database_health() -> Dict[str, Any]:
             "status": "unhealthy",
             "error": str(e)
         }
+
+
+@router.get("/db/pool", dependencies=[Depends(require_admin)])
+async def database_pool_metrics() -> Dict[str, Any]:
+    """
+    Detailed connection pool metrics.
+
+    Histograms use cumulative bucket counts keyed by upper bound in
+    seconds ("+Inf" holds the total), with p50/p95/p99 estimated as the
+    upper bound of the bucket containing the quantile.
+
+    Returns:
+        dict: Pool metrics including:
+            - primary: Sync pool checkouts, timeouts, overflow_events,
+              peak_checked_out, wait_seconds histogram, hold_seconds
+              histograms per route template, and recent (last minute)
+              wait p95 and timeouts
+            - async: The same for the async (asyncpg) pool
+            - adaptive: Adaptive sizing state, or None when disabled
+    """
+    return get_pool_metrics()
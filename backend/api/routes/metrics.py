@@ -0,0 +1,141 @@
+"""
+Prometheus metrics endpoint.
+
+Endpoints:
+- GET /metrics - Application and connection pool metrics in the Prometheus
+  text exposition format
+
+Serves backend.utils.metrics.REGISTRY (request latency per route,
+in-flight requests, calculation phases, cache hit ratios, rate limiter
+rejections, ingestion throughput) plus the connection pool metrics
+recorded by backend.database.pool_metrics. Values are per process.
+
+Access:
+    The pool and per-route series are internal, like /health/db/pool, so
+    the endpoint is not public. With METRICS_TOKEN configured, scrapes
+    must send it as a Bearer token; without it, an admin JWT is required.
+
+Usage:
+    scrape_configs:
+      - job_name: pcf-calculator
+        authorization:
+          credentials_file: /etc/prometheus/pcf_metrics_token
+        static_configs:
+          - targets: ["api:8000"]
+"""
+
+import hmac
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.responses import Response
+from fastapi.security import HTTPAuthorizationCredentials
+from sqlalchemy.orm import Session
+
+from backend.auth.dependencies import (
+    bearer_scheme,
+    get_current_active_user,
+    get_current_user,
+    require_admin,
+)
+from backend.config import settings
+from backend.database import connection
+from backend.database.connection import get_db
+from backend.utils.metrics import (
+    CONTENT_TYPE,
+    Counter,
+    Gauge,
+    HistogramFamily,
+    REGISTRY,
+)
+
+
+router = APIRouter(tags=["monitoring"])
+
+
+def _pool_collector() -> List:
+    """Export PoolMetrics for the sync ("primary") and async pools."""
+    wait = HistogramFamily(
+        "pcf_db_pool_checkout_wait_seconds",
+        "Time to obtain a usable pooled connection",
+        ("pool",),
+    )
+    hold = HistogramFamily(
+        "pcf_db_pool_hold_seconds",
+        "Time a connection was held, by route template",
+        ("pool", "route"),
+    )
+    timeouts = Counter(
+        "pcf_db_pool_timeouts_total", "Checkouts failed with pool_timeout", ("pool",)
+    )
+    overflow = Counter(
+        "pcf_db_pool_overflow_events_total", "Connections opened beyond pool_size", ("pool",)
+    )
+    size = Gauge("pcf_db_pool_size", "Configured (or adaptively tuned) pool_size", ("pool",))
+    checked_out = Gauge("pcf_db_pool_checked_out", "Connections currently checked out", ("pool",))
+
+    pools = [("primary", connection.pool_metrics, connection.engine.pool)]
+    if connection._async_engine is not None:
+        pools.append(("async", connection.async_pool_metrics, connection._async_engine.pool))
+
+    for name, metrics, pool in pools:
+        wait.add(metrics.wait, pool=name)
+        for route, histogram in sorted(metrics.hold.items()):
+            hold.add(histogram, pool=name, route=route)
+        timeouts.inc(metrics.timeouts, pool=name)
+        overflow.inc(metrics.overflow_events, pool=name)
+        size.set(pool.size(), pool=name)
+        checked_out.set(pool.checkedout(), pool=name)
+
+    return [wait, hold, timeouts, overflow, size, checked_out]
+
+
+REGISTRY.add_collector(_pool_collector)
+
+
+async def require_metrics_access(
+    request: Request,
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(bearer_scheme),
+    db: Session = Depends(get_db),
+) -> None:
+    """
+    FastAPI dependency: allow configured scrapers or admins.
+
+    Args:
+        request: Current request
+        credentials: Bearer credentials (injected by FastAPI)
+        db: Database session, used only for the admin fallback
+
+    Raises:
+        HTTPException: 401 if the scrape token is missing or wrong (or
+            no valid JWT is sent), 403 if the JWT user is not an admin
+    """
+    token = settings.METRICS_TOKEN
+    if token:
+        if credentials is None or not hmac.compare_digest(
+            credentials.credentials.encode(), token.encode()
+        ):
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid metrics token",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+        return
+
+    user = await get_current_user(request, credentials, db)
+    await require_admin(await get_current_active_user(user))
+
+
+@router.get(
+    "/metrics",
+    include_in_schema=False,
+    dependencies=[Depends(require_metrics_access)],
+)
+async def metrics() -> Response:
+    """
+    Render all metrics in the Prometheus text exposition format.
+
+    Returns:
+        Response: text/plain exposition (version 0.0.4)
+    """
+    return Response(content=REGISTRY.render(), media_type=CONTENT_TYPE)
@@ -12,7 +12,7 @@ from fastapi import APIRouter, Depends, Query, status
 from sqlalchemy.orm import Session
 from sqlalchemy import func
 
-from backend.database.connection import get_db
+from backend.database.connection import get_read_db
 from backend.models import Product, ProductCategory
 from backend.models.user import User
 from backend.auth.dependencies import get_optional_user
@@ -129,7 +129,7 @@ def get_categories(
     include_product_count: bool = Query(False, description="Include count of products in each category"),
     max_depth: int = Query(10, ge=1, le=100, description="Maximum depth of category tree to return"),
     industry: Optional[str] = Query(None, description="Filter categories by industry sector"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: Optional[User] = Depends(get_optional_user),
 ):
     """Retrieve hierarchical category tree."""
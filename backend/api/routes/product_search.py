@@ -3,6 +3,10 @@ Product Search API Routes (split from products.py for ARCH-009).
 
 Endpoints:
 - GET /api/v1/products/search - Full-text search with multi-criteria filtering
+
+The search and count statements are lambda statements: SQLAlchemy caches
+each filter combination's construction and compiled SQL, and later
+requests only bind new parameter values.
 """
 
 from typing import List, Optional, Tuple, Any, Dict
@@ -11,10 +15,11 @@ import re
 import logging
 
 from fastapi import APIRouter, Depends, Query, status
-from sqlalchemy.orm import Session, joinedload, Query as SQLAQuery
-from sqlalchemy import or_, func, exists, select, not_
+from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import or_, func, exists, lambda_stmt, select, not_
+from sqlalchemy.sql.lambdas import StatementLambdaElement
 
-from backend.database.connection import get_db
+from backend.database.connection import get_read_db
 from backend.models import Product, BillOfMaterials, ProductCategory
 from backend.models.user import User
 from backend.auth.dependencies import get_optional_user
@@ -165,15 +170,14 @@ def _validate_search_params(
     )
 
 
-def _build_search_query(db: Session, params: ValidatedParams) -> SQLAQuery:
-    """Build SQLAlchemy query with filters from validated parameters."""
-    base_query = db.query(Product).options(
-        joinedload(Product.product_category)
-    )
-
+def _apply_search_filters(
+    stmt: StatementLambdaElement,
+    params: ValidatedParams,
+) -> StatementLambdaElement:
+    """Add WHERE criteria for the validated parameters to a lambda statement."""
     if params.query:
         query_lower = f"%{params.query.lower()}%"
-        base_query = base_query.filter(
+        stmt += lambda s: s.where(
             or_(
                 func.lower(Product.name).like(query_lower),
                 func.lower(Product.description).like(query_lower),
@@ -183,45 +187,62 @@ def _build_search_query(db: Session, params: ValidatedParams) -> SQLAQuery:
         )
 
     if params.category_id is not None:
-        base_query = base_query.filter(Product.category_id == params.category_id)
+        category_id = params.category_id
+        stmt += lambda s: s.where(Product.category_id == category_id)
 
     if params.industry is not None:
-        base_query = base_query.filter(
+        industry = params.industry
+        industry_lower = params.industry.lower()
+        stmt += lambda s: s.where(
             or_(
                 exists(
                     select(ProductCategory.id).where(
                         ProductCategory.id == Product.category_id,
-                        ProductCategory.industry_sector == params.industry
+                        ProductCategory.industry_sector == industry
                     )
                 ),
-                func.lower(Product.category) == params.industry.lower()
+                func.lower(Product.category) == industry_lower
             )
         )
 
     if params.manufacturer is not None:
         manufacturer_pattern = f"%{params.manufacturer}%"
-        base_query = base_query.filter(
+        stmt += lambda s: s.where(
             func.lower(Product.manufacturer).like(func.lower(manufacturer_pattern))
         )
 
     if params.country_of_origin is not None:
-        base_query = base_query.filter(Product.country_of_origin == params.country_of_origin)
+        country_of_origin = params.country_of_origin
+        stmt += lambda s: s.where(Product.country_of_origin == country_of_origin)
 
     if params.is_finished_product is not None:
-        base_query = base_query.filter(Product.is_finished_product == params.is_finished_product)
+        is_finished_product = params.is_finished_product
+        stmt += lambda s: s.where(Product.is_finished_product == is_finished_product)
 
-    has_bom_subquery = exists(
-        select(BillOfMaterials.id).where(
-            BillOfMaterials.parent_product_id == Product.id
-        )
-    )
     if params.has_bom is True:
-        base_query = base_query.filter(has_bom_subquery)
+        stmt += lambda s: s.where(
+            exists(select(BillOfMaterials.id).where(BillOfMaterials.parent_product_id == Product.id))
+        )
     elif params.has_bom is False:
-        base_query = base_query.filter(not_(has_bom_subquery))
+        stmt += lambda s: s.where(
+            not_(exists(select(BillOfMaterials.id).where(BillOfMaterials.parent_product_id == Product.id)))
+        )
+
+    return stmt
+
+
+def _build_search_query(params: ValidatedParams) -> StatementLambdaElement:
+    """Build the cached, parameterized search statement (products by name)."""
+    stmt = lambda_stmt(lambda: select(Product).options(joinedload(Product.product_category)))
+    stmt = _apply_search_filters(stmt, params)
+    stmt += lambda s: s.order_by(Product.name)
+    return stmt
+
 
-    base_query = base_query.order_by(Product.name)
-    return base_query
+def _build_search_count(params: ValidatedParams) -> StatementLambdaElement:
+    """Build the cached, parameterized count statement for the same filters."""
+    stmt = lambda_stmt(lambda: select(func.count(Product.id)))
+    return _apply_search_filters(stmt, params)
 
 
 def _apply_relevance_scoring(
@@ -322,7 +343,7 @@ def search_products(
     has_bom: Optional[bool] = Query(None, description="Filter products with bill of materials entries"),
     limit: int = Query(50, ge=1, le=100, description="Number of results to return (1-100)"),
     offset: int = Query(0, ge=0, description="Number of results to skip"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: Optional[User] = Depends(get_optional_user),
 ):
     """Search products with full-text search and multi-criteria filtering."""
@@ -357,9 +378,10 @@ def search_products(
         return ProductSearchResponse(**cached_response)
 
     logger.debug(f"Cache miss for product search: {cache_key}")
-    db_query = _build_search_query(db, validated)
-    total = db_query.count()
-    products = db_query.offset(validated.offset).limit(validated.limit).all()
+    offset, limit = validated.offset, validated.limit
+    total = db.scalar(_build_search_count(validated))
+    page = _build_search_query(validated) + (lambda s: s.offset(offset).limit(limit))
+    products = db.scalars(page).all()
     scored = _apply_relevance_scoring(products, validated.query)
     response_dict = _format_search_results(scored, total, validated)
     cache_response_sync(cache_key, response_dict, PRODUCT_SEARCH_TTL)
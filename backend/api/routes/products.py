@@ -5,6 +5,10 @@ Endpoints:
 - GET /api/v1/products - List products with pagination and filtering
 - GET /api/v1/products/{product_id} - Get product details with BOM
 
+With ASYNC_ROUTES enabled, `async_router` serves both endpoints from
+async handlers backed by ProductService (see main.py); responses are
+identical.
+
 Search and categories endpoints moved to:
 - product_search.py (GET /api/v1/products/search)
 - product_categories.py (GET /api/v1/products/categories)
@@ -17,10 +21,14 @@ import logging
 from fastapi import APIRouter, Depends, Query, Path, status
 from sqlalchemy.orm import Session, joinedload
 
-from backend.database.connection import get_db
+from backend.database.connection import get_read_db
 from backend.models import Product, BillOfMaterials
 from backend.models.user import User
-from backend.auth.dependencies import get_optional_user
+from backend.auth.dependencies import get_optional_user, get_optional_user_async
+from backend.api.dependencies import get_product_service
+from backend.domain.entities.errors import ProductNotFoundError
+from backend.domain.entities.product import ProductWithBOM
+from backend.domain.services.product_service import ProductService
 from backend.api.utils.error_responses import create_error_response
 from backend.schemas import (
     BOMItemResponse,
@@ -29,6 +37,8 @@ from backend.schemas import (
     ProductListResponse,
 )
 from backend.utils.cache import (
+    cache_response,
+    get_cached_response,
     get_cached_response_sync,
     cache_response_sync,
     get_product_list_cache_key,
@@ -45,6 +55,10 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/v1", tags=["products"])
 
+# Async (AsyncSession) handlers for the same endpoints, used when
+# settings.ASYNC_ROUTES is enabled
+async_router = APIRouter(prefix="/api/v1", tags=["products"])
+
 
 # ============================================================================
 # Helper Functions
@@ -75,6 +89,96 @@ def is_valid_id_format(value: str) -> bool:
     return True
 
 
+def product_list_item(product) -> dict:
+    """Convert a Product (ORM row or domain entity) to its list item dict (cacheable JSON)."""
+    return {
+        "id": product.id,
+        "code": product.code,
+        "name": product.name,
+        "unit": product.unit,
+        "category": product.category,
+        "is_finished_product": product.is_finished_product,
+        "created_at": product.created_at.isoformat() if product.created_at else ""
+    }
+
+
+def product_detail_response(product: Product) -> ProductDetailResponse:
+    """Convert a Product with loaded BOM items to its detail response."""
+    bom_items = [
+        BOMItemResponse(
+            id=bom.id,
+            child_product_id=bom.child_product_id,
+            child_product_name=bom.child_product.name if bom.child_product else "Unknown",
+            quantity=float(bom.quantity),
+            unit=bom.unit,
+            notes=bom.notes,
+            emission_factor_id=bom.emission_factor_id,  # Stored in database
+        )
+        for bom in product.bom_items
+    ]
+
+    return ProductDetailResponse(
+        id=product.id,
+        code=product.code,
+        name=product.name,
+        description=product.description,
+        unit=product.unit,
+        category=product.category,
+        is_finished_product=product.is_finished_product,
+        bill_of_materials=bom_items,
+        created_at=product.created_at.isoformat() if product.created_at else ""
+    )
+
+
+def product_with_bom_response(product_with_bom: ProductWithBOM) -> ProductDetailResponse:
+    """Convert a domain ProductWithBOM to its detail response."""
+    product = product_with_bom.product
+    bom_items = [
+        BOMItemResponse(
+            id=item.id,
+            child_product_id=item.component_id,
+            child_product_name=item.component_name or "Unknown",
+            quantity=item.quantity,
+            unit=item.unit,
+            notes=item.notes,
+            emission_factor_id=item.emission_factor_id,
+        )
+        for item in product_with_bom.bom_items
+    ]
+
+    return ProductDetailResponse(
+        id=product.id,
+        code=product.code,
+        name=product.name,
+        description=product.description,
+        unit=product.unit,
+        category=product.category,
+        is_finished_product=product.is_finished_product,
+        bill_of_materials=bom_items,
+        created_at=product.created_at.isoformat() if product.created_at else ""
+    )
+
+
+def invalid_product_id_response():
+    """400 response for a malformed product ID."""
+    return create_error_response(
+        status_code=400,
+        code="INVALID_ID_FORMAT",
+        message="Invalid product ID format",
+        details=[{"field": "product_id", "message": "Must be a valid UUID or identifier"}]
+    )
+
+
+def product_not_found_response(product_id: str):
+    """404 response for an unknown product ID."""
+    return create_error_response(
+        status_code=404,
+        code="PRODUCT_NOT_FOUND",
+        message="Product not found",
+        details=[{"field": "product_id", "message": f"No product exists with ID {product_id}"}]
+    )
+
+
 # ============================================================================
 # Product List Endpoint
 # TASK-BE-P8-003: Added Redis caching
@@ -107,7 +211,7 @@ def list_products(
         None,
         description="Alias for is_finished_product (deprecated, use is_finished_product)"
     ),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: Optional[User] = Depends(get_optional_user),
 ):
     """
@@ -152,18 +256,7 @@ def list_products(
     products = query.order_by(Product.name).offset(offset).limit(limit).all()
 
     # Format response
-    items = [
-        {
-            "id": p.id,
-            "code": p.code,
-            "name": p.name,
-            "unit": p.unit,
-            "category": p.category,
-            "is_finished_product": p.is_finished_product,
-            "created_at": p.created_at.isoformat() if p.created_at else ""
-        }
-        for p in products
-    ]
+    items = [product_list_item(p) for p in products]
 
     response_dict = {
         "items": items,
@@ -194,7 +287,7 @@ def get_product(
         ...,
         description="Product ID (UUID format)"
     ),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: Optional[User] = Depends(get_optional_user),
 ):
     """
@@ -208,12 +301,7 @@ def get_product(
     """
     # Validate ID format
     if not is_valid_id_format(product_id):
-        return create_error_response(
-            status_code=400,
-            code="INVALID_ID_FORMAT",
-            message="Invalid product ID format",
-            details=[{"field": "product_id", "message": "Must be a valid UUID or identifier"}]
-        )
+        return invalid_product_id_response()
 
     # Query product with BOM
     product = db.query(Product).options(
@@ -221,35 +309,78 @@ def get_product(
     ).filter(Product.id == product_id).first()
 
     if product is None:
-        return create_error_response(
-            status_code=404,
-            code="PRODUCT_NOT_FOUND",
-            message="Product not found",
-            details=[{"field": "product_id", "message": f"No product exists with ID {product_id}"}]
-        )
+        return product_not_found_response(product_id)
 
-    # Format BOM items
-    bom_items = [
-        BOMItemResponse(
-            id=bom.id,
-            child_product_id=bom.child_product_id,
-            child_product_name=bom.child_product.name if bom.child_product else "Unknown",
-            quantity=float(bom.quantity),
-            unit=bom.unit,
-            notes=bom.notes,
-            emission_factor_id=bom.emission_factor_id,  # Stored in database
-        )
-        for bom in product.bom_items
-    ]
+    return product_detail_response(product)
 
-    return ProductDetailResponse(
-        id=product.id,
-        code=product.code,
-        name=product.name,
-        description=product.description,
-        unit=product.unit,
-        category=product.category,
-        is_finished_product=product.is_finished_product,
-        bill_of_materials=bom_items,
-        created_at=product.created_at.isoformat() if product.created_at else ""
+
+# ============================================================================
+# Async Endpoints (ASYNC_ROUTES)
+# ============================================================================
+
+@async_router.get(
+    "/products",
+    response_model=ProductListResponse,
+    status_code=status.HTTP_200_OK,
+    summary="List products",
+    description="Retrieve paginated list of products with optional filtering"
+)
+async def list_products_async(
+    limit: int = Query(100, ge=1, le=1000, description="Number of products to return (1-1000)"),
+    offset: int = Query(0, ge=0, description="Number of products to skip"),
+    is_finished_product: Optional[bool] = Query(None, description="Filter for finished products only"),
+    is_finished: Optional[bool] = Query(
+        None,
+        description="Alias for is_finished_product (deprecated, use is_finished_product)"
+    ),
+    product_service: ProductService = Depends(get_product_service),
+    current_user: Optional[User] = Depends(get_optional_user_async),
+):
+    """Async variant of list_products (same parameters, caching and response)."""
+    effective_filter = is_finished_product if is_finished_product is not None else is_finished
+
+    cache_key = get_product_list_cache_key(limit, offset, effective_filter)
+    cached_response = await get_cached_response(cache_key)
+    if cached_response is not None:
+        logger.debug(f"Cache hit for product list: {cache_key}")
+        return ProductListResponse(**cached_response)
+
+    logger.debug(f"Cache miss for product list: {cache_key}")
+    products, total = await product_service.list_products_page(
+        limit=limit, offset=offset, is_finished_product=effective_filter
     )
+
+    response_dict = {
+        "items": [product_list_item(p) for p in products],
+        "total": total,
+        "limit": limit,
+        "offset": offset
+    }
+
+    await cache_response(cache_key, response_dict, PRODUCT_LIST_TTL)
+
+    return ProductListResponse(**response_dict)
+
+
+@async_router.get(
+    "/products/{product_id}",
+    response_model=ProductDetailResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Get product details",
+    description="Retrieve detailed product information with bill of materials"
+)
+async def get_product_async(
+    product_id: str = Path(..., description="Product ID (UUID format)"),
+    product_service: ProductService = Depends(get_product_service),
+    current_user: Optional[User] = Depends(get_optional_user_async),
+):
+    """Async variant of get_product (ProductService.get_product_with_bom)."""
+    if not is_valid_id_format(product_id):
+        return invalid_product_id_response()
+
+    try:
+        product_with_bom = await product_service.get_product_with_bom(product_id)
+    except ProductNotFoundError:
+        return product_not_found_response(product_id)
+
+    return product_with_bom_response(product_with_bom)
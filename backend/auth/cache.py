@@ -0,0 +1,286 @@
+"""
+Authentication Caches
+
+Caches that take JWT verification and the user lookup off the hot path.
+
+Every authenticated request used to verify the token signature up to three
+times (RateLimitMiddleware's admin check, the auth dependency, and the
+unverified client-key decode) and then load the User row. This module adds:
+
+- VerifiedTokenCache: bounded LRU of token -> verified claims. Entries
+  expire at the token's own `exp`, so a cached token is never accepted
+  after it would have failed decode_token().
+- resolve_token_claims(): verifies a token at most once per request and
+  stores the outcome in request state (scope["state"]), so middleware and
+  dependencies share it.
+- UserCache: short-TTL cache of User column values. Cached users are
+  attached to the caller's session with merge(load=False), which issues
+  no SELECT.
+
+Usage:
+    from backend.auth.cache import load_user, load_user_async, resolve_token_claims
+
+    claims = resolve_token_claims(request.scope, token)
+    user = load_user(db, claims["user_id"])              # Session
+    user = await load_user_async(db, claims["user_id"])  # AsyncSession
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, make_transient_to_detached
+
+from backend.auth.jwt import decode_token, InvalidTokenError, TokenExpiredError
+from backend.config import settings
+from backend.models.user import User
+
+
+# Request state key holding (token, claims-or-error) for the current request
+REQUEST_CLAIMS_STATE = "token_claims"
+
+
+class VerifiedTokenCache:
+    """
+    Thread-safe LRU cache of verified token claims.
+
+    Only successfully verified tokens are stored; invalid tokens are
+    re-verified (and rejected) each time. Entries are dropped once the
+    token's `exp` claim has passed.
+
+    Args:
+        maxsize: Maximum number of tokens kept (0 disables caching)
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, token: str) -> Optional[Dict[str, Any]]:
+        """Return cached claims for an unexpired token, else None."""
+        with self._lock:
+            claims = self._entries.get(token)
+            if claims is None:
+                return None
+            if claims.get("exp", 0) <= time.time():
+                del self._entries[token]
+                return None
+            self._entries.move_to_end(token)
+            return claims
+
+    def put(self, token: str, claims: Dict[str, Any]) -> None:
+        """Store verified claims, evicting the least recently used token."""
+        if self.maxsize <= 0 or "exp" not in claims:
+            return
+        with self._lock:
+            self._entries[token] = claims
+            self._entries.move_to_end(token)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached tokens."""
+        with self._lock:
+            self._entries.clear()
+
+
+class UserCache:
+    """
+    Short-TTL cache of User rows keyed by user ID.
+
+    Stores column values rather than ORM instances, so entries are not
+    tied to the session that loaded them. Only existing users are cached;
+    a missing user is looked up again on the next request.
+
+    Args:
+        ttl: Seconds a cached user is reused (0 disables caching)
+        maxsize: Maximum number of users kept
+    """
+
+    def __init__(self, ttl: float = 30.0, maxsize: int = 1024):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Any, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _cached_values(self, user_id: Any) -> Optional[Dict[str, Any]]:
+        """Column values of an unexpired cached user, else None."""
+        with self._lock:
+            entry = self._entries.get(str(user_id))
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self._entries[str(user_id)]
+                return None
+            return entry[1]
+
+    def _store(self, user: User) -> None:
+        """Cache a freshly loaded user's column values."""
+        values = {
+            column.key: getattr(user, column.key)
+            for column in User.__mapper__.column_attrs
+        }
+        with self._lock:
+            key = str(user.id)
+            self._entries[key] = (time.monotonic() + self.ttl, values)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    @staticmethod
+    def _detached(values: Dict[str, Any]) -> User:
+        """Rebuild a detached User that merge(load=False) can attach."""
+        user = User(**values)
+        make_transient_to_detached(user)
+        return user
+
+    def get(self, db: Session, user_id: Any) -> Optional[User]:
+        """
+        Get a user attached to `db`, from cache or the database.
+
+        Args:
+            db: Database session the returned user is attached to
+            user_id: User primary key (from the token's user_id claim)
+
+        Returns:
+            User object, or None if no such user exists
+        """
+        values = self._cached_values(user_id) if self.ttl > 0 else None
+        if values is not None:
+            return db.merge(self._detached(values), load=False)
+
+        user = db.query(User).filter(User.id == user_id).first()
+        if user is not None and self.ttl > 0:
+            self._store(user)
+        return user
+
+    async def get_async(self, db: AsyncSession, user_id: Any) -> Optional[User]:
+        """
+        Async variant of get() for AsyncSession request handlers.
+
+        Args:
+            db: Async session the returned user is attached to
+            user_id: User primary key (from the token's user_id claim)
+
+        Returns:
+            User object, or None if no such user exists
+        """
+        values = self._cached_values(user_id) if self.ttl > 0 else None
+        if values is not None:
+            return await db.merge(self._detached(values), load=False)
+
+        result = await db.execute(select(User).where(User.id == user_id))
+        user = result.scalar_one_or_none()
+        if user is not None and self.ttl > 0:
+            self._store(user)
+        return user
+
+    def invalidate(self, user_id: Any = None) -> None:
+        """Forget one user (e.g. after a role change), or all when None."""
+        with self._lock:
+            if user_id is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(str(user_id), None)
+
+
+token_cache = VerifiedTokenCache(maxsize=settings.AUTH_TOKEN_CACHE_SIZE)
+user_cache = UserCache(ttl=settings.AUTH_USER_CACHE_TTL)
+
+
+def decode_token_cached(token: str) -> Dict[str, Any]:
+    """
+    Decode a JWT, reusing claims of a previously verified token.
+
+    Behaves like decode_token(): raises the same errors for expired or
+    invalid tokens.
+
+    Args:
+        token: JWT string
+
+    Returns:
+        Verified token claims (shared; do not mutate)
+
+    Raises:
+        TokenExpiredError: If token has expired
+        InvalidTokenError: If token is malformed or fails verification
+    """
+    claims = token_cache.get(token)
+    if claims is None:
+        claims = decode_token(token)
+        token_cache.put(token, claims)
+    return claims
+
+
+def resolve_token_claims(scope: Dict[str, Any], token: str) -> Dict[str, Any]:
+    """
+    Verify a token at most once per request.
+
+    The outcome (claims or error) is kept in scope["state"], which backs
+    request.state, so RateLimitMiddleware and the auth dependencies see
+    the same result for the same token.
+
+    Args:
+        scope: ASGI scope (request.scope in dependencies)
+        token: JWT string from the Authorization header
+
+    Returns:
+        Verified token claims
+
+    Raises:
+        TokenExpiredError: If token has expired
+        InvalidTokenError: If token is malformed or fails verification
+    """
+    state = scope.setdefault("state", {})
+    resolved = state.get(REQUEST_CLAIMS_STATE)
+    if resolved is None or resolved[0] != token:
+        try:
+            outcome: Any = decode_token_cached(token)
+        except (TokenExpiredError, InvalidTokenError) as e:
+            outcome = e
+        resolved = (token, outcome)
+        state[REQUEST_CLAIMS_STATE] = resolved
+
+    if isinstance(resolved[1], Exception):
+        raise resolved[1]
+    return resolved[1]
+
+
+def load_user(db: Session, user_id: Any) -> Optional[User]:
+    """Load a user through the shared UserCache."""
+    return user_cache.get(db, user_id)
+
+
+async def load_user_async(db: AsyncSession, user_id: Any) -> Optional[User]:
+    """Load a user through the shared UserCache on an async session."""
+    return await user_cache.get_async(db, user_id)
+
+
+def clear_auth_caches() -> None:
+    """Empty the token and user caches (tests, key rotation)."""
+    token_cache.clear()
+    user_cache.invalidate()
+
+
+__all__ = [
+    'REQUEST_CLAIMS_STATE',
+    'UserCache',
+    'VerifiedTokenCache',
+    'clear_auth_caches',
+    'decode_token_cached',
+    'load_user',
+    'load_user_async',
+    'resolve_token_claims',
+    'token_cache',
+    'user_cache',
+]
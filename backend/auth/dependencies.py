@@ -5,9 +5,14 @@ TASK-BE-P7-018: JWT Authentication + Role-Based Admin Access
 
 This module provides FastAPI dependencies for authentication and authorization:
 - get_current_user: Extract and validate user from JWT token
+- get_optional_user / get_optional_user_async: Identify the user if a token is sent
 - get_current_active_user: Ensure user is active
 - require_admin: Require admin role for endpoint access
 
+Token verification and the user lookup go through backend.auth.cache:
+verified claims are shared with RateLimitMiddleware via request state, and
+users are served from a short-TTL cache.
+
 Role-Based Access Control:
 - user: read_products, create_calculation
 - admin: all user permissions + manage_emission_factors, trigger_data_sync
@@ -26,10 +31,17 @@ from typing import Dict, Any, Optional
 
 from fastapi import Depends, HTTPException, status, Request
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from backend.auth.jwt import decode_token, InvalidTokenError, TokenExpiredError
-from backend.database.connection import get_db
+from backend.auth.cache import (
+    decode_token_cached,
+    load_user,
+    load_user_async,
+    resolve_token_claims,
+)
+from backend.auth.jwt import InvalidTokenError, TokenExpiredError
+from backend.database.connection import get_async_db, get_db
 from backend.models.user import User
 
 
@@ -126,7 +138,7 @@ def get_current_user_from_token(
         HTTPException: 401 if token invalid or user not found
     """
     try:
-        payload = decode_token(token)
+        payload = decode_token_cached(token)
     except TokenExpiredError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -150,7 +162,7 @@ def get_current_user_from_token(
         )
 
     # Get user from database
-    user = db.query(User).filter(User.id == user_id).first()
+    user = load_user(db, user_id)
 
     if user is None:
         raise HTTPException(
@@ -163,6 +175,7 @@ def get_current_user_from_token(
 
 
 async def get_current_user(
+    request: Request,
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(bearer_scheme),
     db: Session = Depends(get_db),
 ) -> User:
@@ -173,6 +186,7 @@ async def get_current_user(
     and returns the corresponding User object from the database.
 
     Args:
+        request: Current request (verified claims are cached in its state)
         credentials: HTTP Authorization credentials (injected by FastAPI)
         db: Database session (injected by FastAPI)
 
@@ -193,7 +207,7 @@ async def get_current_user(
     token = credentials.credentials
 
     try:
-        payload = decode_token(token)
+        payload = resolve_token_claims(request.scope, token)
     except TokenExpiredError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -227,7 +241,7 @@ async def get_current_user(
         )
 
     # Get user from database
-    user = db.query(User).filter(User.id == user_id).first()
+    user = load_user(db, user_id)
 
     if user is None:
         raise HTTPException(
@@ -240,6 +254,7 @@ async def get_current_user(
 
 
 async def get_optional_user(
+    request: Request,
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(bearer_scheme),
     db: Session = Depends(get_db),
 ) -> Optional[User]:
@@ -256,7 +271,33 @@ async def get_optional_user(
         return None
 
     try:
-        payload = decode_token(credentials.credentials)
+        payload = resolve_token_claims(request.scope, credentials.credentials)
+    except (TokenExpiredError, InvalidTokenError):
+        return None
+
+    user_id = payload.get("user_id")
+    if user_id is None:
+        return None
+
+    return load_user(db, user_id)
+
+
+async def get_optional_user_async(
+    request: Request,
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(bearer_scheme),
+    db: AsyncSession = Depends(get_async_db),
+) -> Optional[User]:
+    """
+    FastAPI dependency: get_optional_user for async (AsyncSession) routes.
+
+    Shares the request's AsyncSession with the route handler instead of
+    checking out a sync connection for the user lookup.
+    """
+    if credentials is None:
+        return None
+
+    try:
+        payload = resolve_token_claims(request.scope, credentials.credentials)
     except (TokenExpiredError, InvalidTokenError):
         return None
 
@@ -264,7 +305,7 @@ async def get_optional_user(
     if user_id is None:
         return None
 
-    return db.query(User).filter(User.id == user_id).first()
+    return await load_user_async(db, user_id)
 
 
 async def get_current_active_user(
@@ -326,6 +367,7 @@ __all__ = [
     'get_current_user_from_token',
     'get_current_user',
     'get_optional_user',
+    'get_optional_user_async',
     'get_current_active_user',
     'require_admin',
     'ROLE_PERMISSIONS',
@@ -0,0 +1,23 @@
+"""
+Reproducible performance benchmarks for PCF Calculator Backend.
+
+Suites (see the modules for the individual benchmarks):
+- calculation: PCFCalculator.calculate and build_bom_tree_from_db
+- api: product search, product and emission factor list endpoints
+- rate_limiter: MemoryStorage, RateLimitMiddleware (Redis optional)
+- ingestion: EPA and DEFRA parse/transform and full syncs
+- load: stepped HTTP load test of user flows against a uvicorn server
+  (run separately with `load`, see backend.benchmarks.load)
+
+The calculation, api and ingestion suites run against a SyntheticCatalog:
+a throwaway schema in the DATABASE_URL database holding a catalog of
+configurable size generated from the BOM templates with a fixed seed.
+Results are written as JSON (backend.benchmarks.harness) and can be
+compared between commits to catch regressions.
+
+Usage:
+    python -m backend.benchmarks --products 2000 --iterations 200 --output base.json
+    python -m backend.benchmarks --suites rate_limiter,ingestion --output head.json
+    python -m backend.benchmarks compare base.json head.json --threshold 0.15
+    python -m backend.benchmarks load --users 10,50,100 --output load.json
+"""
@@ -0,0 +1,130 @@
+"""
+Benchmark suite command line.
+
+Usage:
+    python -m backend.benchmarks [--suites calculation,api] [--products 1000]
+        [--iterations 200] [--rows 2000] [--seed 42] [--redis-url URL]
+        [--keep-schema] [--output results.json]
+    python -m backend.benchmarks compare BASELINE CURRENT [--threshold 0.15]
+    python -m backend.benchmarks load --help  (see backend.benchmarks.load)
+
+`compare` prints one line per compared metric and exits with status 1 if
+any metric regressed by more than the threshold.
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from typing import Any, Dict, List, Optional
+
+from backend.benchmarks.harness import compare_results, result_document
+
+
+SUITES = ("calculation", "api", "rate_limiter", "ingestion")
+CATALOG_SUITES = ("calculation", "api", "ingestion")
+
+
+async def run_suites(args: argparse.Namespace) -> Dict[str, Dict[str, Any]]:
+    # Imported here so `compare` works without DATABASE_URL and app settings
+    from backend.benchmarks import api, calculation, ingestion, rate_limiter
+    from backend.benchmarks.catalog import SyntheticCatalog
+
+    results: Dict[str, Dict[str, Any]] = {}
+    if "rate_limiter" in args.suites:
+        results.update(await rate_limiter.run(args.iterations, redis_url=args.redis_url))
+
+    if not any(suite in args.suites for suite in CATALOG_SUITES):
+        return results
+
+    async with SyntheticCatalog(args.products, seed=args.seed, keep=args.keep_schema) as catalog:
+        print(f"Catalog {catalog.schema}: {len(catalog.product_ids)} finished products",
+              file=sys.stderr)
+        if "calculation" in args.suites:
+            results.update(await calculation.run(catalog, args.iterations))
+        if "api" in args.suites:
+            results.update(await asyncio.to_thread(api.run, catalog, args.iterations))
+        if "ingestion" in args.suites:
+            results.update(await ingestion.run(catalog, args.iterations, rows=args.rows))
+    return results
+
+
+def _suites(value: str) -> List[str]:
+    suites = [suite.strip() for suite in value.split(",") if suite.strip()]
+    unknown = set(suites) - set(SUITES)
+    if unknown:
+        raise argparse.ArgumentTypeError(f"unknown suites: {', '.join(sorted(unknown))}")
+    return suites
+
+
+def run_command(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(prog="python -m backend.benchmarks",
+                                     description="Run the benchmark suites")
+    parser.add_argument("--suites", type=_suites, default=list(SUITES),
+                        help=f"Comma-separated suites (default: {','.join(SUITES)})")
+    parser.add_argument("--products", type=int, default=1000, help="Finished products in the catalog")
+    parser.add_argument("--seed", type=int, default=42, help="Catalog generation seed")
+    parser.add_argument("--iterations", type=int, default=200, help="Measured operations per benchmark")
+    parser.add_argument("--rows", type=int, default=2000, help="Rows per ingestion workbook")
+    parser.add_argument("--redis-url", default=None, help="Also benchmark Redis rate limiting")
+    parser.add_argument("--keep-schema", action="store_true", help="Keep the catalog schema")
+    parser.add_argument("--output", default=None, help="Write results to this file")
+    args = parser.parse_args(argv)
+
+    parameters = {
+        "suites": args.suites,
+        "products": args.products,
+        "seed": args.seed,
+        "iterations": args.iterations,
+        "rows": args.rows,
+        "redis": bool(args.redis_url),
+    }
+    document = result_document(parameters, asyncio.run(run_suites(args)))
+    output = json.dumps(document, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+        print(f"Results written to {args.output}", file=sys.stderr)
+    else:
+        print(output)
+    return 0
+
+
+def compare_command(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(prog="python -m backend.benchmarks compare",
+                                     description="Compare two benchmark result files")
+    parser.add_argument("baseline", help="Result file of the reference commit")
+    parser.add_argument("current", help="Result file to check")
+    parser.add_argument("--threshold", type=float, default=0.15,
+                        help="Allowed relative slowdown (default: 0.15)")
+    args = parser.parse_args(argv)
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    with open(args.current) as f:
+        current = json.load(f)
+
+    rows = compare_results(baseline, current, threshold=args.threshold)
+    for row in rows:
+        marker = "REGRESSION" if row["regression"] else "ok"
+        print(f"{marker:<10} {row['benchmark']:<40} {row['metric']:<15} "
+              f"{row['baseline']:>12} -> {row['current']:>12} ({row['change']:+.1%})")
+
+    regressions = sum(row["regression"] for row in rows)
+    print(f"{len(rows)} metrics compared, {regressions} regressions "
+          f"(threshold {args.threshold:.0%})")
+    return 1 if regressions else 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    if argv[:1] == ["compare"]:
+        return compare_command(argv[1:])
+    if argv[:1] == ["load"]:
+        from backend.benchmarks.load import main as load_main
+        return load_main(argv[1:])
+    return run_command(argv)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
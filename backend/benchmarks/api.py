@@ -0,0 +1,124 @@
+"""
+API benchmarks: product search and list endpoints.
+
+The routers are mounted on a bare FastAPI app, without middleware, with
+get_db / get_read_db bound to the benchmark catalog, and called in-process
+through TestClient, so results measure routing, validation, queries and
+serialisation of the handlers themselves (middleware cost is covered by
+backend.benchmarks.rate_limiter and the load tests).
+
+Benchmarks:
+- api.product_search: GET /api/v1/products/search with terms taken from
+  generated product names, paging through results
+- api.products_list: GET /api/v1/products, paging through the catalog
+- api.products_list_finished: the same filtered to finished products
+- api.emission_factors_list: GET /api/v1/emission-factors, paging
+
+Product response caches are cleared first and every request in a run
+uses different parameters where the catalog allows, so responses come
+from the database rather than Redis.
+
+Usage:
+    async with SyntheticCatalog(products=1000) as catalog:
+        results = run(catalog, iterations=200)
+"""
+
+from typing import Any, Callable, Dict, Iterator, List
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from backend.api.routes.emission_factors import router as emission_factors_router
+from backend.api.routes.product_search import router as product_search_router
+from backend.api.routes.products import router as products_router
+from backend.benchmarks.catalog import SyntheticCatalog, template_components
+from backend.benchmarks.harness import measure
+from backend.database.connection import get_db, get_read_db
+from backend.utils.cache import invalidate_all_product_cache_sync
+
+
+PAGE_SIZE = 20
+
+
+def build_app(catalog: SyntheticCatalog) -> FastAPI:
+    """FastAPI app serving the product and emission factor routers from the catalog."""
+    app = FastAPI()
+    app.include_router(product_search_router)
+    app.include_router(products_router)
+    app.include_router(emission_factors_router)
+
+    def catalog_db() -> Iterator[Session]:
+        with catalog.session() as session:
+            yield session
+
+    app.dependency_overrides[get_db] = catalog_db
+    app.dependency_overrides[get_read_db] = catalog_db
+    return app
+
+
+def search_terms(names: List[str], limit: int = 50) -> List[str]:
+    """Distinct words (3+ letters) from product names, in order of appearance."""
+    terms: Dict[str, None] = {}
+    for name in names:
+        for word in name.split():
+            word = word.strip("()-,").lower()
+            if len(word) >= 3 and word.isalpha():
+                terms.setdefault(word, None)
+        if len(terms) >= limit:
+            break
+    return list(terms)[:limit]
+
+
+def _request(client: TestClient, path: str, params: Callable[[int], Dict[str, Any]],
+             errors: Dict[str, int]) -> Callable[[int], None]:
+    def call(i: int) -> None:
+        status_code = client.get(path, params=params(i)).status_code
+        if status_code != 200:
+            errors[str(status_code)] = errors.get(str(status_code), 0) + 1
+    return call
+
+
+def run(catalog: SyntheticCatalog, iterations: int) -> Dict[str, Dict[str, Any]]:
+    """Run the API benchmarks against a seeded catalog."""
+    invalidate_all_product_cache_sync()
+
+    products = len(catalog.product_ids) + len(template_components())
+    pages = max(products // PAGE_SIZE, 1)
+    finished_pages = max(len(catalog.product_ids) // PAGE_SIZE, 1)
+    factor_pages = max(len(template_components()) // PAGE_SIZE, 1)
+    terms = search_terms(catalog.product_names) or ["product"]
+
+    cases = {
+        "api.product_search": ("/api/v1/products/search", lambda i: {
+            "query": terms[i % len(terms)],
+            "limit": PAGE_SIZE,
+            "offset": (i // len(terms)) % 5 * PAGE_SIZE,
+        }),
+        "api.products_list": ("/api/v1/products", lambda i: {
+            "limit": PAGE_SIZE, "offset": i % pages * PAGE_SIZE,
+        }),
+        "api.products_list_finished": ("/api/v1/products", lambda i: {
+            "limit": PAGE_SIZE,
+            "offset": i % finished_pages * PAGE_SIZE,
+            "is_finished_product": True,
+        }),
+        "api.emission_factors_list": ("/api/v1/emission-factors", lambda i: {
+            "limit": PAGE_SIZE, "offset": i % factor_pages * PAGE_SIZE,
+        }),
+    }
+
+    results: Dict[str, Dict[str, Any]] = {}
+    with TestClient(build_app(catalog)) as client:
+        for name, (path, params) in cases.items():
+            errors: Dict[str, int] = {}
+            results[name] = measure(_request(client, path, params, errors), iterations)
+            results[name]["errors"] = errors
+    return results
+
+
+__all__ = [
+    'build_app',
+    'run',
+    'search_terms',
+]
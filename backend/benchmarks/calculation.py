@@ -0,0 +1,89 @@
+"""
+Calculation benchmarks: PCFCalculator.calculate and build_bom_tree_from_db.
+
+Benchmarks (cycling over the catalog's finished products):
+- calculation.calculate: PCFCalculator.calculate with a fresh
+  CachedEmissionFactorProvider per calculation, as the API builds one per
+  request (factor lookups hit the database)
+- calculation.calculate_warm: the same with one provider shared by all
+  calculations (factor lookups served from the cache)
+- calculation.build_bom_tree: build_bom_tree_from_db, with the number of
+  SQL statements per tree (a growing count flags an N+1 regression)
+
+Usage:
+    async with SyntheticCatalog(products=1000) as catalog:
+        results = await run(catalog, iterations=200)
+"""
+
+from typing import Any, Dict, List
+
+from sqlalchemy import select
+from sqlalchemy.orm import aliased
+
+from backend.benchmarks.catalog import SyntheticCatalog
+from backend.benchmarks.harness import measure, measure_async
+from backend.calculator.cache import CachedEmissionFactorProvider
+from backend.calculator.legacy_calculator import build_bom_tree_from_db
+from backend.calculator.pcf_calculator import BOMItem, PCFCalculator
+from backend.calculator.sqlalchemy_provider import SQLAlchemyEmissionFactorProvider
+from backend.models import BillOfMaterials, Product
+from backend.utils.profiling import QueryLog
+
+
+def load_bom_items(catalog: SyntheticCatalog) -> List[List[BOMItem]]:
+    """BOM items of each finished product, in catalog.product_ids order."""
+    component = aliased(Product)
+    items: Dict[str, List[BOMItem]] = {pid: [] for pid in catalog.product_ids}
+    with catalog.session() as session:
+        rows = session.execute(
+            select(BillOfMaterials.parent_product_id, component.code,
+                   BillOfMaterials.quantity, BillOfMaterials.unit)
+            .join(component, BillOfMaterials.child_product_id == component.id)
+            .where(BillOfMaterials.parent_product_id.in_(catalog.product_ids))
+        ).all()
+    for parent_id, code, quantity, unit in rows:
+        items[parent_id].append(BOMItem(material=code, quantity=float(quantity), unit=unit))
+    return [items[pid] for pid in catalog.product_ids]
+
+
+async def run(catalog: SyntheticCatalog, iterations: int) -> Dict[str, Dict[str, Any]]:
+    """Run the calculation benchmarks against a seeded catalog."""
+    product_ids = catalog.product_ids
+    boms = load_bom_items(catalog)
+    results: Dict[str, Dict[str, Any]] = {}
+
+    with catalog.session() as session:
+        provider = SQLAlchemyEmissionFactorProvider(session)
+
+        async def calculate_cold(i: int) -> None:
+            calculator = PCFCalculator(ef_provider=CachedEmissionFactorProvider(provider))
+            await calculator.calculate(product_ids[i % len(product_ids)], boms[i % len(boms)])
+
+        results["calculation.calculate"] = await measure_async(calculate_cold, iterations)
+
+        warm = PCFCalculator(ef_provider=CachedEmissionFactorProvider(provider))
+
+        async def calculate_warm(i: int) -> None:
+            await warm.calculate(product_ids[i % len(product_ids)], boms[i % len(boms)])
+
+        results["calculation.calculate_warm"] = await measure_async(calculate_warm, iterations)
+
+        def build_tree(i: int) -> None:
+            build_bom_tree_from_db(warm, product_ids[i % len(product_ids)], session)
+            session.expire_all()
+
+        with QueryLog() as log:
+            stats = measure(build_tree, iterations, warmup=0)
+        stats["queries_per_operation"] = round(log.count / iterations, 2)
+        results["calculation.build_bom_tree"] = stats
+
+    results["calculation.calculate"]["bom_items_mean"] = round(
+        sum(len(bom) for bom in boms) / len(boms), 2
+    )
+    return results
+
+
+__all__ = [
+    'load_bom_items',
+    'run',
+]
@@ -0,0 +1,197 @@
+"""
+Synthetic catalogs for benchmarks, in a throwaway PostgreSQL schema.
+
+SyntheticCatalog creates a schema named pcf_bench_<random> in the database
+configured by DATABASE_URL, creates the tables there and fills them with:
+- one emission factor per component used by the BOM templates
+  (backend.services.data_ingestion.bom_templates), so every calculation
+  resolves its factors
+- `products` finished products with BOMs, generated by
+  ProductGenerator.generate_catalog_bulk with a fixed seed, spread evenly
+  over the template industries
+
+Engines and sessions handed out by the catalog map the models' tables to
+the benchmark schema with schema_translate_map, so ORM queries and DDL
+never resolve to the application tables in public. They also set
+search_path to the benchmark schema (then public, for extensions such as
+pg_trgm) for raw SQL. The schema is dropped on exit, and runs never touch
+application data.
+
+Usage:
+    async with SyntheticCatalog(products=2000, seed=42) as catalog:
+        with catalog.session() as session:
+            ...
+        async with catalog.async_session() as session:
+            ...
+"""
+
+import logging
+import random
+import uuid
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncIterator, Dict, Iterator, List, Optional
+
+from sqlalchemy import create_engine, insert, select, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from backend.config import settings
+from backend.models import Base, DataSource, EmissionFactor, Product
+from backend.services.data_ingestion.bom_templates import ALL_TEMPLATES
+from backend.services.data_ingestion.product_generator import ProductGenerator
+
+
+logger = logging.getLogger(__name__)
+
+DATA_SOURCE_NAME = "BENCHMARK"
+
+
+def template_components() -> Dict[str, str]:
+    """Every component name any template can use, with its unit."""
+    components: Dict[str, str] = {}
+    for templates in ALL_TEMPLATES.values():
+        for template in templates.values():
+            for spec in (
+                template.base_components
+                + template.calculate_transport(template.typical_mass_kg)
+            ):
+                components.setdefault(spec.name, spec.unit)
+    return components
+
+
+def distribute(products: int) -> Dict[str, int]:
+    """Spread `products` evenly over the template industries."""
+    industries = sorted(ALL_TEMPLATES)
+    share, remainder = divmod(products, len(industries))
+    return {
+        industry: share + (1 if i < remainder else 0)
+        for i, industry in enumerate(industries)
+        if share or i < remainder
+    }
+
+
+class SyntheticCatalog:
+    """
+    Async context manager owning a seeded benchmark schema.
+
+    Args:
+        products: Finished products to generate
+        seed: Seed for emission factors and the product catalog
+        keep: Leave the schema in place on exit (for inspection)
+
+    Attributes:
+        schema: Name of the benchmark schema
+        engine: Sync engine bound to the schema
+        async_engine: Async engine bound to the schema
+        product_ids: Ids of the generated finished products
+        product_names: Names of the generated finished products
+        data_source_id: Id of the DataSource row used by ingestion benchmarks
+    """
+
+    def __init__(self, products: int = 1000, seed: int = 42, keep: bool = False):
+        self.products = products
+        self.seed = seed
+        self.keep = keep
+        self.schema = f"pcf_bench_{uuid.uuid4().hex[:8]}"
+        self.product_ids: List[str] = []
+        self.product_names: List[str] = []
+        self.data_source_id: Optional[str] = None
+
+        # search_path alone is not enough: create_all() checks tables with
+        # pg_table_is_visible, which also sees the ones in public
+        search_path = f"{self.schema},public"
+        translate = {"schema_translate_map": {None: self.schema}}
+        self.engine = create_engine(
+            settings.sync_database_url,
+            connect_args={"options": f"-csearch_path={search_path}"},
+            execution_options=translate,
+        )
+        self.async_engine = create_async_engine(
+            settings.async_database_url,
+            connect_args={"server_settings": {"search_path": search_path}},
+            execution_options=translate,
+        )
+        self._sessions = sessionmaker(bind=self.engine)
+        self._async_sessions = async_sessionmaker(self.async_engine, expire_on_commit=False)
+
+    @contextmanager
+    def session(self) -> Iterator[Session]:
+        """Sync session on the benchmark schema."""
+        session = self._sessions()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    @asynccontextmanager
+    async def async_session(self) -> AsyncIterator[AsyncSession]:
+        """Async session on the benchmark schema."""
+        async with self._async_sessions() as session:
+            yield session
+
+    def _seed_emission_factors(self) -> None:
+        rng = random.Random(self.seed)
+        rows = [
+            {
+                "id": uuid.UUID(int=rng.getrandbits(128), version=4).hex,
+                "activity_name": name,
+                "category": name,
+                "co2e_factor": round(rng.uniform(0.05, 25.0), 4),
+                "unit": unit,
+                "data_source": DATA_SOURCE_NAME,
+                "geography": "GLO",
+                "is_active": True,
+            }
+            for name, unit in sorted(template_components().items())
+        ]
+        with self.session() as session:
+            session.execute(insert(EmissionFactor), rows)
+            source = DataSource(name=DATA_SOURCE_NAME, source_type="file")
+            session.add(source)
+            session.commit()
+            self.data_source_id = source.id
+
+    async def _seed_products(self) -> None:
+        async with self.async_session() as session:
+            await ProductGenerator(session).generate_catalog_bulk(
+                distribute(self.products), seed=self.seed
+            )
+
+        with self.session() as session:
+            rows = session.execute(
+                select(Product.id, Product.name)
+                .where(Product.is_finished_product == True)  # noqa: E712
+                .order_by(Product.code)
+            ).all()
+        self.product_ids = [row.id for row in rows]
+        self.product_names = [row.name for row in rows]
+
+    async def __aenter__(self) -> "SyntheticCatalog":
+        with self.engine.begin() as conn:
+            conn.execute(text(f'CREATE SCHEMA "{self.schema}"'))
+        try:
+            with self.engine.begin() as conn:
+                Base.metadata.create_all(conn)
+            self._seed_emission_factors()
+            await self._seed_products()
+        except BaseException:
+            await self.__aexit__(None, None, None)
+            raise
+        logger.info(
+            f"Benchmark catalog {self.schema}: {len(self.product_ids)} products"
+        )
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.async_engine.dispose()
+        if not self.keep:
+            with self.engine.begin() as conn:
+                conn.execute(text(f'DROP SCHEMA "{self.schema}" CASCADE'))
+        self.engine.dispose()
+
+
+__all__ = [
+    'SyntheticCatalog',
+    'distribute',
+    'template_components',
+]
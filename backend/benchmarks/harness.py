@@ -0,0 +1,206 @@
+"""
+Timing, result documents and regression comparison for the benchmark suite.
+
+Every benchmark reports the same statistics (see summarize()), so results
+from two commits can be compared metric by metric. A result document is:
+
+    {
+        "schema": 1,
+        "environment": {"git_commit": ..., "python": ..., ...},
+        "parameters": {"products": ..., "iterations": ..., "seed": ...},
+        "benchmarks": {"calculation.calculate": {"p50_ms": ..., ...}, ...}
+    }
+
+Usage:
+    stats = measure(lambda i: calculator.calculate_legacy(bom), iterations=500)
+    stats = await measure_async(lambda i: calculator.calculate(pid, items), 200)
+
+    regressions = compare_results(baseline, current, threshold=0.15)
+"""
+
+import os
+import platform
+import statistics
+import subprocess
+import time
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+
+RESULT_SCHEMA = 1
+
+# Statistics compared by compare_results: (name, True if higher is worse)
+COMPARED_METRICS = (
+    ("p50_ms", True),
+    ("p95_ms", True),
+    ("ops_per_second", False),
+)
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """Value at `fraction` of an already sorted list (0 when empty)."""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(len(sorted_values) * fraction))
+    return sorted_values[index]
+
+
+def summarize(latencies_ms: List[float], elapsed: float) -> Dict[str, float]:
+    """
+    Summarize per-operation latencies.
+
+    Args:
+        latencies_ms: Latency of each operation in milliseconds
+        elapsed: Wall-clock seconds for all operations
+
+    Returns:
+        Dict with operations, ops_per_second, mean/min/max and p50/p95/p99
+    """
+    ordered = sorted(latencies_ms)
+    return {
+        "operations": len(ordered),
+        "ops_per_second": round(len(ordered) / elapsed, 2) if elapsed else 0.0,
+        "mean_ms": round(statistics.fmean(ordered), 4) if ordered else 0.0,
+        "min_ms": round(ordered[0], 4) if ordered else 0.0,
+        "p50_ms": round(percentile(ordered, 0.50), 4),
+        "p95_ms": round(percentile(ordered, 0.95), 4),
+        "p99_ms": round(percentile(ordered, 0.99), 4),
+        "max_ms": round(ordered[-1], 4) if ordered else 0.0,
+    }
+
+
+def measure(
+    operation: Callable[[int], Any],
+    iterations: int,
+    warmup: int = 5,
+) -> Dict[str, float]:
+    """
+    Time `iterations` calls of a synchronous operation.
+
+    Args:
+        operation: Called with the iteration index (warmup calls included)
+        iterations: Timed calls
+        warmup: Untimed calls made first (caches, statement compilation)
+
+    Returns:
+        summarize() statistics
+    """
+    for i in range(warmup):
+        operation(i)
+
+    latencies_ms = []
+    started = time.perf_counter()
+    for i in range(iterations):
+        t0 = time.perf_counter()
+        operation(warmup + i)
+        latencies_ms.append((time.perf_counter() - t0) * 1000)
+    return summarize(latencies_ms, time.perf_counter() - started)
+
+
+async def measure_async(
+    operation: Callable[[int], Awaitable[Any]],
+    iterations: int,
+    warmup: int = 5,
+) -> Dict[str, float]:
+    """Async variant of measure() for coroutine operations."""
+    for i in range(warmup):
+        await operation(i)
+
+    latencies_ms = []
+    started = time.perf_counter()
+    for i in range(iterations):
+        t0 = time.perf_counter()
+        await operation(warmup + i)
+        latencies_ms.append((time.perf_counter() - t0) * 1000)
+    return summarize(latencies_ms, time.perf_counter() - started)
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def environment() -> Dict[str, Any]:
+    """Describe the commit and machine a result was produced on."""
+    return {
+        "git_commit": _git_commit(),
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def result_document(
+    parameters: Dict[str, Any],
+    benchmarks: Dict[str, Dict[str, Any]],
+) -> Dict[str, Any]:
+    """Assemble a JSON-serialisable result document."""
+    return {
+        "schema": RESULT_SCHEMA,
+        "environment": environment(),
+        "parameters": parameters,
+        "benchmarks": benchmarks,
+    }
+
+
+def compare_results(
+    baseline: Dict[str, Any],
+    current: Dict[str, Any],
+    threshold: float = 0.15,
+) -> List[Dict[str, Any]]:
+    """
+    Compare two result documents.
+
+    Benchmarks present in both documents are compared on COMPARED_METRICS.
+    A metric regresses when it is worse than the baseline by more than
+    `threshold` (a fraction: 0.15 = 15%).
+
+    Args:
+        baseline: Result document of the reference commit
+        current: Result document to check
+        threshold: Allowed relative slowdown
+
+    Returns:
+        One dict per compared metric (benchmark, metric, baseline, current,
+        change, regression), regressions first
+    """
+    rows = []
+    for name, before in baseline.get("benchmarks", {}).items():
+        after = current.get("benchmarks", {}).get(name)
+        if after is None:
+            continue
+        for metric, higher_is_worse in COMPARED_METRICS:
+            if not before.get(metric) or metric not in after:
+                continue
+            change = (after[metric] - before[metric]) / before[metric]
+            worse = change if higher_is_worse else -change
+            rows.append({
+                "benchmark": name,
+                "metric": metric,
+                "baseline": before[metric],
+                "current": after[metric],
+                "change": round(change, 4),
+                "regression": worse > threshold,
+            })
+    rows.sort(key=lambda row: (not row["regression"], row["benchmark"], row["metric"]))
+    return rows
+
+
+__all__ = [
+    'COMPARED_METRICS',
+    'RESULT_SCHEMA',
+    'compare_results',
+    'environment',
+    'measure',
+    'measure_async',
+    'percentile',
+    'result_document',
+    'summarize',
+]
@@ -0,0 +1,128 @@
+"""
+EPA and DEFRA ingestion benchmarks on synthetic workbooks.
+
+Workbooks are generated in the layouts the connectors parse (EPA
+"Table 1 - Fuel"; DEFRA "Fuels" and "Material use"), so no download is
+needed. Each benchmark operation processes a whole workbook; results add
+records and records_per_second (records / mean operation time).
+
+Benchmarks (for <source> in epa, defra):
+- ingestion.<source>_parse_transform: parse_data + transform_data
+- ingestion.<source>_sync: execute_sync into the benchmark catalog
+  (validation, upserts, commit and sync log). The first operation creates
+  the factors, later ones update them.
+
+Usage:
+    async with SyntheticCatalog(products=100) as catalog:
+        results = await run(catalog, iterations=200, rows=2000)
+"""
+
+import io
+from typing import Any, Callable, Dict, Tuple, Type
+
+from openpyxl import Workbook
+
+from backend.benchmarks.catalog import SyntheticCatalog
+from backend.benchmarks.harness import measure_async
+from backend.services.data_ingestion.base import BaseDataIngestion
+from backend.services.data_ingestion.defra_ingestion import DEFRAEmissionFactorsIngestion
+from backend.services.data_ingestion.epa_ingestion import EPAEmissionFactorsIngestion
+
+
+def _workbook_bytes(workbook: Workbook) -> bytes:
+    buffer = io.BytesIO()
+    workbook.save(buffer)
+    workbook.close()
+    return buffer.getvalue()
+
+
+def epa_workbook(rows: int) -> bytes:
+    """EPA fuels workbook with `rows` stationary combustion factors."""
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet.title = "Table 1 - Fuel"
+    sheet.append(["Fuel Type", "kg CO2e per unit", "Unit", "Category"])
+    for i in range(rows):
+        sheet.append([f"Fuel {i}", round(1 + i % 97 / 10, 2), "kg", "Stationary Combustion"])
+    return _workbook_bytes(workbook)
+
+
+def defra_workbook(rows: int) -> bytes:
+    """DEFRA workbook with `rows` factors split over Fuels and Material use."""
+    workbook = Workbook()
+    workbook.remove(workbook.active)
+    fuels = workbook.create_sheet("Fuels")
+    fuels.append(["Category", "Fuel", "Unit", "kg CO2e"])
+    for i in range(rows // 2):
+        fuels.append(["Liquid fuels", f"Fuel {i}", "litre", round(2 + i % 31 / 10, 2)])
+    materials = workbook.create_sheet("Material use")
+    materials.append(["Category", "Material", "Unit", "kg CO2e"])
+    for i in range(rows - rows // 2):
+        materials.append(["Metals", f"Material {i}", "tonnes", 1000 + i % 500])
+    return _workbook_bytes(workbook)
+
+
+def from_bytes(connector: Type[BaseDataIngestion], raw: bytes) -> Type[BaseDataIngestion]:
+    """Subclass of `connector` whose fetch_raw_data returns `raw`."""
+    async def fetch_raw_data(self) -> bytes:
+        return raw
+
+    return type(connector.__name__, (connector,), {"fetch_raw_data": fetch_raw_data})
+
+
+SOURCES: Dict[str, Tuple[Type[BaseDataIngestion], Callable[[int], bytes]]] = {
+    "epa": (EPAEmissionFactorsIngestion, epa_workbook),
+    "defra": (DEFRAEmissionFactorsIngestion, defra_workbook),
+}
+
+
+def _with_throughput(stats: Dict[str, Any], records: int) -> Dict[str, Any]:
+    stats["records"] = records
+    stats["records_per_second"] = (
+        round(records / (stats["mean_ms"] / 1000), 1) if stats["mean_ms"] else 0.0
+    )
+    return stats
+
+
+async def run(
+    catalog: SyntheticCatalog,
+    iterations: int,
+    rows: int = 2000,
+) -> Dict[str, Dict[str, Any]]:
+    """Run the ingestion benchmarks (iterations // 20 workbooks each, at least 3)."""
+    repeats = max(iterations // 20, 3)
+    results: Dict[str, Dict[str, Any]] = {}
+
+    for source, (connector, build_workbook) in SOURCES.items():
+        raw = build_workbook(rows)
+        parser = connector(None, catalog.data_source_id)
+        records = len(await parser.transform_data(await parser.parse_data(raw)))
+
+        async def parse_transform(i: int) -> None:
+            await parser.transform_data(await parser.parse_data(raw))
+
+        results[f"ingestion.{source}_parse_transform"] = _with_throughput(
+            await measure_async(parse_transform, repeats, warmup=1), records
+        )
+
+        file_connector = from_bytes(connector, raw)
+
+        async def sync(i: int) -> None:
+            async with catalog.async_session() as session:
+                result = await file_connector(session, catalog.data_source_id).execute_sync()
+            if result.status != "completed":
+                raise RuntimeError(f"{source} sync failed: {result}")
+
+        results[f"ingestion.{source}_sync"] = _with_throughput(
+            await measure_async(sync, repeats, warmup=0), records
+        )
+
+    return results
+
+
+__all__ = [
+    'defra_workbook',
+    'epa_workbook',
+    'from_bytes',
+    'run',
+]
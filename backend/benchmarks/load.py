@@ -0,0 +1,539 @@
+"""
+HTTP load test scenarios against a running or locally started API server.
+
+Virtual users (Locust-style) each loop over weighted scenarios until the
+stage ends; one scenario run is one user flow:
+- shopper: search -> product detail -> POST /calculate -> poll the
+  calculation until it completes or fails
+- browser: product and emission factor list pages
+- admin: emission factor coverage, sync log list and detail, data sources
+  (needs an admin token, see below)
+
+The test steps through increasing user counts (--users 10,50,100,200).
+Every stage reports throughput, p50/p95/p99 and error rate per endpoint;
+the saturation point is the last stage that still raised throughput
+without exceeding --max-error-rate or --p95-limit-ms. Per-endpoint
+statistics at the saturation point form the result's "benchmarks", so
+load results can be compared with `python -m backend.benchmarks compare`.
+
+Without --base-url, uvicorn is started against the configured DATABASE_URL
+(which must hold seed data) with rate limits raised and in-memory rate
+limiting, so no Redis is needed; the response cache degrades to database
+reads unless --redis-url points at a Redis instance. Admin scenarios log in
+with --admin-username/--admin-password, or, for a locally started server,
+use a token issued for the first active admin user in the database.
+
+Usage:
+    python -m backend.benchmarks load --users 10,50,100,200 --stage-duration 30
+    python -m backend.benchmarks load --base-url http://localhost:8000 \\
+        --scenarios shopper,browser --admin-username admin --admin-password ...
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+from typing import Any, Dict, List, Optional, Type
+
+import httpx
+
+from backend.benchmarks.api import PAGE_SIZE, search_terms
+from backend.benchmarks.harness import result_document, summarize
+
+
+CALCULATION_DONE = ("completed", "failed")
+COVERAGE_GROUPS = ("source", "geography", "category", "year")
+
+
+class Recorder:
+    """Latencies and errors per endpoint name for one stage."""
+
+    def __init__(self):
+        self.latencies_ms: Dict[str, List[float]] = {}
+        self.errors: Dict[str, Dict[str, int]] = {}
+        self.flows: Dict[str, int] = {}
+
+    async def request(
+        self,
+        http: httpx.AsyncClient,
+        endpoint: str,
+        method: str,
+        path: str,
+        **kwargs: Any,
+    ) -> Optional[httpx.Response]:
+        """Send a request, recording it under `endpoint`; None on error."""
+        started = time.perf_counter()
+        response: Optional[httpx.Response] = None
+        try:
+            response = await http.request(method, path, **kwargs)
+            error = str(response.status_code) if response.status_code >= 400 else None
+        except httpx.HTTPError as e:
+            error = type(e).__name__
+        self.latencies_ms.setdefault(endpoint, []).append((time.perf_counter() - started) * 1000)
+        if error:
+            errors = self.errors.setdefault(endpoint, {})
+            errors[error] = errors.get(error, 0) + 1
+            return None
+        return response
+
+    def flow(self, name: str) -> None:
+        self.flows[name] = self.flows.get(name, 0) + 1
+
+    def report(self, elapsed: float) -> Dict[str, Any]:
+        """Per-endpoint and total statistics."""
+        endpoints = {}
+        for endpoint, latencies in sorted(self.latencies_ms.items()):
+            endpoints[endpoint] = _stats(latencies, self.errors.get(endpoint, {}), elapsed)
+
+        all_errors: Dict[str, int] = {}
+        for errors in self.errors.values():
+            for error, count in errors.items():
+                all_errors[error] = all_errors.get(error, 0) + count
+        total = _stats(
+            [ms for latencies in self.latencies_ms.values() for ms in latencies],
+            all_errors, elapsed,
+        )
+        return {"total": total, "endpoints": endpoints, "flows": dict(self.flows)}
+
+
+def _stats(latencies_ms: List[float], errors: Dict[str, int], elapsed: float) -> Dict[str, Any]:
+    stats: Dict[str, Any] = summarize(latencies_ms, elapsed)
+    stats["errors"] = dict(errors)
+    failed = sum(errors.values())
+    stats["error_rate"] = round(failed / len(latencies_ms), 4) if latencies_ms else 0.0
+    return stats
+
+
+class LoadContext:
+    """Data the scenarios draw from, discovered once before the test."""
+
+    def __init__(
+        self,
+        product_ids: List[str],
+        terms: List[str],
+        admin_headers: Optional[Dict[str, str]] = None,
+        poll_interval: float = 0.5,
+        max_polls: int = 60,
+        think_time: float = 0.0,
+    ):
+        self.product_ids = product_ids
+        self.terms = terms
+        self.admin_headers = admin_headers
+        self.poll_interval = poll_interval
+        self.max_polls = max_polls
+        self.think_time = think_time
+
+
+class Scenario:
+    """
+    One kind of user flow; `weight` sets how often virtual users pick it.
+
+    Subclasses implement run(), issuing requests through the recorder so
+    each endpoint is reported under a stable name.
+    """
+
+    name = ""
+    weight = 1
+
+    def __init__(self, context: LoadContext, recorder: Recorder, rng: random.Random):
+        self.context = context
+        self.recorder = recorder
+        self.rng = rng
+
+    async def run(self, http: httpx.AsyncClient, deadline: float) -> None:
+        raise NotImplementedError
+
+
+class ShopperScenario(Scenario):
+    """Search, open a product, calculate its footprint and poll the result."""
+
+    name = "shopper"
+    weight = 6
+
+    async def run(self, http: httpx.AsyncClient, deadline: float) -> None:
+        response = await self.recorder.request(
+            http, "product_search", "GET", "/api/v1/products/search",
+            params={
+                "query": self.rng.choice(self.context.terms),
+                "is_finished_product": True,
+                "limit": PAGE_SIZE,
+            },
+        )
+        items = response.json()["items"] if response is not None else []
+        product_id = (
+            self.rng.choice(items)["id"] if items else self.rng.choice(self.context.product_ids)
+        )
+
+        await self.recorder.request(http, "product_detail", "GET", f"/api/v1/products/{product_id}")
+
+        response = await self.recorder.request(
+            http, "calculate", "POST", "/api/v1/calculate", json={"product_id": product_id}
+        )
+        if response is None:
+            return
+        calculation_id = response.json()["calculation_id"]
+
+        for _ in range(self.context.max_polls):
+            if time.perf_counter() >= deadline:
+                return
+            await asyncio.sleep(self.context.poll_interval)
+            response = await self.recorder.request(
+                http, "calculation_status", "GET", f"/api/v1/calculations/{calculation_id}"
+            )
+            if response is not None and response.json()["status"] in CALCULATION_DONE:
+                self.recorder.flow(f"calculation_{response.json()['status']}")
+                return
+        self.recorder.flow("calculation_unfinished")
+
+
+class BrowserScenario(Scenario):
+    """Page through the product and emission factor lists."""
+
+    name = "browser"
+    weight = 3
+
+    async def run(self, http: httpx.AsyncClient, deadline: float) -> None:
+        await self.recorder.request(
+            http, "products_list", "GET", "/api/v1/products",
+            params={"limit": PAGE_SIZE, "offset": self.rng.randrange(10) * PAGE_SIZE},
+        )
+        await self.recorder.request(
+            http, "emission_factors_list", "GET", "/api/v1/emission-factors",
+            params={"limit": PAGE_SIZE, "offset": self.rng.randrange(10) * PAGE_SIZE},
+        )
+
+
+class AdminScenario(Scenario):
+    """Check coverage, sync history and data sources as an admin."""
+
+    name = "admin"
+    weight = 1
+
+    async def run(self, http: httpx.AsyncClient, deadline: float) -> None:
+        headers = self.context.admin_headers
+        await self.recorder.request(
+            http, "admin_coverage", "GET", "/admin/emission-factors/coverage",
+            params={"group_by": self.rng.choice(COVERAGE_GROUPS)}, headers=headers,
+        )
+        response = await self.recorder.request(
+            http, "admin_sync_logs", "GET", "/admin/sync-logs",
+            params={"limit": PAGE_SIZE}, headers=headers,
+        )
+        items = response.json()["items"] if response is not None else []
+        if items:
+            await self.recorder.request(
+                http, "admin_sync_log_detail", "GET",
+                f"/admin/sync-logs/{self.rng.choice(items)['id']}", headers=headers,
+            )
+        await self.recorder.request(
+            http, "admin_data_sources", "GET", "/admin/data-sources", headers=headers,
+        )
+
+
+SCENARIOS: Dict[str, Type[Scenario]] = {
+    scenario.name: scenario for scenario in (ShopperScenario, BrowserScenario, AdminScenario)
+}
+
+
+async def virtual_user(
+    http: httpx.AsyncClient,
+    scenarios: List[Scenario],
+    deadline: float,
+    rng: random.Random,
+    think_time: float,
+) -> None:
+    """Run weighted scenarios back to back until the deadline."""
+    weights = [scenario.weight for scenario in scenarios]
+    while time.perf_counter() < deadline:
+        scenario = rng.choices(scenarios, weights)[0]
+        await scenario.run(http, deadline)
+        scenario.recorder.flow(scenario.name)
+        if think_time:
+            await asyncio.sleep(rng.uniform(0, 2 * think_time))
+
+
+async def run_stage(
+    base_url: str,
+    users: int,
+    duration: float,
+    context: LoadContext,
+    scenario_names: List[str],
+    seed: int,
+) -> Dict[str, Any]:
+    """Run `users` virtual users for `duration` seconds."""
+    recorder = Recorder()
+    limits = httpx.Limits(max_connections=users, max_keepalive_connections=users)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=httpx.Timeout(60.0)) as http:
+        started = time.perf_counter()
+        deadline = started + duration
+        user_tasks = []
+        for user in range(users):
+            rng = random.Random(seed * 100003 + user)
+            scenarios = [SCENARIOS[name](context, recorder, rng) for name in scenario_names]
+            user_tasks.append(virtual_user(http, scenarios, deadline, rng, context.think_time))
+        await asyncio.gather(*user_tasks)
+        elapsed = time.perf_counter() - started
+
+    return {"users": users, "duration_s": round(elapsed, 2), **recorder.report(elapsed)}
+
+
+def find_saturation(
+    stages: List[Dict[str, Any]],
+    max_error_rate: float = 0.01,
+    p95_limit_ms: Optional[float] = None,
+    min_gain: float = 0.05,
+) -> Dict[str, Any]:
+    """
+    Locate the saturation point of a stepped load test.
+
+    Stages are walked in order; the test saturates at the first stage whose
+    error rate or p95 exceeds the limits, or whose throughput is less than
+    `min_gain` above the best so far.
+
+    Args:
+        stages: run_stage() results in increasing user order
+        max_error_rate: Highest acceptable fraction of failed requests
+        p95_limit_ms: Highest acceptable overall p95, None for no limit
+        min_gain: Smallest relative throughput increase still counted as scaling
+
+    Returns:
+        Dict with the index and users of the best stage, its throughput, and
+        limited_by ("errors", "latency", "throughput" or None if the last
+        stage was still scaling)
+    """
+    best: Optional[int] = None
+    limited_by: Optional[str] = None
+    for index, stage in enumerate(stages):
+        total = stage["total"]
+        if total["error_rate"] > max_error_rate:
+            limited_by = "errors"
+        elif p95_limit_ms is not None and total["p95_ms"] > p95_limit_ms:
+            limited_by = "latency"
+        elif best is not None and (
+            total["ops_per_second"] < stages[best]["total"]["ops_per_second"] * (1 + min_gain)
+        ):
+            limited_by = "throughput"
+        else:
+            best = index
+            continue
+        break
+
+    if best is None:
+        return {"stage": None, "users": None, "throughput_rps": 0.0, "limited_by": limited_by}
+    return {
+        "stage": best,
+        "users": stages[best]["users"],
+        "throughput_rps": stages[best]["total"]["ops_per_second"],
+        "limited_by": limited_by,
+    }
+
+
+async def discover(http: httpx.AsyncClient, admin_headers: Optional[Dict[str, str]]) -> LoadContext:
+    """Collect finished products and search terms from the server."""
+    response = await http.get("/api/v1/products", params={"limit": 100, "is_finished_product": True})
+    response.raise_for_status()
+    items = response.json()["items"]
+    if not items:
+        raise SystemExit("No finished products found; seed the database first")
+    return LoadContext(
+        product_ids=[item["id"] for item in items],
+        terms=search_terms([item["name"] for item in items]) or ["product"],
+        admin_headers=admin_headers,
+    )
+
+
+async def login(http: httpx.AsyncClient, username: str, password: str) -> Dict[str, str]:
+    """Admin Authorization header from /api/v1/auth/login."""
+    response = await http.post("/api/v1/auth/login", json={"username": username, "password": password})
+    response.raise_for_status()
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+def local_admin_headers() -> Optional[Dict[str, str]]:
+    """Authorization header for the first active admin user, if any."""
+    from backend.auth.jwt import create_access_token
+    from backend.database.connection import SessionLocal
+    from backend.models import User
+
+    with SessionLocal() as session:
+        user = (
+            session.query(User)
+            .filter(User.role == "admin", User.is_active.is_(True))
+            .order_by(User.username)
+            .first()
+        )
+        if user is None:
+            return None
+        token = create_access_token(
+            {"user_id": str(user.id), "username": user.username, "role": user.role}
+        )
+    return {"Authorization": f"Bearer {token}"}
+
+
+def start_server(port: int, workers: int, redis_url: Optional[str]) -> subprocess.Popen:
+    """Start uvicorn serving backend.main:app with rate limits out of the way."""
+    env = dict(os.environ)
+    env.update({
+        "RATE_LIMIT_GENERAL": "100000000",
+        "RATE_LIMIT_CALCULATION": "100000000",
+        "RATE_LIMIT_STORAGE": "redis" if redis_url else "memory",
+    })
+    if redis_url:
+        env.update({"CELERY_BROKER_URL": redis_url, "RATE_LIMIT_REDIS_URL": redis_url})
+    return subprocess.Popen(
+        [
+            sys.executable, "-m", "uvicorn", "backend.main:app",
+            "--port", str(port), "--workers", str(workers),
+            "--log-level", "warning", "--no-access-log",
+        ],
+        env=env,
+    )
+
+
+async def wait_until_ready(base_url: str, timeout: float = 60.0) -> None:
+    """Poll /health until the server answers."""
+    deadline = time.perf_counter() + timeout
+    async with httpx.AsyncClient(base_url=base_url) as http:
+        while time.perf_counter() < deadline:
+            try:
+                if (await http.get("/health")).status_code < 500:
+                    return
+            except httpx.HTTPError:
+                pass
+            await asyncio.sleep(0.5)
+    raise SystemExit(f"Server at {base_url} did not become ready")
+
+
+async def load_test(args: argparse.Namespace, base_url: str) -> Dict[str, Any]:
+    """Discover test data, then run every stage against `base_url`."""
+    scenario_names = list(args.scenarios)
+    async with httpx.AsyncClient(base_url=base_url, timeout=httpx.Timeout(60.0)) as http:
+        if args.admin_username:
+            admin_headers = await login(http, args.admin_username, args.admin_password or "")
+        elif not args.base_url:
+            admin_headers = local_admin_headers()
+        else:
+            admin_headers = None
+        context = await discover(http, admin_headers)
+
+    if "admin" in scenario_names and admin_headers is None:
+        print("No admin credentials; skipping the admin scenario", file=sys.stderr)
+        scenario_names.remove("admin")
+    if not scenario_names:
+        raise SystemExit("No scenarios to run")
+    context.poll_interval = args.poll_interval
+    context.think_time = args.think_time
+
+    stages = []
+    for users in args.users:
+        print(f"Stage: {users} users for {args.stage_duration}s", file=sys.stderr)
+        stages.append(await run_stage(
+            base_url, users, args.stage_duration, context, scenario_names, args.seed
+        ))
+
+    saturation = find_saturation(stages, args.max_error_rate, args.p95_limit_ms)
+    benchmarks: Dict[str, Dict[str, Any]] = {}
+    if saturation["stage"] is not None:
+        stage = stages[saturation["stage"]]
+        benchmarks["load.total"] = stage["total"]
+        for endpoint, stats in stage["endpoints"].items():
+            benchmarks[f"load.{endpoint}"] = stats
+
+    parameters = {
+        "base_url": args.base_url,
+        "users": args.users,
+        "stage_duration_s": args.stage_duration,
+        "scenarios": scenario_names,
+        "think_time_s": args.think_time,
+        "workers": None if args.base_url else args.workers,
+        "seed": args.seed,
+    }
+    document = result_document(parameters, benchmarks)
+    document["saturation"] = saturation
+    document["stages"] = stages
+    return document
+
+
+async def run(args: argparse.Namespace) -> Dict[str, Any]:
+    if args.base_url:
+        return await load_test(args, args.base_url)
+
+    server = start_server(args.port, args.workers, args.redis_url)
+    base_url = f"http://127.0.0.1:{args.port}"
+    try:
+        await wait_until_ready(base_url)
+        return await load_test(args, base_url)
+    finally:
+        server.terminate()
+        server.wait(timeout=30)
+
+
+def _int_list(value: str) -> List[int]:
+    return [int(part) for part in value.split(",") if part.strip()]
+
+
+def _scenarios(value: str) -> List[str]:
+    names = [name.strip() for name in value.split(",") if name.strip()]
+    unknown = set(names) - set(SCENARIOS)
+    if unknown:
+        raise argparse.ArgumentTypeError(f"unknown scenarios: {', '.join(sorted(unknown))}")
+    return names
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m backend.benchmarks load",
+                                     description="Stepped HTTP load test")
+    parser.add_argument("--base-url", help="Test a running server instead of starting uvicorn")
+    parser.add_argument("--users", type=_int_list, default=[10, 50, 100, 200],
+                        help="Comma-separated virtual users per stage")
+    parser.add_argument("--stage-duration", type=float, default=30.0, help="Seconds per stage")
+    parser.add_argument("--scenarios", type=_scenarios, default=list(SCENARIOS),
+                        help=f"Comma-separated scenarios (default: {','.join(SCENARIOS)})")
+    parser.add_argument("--think-time", type=float, default=0.0,
+                        help="Mean pause between user flows in seconds (0 for saturation tests)")
+    parser.add_argument("--poll-interval", type=float, default=0.5,
+                        help="Seconds between calculation status polls")
+    parser.add_argument("--max-error-rate", type=float, default=0.01,
+                        help="Error rate above which a stage counts as saturated")
+    parser.add_argument("--p95-limit-ms", type=float, default=None,
+                        help="Overall p95 above which a stage counts as saturated")
+    parser.add_argument("--admin-username", help="Admin login for the admin scenario")
+    parser.add_argument("--admin-password", help="Admin password")
+    parser.add_argument("--port", type=int, default=8766, help="Port for the local server")
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn workers for the local server")
+    parser.add_argument("--redis-url", default=None, help="Redis for the local server's cache and limiter")
+    parser.add_argument("--seed", type=int, default=42, help="Virtual user random seed")
+    parser.add_argument("--output", default=None, help="Write results to this file")
+    args = parser.parse_args(argv)
+
+    document = asyncio.run(run(args))
+    output = json.dumps(document, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+        print(f"Results written to {args.output}", file=sys.stderr)
+    else:
+        print(output)
+
+    saturation = document["saturation"]
+    print(f"Saturation: {saturation['throughput_rps']} req/s at {saturation['users']} users "
+          f"(limited by {saturation['limited_by'] or 'nothing, still scaling'})", file=sys.stderr)
+    return 0
+
+
+__all__ = [
+    'SCENARIOS',
+    'AdminScenario',
+    'BrowserScenario',
+    'LoadContext',
+    'Recorder',
+    'Scenario',
+    'ShopperScenario',
+    'find_saturation',
+    'main',
+    'run_stage',
+]
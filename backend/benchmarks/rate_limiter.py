@@ -0,0 +1,116 @@
+"""
+Rate limiter benchmarks.
+
+Benchmarks (100 operations per requested iteration, over 1000 client keys):
+- rate_limiter.memory_hit: MemoryStorage.hit
+- rate_limiter.middleware: one request through RateLimitMiddleware with
+  MemoryStorage, called as a plain ASGI app around a no-op endpoint
+- rate_limiter.redis_<algorithm>: RedisStorage.hit for each Lua algorithm,
+  and rate_limiter.hybrid_hit: HybridStorage.hit (only with --redis-url;
+  keys are written to that database and deleted afterwards)
+
+backend/scripts/benchmark_rate_limiter.py compares Redis round trips in
+more detail.
+
+Usage:
+    results = await run(iterations=200, redis_url=None)
+"""
+
+from typing import Any, Dict, Optional
+
+from backend.benchmarks.harness import measure, measure_async
+from backend.middleware.rate_limiting import (
+    RATE_LIMIT_SCRIPTS,
+    HybridStorage,
+    MemoryStorage,
+    RateLimitMiddleware,
+    RedisStorage,
+)
+
+
+OPERATIONS_PER_ITERATION = 100
+CLIENTS = 1000
+KEY_PREFIX = "bench:rate_limit"
+
+
+async def _noop_app(scope, receive, send) -> None:
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b""})
+
+
+async def _receive() -> Dict[str, Any]:
+    return {"type": "http.request", "body": b"", "more_body": False}
+
+
+async def _send(message) -> None:
+    pass
+
+
+def _scope(i: int) -> Dict[str, Any]:
+    return {
+        "type": "http",
+        "method": "GET",
+        "path": "/api/v1/products",
+        "query_string": b"",
+        "headers": [(b"host", b"bench")],
+        "client": (f"10.0.{i % CLIENTS // 256}.{i % 256}", 40000),
+    }
+
+
+def _redis_benchmarks(redis_url: str, operations: int) -> Dict[str, Dict[str, Any]]:
+    import redis
+
+    client = redis.from_url(redis_url)
+    client.ping()
+    keys = [f"{KEY_PREFIX}:{i}" for i in range(CLIENTS)]
+    results: Dict[str, Dict[str, Any]] = {}
+    try:
+        for algorithm in RATE_LIMIT_SCRIPTS:
+            storage = RedisStorage(client, algorithm=algorithm)
+            results[f"rate_limiter.redis_{algorithm}"] = measure(
+                lambda i: storage.hit(keys[i % CLIENTS], 10**9, 60), operations
+            )
+        hybrid = HybridStorage(client)
+        try:
+            results["rate_limiter.hybrid_hit"] = measure(
+                lambda i: hybrid.hit(keys[i % CLIENTS], 10**9, 60), operations
+            )
+        finally:
+            hybrid.close()
+    finally:
+        stale = client.keys(f"*{KEY_PREFIX}*")
+        if stale:
+            client.delete(*stale)
+        client.close()
+    return results
+
+
+async def run(iterations: int, redis_url: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+    """Run the rate limiter benchmarks."""
+    operations = iterations * OPERATIONS_PER_ITERATION
+    keys = [f"ip:{i}" for i in range(CLIENTS)]
+    results: Dict[str, Dict[str, Any]] = {}
+
+    storage = MemoryStorage(cleanup_interval=None)
+    results["rate_limiter.memory_hit"] = measure(
+        lambda i: storage.hit(keys[i % CLIENTS], 10**9, 60), operations
+    )
+
+    middleware = RateLimitMiddleware(
+        _noop_app,
+        storage=MemoryStorage(cleanup_interval=None),
+        default_limit=10**9,
+        window_seconds=60,
+    )
+    results["rate_limiter.middleware"] = await measure_async(
+        lambda i: middleware(_scope(i), _receive, _send), operations
+    )
+
+    if redis_url:
+        results.update(_redis_benchmarks(redis_url, operations))
+    return results
+
+
+__all__ = [
+    'run',
+]
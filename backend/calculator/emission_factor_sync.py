@@ -8,19 +8,39 @@ Features:
 - Syncs all emission factors from SQLite to Brightway2
 - Creates proper biosphere exchanges for CO2e
 - Idempotent (safe to run multiple times)
-- Updates existing factors when database changes
+- Incremental: diffs factors by content hash against the last sync and
+  rewrites only created, changed and deleted activities
+- Content hash stored on each activity; the sync watermark (digest,
+  factor count, timestamps) kept in a sidecar file in the project directory
 - Error handling for missing dependencies
 - Retry logic for SQLite database lock errors (TASK-BE-P9-010)
 - Optional skip_if_synced flag for startup optimization
 
+A full drop-and-rewrite still happens with force=True, when Brightway2
+has no activities yet (first sync), or when more than
+FULL_REWRITE_FRACTION of the activities changed. Activities written by an
+older version have no content hash and count as changed.
+
+The hashes are read back from the activities rather than recorded
+separately, so the diff cannot drift from what Brightway2 holds. Nothing
+is kept in bw.databases metadata: bw2data re-serializes it on every
+activity save.
+
 TASK-CALC-002: Sync Emission Factors to Brightway2
 TASK-BE-P9-010: Fix emission factor sync failures due to database locks
 """
 
+import contextlib
+import hashlib
+import json
+import os
 import time
+from datetime import datetime, timezone
+from pathlib import Path
 import brightway2 as bw
+from bw2data.errors import UnknownObject
 from sqlalchemy.orm import Session
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
@@ -34,31 +54,233 @@ MAX_RETRIES = 5
 INITIAL_RETRY_DELAY = 0.5  # seconds
 MAX_RETRY_DELAY = 10.0  # seconds
 
+EF_DATABASE = "pcf_emission_factors"
+
+# Sync watermark file in the Brightway2 project directory
+SYNC_STATE_FILE = "pcf_emission_factors_sync.json"
+
+# Key under which older versions kept the watermark in bw.databases[EF_DATABASE]
+LEGACY_SYNC_STATE_KEY = "pcf_sync"
+
+# Above this fraction of changed activities a full rewrite is cheaper than
+# per-activity saves
+FULL_REWRITE_FRACTION = 0.5
+
+
+def content_hash(activity: Dict[str, Any]) -> str:
+    """
+    Hash of the emission factor fields that end up in Brightway2.
+
+    Args:
+        activity: Entry from _load_factors()
+
+    Returns:
+        16-character hex digest
+    """
+    raw = json.dumps([
+        activity["emission_factor_id"],
+        activity["name"],
+        activity["unit"],
+        activity["location"],
+        activity["co2e"],
+    ])
+    return hashlib.sha256(raw.encode()).hexdigest()[:16]
+
+
+def _digest(hashes: Dict[str, str]) -> str:
+    raw = json.dumps(sorted(hashes.items()))
+    return hashlib.sha256(raw.encode()).hexdigest()[:16]
+
+
+def _load_factors(db_session: Session) -> Tuple[Dict[str, Dict[str, Any]], int, Optional[datetime]]:
+    """
+    Read the emission factors to sync, keyed by activity code.
+
+    The activity name is the Brightway2 code; when several factors share a
+    name the one with the highest id wins (as the last write did before).
+
+    Returns:
+        (activities by code, number of factors, latest updated_at)
+    """
+    from backend.models import EmissionFactor
+
+    rows = (
+        db_session.query(
+            EmissionFactor.id,
+            EmissionFactor.activity_name,
+            EmissionFactor.unit,
+            EmissionFactor.geography,
+            EmissionFactor.co2e_factor,
+            EmissionFactor.updated_at,
+        )
+        .order_by(EmissionFactor.id)
+        .all()
+    )
+
+    activities: Dict[str, Dict[str, Any]] = {}
+    for row in rows:
+        activity = {
+            "emission_factor_id": row.id,
+            "name": row.activity_name,
+            "unit": row.unit,
+            "location": row.geography or "GLO",
+            "co2e": float(row.co2e_factor),
+        }
+        activity["hash"] = content_hash(activity)
+        activities[row.activity_name] = activity
+
+    updated = [row.updated_at for row in rows if row.updated_at is not None]
+    return activities, len(rows), max(updated) if updated else None
+
+
+def diff_activities(
+    current: Dict[str, str],
+    previous: Dict[str, Optional[str]],
+) -> Dict[str, List[str]]:
+    """
+    Compare content hashes by activity code.
+
+    Args:
+        current: Hash per code from the SQL database
+        previous: Hash per code stored in Brightway2 by the last sync
+
+    Returns:
+        Dict of sorted code lists: created, updated, deleted, unchanged
+    """
+    return {
+        "created": sorted(current.keys() - previous.keys()),
+        "updated": sorted(
+            code for code in current.keys() & previous.keys() if current[code] != previous[code]
+        ),
+        "deleted": sorted(previous.keys() - current.keys()),
+        "unchanged": sorted(
+            code for code in current.keys() & previous.keys() if current[code] == previous[code]
+        ),
+    }
+
+
+def synced_hashes() -> Dict[str, Optional[str]]:
+    """
+    Content hash per activity code as stored in Brightway2.
+
+    Returns:
+        Dict of code to content hash (None for activities written before
+        hashes were stored); empty if the database does not exist
+    """
+    if EF_DATABASE not in bw.databases:
+        return {}
+    return {act["code"]: act.get("content_hash") for act in bw.Database(EF_DATABASE)}
+
+
+def _sync_state_path() -> Path:
+    return Path(bw.projects.dir) / SYNC_STATE_FILE
+
+
+def get_sync_state() -> Optional[Dict[str, Any]]:
+    """
+    Sync watermark recorded by the last sync, if any.
+
+    Returns:
+        Dict with digest, factor_count, synced_at and max_updated_at
+        (ISO 8601), or None
+    """
+    try:
+        with open(_sync_state_path()) as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return None
+
+
+def _record_sync_state(
+    activities: Dict[str, Dict[str, Any]],
+    factor_count: int,
+    max_updated_at: Optional[datetime],
+) -> Dict[str, Any]:
+    hashes = {code: activity["hash"] for code, activity in activities.items()}
+    state = {
+        "digest": _digest(hashes),
+        "factor_count": factor_count,
+        "synced_at": datetime.now(timezone.utc).isoformat(),
+        "max_updated_at": max_updated_at.isoformat() if max_updated_at else None,
+    }
+    path = _sync_state_path()
+    tmp = path.with_suffix(".tmp")
+    with open(tmp, "w") as f:
+        json.dump(state, f)
+    os.replace(tmp, path)
+
+    # Drop the watermark older versions kept in the database metadata
+    if bw.databases.get(EF_DATABASE, {}).pop(LEGACY_SYNC_STATE_KEY, None) is not None:
+        bw.databases.flush()
+    return state
+
+
+def _activity_data(code: str, activity: Dict[str, Any]) -> Dict[str, Any]:
+    """Brightway2 activity dataset for one emission factor."""
+    return {
+        "name": activity["name"],
+        "unit": activity["unit"],
+        "type": "process",
+        "location": activity["location"],
+        "categories": ("emission_factor",),
+        "emission_factor_id": activity["emission_factor_id"],
+        "content_hash": activity["hash"],
+        "exchanges": [
+            {
+                # Production exchange (self-reference)
+                "input": (EF_DATABASE, code),
+                "amount": 1.0,
+                "unit": activity["unit"],
+                "type": "production",
+            },
+            {
+                # CO2e biosphere exchange
+                # Uses "Carbon dioxide, fossil" flow from biosphere3
+                "input": ("biosphere3", DEFAULT_CO2_FLOW_CODE),
+                "amount": activity["co2e"],
+                "unit": "kg",
+                "type": "biosphere",
+                "name": "Carbon dioxide, fossil",
+            },
+        ],
+    }
+
+
+def _lci_transaction():
+    """
+    One SQLite transaction for a batch of activity writes.
+
+    Falls back to no explicit transaction if the bw2data version does not
+    expose its LCI database.
+    """
+    try:
+        from bw2data.backends import sqlite3_lci_db  # bw2data >= 4
+    except ImportError:
+        try:
+            from bw2data.backends.peewee import sqlite3_lci_db  # bw2data 3.x
+        except ImportError:
+            return contextlib.nullcontext()
+    return sqlite3_lci_db.db.atomic()
+
 
 def is_sync_needed(db_session: Session) -> bool:
     """
     Check if emission factor sync is needed.
 
-    Compares the count of emission factors in the PostgreSQL/SQLite database
-    with the count in Brightway2. Also checks for empty Brightway2 database.
-
-    Note: This only checks counts, not whether individual values have changed.
-    For detecting content changes, use force=True on sync_emission_factors().
+    Compares the content hashes of the emission factors in the
+    PostgreSQL/SQLite database with those stored on the Brightway2
+    activities, so changed values are detected as well as added or
+    removed factors.
 
     Args:
         db_session: SQLAlchemy session for database access
 
     Returns:
-        True if sync is needed (Brightway2 empty or counts differ),
-        False if counts match (data may or may not be stale)
+        True if sync is needed (no recorded sync, or Brightway2 activities
+        differ from the factors), False if Brightway2 is up to date
 
     TASK-BE-P9-010: Added to optimize sync by skipping when unnecessary
     """
-    from backend.models import EmissionFactor
-
-    # Count emission factors in SQL database
-    sql_count = db_session.query(EmissionFactor).count()
-
     # Check Brightway2 database
     if "pcf_calculator" not in bw.projects:
         logger.debug("Sync needed: Brightway2 project does not exist")
@@ -66,22 +288,21 @@ def is_sync_needed(db_session: Session) -> bool:
 
     bw.projects.set_current("pcf_calculator")
 
-    if "pcf_emission_factors" not in bw.databases:
+    if EF_DATABASE not in bw.databases:
         logger.debug("Sync needed: pcf_emission_factors database does not exist")
         return True
 
-    ef_db = bw.Database("pcf_emission_factors")
-    bw_count = len(ef_db)
-
-    if bw_count == 0 and sql_count > 0:
-        logger.debug(f"Sync needed: Brightway2 database empty but SQL has {sql_count} factors")
+    if get_sync_state() is None:
+        logger.debug("Sync needed: no sync state recorded")
         return True
 
-    if bw_count != sql_count:
-        logger.debug(f"Sync needed: Count mismatch - SQL={sql_count}, BW2={bw_count}")
+    activities, factor_count, _ = _load_factors(db_session)
+    hashes = {code: activity["hash"] for code, activity in activities.items()}
+    if hashes != synced_hashes():
+        logger.debug("Sync needed: emission factors changed since last sync")
         return True
 
-    logger.debug(f"Sync not needed: Both databases have {sql_count} emission factors")
+    logger.debug(f"Sync not needed: {factor_count} emission factors unchanged")
     return False
 
 
@@ -90,6 +311,7 @@ def sync_emission_factors(
     validate_biosphere: bool = False,
     skip_if_synced: bool = False,
     max_retries: int = MAX_RETRIES,
+    force: bool = False,
 ) -> Dict[str, Any]:
     """
     Sync emission factors from SQLite database to Brightway2.
@@ -100,7 +322,10 @@ def sync_emission_factors(
     emission factor.
 
     The sync is idempotent - running multiple times will not create duplicates.
-    Instead, the existing database is cleared and recreated with current data.
+    Factors are diffed by content hash against the last sync and only
+    created, changed and deleted activities are written; an unchanged
+    resync writes nothing. A full drop-and-rewrite is used with force=True,
+    on the first sync, or when most activities changed.
 
     Includes retry logic with exponential backoff for SQLite lock errors
     (TASK-BE-P9-010).
@@ -110,18 +335,23 @@ def sync_emission_factors(
                    If None, creates a new session automatically.
         validate_biosphere: If True, raises error if biosphere3 database
                            is not available. Default False.
-        skip_if_synced: If True, skip sync when Brightway2 already has
-                        emission factors with matching count. Default False.
-                        This is useful for startup optimization but should NOT
-                        be used when expecting data updates to be reflected.
+        skip_if_synced: If True, skip sync when is_sync_needed() reports
+                        Brightway2 up to date. Default False.
         max_retries: Maximum number of retries for database lock errors.
                     Default 5.
+        force: If True, drop and rewrite the whole database. Default False.
 
     Returns:
         Dictionary with sync statistics:
         {
             "synced_count": int,  # Number of emission factors synced
-            "skipped": bool       # True if sync was skipped (skip_if_synced=True and data present)
+            "skipped": bool,      # True if sync was skipped (skip_if_synced=True and up to date)
+            "mode": str,          # "full" or "incremental"
+            "created": int,       # Activities added
+            "updated": int,       # Activities rewritten with new values
+            "deleted": int,       # Activities removed
+            "unchanged": int,     # Activities left untouched
+            "watermark": dict,    # synced_at, max_updated_at, digest
         }
 
     Raises:
@@ -135,7 +365,7 @@ def sync_emission_factors(
         >>> print(f"Synced {result['synced_count']} emission factors")
 
     Example (startup optimization):
-        >>> # Skip sync if already populated (for faster startup)
+        >>> # Skip sync if already up to date (for faster startup)
         >>> result = sync_emission_factors(skip_if_synced=True)
         >>> if result.get('skipped'):
         ...     print("Using existing Brightway2 data")
@@ -162,15 +392,16 @@ def sync_emission_factors(
         from backend.database.connection import db_context
 
         with db_context() as session:
-            return _sync_with_retry(session, skip_if_synced, max_retries)
+            return _sync_with_retry(session, skip_if_synced, max_retries, force)
     else:
-        return _sync_with_retry(db_session, skip_if_synced, max_retries)
+        return _sync_with_retry(db_session, skip_if_synced, max_retries, force)
 
 
 def _sync_with_retry(
     db_session: Session,
     skip_if_synced: bool,
     max_retries: int,
+    force: bool = False,
 ) -> Dict[str, Any]:
     """
     Perform sync with retry logic for database lock errors.
@@ -179,8 +410,9 @@ def _sync_with_retry(
 
     Args:
         db_session: Active SQLAlchemy session
-        skip_if_synced: If True, skip sync when counts match
+        skip_if_synced: If True, skip sync when Brightway2 is up to date
         max_retries: Maximum number of retries
+        force: If True, drop and rewrite the whole database
 
     Returns:
         Dictionary with sync statistics
@@ -190,10 +422,9 @@ def _sync_with_retry(
     import random
 
     # Check if sync should be skipped (optimization)
-    if skip_if_synced and not is_sync_needed(db_session):
-        bw.projects.set_current("pcf_calculator")
-        ef_db = bw.Database("pcf_emission_factors")
-        count = len(ef_db)
+    if skip_if_synced and not force and not is_sync_needed(db_session):
+        state = get_sync_state()
+        count = state["factor_count"]
         logger.info(f"Sync skipped: Brightway2 already has {count} emission factors")
         return {"synced_count": count, "skipped": True}
 
@@ -202,7 +433,7 @@ def _sync_with_retry(
 
     for attempt in range(max_retries):
         try:
-            result = _sync_emission_factors_impl(db_session)
+            result = _sync_emission_factors_impl(db_session, force=force)
             result["skipped"] = False
             return result
         except Exception as e:
@@ -237,7 +468,7 @@ def _sync_with_retry(
     )
 
 
-def _sync_emission_factors_impl(db_session: Session) -> Dict[str, Any]:
+def _sync_emission_factors_impl(db_session: Session, force: bool = False) -> Dict[str, Any]:
     """
     Internal implementation of emission factor sync.
 
@@ -245,75 +476,106 @@ def _sync_emission_factors_impl(db_session: Session) -> Dict[str, Any]:
 
     Args:
         db_session: Active SQLAlchemy session
+        force: If True, drop and rewrite the whole database
 
     Returns:
         Dictionary with sync statistics
     """
-    from backend.models import EmissionFactor
+    activities, factor_count, max_updated_at = _load_factors(db_session)
+
+    logger.info(f"Found {factor_count} emission factors in database")
+
+    hashes = {code: activity["hash"] for code, activity in activities.items()}
+    previous = synced_hashes()
+    changes = diff_activities(hashes, previous)
+    changed = len(changes["created"]) + len(changes["updated"]) + len(changes["deleted"])
+
+    full = (
+        force
+        or not previous
+        or changed > FULL_REWRITE_FRACTION * max(len(hashes), 1)
+    )
+
+    if full:
+        _write_all(activities)
+        changes = diff_activities(hashes, {})
+    elif changed:
+        _write_changes(activities, changes)
+        logger.info(
+            f"Synced {changed} changed emission factors to Brightway2 "
+            f"({len(changes['created'])} created, {len(changes['updated'])} updated, "
+            f"{len(changes['deleted'])} deleted)"
+        )
+    else:
+        logger.info(f"Sync found no changes in {factor_count} emission factors")
+
+    state = get_sync_state()
+    if full or changed or state is None:
+        state = _record_sync_state(activities, factor_count, max_updated_at)
 
-    # Query all emission factors from database
-    factors = db_session.query(EmissionFactor).all()
+    return {
+        "synced_count": factor_count,
+        "mode": "full" if full else "incremental",
+        "created": len(changes["created"]),
+        "updated": len(changes["updated"]),
+        "deleted": len(changes["deleted"]),
+        "unchanged": len(changes["unchanged"]),
+        "watermark": {
+            "synced_at": state["synced_at"],
+            "max_updated_at": state["max_updated_at"],
+            "digest": state["digest"],
+        },
+    }
 
-    logger.info(f"Found {len(factors)} emission factors in database")
 
+def _write_all(activities: Dict[str, Dict[str, Any]]) -> None:
+    """Drop pcf_emission_factors and write every activity."""
     # Clear and recreate pcf_emission_factors database
     # This ensures idempotency - no duplicates on re-run
-    if "pcf_emission_factors" in bw.databases:
-        ef_db = bw.Database("pcf_emission_factors")
+    if EF_DATABASE in bw.databases:
+        ef_db = bw.Database(EF_DATABASE)
         ef_db.delete(warn=False)  # Suppress deprecation warning
         logger.info("Cleared existing pcf_emission_factors database")
 
-    ef_db = bw.Database("pcf_emission_factors")
-
-    # Build activity data for Brightway2
-    data = {}
-
-    for factor in factors:
-        # Use activity_name as the code (unique identifier)
-        code = factor.activity_name
-
-        # Create activity with biosphere exchange
-        activity_data = {
-            "name": factor.activity_name,
-            "unit": factor.unit,
-            "type": "process",
-            "location": factor.geography or "GLO",
-            "categories": ("emission_factor",),
-            "exchanges": [
-                {
-                    # Production exchange (self-reference)
-                    "input": ("pcf_emission_factors", code),
-                    "amount": 1.0,
-                    "unit": factor.unit,
-                    "type": "production",
-                },
-                {
-                    # CO2e biosphere exchange
-                    # Uses "Carbon dioxide, fossil" flow from biosphere3
-                    "input": ("biosphere3", DEFAULT_CO2_FLOW_CODE),
-                    "amount": float(factor.co2e_factor),
-                    "unit": "kg",
-                    "type": "biosphere",
-                    "name": "Carbon dioxide, fossil",
-                },
-            ],
-        }
-
-        # Store in data dictionary with database key
-        data[(ef_db.name, code)] = activity_data
+    ef_db = bw.Database(EF_DATABASE)
+    data = {
+        (EF_DATABASE, code): _activity_data(code, activity)
+        for code, activity in activities.items()
+    }
 
     # Write all activities to Brightway2 database
+    ef_db.write(data)
     if data:
-        ef_db.write(data)
-        logger.info(f"Synced {len(factors)} emission factors to Brightway2")
+        logger.info(f"Synced {len(data)} emission factors to Brightway2")
     else:
         # Handle empty database case
-        ef_db.write({})
         logger.info("No emission factors to sync (empty database)")
 
-    return {
-        "synced_count": len(factors)
-    }
+
+def _write_changes(
+    activities: Dict[str, Dict[str, Any]],
+    changes: Dict[str, List[str]],
+) -> None:
+    """Delete removed and changed activities and save new versions in one transaction."""
+    ef_db = bw.Database(EF_DATABASE)
+
+    with _lci_transaction():
+        for code in changes["deleted"] + changes["updated"]:
+            try:
+                ef_db.get(code).delete()
+            except UnknownObject:
+                pass
+
+        for code in changes["updated"] + changes["created"]:
+            data = _activity_data(code, activities[code])
+            exchanges = data.pop("exchanges")
+            act = ef_db.new_activity(code, **data)
+            act.save()
+            for exchange in exchanges:
+                act.new_exchange(**exchange).save()
+
+    # Rebuild the processed arrays once for the batch
+    ef_db.process()
 
 
 def get_emission_factor_activity(activity_name: str) -> Optional[Any]:
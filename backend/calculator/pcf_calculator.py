@@ -17,6 +17,7 @@ Features:
 - Data quality scoring
 - Integration with database products
 - Non-blocking async initialization (TASK-CALC-P7-016)
+- Lazy Brightway2 initialization on first legacy use (get_legacy_calculator)
 - Decoupled from ORM via dependency injection (TASK-CALC-P7-022)
 - Robust sync with retry logic (TASK-BE-P9-010)
 
@@ -27,7 +28,9 @@ TASK-BE-P9-010: Fix emission factor sync failures due to database locks
 """
 
 import asyncio
+import importlib.util
 import logging
+import time
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
 
@@ -106,6 +109,11 @@ _calculator_instance: Optional["PCFCalculator"] = None
 _init_lock = asyncio.Lock()
 _initialized = False
 
+# Legacy engine state for readiness checks: cold -> warming -> warm | failed
+_init_status = "cold"
+_init_error: Optional[str] = None
+_init_seconds: Optional[float] = None
+
 
 def _initialize_brightway_sync() -> None:
     """
@@ -125,36 +133,47 @@ def _initialize_brightway_sync() -> None:
     Raises:
         Exception: If Brightway2 project or database not initialized
     """
-    global _calculator_instance, _initialized
+    global _calculator_instance, _initialized, _init_status, _init_error, _init_seconds
 
     if _initialized:
         logger.debug("PCFCalculator already initialized, skipping")
         return
 
     logger.info("Starting synchronous Brightway2 initialization in thread pool...")
+    _init_status = "warming"
+    _init_error = None
+    started = time.perf_counter()
+
+    try:
+        # Import and run Brightway setup
+        from backend.calculator.brightway_setup import initialize_brightway
+        from backend.calculator.emission_factor_sync import sync_emission_factors
+        from backend.database.connection import db_context
+
+        # Initialize Brightway2
+        initialize_brightway()
+
+        # Sync emission factors from database
+        # TASK-BE-P9-010: Use skip_if_synced=True for faster startup when data already synced
+        # This avoids re-syncing on every server restart, improving startup time.
+        # Also includes retry logic for database lock errors.
+        with db_context() as session:
+            result = sync_emission_factors(db_session=session, skip_if_synced=True)
+            if result.get("skipped"):
+                logger.info(f"Using existing {result['synced_count']} emission factors in Brightway2")
+            else:
+                logger.info(f"Synced {result['synced_count']} emission factors to Brightway2")
 
-    # Import and run Brightway setup
-    from backend.calculator.brightway_setup import initialize_brightway
-    from backend.calculator.emission_factor_sync import sync_emission_factors
-    from backend.database.connection import db_context
-
-    # Initialize Brightway2
-    initialize_brightway()
-
-    # Sync emission factors from database
-    # TASK-BE-P9-010: Use skip_if_synced=True for faster startup when data already synced
-    # This avoids re-syncing on every server restart, improving startup time.
-    # Also includes retry logic for database lock errors.
-    with db_context() as session:
-        result = sync_emission_factors(db_session=session, skip_if_synced=True)
-        if result.get("skipped"):
-            logger.info(f"Using existing {result['synced_count']} emission factors in Brightway2")
-        else:
-            logger.info(f"Synced {result['synced_count']} emission factors to Brightway2")
+        # Create calculator instance (legacy mode without ef_provider)
+        _calculator_instance = PCFCalculator()
+    except Exception as e:
+        _init_status = "failed"
+        _init_error = f"{type(e).__name__}: {e}"
+        raise
 
-    # Create calculator instance (legacy mode without ef_provider)
-    _calculator_instance = PCFCalculator()
     _initialized = True
+    _init_status = "warm"
+    _init_seconds = round(time.perf_counter() - started, 3)
 
     logger.info("Brightway2 initialization complete")
 
@@ -195,7 +214,8 @@ def get_pcf_calculator() -> "PCFCalculator":
     Get the initialized PCF Calculator instance.
 
     Returns the singleton PCFCalculator instance that was created
-    during async initialization.
+    during async initialization. Brightway2 is initialized lazily, so
+    prefer get_legacy_calculator(), which initializes on first use.
 
     Returns:
         PCFCalculator: The initialized calculator instance
@@ -210,8 +230,8 @@ def get_pcf_calculator() -> "PCFCalculator":
     """
     if _calculator_instance is None:
         raise RuntimeError(
-            "PCF Calculator not initialized. Wait for startup to complete. "
-            "Call initialize_pcf_calculator() during application startup."
+            "PCF Calculator not initialized. Use get_legacy_calculator() or "
+            "await initialize_pcf_calculator() first."
         )
     return _calculator_instance
 
@@ -230,6 +250,48 @@ def is_calculator_initialized() -> bool:
     return _initialized
 
 
+async def get_legacy_calculator() -> "PCFCalculator":
+    """
+    Get the legacy (Brightway2) PCF Calculator, initializing it on first use.
+
+    Brightway2 is not initialized at startup unless BRIGHTWAY_EAGER_INIT is
+    set, so legacy callers use this instead of get_pcf_calculator(). The
+    first call runs initialize_pcf_calculator() (in the thread pool);
+    concurrent first calls share one initialization.
+
+    Returns:
+        PCFCalculator: The initialized calculator instance
+
+    Raises:
+        Exception: If Brightway2 initialization fails
+
+    Example:
+        calculator = await get_legacy_calculator()
+        result = calculator.calculate_legacy(bom)
+    """
+    await initialize_pcf_calculator()
+    return get_pcf_calculator()
+
+
+def get_legacy_engine_status() -> Dict[str, Any]:
+    """
+    Describe the legacy Brightway2 engine for readiness checks.
+
+    Does not import Brightway2.
+
+    Returns:
+        dict with:
+        - status: "cold" (not yet used), "warming", "warm", "failed", or
+          "unavailable" (cold and brightway2 is not installed)
+        - error: Initialization error of the last failed attempt
+        - init_seconds: Initialization duration once warm
+    """
+    status = _init_status
+    if status == "cold" and importlib.util.find_spec("brightway2") is None:
+        status = "unavailable"
+    return {"status": status, "error": _init_error, "init_seconds": _init_seconds}
+
+
 async def wait_for_calculator_ready(timeout: float = 30.0) -> None:
     """
     Wait for the PCF Calculator to be initialized.
@@ -11,16 +11,49 @@ Design Notes:
 - This is the ONLY module in the calculator package that imports SQLAlchemy
 - All database operations are async-compatible using SQLAlchemy sessions
 - Converts ORM models to DTOs to maintain separation of concerns
+- get_by_category uses cached lambda statements: each lookup is built and
+  compiled once per process, later calls only bind the category
 """
 
 from typing import Dict, Optional
 
-from sqlalchemy import select
+from sqlalchemy import case, lambda_stmt, or_, select
 from sqlalchemy.orm import Session
+from sqlalchemy.sql.lambdas import StatementLambdaElement
 
 from .providers import EmissionFactorDTO, EmissionFactorProvider
 
 
+def category_exact_statement(category: str) -> StatementLambdaElement:
+    """Cached lookup of the first active factor with exactly this category."""
+    # Import here to avoid circular imports and keep SQLAlchemy imports isolated
+    from backend.models import EmissionFactor
+
+    return lambda_stmt(
+        lambda: select(EmissionFactor).where(
+            EmissionFactor.category == category,
+            EmissionFactor.is_active == True  # noqa: E712
+        ).limit(1)
+    )
+
+
+def category_fallback_statement(category: str) -> StatementLambdaElement:
+    """Cached case-insensitive category, then activity_name, lookup."""
+    from backend.models import EmissionFactor
+
+    return lambda_stmt(
+        lambda: select(EmissionFactor).where(
+            or_(
+                EmissionFactor.category.ilike(category),
+                EmissionFactor.activity_name.ilike(category),
+            ),
+            EmissionFactor.is_active == True  # noqa: E712
+        ).order_by(
+            case((EmissionFactor.category.ilike(category), 0), else_=1)
+        ).limit(1)
+    )
+
+
 class SQLAlchemyEmissionFactorProvider(EmissionFactorProvider):
     """
     SQLAlchemy implementation of EmissionFactorProvider.
@@ -65,31 +98,18 @@ class SQLAlchemyEmissionFactorProvider(EmissionFactorProvider):
             EmissionFactorDTO if found, None otherwise
 
         Note:
-            Uses case-insensitive matching for category lookup.
+            Uses case-insensitive matching for category lookup. The
+            case-insensitive fallbacks run as one query; on PostgreSQL the
+            ILIKE predicates are served by the pg_trgm GIN indexes.
         """
-        # Import here to avoid circular imports and keep SQLAlchemy imports isolated
-        from backend.models import EmissionFactor
-
         # Query for matching category (case-insensitive, active only)
         # Try exact match first, then case-insensitive
-        result = self._session.query(EmissionFactor).filter(
-            EmissionFactor.category == category,
-            EmissionFactor.is_active == True  # noqa: E712
-        ).first()
+        result = self._session.scalars(category_exact_statement(category)).first()
 
-        # If no exact match, try case-insensitive
+        # If no exact match, try case-insensitive category, then activity_name
+        # as fallback, in a single query (category matches rank first)
         if result is None:
-            result = self._session.query(EmissionFactor).filter(
-                EmissionFactor.category.ilike(category),
-                EmissionFactor.is_active == True  # noqa: E712
-            ).first()
-
-        # If still no match, try activity_name as fallback
-        if result is None:
-            result = self._session.query(EmissionFactor).filter(
-                EmissionFactor.activity_name.ilike(category),
-                EmissionFactor.is_active == True  # noqa: E712
-            ).first()
+            result = self._session.scalars(category_fallback_statement(category)).first()
 
         if result is None:
             return None
@@ -131,8 +131,20 @@ class Settings(BaseSettings):
         db_max_overflow: Maximum overflow connections
         db_pool_timeout: Connection pool timeout in seconds
         db_pool_recycle: Connection recycle time in seconds
+        db_prepared_statement_cache_size: asyncpg prepared statements kept per connection
+        db_pool_adaptive: Tune pool_size/max_overflow from observed checkout waits
+        db_pool_min_size: Smallest pool_size in adaptive mode
+        db_pool_max_size: Largest pool_size in adaptive mode
+        db_pool_max_overflow_limit: Largest max_overflow in adaptive mode
+        db_pool_target_wait_ms: Acceptable p95 checkout wait in adaptive mode
+        database_replica_urls: Comma-separated read replica URLs (optional)
+        db_replica_check_interval: Seconds a healthy replica probe is trusted
+        db_replica_retry_after: Seconds a failed replica is skipped
+        db_read_your_writes_seconds: Seconds a writer's reads stay on the primary
         cors_origins: Allowed CORS origins for frontend
         api_v1_prefix: API version 1 prefix
+        ASYNC_ROUTES: Serve hot read/calculation endpoints from async handlers
+        BRIGHTWAY_EAGER_INIT: Warm the legacy Brightway2 engine in the background at startup
         CELERY_BROKER_URL: Celery broker URL (Redis)
         CELERY_RESULT_BACKEND: Celery result backend URL (Redis)
         REDIS_HOST: Redis host
@@ -140,12 +152,24 @@ class Settings(BaseSettings):
         REDIS_DB: Redis database number
         PCF_CALC_JWT_SECRET_KEY: Secret key for JWT token signing (from file/env)
         ACCESS_TOKEN_EXPIRE_MINUTES: JWT token expiration time
+        AUTH_TOKEN_CACHE_SIZE: Verified JWT cache size
+        AUTH_USER_CACHE_TTL: Authenticated user cache TTL
         emission_factor_cache_ttl: Emission factor cache TTL in seconds
         RATE_LIMIT_GENERAL: General rate limit (requests/minute)
         RATE_LIMIT_CALCULATION: Calculation rate limit (requests/minute)
         RATE_LIMIT_AUTH_ATTEMPTS: Auth rate limit (attempts/5 minutes)
         RATE_LIMIT_STORAGE: Storage backend for rate limiting
         RATE_LIMIT_ADMIN_MULTIPLIER: Multiplier for admin rate limits
+        RATE_LIMIT_ALGORITHM: Redis rate limit algorithm
+        RATE_LIMIT_SYNC_INTERVAL: Hybrid mode reconciliation interval
+        RATE_LIMIT_SLACK: Hybrid mode unsynced admissions per client before an early reconciliation
+        METRICS_TOKEN: Bearer token for /metrics scrapes (unset: admin JWT required)
+        PROFILING_ENABLED: Enable request profiling (X-Profile header, slow requests)
+        PROFILING_SLOW_REQUEST_MS: Profile requests slower than this (0 disables)
+        PROFILING_CPROFILE_ADMINS: Comma-separated admin usernames allowed cProfile
+        PROFILING_SAMPLE_INTERVAL_MS: Stack sampling interval
+        PROFILING_DIR: Directory for profile artifacts
+        PROFILING_MAX_PROFILES: Number of profiles kept
     """
 
     model_config = SettingsConfigDict(
@@ -189,6 +213,54 @@ class Settings(BaseSettings):
         default=1800,
         description="Seconds before recycling connections (30 min default)"
     )
+    db_prepared_statement_cache_size: int = Field(
+        default=500,
+        description=(
+            "Server-side prepared statements cached per asyncpg connection "
+            "(0 disables; required behind PgBouncer in transaction mode)"
+        )
+    )
+
+    # Adaptive pool sizing (optional); see backend/database/pool_metrics.py
+    db_pool_adaptive: bool = Field(
+        default=False,
+        description="Grow/shrink pool_size and max_overflow based on checkout wait time"
+    )
+    db_pool_min_size: int = Field(
+        default=5,
+        description="Lower bound for pool_size when adaptive sizing is enabled"
+    )
+    db_pool_max_size: int = Field(
+        default=40,
+        description="Upper bound for pool_size when adaptive sizing is enabled"
+    )
+    db_pool_max_overflow_limit: int = Field(
+        default=40,
+        description="Upper bound for max_overflow when adaptive sizing is enabled"
+    )
+    db_pool_target_wait_ms: float = Field(
+        default=50.0,
+        description="p95 checkout wait (ms) above which the adaptive pool grows"
+    )
+
+    # Read replicas (optional): read-only endpoints are routed to these
+    # when set; see backend/database/replicas.py
+    database_replica_urls: str = Field(
+        default="",
+        description="Comma-separated PostgreSQL read replica URLs (empty disables routing)"
+    )
+    db_replica_check_interval: float = Field(
+        default=5.0,
+        description="Seconds a successful replica health probe is trusted"
+    )
+    db_replica_retry_after: float = Field(
+        default=30.0,
+        description="Seconds a failed replica is skipped before it is probed again"
+    )
+    db_read_your_writes_seconds: float = Field(
+        default=5.0,
+        description="Seconds after a write that the same user/client reads from the primary"
+    )
 
     # Supabase settings (optional)
     supabase_url: Optional[str] = Field(
@@ -221,6 +293,20 @@ class Settings(BaseSettings):
 
     # API settings
     api_v1_prefix: str = Field(default="/api/v1", description="API v1 prefix")
+    ASYNC_ROUTES: bool = Field(
+        default=False,
+        description=(
+            "Serve product, emission factor list and calculation endpoints from "
+            "async handlers on AsyncSession (asyncpg) instead of the threadpool"
+        )
+    )
+    BRIGHTWAY_EAGER_INIT: bool = Field(
+        default=False,
+        description=(
+            "Initialize the legacy Brightway2 calculator in the background at "
+            "startup; otherwise it is initialized on first legacy use"
+        )
+    )
 
     # Celery settings
     CELERY_BROKER_URL: str = Field(
@@ -257,6 +343,14 @@ class Settings(BaseSettings):
         default=60,
         description="JWT access token expiration time in minutes"
     )
+    AUTH_TOKEN_CACHE_SIZE: int = Field(
+        default=1024,
+        description="Verified JWT cache size (tokens); 0 disables the cache"
+    )
+    AUTH_USER_CACHE_TTL: float = Field(
+        default=30.0,
+        description="Seconds an authenticated user's row is cached; 0 disables the cache"
+    )
 
     # Emission factor cache settings (TASK-CALC-P7-022)
     emission_factor_cache_ttl: int = Field(
@@ -279,7 +373,7 @@ class Settings(BaseSettings):
     )
     RATE_LIMIT_STORAGE: str = Field(
         default="memory",
-        description="Rate limit storage backend: 'memory' or 'redis'"
+        description="Rate limit storage backend: 'memory', 'redis' or 'hybrid'"
     )
     RATE_LIMIT_ADMIN_MULTIPLIER: int = Field(
         default=10,
@@ -289,6 +383,50 @@ class Settings(BaseSettings):
         default=None,
         description="Redis URL for distributed rate limiting (optional)"
     )
+    RATE_LIMIT_ALGORITHM: str = Field(
+        default="sliding_window",
+        description="Redis rate limit algorithm: 'sliding_window', 'gcra' or 'fixed_window'"
+    )
+    RATE_LIMIT_SYNC_INTERVAL: float = Field(
+        default=1.0,
+        description="Hybrid rate limiting: seconds between Redis reconciliations"
+    )
+    RATE_LIMIT_SLACK: int = Field(
+        default=10,
+        description="Hybrid rate limiting: unsynced admissions per client after which a worker reconciles early"
+    )
+
+    # Prometheus scrape token for /metrics
+    METRICS_TOKEN: Optional[str] = Field(
+        default=None,
+        description="Bearer token required by GET /metrics; when unset an admin JWT is required"
+    )
+
+    # Request profiling settings
+    PROFILING_ENABLED: bool = Field(
+        default=False,
+        description="Enable request profiling (admin X-Profile header and slow requests)"
+    )
+    PROFILING_SLOW_REQUEST_MS: float = Field(
+        default=0.0,
+        description="Profile every request slower than this many milliseconds (0 disables)"
+    )
+    PROFILING_CPROFILE_ADMINS: str = Field(
+        default="",
+        description="Comma-separated admin usernames allowed to request cProfile"
+    )
+    PROFILING_SAMPLE_INTERVAL_MS: float = Field(
+        default=5.0,
+        description="Stack sampling interval in milliseconds"
+    )
+    PROFILING_DIR: str = Field(
+        default="",
+        description="Directory for profile artifacts (default: <tmp>/pcf-profiles)"
+    )
+    PROFILING_MAX_PROFILES: int = Field(
+        default=200,
+        description="Number of profiles kept; older ones are deleted"
+    )
 
     @property
     def is_postgresql(self) -> bool:
@@ -319,6 +457,23 @@ class Settings(BaseSettings):
             return url.replace("postgres://", "postgresql://", 1)
         return url
 
+    @property
+    def replica_database_urls(self) -> list[str]:
+        """
+        Get the normalized read replica URLs for sync SQLAlchemy operations.
+
+        Parses database_replica_urls (comma-separated) and normalizes
+        'postgres://' to 'postgresql://' like sync_database_url.
+        """
+        urls = []
+        for url in self.database_replica_urls.split(","):
+            url = url.strip()
+            if url.startswith("postgres://"):
+                url = url.replace("postgres://", "postgresql://", 1)
+            if url:
+                urls.append(url)
+        return urls
+
     @property
     def async_database_url(self) -> str:
         """
@@ -342,7 +497,7 @@ class Settings(BaseSettings):
         """Get Redis URL for rate limiting if configured."""
         if self.RATE_LIMIT_REDIS_URL:
             return self.RATE_LIMIT_REDIS_URL
-        if self.RATE_LIMIT_STORAGE == "redis":
+        if self.RATE_LIMIT_STORAGE in ("redis", "hybrid"):
             return f"redis://{self.REDIS_HOST}:{self.REDIS_PORT}/{self.REDIS_DB}"
         return None
 
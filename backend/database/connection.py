@@ -8,20 +8,37 @@ This module handles:
 - Session lifecycle management (sync and async)
 - FastAPI dependency injection for database sessions
 - Pool status monitoring for health checks
+- Optional read-replica routing for read-only endpoints (get_read_db)
+- Continuous pool metrics and optional adaptive pool sizing (pool_metrics)
 
 TASK-DB-P9-001: Added POOL_CONFIG and get_pool_status for production readiness.
 TASK-DB-P9-SQLITE-REMOVAL: Removed SQLite support - PostgreSQL only.
 """
 
 from contextlib import contextmanager, asynccontextmanager
-from typing import Generator, AsyncGenerator, Dict, Any
+from typing import Generator, AsyncGenerator, Dict, Any, List
 
+from fastapi import Depends, Request
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.pool import QueuePool, NullPool, AsyncAdaptedQueuePool
 
 from backend.config import settings
+from backend.database.pool_metrics import (
+    InstrumentedAsyncAdaptedQueuePool,
+    InstrumentedQueuePool,
+    PoolMetrics,
+    PoolTuner,
+    instrument_engine,
+)
+from backend.database.replicas import (
+    RecentWrites,
+    ReplicaRouter,
+    RoutingSession,
+    SESSION_WROTE,
+    track_writes,
+)
 
 
 # =============================================================================
@@ -66,7 +83,7 @@ def _create_engine():
     # PostgreSQL configuration with full pooling support
     engine = create_engine(
         db_url,
-        poolclass=QueuePool,
+        poolclass=InstrumentedQueuePool,
         pool_size=POOL_CONFIG["pool_size"],
         max_overflow=POOL_CONFIG["max_overflow"],
         pool_timeout=POOL_CONFIG["pool_timeout"],
@@ -80,6 +97,18 @@ def _create_engine():
 # Create SQLAlchemy engine
 engine = _create_engine()
 
+# Checkout wait, hold time per endpoint, overflow and timeout metrics
+pool_metrics = instrument_engine(engine)
+
+# Optional adaptive sizing of the primary pool (DB_POOL_ADAPTIVE)
+pool_tuner = PoolTuner(
+    engine.pool,
+    min_size=settings.db_pool_min_size,
+    max_size=settings.db_pool_max_size,
+    max_overflow_limit=settings.db_pool_max_overflow_limit,
+    target_wait=settings.db_pool_target_wait_ms / 1000,
+) if settings.db_pool_adaptive else None
+
 
 # Session factory for creating database sessions
 SessionLocal = sessionmaker(
@@ -89,6 +118,76 @@ SessionLocal = sessionmaker(
 )
 
 
+# =============================================================================
+# Read Replica Routing
+# =============================================================================
+
+# Seconds to wait when connecting to a replica before failing over
+REPLICA_CONNECT_TIMEOUT = 3
+
+
+def _create_replica_engines() -> List:
+    """Create one pooled engine per configured read replica URL."""
+    return [
+        create_engine(
+            url,
+            poolclass=QueuePool,
+            pool_size=POOL_CONFIG["pool_size"],
+            max_overflow=POOL_CONFIG["max_overflow"],
+            pool_timeout=POOL_CONFIG["pool_timeout"],
+            pool_recycle=POOL_CONFIG["pool_recycle"],
+            pool_pre_ping=POOL_CONFIG["pool_pre_ping"],
+            connect_args={"connect_timeout": REPLICA_CONNECT_TIMEOUT},
+            echo=settings.debug,
+        )
+        for url in settings.replica_database_urls
+    ]
+
+
+_replica_engines = _create_replica_engines()
+
+# None when no replicas are configured: get_read_db then uses the primary
+replica_router = ReplicaRouter(
+    engine,
+    _replica_engines,
+    check_interval=settings.db_replica_check_interval,
+    retry_after=settings.db_replica_retry_after,
+) if _replica_engines else None
+
+ReadSessionLocal = sessionmaker(
+    class_=RoutingSession,
+    router=replica_router,
+    autoflush=False,
+) if replica_router else None
+
+# Users/clients that wrote recently read from the primary (read-your-writes)
+recent_writes = RecentWrites(window=settings.db_read_your_writes_seconds)
+
+if replica_router:
+    track_writes(SessionLocal)
+
+
+def client_session_key(request: Request) -> str:
+    """
+    Key identifying the caller for read-your-writes stickiness.
+
+    Uses the authenticated user ID when the request carries a valid token
+    (claims resolved by RateLimitMiddleware/auth dependencies), otherwise
+    the client address.
+    """
+    from backend.auth.cache import REQUEST_CLAIMS_STATE
+
+    resolved = getattr(request.state, REQUEST_CLAIMS_STATE, None)
+    if resolved and isinstance(resolved[1], dict) and resolved[1].get("user_id"):
+        return f"user:{resolved[1]['user_id']}"
+    return f"client:{request.client.host if request.client else 'unknown'}"
+
+
+def get_replica_status() -> List[Dict[str, Any]]:
+    """Health of each configured read replica (empty if none)."""
+    return replica_router.status() if replica_router else []
+
+
 def get_engine():
     """
     Get the SQLAlchemy engine instance.
@@ -130,12 +229,33 @@ def get_pool_status() -> Dict[str, Any]:
     }
 
 
-def get_db() -> Generator[Session, None, None]:
+def get_pool_metrics() -> Dict[str, Any]:
+    """
+    Continuous connection pool metrics for monitoring.
+
+    Returns:
+        dict with:
+        - primary: Sync pool checkout wait and per-endpoint hold time
+          histograms, overflow events and timeouts
+        - async: The same for the async (asyncpg) pool
+        - adaptive: Adaptive sizing bounds and recent adjustments, or None
+          when DB_POOL_ADAPTIVE is off
+    """
+    return {
+        "primary": pool_metrics.snapshot(),
+        "async": async_pool_metrics.snapshot(),
+        "adaptive": pool_tuner.status() if pool_tuner else None,
+    }
+
+
+def get_db(request: Request = None) -> Generator[Session, None, None]:
     """
     FastAPI dependency for database sessions.
 
     Provides a database session for the duration of a request.
     Automatically closes the session after the request completes.
+    With read replicas configured, a session that wrote marks the caller
+    as a recent writer so their next reads stay on the primary.
 
     Usage:
         @app.get("/endpoint")
@@ -143,6 +263,9 @@ def get_db() -> Generator[Session, None, None]:
             # Use db session here
             pass
 
+    Args:
+        request: Current request (injected by FastAPI; None when called directly)
+
     Yields:
         Session: SQLAlchemy database session
     """
@@ -150,9 +273,48 @@ def get_db() -> Generator[Session, None, None]:
     try:
         yield db
     finally:
+        if request is not None and db.info.get(SESSION_WROTE):
+            recent_writes.record(client_session_key(request))
         db.close()
 
 
+def get_read_db(
+    request: Request,
+    db: Session = Depends(get_db),
+) -> Generator[Session, None, None]:
+    """
+    FastAPI dependency for read-mostly endpoints.
+
+    With DATABASE_REPLICA_URLS set, yields a RoutingSession that reads from
+    a healthy replica (round-robin, primary fallback) and sends any writes
+    to the primary. Without replicas, or when the caller wrote within
+    db_read_your_writes_seconds, yields the regular get_db session.
+
+    Usage:
+        @app.get("/endpoint")
+        def endpoint(db: Session = Depends(get_read_db)):
+            pass
+
+    Args:
+        request: Current request (for read-your-writes stickiness)
+        db: Primary session from get_db (created lazily; unused when routed)
+
+    Yields:
+        Session: Replica-routed or primary database session
+    """
+    if ReadSessionLocal is None or recent_writes.is_recent(client_session_key(request)):
+        yield db
+        return
+
+    read_db = ReadSessionLocal()
+    try:
+        yield read_db
+    finally:
+        if read_db.info.get(SESSION_WROTE):
+            recent_writes.record(client_session_key(request))
+        read_db.close()
+
+
 @contextmanager
 def db_context() -> Generator[Session, None, None]:
     """
@@ -212,6 +374,10 @@ def _create_async_engine():
     - postgresql:// to postgresql+asyncpg://
 
     TASK-DB-P9-001: Updated to use POOL_CONFIG for consistency.
+
+    asyncpg prepares every statement server-side and keeps the most recent
+    ones per connection; the cache is sized by
+    DB_PREPARED_STATEMENT_CACHE_SIZE so the hot queries stay prepared.
     """
     async_url = settings.async_database_url
 
@@ -220,12 +386,15 @@ def _create_async_engine():
 
     return create_async_engine(
         async_url,
-        poolclass=AsyncAdaptedQueuePool,
+        poolclass=InstrumentedAsyncAdaptedQueuePool,
         pool_size=POOL_CONFIG["pool_size"],
         max_overflow=POOL_CONFIG["max_overflow"],
         pool_timeout=POOL_CONFIG["pool_timeout"],
         pool_recycle=POOL_CONFIG["pool_recycle"],
         pool_pre_ping=POOL_CONFIG["pool_pre_ping"],
+        connect_args={
+            "prepared_statement_cache_size": settings.db_prepared_statement_cache_size,
+        },
         echo=settings.debug,
     )
 
@@ -234,6 +403,7 @@ def _create_async_engine():
 # Avoids import-time errors in scripts that only need sync database access
 _async_engine = None
 _AsyncSessionLocal = None
+async_pool_metrics = PoolMetrics()
 
 
 def _get_async_engine():
@@ -241,6 +411,7 @@ def _get_async_engine():
     global _async_engine
     if _async_engine is None:
         _async_engine = _create_async_engine()
+        instrument_engine(_async_engine.sync_engine, async_pool_metrics)
     return _async_engine
 
 
@@ -0,0 +1,397 @@
+"""
+Connection pool instrumentation and adaptive sizing.
+
+get_pool_status() is a point-in-time snapshot; starvation only became
+visible as pool_timeout failures. This module records pool behaviour
+continuously:
+
+- Checkout wait time: histogram of how long callers waited for a usable
+  connection, including pre-ping and opening new connections (measured
+  around Pool.connect(), since no pool event marks the start of a wait)
+- Hold time per endpoint: histogram of checkout-to-checkin time, labelled
+  with the route template of the request that held the connection
+  (recorded through the pool "checkout"/"checkin" events)
+- Overflow events: connections opened beyond pool_size ("connect" event)
+- Timeouts: checkouts that failed with pool_timeout
+
+Snapshots are surfaced on /health/db and /health/db/pool.
+
+With PoolTuner attached (DB_POOL_ADAPTIVE=true), pool_size and then
+max_overflow are grown within bounds while recent checkout waits exceed a
+target, and shrunk back when the pool is idle. Adaptive sizing is only
+supported for the synchronous QueuePool.
+
+Usage:
+    engine = create_engine(url, poolclass=InstrumentedQueuePool)
+    metrics = instrument_engine(engine)
+    metrics.snapshot()
+
+    PoolTuner(engine.pool, min_size=5, max_size=40, max_overflow_limit=40)
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from contextvars import ContextVar
+from typing import Any, Deque, Dict, MutableMapping, Optional, Tuple
+
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+from sqlalchemy.util import queue as sqla_queue
+
+from backend.utils.metrics import Histogram
+
+logger = logging.getLogger(__name__)
+
+# Seconds; spans sub-millisecond checkouts up to the default 30s pool_timeout
+WAIT_BUCKETS: Tuple[float, ...] = (
+    0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0,
+)
+HOLD_BUCKETS: Tuple[float, ...] = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0,
+)
+
+# Label for connections held outside any HTTP request (startup, scripts)
+NO_ENDPOINT = "background"
+
+# ASGI scope of the current request; FastAPI stores the matched route in it
+request_scope: ContextVar[Optional[MutableMapping[str, Any]]] = ContextVar(
+    "pool_metrics_request_scope", default=None
+)
+
+# connection_record.info key holding (checkout time, endpoint)
+_CHECKOUT_INFO = "pool_metrics_checkout"
+
+
+def current_endpoint() -> str:
+    """Route template of the current request, e.g. "/api/v1/products/{product_id}"."""
+    scope = request_scope.get()
+    if scope is None:
+        return NO_ENDPOINT
+    route = scope.get("route")
+    path = getattr(route, "path", None)
+    return path or "unmatched"
+
+
+class PoolMetrics:
+    """
+    Continuous metrics for one connection pool.
+
+    Args:
+        window: Seconds of recent checkout waits kept for adaptive sizing
+    """
+
+    def __init__(self, window: float = 60.0):
+        self.window = window
+        self.wait = Histogram(WAIT_BUCKETS)
+        self.hold: Dict[str, Histogram] = {}
+        self.checkouts = 0
+        self.timeouts = 0
+        self.overflow_events = 0
+        self.peak_checked_out = 0
+        self._recent_waits: Deque[Tuple[float, float]] = deque()
+        self._recent_timeouts: Deque[float] = deque()
+        self._lock = threading.Lock()
+
+    def _trim(self, now: float) -> None:
+        cutoff = now - self.window
+        while self._recent_waits and self._recent_waits[0][0] < cutoff:
+            self._recent_waits.popleft()
+        while self._recent_timeouts and self._recent_timeouts[0] < cutoff:
+            self._recent_timeouts.popleft()
+
+    def record_wait(self, seconds: float, checked_out: int) -> None:
+        """Record a successful checkout that waited `seconds`."""
+        self.wait.observe(seconds)
+        now = time.monotonic()
+        with self._lock:
+            self.checkouts += 1
+            self.peak_checked_out = max(self.peak_checked_out, checked_out)
+            self._recent_waits.append((now, seconds))
+            self._trim(now)
+
+    def record_timeout(self) -> None:
+        """Record a checkout that failed with pool_timeout."""
+        now = time.monotonic()
+        with self._lock:
+            self.timeouts += 1
+            self._recent_timeouts.append(now)
+            self._trim(now)
+
+    def record_overflow(self) -> None:
+        """Record a connection opened beyond pool_size."""
+        with self._lock:
+            self.overflow_events += 1
+
+    def record_hold(self, endpoint: str, seconds: float) -> None:
+        """Record how long `endpoint` held a connection."""
+        histogram = self.hold.get(endpoint)
+        if histogram is None:
+            with self._lock:
+                histogram = self.hold.setdefault(endpoint, Histogram(HOLD_BUCKETS))
+        histogram.observe(seconds)
+
+    def recent(self) -> Dict[str, Any]:
+        """p95 checkout wait and timeouts within the last `window` seconds."""
+        with self._lock:
+            self._trim(time.monotonic())
+            waits = sorted(wait for _, wait in self._recent_waits)
+            timeouts = len(self._recent_timeouts)
+        p95 = waits[min(len(waits) - 1, int(len(waits) * 0.95))] if waits else 0.0
+        return {"checkouts": len(waits), "wait_p95": p95, "timeouts": timeouts}
+
+    def reset_peak(self, checked_out: int) -> None:
+        """Start a new peak-usage period at the current checked-out count."""
+        with self._lock:
+            self.peak_checked_out = checked_out
+
+    def snapshot(self) -> Dict[str, Any]:
+        """All pool metrics, for /health/db and the metrics endpoint."""
+        with self._lock:
+            hold = dict(self.hold)
+        return {
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "overflow_events": self.overflow_events,
+            "peak_checked_out": self.peak_checked_out,
+            "wait_seconds": self.wait.snapshot(),
+            "hold_seconds": {endpoint: h.snapshot() for endpoint, h in sorted(hold.items())},
+            "recent": self.recent(),
+        }
+
+
+class _InstrumentedPoolMixin:
+    """Time checkout waits and count timeouts; allow resizing."""
+
+    metrics: Optional[PoolMetrics] = None
+    tuner: Optional["PoolTuner"] = None
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            if self.metrics is not None:
+                self.metrics.record_timeout()
+            if self.tuner is not None:
+                self.tuner.maybe_adjust()
+            raise
+        if self.metrics is not None:
+            self.metrics.record_wait(time.perf_counter() - started, self.checkedout())
+        if self.tuner is not None:
+            self.tuner.maybe_adjust()
+        return connection
+
+    def recreate(self):
+        # The new pool keeps the current (possibly tuned) size and overflow
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        if self.tuner is not None:
+            pool.tuner = self.tuner
+            self.tuner.pool = pool
+        return pool
+
+    def resize(self, pool_size: int, max_overflow: int) -> None:
+        """
+        Change pool_size and max_overflow in place.
+
+        Idle connections beyond a smaller pool_size are closed; checked-out
+        connections are closed as they are returned.
+        """
+        with self._overflow_lock:
+            delta = pool_size - self._pool.maxsize
+            self._pool.maxsize = pool_size
+            # _overflow counts open connections beyond pool_size
+            self._overflow -= delta
+            self._max_overflow = max_overflow
+
+        while self._pool.qsize() > pool_size:
+            try:
+                record = self._pool.get(False)
+            except sqla_queue.Empty:
+                break
+            try:
+                record.close()
+            finally:
+                self._dec_overflow()
+
+
+class InstrumentedQueuePool(_InstrumentedPoolMixin, QueuePool):
+    """QueuePool recording checkout waits and timeouts into `metrics`."""
+
+
+class InstrumentedAsyncAdaptedQueuePool(_InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool recording checkout waits and timeouts into `metrics`."""
+
+
+def instrument_engine(engine: Engine, metrics: Optional[PoolMetrics] = None) -> PoolMetrics:
+    """
+    Record pool metrics for `engine`.
+
+    Hold times and overflow events are recorded through pool events and
+    work with any QueuePool; checkout waits and timeouts additionally need
+    an Instrumented*QueuePool poolclass.
+
+    Args:
+        engine: Sync engine (pass AsyncEngine.sync_engine for async engines)
+        metrics: Existing PoolMetrics to record into (a new one by default)
+
+    Returns:
+        The PoolMetrics being recorded into
+    """
+    metrics = metrics or PoolMetrics()
+    engine.pool.metrics = metrics
+
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        if engine.pool.overflow() > 0:
+            metrics.record_overflow()
+
+    @event.listens_for(engine, "checkout")
+    def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+        connection_record.info[_CHECKOUT_INFO] = (time.perf_counter(), current_endpoint())
+
+    @event.listens_for(engine, "checkin")
+    def _on_checkin(dbapi_connection, connection_record):
+        checkout = connection_record.info.pop(_CHECKOUT_INFO, None)
+        if checkout is not None:
+            started, endpoint = checkout
+            metrics.record_hold(endpoint, time.perf_counter() - started)
+
+    return metrics
+
+
+class PoolTuner:
+    """
+    Grow or shrink a pool within bounds based on recent checkout waits.
+
+    Evaluated at most every `interval` seconds, on checkout:
+    - recent wait p95 above `target_wait` or any timeout: grow pool_size by
+      `step` up to `max_size`, then max_overflow up to `max_overflow_limit`
+    - recent wait p95 below a tenth of `target_wait` and peak usage at least
+      `step` below pool_size: shrink max_overflow back to its initial value,
+      then pool_size down to `min_size`
+
+    Args:
+        pool: InstrumentedQueuePool with metrics attached
+        min_size: Smallest pool_size
+        max_size: Largest pool_size
+        max_overflow_limit: Largest max_overflow
+        target_wait: Acceptable p95 checkout wait, in seconds
+        interval: Seconds between adjustments
+        step: Connections added or removed per adjustment
+    """
+
+    def __init__(
+        self,
+        pool: InstrumentedQueuePool,
+        min_size: int,
+        max_size: int,
+        max_overflow_limit: int,
+        target_wait: float = 0.05,
+        interval: float = 30.0,
+        step: int = 2,
+    ):
+        if pool.metrics is None:
+            raise ValueError("PoolTuner requires an instrumented pool (call instrument_engine first)")
+        self.pool = pool
+        self.min_size = min_size
+        self.max_size = max(max_size, min_size)
+        self.base_overflow = pool._max_overflow
+        self.max_overflow_limit = max(max_overflow_limit, self.base_overflow)
+        self.target_wait = target_wait
+        self.interval = interval
+        self.step = step
+        self.adjustments: Deque[Dict[str, Any]] = deque(maxlen=20)
+        self._next_check = time.monotonic() + interval
+        self._lock = threading.Lock()
+        pool.tuner = self
+
+    def maybe_adjust(self) -> None:
+        """Adjust the pool if `interval` has passed since the last check."""
+        now = time.monotonic()
+        if now < self._next_check or not self._lock.acquire(blocking=False):
+            return
+        try:
+            self._next_check = now + self.interval
+            self.adjust()
+        finally:
+            self._lock.release()
+
+    def adjust(self) -> Optional[Dict[str, Any]]:
+        """
+        Evaluate recent metrics and resize the pool once.
+
+        Returns:
+            The adjustment made (also kept in `adjustments`), or None
+        """
+        pool = self.pool
+        metrics = pool.metrics
+        recent = metrics.recent()
+        size, overflow = pool.size(), pool._max_overflow
+        new_size, new_overflow = size, overflow
+
+        if recent["timeouts"] or recent["wait_p95"] > self.target_wait:
+            if size < self.max_size:
+                new_size = min(self.max_size, size + self.step)
+            else:
+                new_overflow = min(self.max_overflow_limit, overflow + self.step)
+        elif (
+            recent["wait_p95"] < self.target_wait / 10
+            and metrics.peak_checked_out <= size - self.step
+        ):
+            if overflow > self.base_overflow:
+                new_overflow = max(self.base_overflow, overflow - self.step)
+            else:
+                new_size = max(self.min_size, size - self.step)
+
+        metrics.reset_peak(pool.checkedout())
+        if (new_size, new_overflow) == (size, overflow):
+            return None
+
+        pool.resize(new_size, new_overflow)
+        adjustment = {
+            "at": time.time(),
+            "pool_size": [size, new_size],
+            "max_overflow": [overflow, new_overflow],
+            "wait_p95": recent["wait_p95"],
+            "timeouts": recent["timeouts"],
+        }
+        self.adjustments.append(adjustment)
+        logger.info(
+            f"Adaptive pool sizing: pool_size {size}->{new_size}, "
+            f"max_overflow {overflow}->{new_overflow} "
+            f"(wait p95 {recent['wait_p95']:.3f}s, timeouts {recent['timeouts']})"
+        )
+        return adjustment
+
+    def status(self) -> Dict[str, Any]:
+        """Current bounds, sizes and recent adjustments."""
+        return {
+            "pool_size": self.pool.size(),
+            "max_overflow": self.pool._max_overflow,
+            "bounds": {
+                "min_size": self.min_size,
+                "max_size": self.max_size,
+                "max_overflow_limit": self.max_overflow_limit,
+            },
+            "target_wait_seconds": self.target_wait,
+            "adjustments": list(self.adjustments),
+        }
+
+
+__all__ = [
+    'HOLD_BUCKETS',
+    'Histogram',
+    'InstrumentedAsyncAdaptedQueuePool',
+    'InstrumentedQueuePool',
+    'NO_ENDPOINT',
+    'PoolMetrics',
+    'PoolTuner',
+    'WAIT_BUCKETS',
+    'current_endpoint',
+    'instrument_engine',
+    'request_scope',
+]
@@ -0,0 +1,149 @@
+"""
+Trigram (pg_trgm) helpers for partial text matching.
+
+`ILIKE '%term%'` cannot use a B-tree index, so every partial lookup on
+emission_factors used to scan the whole table. With the pg_trgm GIN indexes
+from migration i9j0k1l2m3n4, PostgreSQL serves the same ILIKE predicates
+from the index, and `similarity()` can rank candidates so only the best
+rows are fetched.
+
+These helpers keep queries portable: when the database is not PostgreSQL,
+or pg_trgm is not installed, ranking falls back to the shortest matching
+name (the original "most specific match" rule) and the ILIKE filter is
+unchanged.
+
+Usage:
+    from backend.database.trigram import (
+        partial_match_order,
+        trigram_available,
+        trigram_available_async,
+    )
+
+    use_trgm = trigram_available(db)
+    query = (
+        db.query(EmissionFactor)
+        .filter(EmissionFactor.activity_name.ilike(f"%{term}%"))
+        .order_by(*partial_match_order(EmissionFactor.activity_name, term, use_trgm))
+    )
+"""
+
+import logging
+import threading
+from typing import Dict, List
+
+from sqlalchemy import func, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+
+logger = logging.getLogger(__name__)
+
+# GIN trigram indexes created by the migration: name -> (table, column)
+TRIGRAM_INDEXES: Dict[str, tuple] = {
+    "idx_ef_activity_name_trgm": ("emission_factors", "activity_name"),
+    "idx_ef_category_trgm": ("emission_factors", "category"),
+}
+
+_EXTENSION_QUERY = text("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+
+# Per-database cache of whether pg_trgm is installed
+_availability: Dict[str, bool] = {}
+_availability_lock = threading.Lock()
+
+
+def _bind_key(bind) -> str:
+    """Identify a database by its (password-masked) URL."""
+    # Sessions may be bound to a Connection rather than an Engine
+    return str(getattr(bind, "engine", bind).url)
+
+
+def _is_postgresql(bind) -> bool:
+    dialect = getattr(bind, "dialect", None)
+    return getattr(dialect, "name", None) == "postgresql"
+
+
+def trigram_available(db: Session) -> bool:
+    """
+    Check whether pg_trgm can be used on a sync session's database.
+
+    The extension lookup runs once per database URL and is cached.
+
+    Args:
+        db: Sync SQLAlchemy session
+
+    Returns:
+        True if the database is PostgreSQL with pg_trgm installed
+    """
+    bind = db.get_bind()
+    if not _is_postgresql(bind):
+        return False
+
+    key = _bind_key(bind)
+    if key not in _availability:
+        available = db.execute(_EXTENSION_QUERY).scalar() is not None
+        with _availability_lock:
+            _availability[key] = available
+        logger.info(f"pg_trgm available: {available}")
+    return _availability[key]
+
+
+async def trigram_available_async(db: AsyncSession) -> bool:
+    """
+    Check whether pg_trgm can be used on an async session's database.
+
+    Args:
+        db: Async SQLAlchemy session
+
+    Returns:
+        True if the database is PostgreSQL with pg_trgm installed
+    """
+    bind = db.get_bind()
+    if not _is_postgresql(bind):
+        return False
+
+    key = _bind_key(bind)
+    if key not in _availability:
+        result = await db.execute(_EXTENSION_QUERY)
+        available = result.scalar() is not None
+        with _availability_lock:
+            _availability[key] = available
+        logger.info(f"pg_trgm available: {available}")
+    return _availability[key]
+
+
+def reset_trigram_availability() -> None:
+    """Forget cached extension checks (e.g. after running migrations)."""
+    with _availability_lock:
+        _availability.clear()
+
+
+def partial_match_order(column, term: str, use_trigram: bool) -> List:
+    """
+    Build ORDER BY clauses ranking partial matches best-first.
+
+    With pg_trgm, rows are ranked by similarity to the search term. Since
+    every candidate already contains the term, higher similarity means
+    fewer extra characters, so this agrees with the shortest-name rule
+    used elsewhere, which is also the fallback ordering and tie-breaker.
+
+    Args:
+        column: Text column being matched (e.g. EmissionFactor.activity_name)
+        term: Search term (without LIKE wildcards)
+        use_trigram: Whether pg_trgm's similarity() is available
+
+    Returns:
+        List of ORDER BY expressions
+    """
+    order = [func.length(column), column]
+    if use_trigram:
+        order.insert(0, func.similarity(column, term).desc())
+    return order
+
+
+__all__ = [
+    "TRIGRAM_INDEXES",
+    "partial_match_order",
+    "reset_trigram_availability",
+    "trigram_available",
+    "trigram_available_async",
+]
@@ -8,7 +8,8 @@ No SQLAlchemy or infrastructure dependencies allowed.
 """
 
 from dataclasses import dataclass
-from typing import Optional
+from datetime import datetime
+from typing import Any, Dict, Optional
 
 from backend.domain.entities.errors import DomainValidationError
 
@@ -30,6 +31,10 @@ class Calculation:
         energy_co2e: Optional emissions from energy.
         transport_co2e: Optional emissions from transport.
         waste_co2e: Optional emissions from waste.
+        calculation_time_ms: Optional calculation duration in milliseconds.
+        breakdown: Optional emissions per component.
+        error_message: Optional error recorded by a failed calculation.
+        created_at: Creation timestamp, if persisted.
     """
 
     id: str
@@ -41,6 +46,10 @@ class Calculation:
     energy_co2e: Optional[float] = None
     transport_co2e: Optional[float] = None
     waste_co2e: Optional[float] = None
+    calculation_time_ms: Optional[int] = None
+    breakdown: Optional[Dict[str, Any]] = None
+    error_message: Optional[str] = None
+    created_at: Optional[datetime] = None
 
     def __post_init__(self):
         """Validate entity on construction."""
@@ -8,6 +8,7 @@ No SQLAlchemy or infrastructure dependencies allowed.
 """
 
 from dataclasses import dataclass
+from datetime import datetime
 from typing import Optional, List
 
 from backend.domain.entities.errors import DomainValidationError
@@ -28,6 +29,8 @@ class Product:
         unit: Unit of measure (kg, unit, L, etc.).
         category: Optional product category.
         description: Optional description.
+        is_finished_product: Whether this is a finished (sellable) product.
+        created_at: Creation timestamp, if persisted.
     """
 
     id: str
@@ -36,6 +39,8 @@ class Product:
     unit: str
     category: Optional[str] = None
     description: Optional[str] = None
+    is_finished_product: bool = False
+    created_at: Optional[datetime] = None
 
     def __post_init__(self):
         """Validate entity on construction."""
@@ -56,11 +61,19 @@ class BOMItem:
         component_id: ID of the component product.
         quantity: Quantity of the component required.
         unit: Unit of measure for the quantity.
+        id: BOM line ID, if persisted.
+        component_name: Display name of the component product.
+        notes: Optional notes on the BOM line.
+        emission_factor_id: Linked emission factor, if any.
     """
 
     component_id: str
     quantity: float
     unit: str
+    id: Optional[str] = None
+    component_name: Optional[str] = None
+    notes: Optional[str] = None
+    emission_factor_id: Optional[str] = None
 
     def __post_init__(self):
         """Validate entity on construction."""
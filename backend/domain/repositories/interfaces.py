@@ -41,19 +41,38 @@ class ProductRepository(ABC):
         pass
 
     @abstractmethod
-    async def list_all(self, limit: int = 100, offset: int = 0) -> List[Product]:
+    async def list_all(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        is_finished_product: Optional[bool] = None,
+    ) -> List[Product]:
         """
-        List all products with pagination.
+        List all products with pagination, ordered by name.
 
         Args:
             limit: Maximum number of products to return.
             offset: Number of products to skip.
+            is_finished_product: Optional filter on the finished product flag.
 
         Returns:
             List of Product domain entities.
         """
         pass
 
+    @abstractmethod
+    async def count(self, is_finished_product: Optional[bool] = None) -> int:
+        """
+        Count products.
+
+        Args:
+            is_finished_product: Optional filter on the finished product flag.
+
+        Returns:
+            Number of matching products.
+        """
+        pass
+
     @abstractmethod
     async def create(self, product: Product) -> Product:
         """
@@ -117,6 +136,22 @@ class CalculationRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def create_pending(
+        self, product_id: str, calculation_type: str
+    ) -> CalculationResult:
+        """
+        Create a pending calculation record of the given type.
+
+        Args:
+            product_id: The unique identifier of the product.
+            calculation_type: Calculation boundary (cradle_to_gate, etc.).
+
+        Returns:
+            CalculationResult with pending status.
+        """
+        pass
+
     @abstractmethod
     async def list_for_product(self, product_id: str) -> List[Calculation]:
         """
@@ -88,6 +88,33 @@ class CalculationService:
         # Create calculation
         return await self._calculation_repo.create(request)
 
+    async def start_calculation(
+        self, product_id: str, calculation_type: str
+    ) -> CalculationResult:
+        """
+        Create a pending calculation of the given type for a product.
+
+        The calculation itself is executed separately; the returned
+        result identifies the record to poll.
+
+        Args:
+            product_id: The unique identifier of the product.
+            calculation_type: Calculation boundary (cradle_to_gate, etc.).
+
+        Returns:
+            CalculationResult with pending status.
+
+        Raises:
+            ProductNotFoundError: If the product does not exist.
+        """
+        product = await self._product_repo.get_by_id(product_id)
+        if product is None:
+            raise ProductNotFoundError(product_id=product_id)
+
+        return await self._calculation_repo.create_pending(
+            product_id, calculation_type
+        )
+
     async def get_calculation(self, calculation_id: str) -> Calculation:
         """
         Get a calculation by ID.
@@ -10,7 +10,7 @@ No SQLAlchemy or infrastructure imports allowed.
 """
 
 import uuid
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from backend.domain.entities.product import Product, ProductWithBOM
 from backend.domain.entities.errors import ProductNotFoundError
@@ -85,6 +85,31 @@ class ProductService:
         """
         return await self._product_repo.list_all(limit=limit, offset=offset)
 
+    async def list_products_page(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        is_finished_product: Optional[bool] = None,
+    ) -> Tuple[List[Product], int]:
+        """
+        List one page of products together with the total match count.
+
+        Args:
+            limit: Maximum number of products to return.
+            offset: Number of products to skip.
+            is_finished_product: Optional filter on the finished product flag.
+
+        Returns:
+            Tuple of (products ordered by name, total matching products).
+        """
+        total = await self._product_repo.count(
+            is_finished_product=is_finished_product
+        )
+        products = await self._product_repo.list_all(
+            limit=limit, offset=offset, is_finished_product=is_finished_product
+        )
+        return products, total
+
     async def create_product(
         self,
         code: str,
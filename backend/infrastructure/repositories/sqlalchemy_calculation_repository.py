@@ -8,9 +8,10 @@ Handles mapping between ORM models and domain entities.
 """
 
 import uuid
+from datetime import datetime, UTC
 from typing import Optional, List
 
-from sqlalchemy import select
+from sqlalchemy import lambda_stmt, select
 
 from backend.domain.entities.calculation import (
     Calculation,
@@ -47,8 +48,13 @@ class SQLAlchemyCalculationRepository(CalculationRepository):
         Returns:
             Calculation domain entity if found, None otherwise.
         """
+        # Cached lambda statement: status polling calls this repeatedly
         result = await self._session.execute(
-            select(CalculationModel).where(CalculationModel.id == calculation_id)
+            lambda_stmt(
+                lambda: select(CalculationModel).where(
+                    CalculationModel.id == calculation_id
+                )
+            )
         )
         orm_calc = result.scalar_one_or_none()
 
@@ -87,6 +93,41 @@ class SQLAlchemyCalculationRepository(CalculationRepository):
             product_id=request.product_id,
         )
 
+    async def create_pending(
+        self, product_id: str, calculation_type: str
+    ) -> CalculationResult:
+        """
+        Create a pending calculation record of the given type.
+
+        Args:
+            product_id: The unique identifier of the product.
+            calculation_type: Calculation boundary (cradle_to_gate, etc.).
+
+        Returns:
+            CalculationResult with pending status.
+        """
+        calculation_id = uuid.uuid4().hex
+
+        orm_calc = CalculationModel(
+            id=calculation_id,
+            product_id=product_id,
+            calculation_type=calculation_type,
+            status="pending",
+            total_co2e_kg=0.0,  # Will be updated when calculation completes
+            # asyncpg rejects aware datetimes for TIMESTAMP WITHOUT TIME ZONE
+            # columns (psycopg2 converts them); store naive UTC
+            created_at=datetime.now(UTC).replace(tzinfo=None),
+        )
+
+        self._session.add(orm_calc)
+        await self._session.commit()
+
+        return CalculationResult(
+            id=calculation_id,
+            status="pending",
+            product_id=product_id,
+        )
+
     async def list_for_product(self, product_id: str) -> List[Calculation]:
         """
         List all calculations for a specific product.
@@ -142,4 +183,8 @@ class SQLAlchemyCalculationRepository(CalculationRepository):
                 if orm_calc.waste_co2e is not None
                 else None
             ),
+            calculation_time_ms=orm_calc.calculation_time_ms,
+            breakdown=orm_calc.breakdown,
+            error_message=orm_calc.error_message,
+            created_at=orm_calc.created_at,
         )
@@ -10,9 +10,9 @@ Handles mapping between ORM models and domain entities.
 import uuid
 from typing import Optional, List
 
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload
 
 from backend.domain.entities.product import Product, BOMItem, ProductWithBOM
 from backend.domain.entities.errors import DuplicateProductError
@@ -57,24 +57,50 @@ class SQLAlchemyProductRepository(ProductRepository):
 
         return self._to_domain(orm_product)
 
-    async def list_all(self, limit: int = 100, offset: int = 0) -> List[Product]:
+    async def list_all(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        is_finished_product: Optional[bool] = None,
+    ) -> List[Product]:
         """
-        List all products with pagination.
+        List all products with pagination, ordered by name.
 
         Args:
             limit: Maximum number of products to return.
             offset: Number of products to skip.
+            is_finished_product: Optional filter on the finished product flag.
 
         Returns:
             List of Product domain entities.
         """
         result = await self._session.execute(
-            select(ProductModel).limit(limit).offset(offset)
+            select(ProductModel)
+            .where(*self._filters(is_finished_product))
+            .order_by(ProductModel.name)
+            .limit(limit)
+            .offset(offset)
         )
         orm_products = result.scalars().all()
 
         return [self._to_domain(p) for p in orm_products]
 
+    async def count(self, is_finished_product: Optional[bool] = None) -> int:
+        """
+        Count products.
+
+        Args:
+            is_finished_product: Optional filter on the finished product flag.
+
+        Returns:
+            Number of matching products.
+        """
+        return await self._session.scalar(
+            select(func.count(ProductModel.id)).where(
+                *self._filters(is_finished_product)
+            )
+        )
+
     async def create(self, product: Product) -> Product:
         """
         Create a new product.
@@ -117,9 +143,12 @@ class SQLAlchemyProductRepository(ProductRepository):
         Returns:
             ProductWithBOM containing product and BOM items, or None if not found.
         """
+        # One query for the product, its BOM lines and their child products
         result = await self._session.execute(
             select(ProductModel)
-            .options(selectinload(ProductModel.bom_items))
+            .options(
+                joinedload(ProductModel.bom_items).joinedload(BOMModel.child_product)
+            )
             .where(ProductModel.id == product_id)
         )
         orm_product = result.unique().scalar_one_or_none()
@@ -134,6 +163,20 @@ class SQLAlchemyProductRepository(ProductRepository):
 
         return ProductWithBOM(product=product, bom_items=bom_items)
 
+    def _filters(self, is_finished_product: Optional[bool]) -> list:
+        """
+        WHERE conditions for the optional list filters.
+
+        Args:
+            is_finished_product: Optional filter on the finished product flag.
+
+        Returns:
+            List of SQLAlchemy conditions (empty when unfiltered).
+        """
+        if is_finished_product is None:
+            return []
+        return [ProductModel.is_finished_product == is_finished_product]
+
     def _to_domain(self, orm_product: ProductModel) -> Product:
         """
         Convert ORM model to domain entity.
@@ -151,6 +194,8 @@ class SQLAlchemyProductRepository(ProductRepository):
             unit=orm_product.unit,
             category=orm_product.category,
             description=orm_product.description,
+            is_finished_product=orm_product.is_finished_product,
+            created_at=orm_product.created_at,
         )
 
     def _bom_to_domain(self, orm_bom: BOMModel) -> BOMItem:
@@ -167,4 +212,10 @@ class SQLAlchemyProductRepository(ProductRepository):
             component_id=orm_bom.child_product_id,
             quantity=float(orm_bom.quantity),
             unit=orm_bom.unit or "unit",
+            id=orm_bom.id,
+            component_name=(
+                orm_bom.child_product.name if orm_bom.child_product else None
+            ),
+            notes=orm_bom.notes,
+            emission_factor_id=orm_bom.emission_factor_id,
         )
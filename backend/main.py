@@ -7,6 +7,7 @@ TASK-BE-P7-020: Added rate limiting middleware with per-endpoint limits.
 TASK-BE-P7-050: Added domain exception handlers for clean architecture.
 """
 
+import asyncio
 import logging
 import time
 import uuid
@@ -23,15 +24,23 @@ from backend.middleware import (
     SecurityHeadersMiddleware,
     ExtendedCORSMiddleware,
     RateLimitMiddleware,
+    RouteContextMiddleware,
+    MetricsMiddleware,
+    ProfilingMiddleware,
     get_storage,
 )
 from backend.api.routes.products import router as products_router
+from backend.api.routes.products import async_router as products_async_router
 from backend.api.routes.product_search import router as product_search_router
 from backend.api.routes.product_categories import router as product_categories_router
 from backend.api.routes.calculations import router as calculations_router
+from backend.api.routes.calculations import async_router as calculations_async_router
 from backend.api.routes.emission_factors import router as emission_factors_router
+from backend.api.routes.emission_factors import async_router as emission_factors_async_router
 from backend.api.routes.admin import router as admin_router
 from backend.api.routes.auth import router as auth_router
+from backend.api.routes.health import router as health_router
+from backend.api.routes.metrics import router as metrics_router
 from backend.database.connection import db_context
 from backend.database.seeds.data_sources import seed_data_sources, verify_data_sources
 
@@ -61,7 +70,7 @@ app = FastAPI(
     )
 )
 
-# Startup event: Initialize Brightway2, seed data sources, and sync emission factors
+# Startup event: seed data sources; Brightway2 is initialized lazily
 @app.on_event("startup")
 async def startup_event():
     """
@@ -69,7 +78,13 @@ async def startup_event():
 
     Performs the following initialization steps:
     1. Seeds data_sources table with EPA, DEFRA entries (idempotent)
-    2. Initializes Brightway2 for LCA calculations (non-blocking via thread pool)
+    2. With BRIGHTWAY_EAGER_INIT, starts warming the legacy Brightway2
+       calculator in the background
+
+    The /calculate path only uses SQL emission factor lookups, so Brightway2
+    is otherwise not imported until legacy mode is first used (see
+    get_legacy_calculator). /health/ready reports "serving" once this event
+    has finished and the legacy engine state separately.
 
     TASK-CALC-P7-016: Brightway2 initialization now uses asyncio.to_thread()
     to prevent blocking the FastAPI event loop during startup.
@@ -92,16 +107,23 @@ async def startup_event():
         logger.error(f"Failed to seed data sources: {e}", exc_info=True)
         # Do not fail startup - allow server to run for debugging
 
-    # Step 2: Initialize Brightway2 asynchronously (non-blocking)
-    # TASK-CALC-P7-016: Use async initialization to prevent blocking the event loop
+    # Step 2: Optionally warm Brightway2 without delaying startup
+    if settings.BRIGHTWAY_EAGER_INIT:
+        logger.info("Warming Brightway2 in the background (BRIGHTWAY_EAGER_INIT)")
+        app.state.legacy_engine_task = asyncio.create_task(_warm_legacy_engine())
+
+    app.state.startup_complete = True
+
+
+async def _warm_legacy_engine() -> None:
+    """Background Brightway2 initialization; failures are logged, not raised."""
+    from backend.calculator.pcf_calculator import initialize_pcf_calculator
+
     try:
-        from backend.calculator.pcf_calculator import initialize_pcf_calculator
-        logger.info("Starting Brightway2 initialization (non-blocking)...")
         await initialize_pcf_calculator()
         logger.info("Brightway2 initialization complete")
     except Exception as e:
         logger.error(f"Failed to initialize Brightway2: {e}", exc_info=True)
-        # Do not fail startup - allow server to run for debugging
 
 
 # Configure CORS middleware
@@ -131,6 +153,7 @@ app.add_middleware(
         "Accept",             # Standard header
         "Accept-Language",    # Internationalization
         "Cache-Control",      # Caching hints
+        "X-Profile",          # Request profiling (admins)
     ],
     expose_headers=[
         "X-Request-ID",       # Allow frontend to read request ID
@@ -140,6 +163,7 @@ app.add_middleware(
         "X-RateLimit-Remaining",  # Rate limit headers (TASK-BE-P7-020)
         "X-RateLimit-Reset",      # Rate limit headers (TASK-BE-P7-020)
         "Retry-After",            # Rate limit headers (TASK-BE-P7-020)
+        "X-Profile-Id",           # Request profiling
     ],
 )
 
@@ -156,8 +180,17 @@ app.add_middleware(SecurityHeadersMiddleware)
 # - Auth endpoints: 5 attempts/5 minutes (brute force protection)
 # - Admin users: 10x higher limits (configurable via RATE_LIMIT_ADMIN_MULTIPLIER)
 #
-# Storage: Memory (default) or Redis (for distributed deployments)
-rate_limit_storage = get_storage(settings.rate_limit_redis_url)
+# Storage: Memory (default) or Redis (for distributed deployments, with
+# RATE_LIMIT_ALGORITHM selecting sliding_window, gcra or fixed_window).
+# RATE_LIMIT_STORAGE=hybrid keeps local token buckets per worker and
+# reconciles with Redis in the background (no Redis call per request).
+rate_limit_storage = get_storage(
+    settings.rate_limit_redis_url,
+    algorithm=settings.RATE_LIMIT_ALGORITHM,
+    hybrid=settings.RATE_LIMIT_STORAGE == "hybrid",
+    sync_interval=settings.RATE_LIMIT_SYNC_INTERVAL,
+    slack=settings.RATE_LIMIT_SLACK,
+)
 app.add_middleware(
     RateLimitMiddleware,
     storage=rate_limit_storage,
@@ -177,6 +210,28 @@ app.add_middleware(
     excluded_paths=["/health", "/docs", "/openapi.json", "/redoc"],
 )
 
+# Expose the request's matched route to pool metrics (hold time per endpoint)
+app.add_middleware(RouteContextMiddleware)
+
+# Opt-in request profiling: admins send X-Profile, and requests slower than
+# PROFILING_SLOW_REQUEST_MS are profiled automatically (see /admin/profiles)
+if settings.PROFILING_ENABLED:
+    app.add_middleware(
+        ProfilingMiddleware,
+        slow_threshold_ms=settings.PROFILING_SLOW_REQUEST_MS,
+        cprofile_admins=[
+            name.strip()
+            for name in settings.PROFILING_CPROFILE_ADMINS.split(",")
+            if name.strip()
+        ],
+        sample_interval_ms=settings.PROFILING_SAMPLE_INTERVAL_MS,
+    )
+
+# Request latency/count/in-flight metrics for /metrics; added last so it is
+# outermost and also counts responses produced by the middleware above
+# (e.g. rate limiter 429s)
+app.add_middleware(MetricsMiddleware)
+
 
 # Request logging middleware
 @app.middleware("http")
@@ -385,10 +440,21 @@ async def global_exception_handler(request: Request, exc: Exception):
 app.include_router(auth_router)
 app.include_router(product_search_router)
 app.include_router(product_categories_router)
+if settings.ASYNC_ROUTES:
+    # Async handlers take precedence over the sync routes with the same paths;
+    # the sync routes stay registered (and documented) as the schema source
+    app.include_router(products_async_router, include_in_schema=False)
+    app.include_router(calculations_async_router, include_in_schema=False)
+    app.include_router(emission_factors_async_router, include_in_schema=False)
 app.include_router(products_router)
 app.include_router(calculations_router)
 app.include_router(emission_factors_router)
 app.include_router(admin_router)
+# Readiness (/health/ready, public) and admin-only Celery and database pool
+# health (/health/celery, /health/db, /health/db/pool)
+app.include_router(health_router)
+# Prometheus metrics (/metrics; METRICS_TOKEN bearer or admin)
+app.include_router(metrics_router)
 
 
 @app.get("/health")
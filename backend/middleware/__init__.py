@@ -5,6 +5,9 @@ This package contains all ASGI middleware components:
 - Security headers middleware (OWASP best practices)
 - Extended CORS middleware
 - Rate limiting middleware (TASK-BE-P7-020)
+- Route context middleware (route labels for pool metrics)
+- Request metrics middleware (/metrics latency, counts, in-flight)
+- Request profiling middleware (X-Profile header, slow requests)
 
 Usage:
     from backend.middleware import (
@@ -12,6 +15,9 @@ Usage:
         ExtendedCORSMiddleware,
         RateLimitMiddleware,
         MemoryStorage,
+        RouteContextMiddleware,
+        MetricsMiddleware,
+        ProfilingMiddleware,
     )
 """
 
@@ -21,11 +27,16 @@ from backend.middleware.security import (
 )
 from backend.middleware.rate_limiting import (
     RateLimitMiddleware,
+    RateLimitResult,
     MemoryStorage,
     RedisStorage,
+    HybridStorage,
     get_storage,
     get_rate_limit_storage,
 )
+from backend.middleware.route_context import RouteContextMiddleware
+from backend.middleware.metrics import MetricsMiddleware
+from backend.middleware.profiling import ProfilingMiddleware
 
 __all__ = [
     # Security middleware
@@ -33,8 +44,16 @@ __all__ = [
     "ExtendedCORSMiddleware",
     # Rate limiting middleware
     "RateLimitMiddleware",
+    "RateLimitResult",
     "MemoryStorage",
     "RedisStorage",
+    "HybridStorage",
     "get_storage",
     "get_rate_limit_storage",
+    # Route context middleware
+    "RouteContextMiddleware",
+    # Request metrics middleware
+    "MetricsMiddleware",
+    # Request profiling middleware
+    "ProfilingMiddleware",
 ]
@@ -0,0 +1,54 @@
+"""
+Request metrics middleware for PCF Calculator Backend.
+
+Records, for every HTTP request:
+- pcf_http_requests_in_flight (per method) while the request is served
+- pcf_http_requests_total (per method, route template and status)
+- pcf_http_request_duration_seconds (per method and route template)
+
+Routes are labelled with the matched route template FastAPI stores in the
+ASGI scope (e.g. "/api/v1/products/{product_id}"), so label cardinality
+stays bounded; requests matching no route are labelled "unmatched".
+
+Usage:
+    app.add_middleware(MetricsMiddleware)
+"""
+
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from backend.utils.metrics import HTTP_IN_FLIGHT, HTTP_REQUEST_DURATION, HTTP_REQUESTS
+
+
+class MetricsMiddleware:
+    """Pure ASGI middleware recording request counts, latency and in-flight requests."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status_code = 500
+        started = time.perf_counter()
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        HTTP_IN_FLIGHT.inc(method=method)
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            HTTP_IN_FLIGHT.dec(method=method)
+            route = getattr(scope.get("route"), "path", None) or "unmatched"
+            HTTP_REQUEST_DURATION.observe(
+                time.perf_counter() - started, method=method, route=route
+            )
+            HTTP_REQUESTS.inc(method=method, route=route, status=status_code)
@@ -0,0 +1,200 @@
+"""
+Request profiling middleware for PCF Calculator Backend.
+
+Opt-in (PROFILING_ENABLED) profiling of individual requests. A profile is
+a per-request SQL query log (counts and timings) plus either a sampled
+stack profile or a cProfile dump, stored by ProfileStore and downloadable
+from /admin/profiles.
+
+Triggers:
+- Per request: admins send "X-Profile: sample" (or "1") for a sampled
+  stack profile, or "X-Profile: cprofile" for cProfile. cProfile is only
+  granted to usernames in PROFILING_CPROFILE_ADMINS; other admins get a
+  sampled profile. The response carries X-Profile-Id. The header is
+  ignored for anyone else.
+- Slow requests: with PROFILING_SLOW_REQUEST_MS > 0 every request keeps a
+  SQL query log, and stack sampling starts once the request has run that
+  long (timed on the event loop); requests finishing over the threshold
+  are stored.
+
+cProfile instruments the event loop thread only, so for sync endpoints
+(run in the threadpool) the sampled profile is the more useful one.
+Background tasks run before the ASGI call returns and are included.
+
+Usage:
+    app.add_middleware(
+        ProfilingMiddleware,
+        slow_threshold_ms=settings.PROFILING_SLOW_REQUEST_MS,
+        cprofile_admins=["alice"],
+    )
+"""
+
+import asyncio
+import logging
+import time
+from datetime import datetime, timezone
+from typing import Iterable, Optional
+
+import anyio
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from backend.middleware.rate_limiting import get_token_claims
+from backend.utils.profiling import (
+    ProfileStore,
+    QueryLog,
+    StackSampler,
+    get_profile_store,
+    new_profile_id,
+    start_cprofile,
+    stop_cprofile,
+)
+
+
+logger = logging.getLogger(__name__)
+
+PROFILE_HEADER = "x-profile"
+PROFILE_ID_HEADER = "X-Profile-Id"
+
+# Each sampler is a thread sampling the whole process; more add nothing
+MAX_ACTIVE_SAMPLERS = 4
+
+
+class ProfilingMiddleware:
+    """
+    Pure ASGI middleware profiling requests on demand or when slow.
+
+    Args:
+        app: ASGI application
+        store: Where profiles are saved (default: get_profile_store())
+        slow_threshold_ms: Profile requests slower than this (0 disables)
+        cprofile_admins: Admin usernames allowed to request cProfile
+        sample_interval_ms: Stack sampling interval
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        store: Optional[ProfileStore] = None,
+        slow_threshold_ms: float = 0.0,
+        cprofile_admins: Iterable[str] = (),
+        sample_interval_ms: float = 5.0,
+    ):
+        self.app = app
+        self.store = store
+        self.slow_threshold = slow_threshold_ms / 1000
+        self.cprofile_admins = set(cprofile_admins)
+        self.sample_interval = sample_interval_ms / 1000
+        self._active_samplers = 0
+
+    def _requested_mode(self, scope: Scope) -> Optional[str]:
+        """Profiling mode requested via X-Profile, if the caller may request it."""
+        requested = Headers(scope=scope).get(PROFILE_HEADER, "").strip().lower()
+        if requested not in ("1", "sample", "cprofile"):
+            return None
+
+        claims = get_token_claims(scope)
+        if not claims or claims.get("role") != "admin":
+            return None
+        if requested == "cprofile" and claims.get("username") in self.cprofile_admins:
+            return "cprofile"
+        return "sample"
+
+    def _start_sampler(self) -> Optional[StackSampler]:
+        if self._active_samplers >= MAX_ACTIVE_SAMPLERS:
+            return None
+        self._active_samplers += 1
+        sampler = StackSampler(interval=self.sample_interval)
+        sampler.start()
+        return sampler
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        mode = self._requested_mode(scope)
+        if mode is None and not self.slow_threshold:
+            await self.app(scope, receive, send)
+            return
+
+        profile_id = new_profile_id()
+        sampler: Optional[StackSampler] = None
+        profiler = None
+        timer: Optional[asyncio.TimerHandle] = None
+        status_code = 500
+        response_seconds: Optional[float] = None
+
+        if mode == "cprofile":
+            profiler = start_cprofile()
+            if profiler is None:
+                mode = "sample"  # another request holds cProfile
+        if mode == "sample":
+            sampler = self._start_sampler()
+        elif mode is None:
+            def start_late_sampler() -> None:
+                nonlocal sampler
+                sampler = self._start_sampler()
+
+            timer = asyncio.get_running_loop().call_later(
+                self.slow_threshold, start_late_sampler
+            )
+
+        started = time.perf_counter()
+
+        async def send_with_profile_id(message: Message) -> None:
+            nonlocal status_code, response_seconds
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                response_seconds = time.perf_counter() - started
+                if mode is not None:
+                    MutableHeaders(scope=message)[PROFILE_ID_HEADER] = profile_id
+            await send(message)
+
+        query_log = QueryLog()
+        try:
+            with query_log:
+                await self.app(scope, receive, send_with_profile_id)
+        finally:
+            duration = time.perf_counter() - started
+            if timer is not None:
+                timer.cancel()
+            if profiler is not None:
+                stop_cprofile(profiler)
+            if sampler is not None:
+                sampler.stop()
+                self._active_samplers -= 1
+
+            if mode is not None or duration >= self.slow_threshold:
+                route = getattr(scope.get("route"), "path", None)
+                claims = get_token_claims(scope)
+                report = {
+                    "id": profile_id,
+                    "created_at": datetime.now(timezone.utc).isoformat(),
+                    "trigger": "header" if mode is not None else "slow",
+                    "mode": "cprofile" if profiler is not None else "sample",
+                    "method": scope["method"],
+                    "path": scope["path"],
+                    "route": route,
+                    "user": claims.get("username") if claims else None,
+                    "status": status_code,
+                    "duration_ms": round(duration * 1000, 3),
+                    "response_ms": (
+                        round(response_seconds * 1000, 3)
+                        if response_seconds is not None else None
+                    ),
+                    "queries": dict(query_log.summary(), entries=query_log.entries),
+                    "samples": sampler.samples if sampler is not None else 0,
+                    "top_frames": sampler.top_frames() if sampler is not None else [],
+                }
+                try:
+                    await anyio.to_thread.run_sync(
+                        lambda: (self.store or get_profile_store()).save(
+                            profile_id,
+                            report,
+                            stacks=sampler.folded() if sampler is not None else None,
+                            profiler=profiler,
+                        )
+                    )
+                except OSError as e:
+                    logger.warning(f"Failed to save profile {profile_id}: {e}")
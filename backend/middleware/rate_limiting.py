@@ -11,44 +11,211 @@ Implements rate limiting to protect API endpoints from abuse:
 
 Features:
 - Per-client tracking (by IP or user ID)
+- JWT verified once per request; claims shared with the auth
+  dependencies via request state
 - Memory storage (default) or Redis (distributed)
+- Redis decisions in one round trip via an atomic Lua script
+  (sliding-window log, GCRA or fixed window)
+- Hybrid mode: local per-worker token buckets reconciled with Redis in
+  the background, so the request path never waits on Redis
 - RFC-compliant rate limit headers
-- 429 Too Many Requests with Retry-After
+- 429 Too Many Requests with Retry-After (counted per category in
+  pcf_rate_limit_rejections_total)
 
 Reference: RFC 6585 (429 status), IETF draft-polli-ratelimit-headers
 """
 
-import base64
-import json
 import logging
+import math
 import threading
 import time
+import uuid
+import weakref
+from dataclasses import dataclass
 from typing import Any, Callable, Optional
 
+from redis.exceptions import ResponseError
 from starlette.datastructures import Headers, MutableHeaders
 from starlette.requests import Request
 from starlette.responses import JSONResponse
 from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
+from backend.utils.metrics import RATE_LIMIT_REJECTIONS
+
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class RateLimitResult:
+    """
+    Outcome of counting one request against a limit.
+
+    Attributes:
+        count: Requests in the current window, including this one
+            (limit + 1 when the request was rejected)
+        limit: Limit the request was checked against
+        reset_time: Unix timestamp when quota frees up (for rejected
+            requests: when the next request will be allowed)
+        allowed: Whether the request is within the limit
+    """
+    count: int
+    limit: int
+    reset_time: int
+    allowed: bool
+
+    @property
+    def remaining(self) -> int:
+        """Requests left in the current window."""
+        return max(0, self.limit - self.count)
+
+
+class PeriodicWorker:
+    """
+    Daemon thread calling a method of an object every `interval` seconds.
+
+    Holds only a weak reference to the object, so the thread exits once
+    the object is garbage collected (or stop() is called).
+
+    Args:
+        target: Object whose method is called
+        method_name: Name of the method to call
+        interval: Seconds between calls
+    """
+
+    def __init__(self, target: Any, method_name: str, interval: float):
+        self._target = weakref.ref(target)
+        self._method_name = method_name
+        self.interval = interval
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run,
+            name=f"{type(target).__name__}.{method_name}",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            self._wake.wait(self.interval)
+            self._wake.clear()
+            target = self._target()
+            if target is None or self._stopped.is_set():
+                return
+            try:
+                getattr(target, self._method_name)()
+            except Exception as e:
+                logger.warning(f"{self._thread.name} failed: {e}")
+            del target
+
+    def wake(self) -> None:
+        """Run the method now instead of waiting for the interval."""
+        self._wake.set()
+
+    def stop(self) -> None:
+        """Stop the thread after the current call."""
+        self._stopped.set()
+        self._wake.set()
+
+
+class _MemoryShard:
+    """
+    One shard of MemoryStorage: a dict, its lock and a timing wheel.
+
+    The wheel has `size` one-second slots; a key sits in the slot of the
+    second its window ends. Advancing the wheel visits only the slots
+    whose second has passed, so expiry costs O(expired keys) instead of
+    a scan of the whole dict. Keys whose window ends more than `size`
+    seconds ahead stay in their slot until their round comes up.
+    """
+
+    __slots__ = ("data", "lock", "slots", "tick")
+
+    def __init__(self, size: int):
+        self.data: dict[str, tuple[int, float]] = {}
+        self.lock = threading.Lock()
+        self.slots: list[set[str]] = [set() for _ in range(size)]
+        self.tick = int(time.time())
+
+    def schedule(self, key: str, reset_time: float) -> None:
+        self.slots[int(reset_time) % len(self.slots)].add(key)
+
+    def unschedule(self, key: str, reset_time: float) -> None:
+        self.slots[int(reset_time) % len(self.slots)].discard(key)
+
+    def advance(self, now: float) -> int:
+        """Expire keys whose window ended; caller holds the lock."""
+        now_tick = int(now)
+        if now_tick <= self.tick:
+            return 0
+
+        expired = 0
+        size = len(self.slots)
+        first = max(self.tick, now_tick - size + 1)
+        for tick in range(first, now_tick + 1):
+            slot = self.slots[tick % size]
+            for key in [k for k in slot if self.data[k][1] <= now]:
+                slot.discard(key)
+                del self.data[key]
+                expired += 1
+        self.tick = now_tick
+        return expired
+
+
 class MemoryStorage:
     """
     In-memory storage backend for rate limiting.
 
-    Thread-safe storage using dictionary with automatic expiration.
+    Thread-safe storage split into `shards` independent dict+lock shards
+    chosen by key hash, so threadpool workers rarely contend on the same
+    lock. hit() counts a request and returns its reset time in a single
+    critical section. Expired keys are removed by per-shard timing wheels,
+    advanced on every write and by a background thread every
+    `cleanup_interval` seconds, so memory stays bounded by the number of
+    clients active within one window.
+
     Suitable for single-instance deployments.
 
     Attributes:
-        _data: Dictionary storing {key: (count, reset_time)}
-        _lock: Threading lock for thread safety
+        _shards: List of _MemoryShard
     """
 
-    def __init__(self):
-        """Initialize memory storage."""
-        self._data: dict[str, tuple[int, float]] = {}
-        self._lock = threading.Lock()
+    def __init__(
+        self,
+        cleanup_interval: Optional[float] = 60.0,
+        shards: int = 16,
+        wheel_size: int = 512,
+    ):
+        """
+        Initialize memory storage.
+
+        Args:
+            cleanup_interval: Seconds between background expiry passes
+                (None disables background expiry)
+            shards: Number of independent dict+lock shards
+            wheel_size: One-second slots per shard timing wheel
+        """
+        self._shards = [_MemoryShard(wheel_size) for _ in range(shards)]
+        self.cleanup_interval = cleanup_interval
+        self._reaper: Optional[PeriodicWorker] = None
+
+    def _shard(self, key: str) -> _MemoryShard:
+        return self._shards[hash(key) % len(self._shards)]
+
+    def __len__(self) -> int:
+        """Number of tracked keys (including not yet expired ones)."""
+        return sum(len(shard.data) for shard in self._shards)
+
+    def _ensure_reaper(self) -> None:
+        """Start background expiry on first write."""
+        if self._reaper is None and self.cleanup_interval:
+            self._reaper = PeriodicWorker(self, "cleanup_expired", self.cleanup_interval)
+
+    def close(self) -> None:
+        """Stop background expiry."""
+        if self._reaper is not None:
+            self._reaper.stop()
+            self._reaper = None
 
     def clear(self) -> None:
         """
@@ -56,8 +223,11 @@ class MemoryStorage:
 
         Useful for testing to reset rate limits between tests.
         """
-        with self._lock:
-            self._data.clear()
+        for shard in self._shards:
+            with shard.lock:
+                shard.data.clear()
+                for slot in shard.slots:
+                    slot.clear()
 
     def get_count(self, key: str) -> int:
         """
@@ -69,18 +239,53 @@ class MemoryStorage:
         Returns:
             Current count, or 0 if key doesn't exist or is expired
         """
-        with self._lock:
-            if key not in self._data:
+        shard = self._shard(key)
+        with shard.lock:
+            entry = shard.data.get(key)
+            if entry is None or time.time() >= entry[1]:
                 return 0
+            return entry[0]
 
-            count, reset_time = self._data[key]
+    def hit(self, key: str, limit: int, window_seconds: int) -> RateLimitResult:
+        """
+        Count a request and return its reset time in one critical section.
 
-            # Check if expired
-            if time.time() >= reset_time:
-                del self._data[key]
-                return 0
+        Args:
+            key: Rate limit key (client identifier)
+            limit: Maximum requests per window
+            window_seconds: Time window for rate limiting
+
+        Returns:
+            RateLimitResult for this request
+        """
+        if self._reaper is None:
+            self._ensure_reaper()
 
-            return count
+        shard = self._shard(key)
+        with shard.lock:
+            current_time = time.time()
+            shard.advance(current_time)
+
+            entry = shard.data.get(key)
+            if entry is None or current_time >= entry[1]:
+                # New key or expired window: start a new window
+                if entry is not None:
+                    shard.unschedule(key, entry[1])
+                count = 1
+                reset_time = current_time + window_seconds
+                shard.schedule(key, reset_time)
+            else:
+                # Increment within window
+                count = entry[0] + 1
+                reset_time = entry[1]
+            shard.data[key] = (count, reset_time)
+
+        return RateLimitResult(
+            count=count,
+            limit=limit,
+            reset_time=int(reset_time),
+            allowed=count <= limit,
+        )
 
     def increment(self, key: str, window_seconds: int) -> int:
         """
@@ -93,28 +298,7 @@ class MemoryStorage:
         Returns:
             New count after increment
         """
-        with self._lock:
-            current_time = time.time()
-
-            if key in self._data:
-                count, reset_time = self._data[key]
-
-                # Check if window expired
-                if current_time >= reset_time:
-                    # Reset window
-                    new_reset = current_time + window_seconds
-                    self._data[key] = (1, new_reset)
-                    return 1
-                else:
-                    # Increment within window
-                    new_count = count + 1
-                    self._data[key] = (new_count, reset_time)
-                    return new_count
-            else:
-                # New key
-                reset_time = current_time + window_seconds
-                self._data[key] = (1, reset_time)
-                return 1
+        return self.hit(key, 2**31 - 1, window_seconds).count
 
     def get_reset_time(self, key: str) -> int:
         """
@@ -126,28 +310,87 @@ class MemoryStorage:
         Returns:
             Unix timestamp when the rate limit resets
         """
-        with self._lock:
-            if key in self._data:
-                _, reset_time = self._data[key]
-                return int(reset_time)
+        shard = self._shard(key)
+        with shard.lock:
+            entry = shard.data.get(key)
+            if entry is not None:
+                return int(entry[1])
             return int(time.time())
 
     def cleanup_expired(self) -> int:
         """
-        Remove expired entries from storage.
+        Remove expired entries from storage by advancing every timing wheel.
 
         Returns:
             Number of entries cleaned up
         """
-        with self._lock:
-            current_time = time.time()
-            expired_keys = [
-                k for k, (_, reset_time) in self._data.items()
-                if current_time >= reset_time
-            ]
-            for key in expired_keys:
-                del self._data[key]
-            return len(expired_keys)
+        now = time.time()
+        expired = 0
+        for shard in self._shards:
+            with shard.lock:
+                expired += shard.advance(now)
+        return expired
+
+
+# Lua scripts return {count, milliseconds until reset, allowed}.
+# They read the clock with TIME so all app instances share Redis' clock.
+
+FIXED_WINDOW_SCRIPT = """
+local count = redis.call('INCR', KEYS[1])
+local ttl = redis.call('PTTL', KEYS[1])
+if ttl < 0 then
+    redis.call('PEXPIRE', KEYS[1], ARGV[2])
+    ttl = tonumber(ARGV[2])
+end
+local allowed = 0
+if count <= tonumber(ARGV[1]) then allowed = 1 end
+return {count, ttl, allowed}
+"""
+
+SLIDING_WINDOW_SCRIPT = """
+local limit = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local t = redis.call('TIME')
+local now = t[1] * 1000 + math.floor(t[2] / 1000)
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', now - window)
+local count = redis.call('ZCARD', KEYS[1])
+local allowed = 0
+if count < limit then
+    redis.call('ZADD', KEYS[1], now, ARGV[3])
+    count = count + 1
+    allowed = 1
+else
+    count = limit + 1
+end
+redis.call('PEXPIRE', KEYS[1], window)
+local reset = window
+local oldest = redis.call('ZRANGE', KEYS[1], 0, 0, 'WITHSCORES')
+if oldest[2] then reset = tonumber(oldest[2]) + window - now end
+return {count, reset, allowed}
+"""
+
+GCRA_SCRIPT = """
+local limit = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local t = redis.call('TIME')
+local now = t[1] * 1000 + math.floor(t[2] / 1000)
+local interval = window / limit
+local tat = tonumber(redis.call('GET', KEYS[1])) or now
+if tat < now then tat = now end
+local new_tat = tat + interval
+local allow_at = new_tat - window
+if now < allow_at then
+    return {limit + 1, math.ceil(allow_at - now), 0}
+end
+redis.call('SET', KEYS[1], tostring(new_tat), 'PX', math.ceil(new_tat - now))
+return {math.ceil((new_tat - now) / interval), math.ceil(new_tat - now), 1}
+"""
+
+RATE_LIMIT_SCRIPTS: dict[str, str] = {
+    "fixed_window": FIXED_WINDOW_SCRIPT,
+    "sliding_window": SLIDING_WINDOW_SCRIPT,
+    "gcra": GCRA_SCRIPT,
+}
 
 
 class RedisStorage:
@@ -155,20 +398,102 @@ class RedisStorage:
     Redis-based storage backend for rate limiting.
 
     Suitable for distributed deployments with multiple instances.
-    Uses Redis INCR with TTL for atomic operations.
+    hit() counts a request and decides allow/deny with one atomic Lua
+    script (one round trip). Algorithms:
+    - sliding_window: sliding-window log (sorted set of timestamps), no
+      bursts at window boundaries
+    - gcra: generic cell rate algorithm, one value per key, requests
+      spaced evenly with bursts up to the limit
+    - fixed_window: INCR with TTL (the original behaviour)
+
+    If the server rejects scripts (EVAL disabled), hit() falls back to a
+    pipelined fixed window (SET NX EX, INCR, PTTL in one transaction).
 
     Attributes:
         _client: Redis client instance
+        algorithm: Rate limiting algorithm name
     """
 
-    def __init__(self, client: Any):
+    def __init__(self, client: Any, algorithm: str = "sliding_window"):
         """
         Initialize Redis storage.
 
         Args:
             client: Redis client instance
+            algorithm: sliding_window, gcra or fixed_window
+
+        Raises:
+            ValueError: If the algorithm is unknown
         """
+        if algorithm not in RATE_LIMIT_SCRIPTS:
+            raise ValueError(
+                f"Unknown rate limit algorithm '{algorithm}'. "
+                f"Expected one of: {', '.join(RATE_LIMIT_SCRIPTS)}"
+            )
         self._client = client
+        self.algorithm = algorithm
+        self._script = client.register_script(RATE_LIMIT_SCRIPTS[algorithm])
+        self._scripting = True
+
+    def _key(self, key: str) -> str:
+        """Storage key; algorithms keep different data types per key."""
+        if self.algorithm == "fixed_window":
+            return key
+        return f"{key}:{self.algorithm}"
+
+    def hit(self, key: str, limit: int, window_seconds: int) -> RateLimitResult:
+        """
+        Count a request and decide whether it is allowed, in one round trip.
+
+        Fails open (request allowed) if Redis is unreachable.
+
+        Args:
+            key: Rate limit key (client identifier)
+            limit: Maximum requests per window
+            window_seconds: Time window for rate limiting
+
+        Returns:
+            RateLimitResult for this request
+        """
+        window_ms = window_seconds * 1000
+        try:
+            if self._scripting:
+                try:
+                    count, reset_ms, allowed = self._script(
+                        keys=[self._key(key)],
+                        args=[limit, window_ms, uuid.uuid4().hex],
+                    )
+                except ResponseError as e:
+                    if "WRONGTYPE" in str(e):
+                        raise
+                    logger.warning(
+                        f"Redis scripting unavailable, using pipelined fixed window: {e}"
+                    )
+                    self._scripting = False
+            if not self._scripting:
+                count, reset_ms = self._pipelined_hit(key, window_ms)
+                allowed = count <= limit
+        except Exception as e:
+            logger.warning(f"Redis rate limit check failed: {e}")
+            return RateLimitResult(
+                count=1, limit=limit, reset_time=int(time.time()) + window_seconds, allowed=True
+            )
+
+        return RateLimitResult(
+            count=int(count),
+            limit=limit,
+            reset_time=int(time.time()) + math.ceil(max(0, int(reset_ms)) / 1000),
+            allowed=bool(allowed),
+        )
+
+    def _pipelined_hit(self, key: str, window_ms: int) -> tuple[int, int]:
+        """Fixed-window count and PTTL in one MULTI/EXEC round trip."""
+        pipe = self._client.pipeline(transaction=True)
+        pipe.set(key, 0, px=window_ms, nx=True)
+        pipe.incr(key)
+        pipe.pttl(key)
+        _, count, ttl = pipe.execute()
+        return count, ttl if ttl > 0 else window_ms
 
     def get_count(self, key: str) -> int:
         """
@@ -181,6 +506,11 @@ class RedisStorage:
             Current count, or 0 if key doesn't exist
         """
         try:
+            if self.algorithm == "sliding_window" and self._scripting:
+                return int(self._client.zcard(self._key(key)))
+            if self.algorithm == "gcra" and self._scripting:
+                # GCRA keeps no count; report whether the key is throttling
+                return 1 if self._client.exists(self._key(key)) else 0
             value = self._client.get(key)
             return int(value) if value else 0
         except Exception as e:
@@ -191,6 +521,8 @@ class RedisStorage:
         """
         Increment request count in Redis with TTL.
 
+        Prefer hit(), which also returns the reset time and decision.
+
         Args:
             key: Rate limit key (client identifier)
             window_seconds: Time window for rate limiting
@@ -198,23 +530,7 @@ class RedisStorage:
         Returns:
             New count after increment
         """
-        try:
-            pipe = self._client.pipeline()
-            pipe.incr(key)
-            pipe.ttl(key)
-            results = pipe.execute()
-
-            count = results[0]
-            ttl = results[1]
-
-            # Set expiration if this is a new key (TTL is -1 if not set)
-            if ttl == -1:
-                self._client.expire(key, window_seconds)
-
-            return count
-        except Exception as e:
-            logger.warning(f"Redis increment failed: {e}")
-            return 1
+        return self.hit(key, 2**31 - 1, window_seconds).count
 
     def get_reset_time(self, key: str) -> int:
         """
@@ -227,32 +543,230 @@ class RedisStorage:
             Unix timestamp when the rate limit resets
         """
         try:
-            ttl = self._client.ttl(key)
-            if ttl > 0:
-                return int(time.time()) + ttl
+            ttl_ms = self._client.pttl(self._key(key) if self._scripting else key)
+            if ttl_ms > 0:
+                return int(time.time()) + math.ceil(ttl_ms / 1000)
             return int(time.time())
         except Exception as e:
             logger.warning(f"Redis get_reset_time failed: {e}")
             return int(time.time())
 
 
-def get_storage(redis_url: Optional[str] = None) -> MemoryStorage | RedisStorage:
+@dataclass
+class _LocalBucket:
+    """Per-key state of HybridStorage for one fixed window."""
+    window_index: int
+    window_seconds: int
+    limit: int
+    synced_count: int = 0  # cluster-wide count at the last reconciliation
+    pending: int = 0  # local admissions not yet pushed to Redis
+    pushing: int = 0  # local admissions in a reconciliation still in flight
+
+
+class HybridStorage:
+    """
+    Local token buckets reconciled with Redis in the background.
+
+    Every worker decides locally: a request is allowed while the last
+    known cluster-wide count plus local unsynced admissions is below the
+    limit. A background thread pushes the local admissions to Redis (one
+    pipelined INCRBY per key, every `sync_interval` seconds) and reads
+    back the cluster totals. Once a key has `slack` unsynced admissions
+    the thread is woken to reconcile immediately; requests keep being
+    admitted meanwhile, so slack never caps throughput below the limit.
+
+    The request path never touches Redis. Each worker is behind on other
+    workers' admissions by at most `slack` per key plus what they admit
+    during one reconciliation round trip, which bounds the cluster-wide
+    overshoot. Windows are aligned fixed windows (floor(now / window))
+    shared by all workers.
+
+    Attributes:
+        _client: Redis client instance
+        sync_interval: Seconds between reconciliations
+        slack: Unsynced admissions per key that trigger a reconciliation
+    """
+
+    def __init__(self, client: Any, sync_interval: float = 1.0, slack: int = 10):
+        """
+        Initialize hybrid storage.
+
+        Args:
+            client: Redis client instance
+            sync_interval: Seconds between background reconciliations
+            slack: Unsynced admissions per key after which a worker
+                reconciles without waiting for the next interval
+        """
+        self._client = client
+        self.sync_interval = sync_interval
+        self.slack = slack
+        self._buckets: dict[str, _LocalBucket] = {}
+        self._lock = threading.Lock()
+        self._syncer: Optional[PeriodicWorker] = None
+
+    @staticmethod
+    def _redis_key(key: str, bucket: _LocalBucket) -> str:
+        return f"{key}:hybrid:{bucket.window_index}"
+
+    def hit(self, key: str, limit: int, window_seconds: int) -> RateLimitResult:
+        """
+        Count a request against local state; never waits on Redis.
+
+        Args:
+            key: Rate limit key (client identifier)
+            limit: Maximum requests per window (cluster-wide)
+            window_seconds: Time window for rate limiting
+
+        Returns:
+            RateLimitResult for this request
+        """
+        if self._syncer is None:
+            self._ensure_syncer()
+
+        now = time.time()
+        window_index = int(now // window_seconds)
+
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None or bucket.window_index != window_index:
+                bucket = _LocalBucket(window_index, window_seconds, limit)
+                self._buckets[key] = bucket
+            bucket.limit = limit
+
+            count = bucket.synced_count + bucket.pushing + bucket.pending
+            allowed = count < limit
+            if allowed:
+                bucket.pending += 1
+                count += 1
+            else:
+                count = max(count, limit + 1)
+            reconcile = bucket.pending >= self.slack
+
+        if reconcile:
+            # Slack used up: reconcile now rather than at the next tick
+            self._syncer.wake()
+
+        return RateLimitResult(
+            count=count,
+            limit=limit,
+            reset_time=(window_index + 1) * window_seconds,
+            allowed=allowed,
+        )
+
+    def increment(self, key: str, window_seconds: int) -> int:
+        """Count a request without a limit (compatibility with MemoryStorage)."""
+        return self.hit(key, 2**31 - 1, window_seconds).count
+
+    def get_count(self, key: str) -> int:
+        """Best known count for a key in its current window."""
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None or bucket.window_index != int(time.time() // bucket.window_seconds):
+                return 0
+            return bucket.synced_count + bucket.pushing + bucket.pending
+
+    def get_reset_time(self, key: str) -> int:
+        """Unix timestamp when the key's current window ends."""
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                return int(time.time())
+            return (bucket.window_index + 1) * bucket.window_seconds
+
+    def sync(self) -> int:
+        """
+        Push local admissions to Redis and refresh cluster-wide counts.
+
+        Runs on the background thread; buckets of past windows are dropped.
+        If Redis is unavailable the pending counts are discarded (the
+        limiter fails open, like RedisStorage).
+
+        Returns:
+            Number of keys reconciled
+        """
+        now = time.time()
+        with self._lock:
+            for key in [
+                k for k, b in self._buckets.items()
+                if b.window_index != int(now // b.window_seconds)
+            ]:
+                del self._buckets[key]
+            batch = [(key, bucket, bucket.pending) for key, bucket in self._buckets.items()]
+            for _, bucket, delta in batch:
+                bucket.pending = 0
+                bucket.pushing += delta
+
+        if not batch:
+            return 0
+
+        try:
+            pipe = self._client.pipeline(transaction=False)
+            for key, bucket, delta in batch:
+                redis_key = self._redis_key(key, bucket)
+                pipe.incrby(redis_key, delta)
+                pipe.expire(redis_key, bucket.window_seconds * 2)
+            totals = pipe.execute()[::2]
+        except Exception as e:
+            logger.warning(f"Rate limit reconciliation with Redis failed: {e}")
+            with self._lock:
+                for _, bucket, delta in batch:
+                    bucket.pushing -= delta
+            return 0
+
+        with self._lock:
+            for (key, bucket, delta), total in zip(batch, totals):
+                bucket.pushing -= delta
+                # Totals only grow within a window; a slower concurrent
+                # reconciliation must not move the count back
+                bucket.synced_count = max(bucket.synced_count, int(total))
+        return len(batch)
+
+    def _ensure_syncer(self) -> None:
+        with self._lock:
+            if self._syncer is None:
+                self._syncer = PeriodicWorker(self, "sync", self.sync_interval)
+
+    def close(self) -> None:
+        """Stop background reconciliation after a final sync."""
+        if self._syncer is not None:
+            self._syncer.stop()
+            self._syncer = None
+        self.sync()
+
+
+def get_storage(
+    redis_url: Optional[str] = None,
+    algorithm: str = "sliding_window",
+    hybrid: bool = False,
+    sync_interval: float = 1.0,
+    slack: int = 10,
+) -> MemoryStorage | RedisStorage | HybridStorage:
     """
     Get storage backend based on configuration.
 
     Args:
         redis_url: Optional Redis URL for distributed storage
+        algorithm: Redis rate limiting algorithm (see RedisStorage)
+        hybrid: Use local token buckets reconciled with Redis (HybridStorage)
+        sync_interval: Hybrid mode reconciliation interval in seconds
+        slack: Hybrid mode local tokens per key between reconciliations
 
     Returns:
-        MemoryStorage or RedisStorage instance
+        MemoryStorage, RedisStorage or HybridStorage instance
     """
     if redis_url:
         try:
             import redis
             client = redis.from_url(redis_url)
             client.ping()  # Test connection
-            logger.info("Using Redis storage for rate limiting")
-            return RedisStorage(client)
+            if hybrid:
+                logger.info(
+                    f"Using hybrid storage for rate limiting "
+                    f"(sync every {sync_interval}s, slack {slack})"
+                )
+                return HybridStorage(client, sync_interval=sync_interval, slack=slack)
+            logger.info(f"Using Redis storage for rate limiting ({algorithm})")
+            return RedisStorage(client, algorithm=algorithm)
         except Exception as e:
             logger.warning(f"Redis connection failed, falling back to memory: {e}")
 
@@ -298,69 +812,51 @@ def get_client_ip(scope: Scope) -> str:
     return "unknown"
 
 
-def get_user_from_token(headers: Headers) -> Optional[str]:
+def get_token_claims(scope: Scope) -> Optional[dict]:
     """
-    Extract user ID from JWT token in Authorization header.
+    Get verified JWT claims for the request's Bearer token.
+
+    Verification goes through backend.auth.cache, so the outcome is stored
+    in request state and reused by the auth dependencies instead of
+    decoding the token again.
 
     Args:
-        headers: Request headers
+        scope: ASGI scope
 
     Returns:
-        User ID if authenticated, None otherwise
+        Token claims if a valid token was sent, None otherwise
     """
-    auth_header = headers.get("authorization", "")
+    from backend.auth.cache import resolve_token_claims
+    from backend.auth.jwt import InvalidTokenError, TokenExpiredError
 
+    auth_header = Headers(scope=scope).get("authorization", "")
     if not auth_header.startswith("Bearer "):
         return None
 
     try:
-        # Extract token
-        token = auth_header[7:]
-
-        # Decode JWT payload (without verification - just for ID extraction)
-        # The auth middleware handles actual verification
-        parts = token.split(".")
-        if len(parts) != 3:
-            return None
-
-        # Decode payload (middle part)
-        payload_b64 = parts[1]
-        # Add padding if needed
-        padding = 4 - len(payload_b64) % 4
-        if padding != 4:
-            payload_b64 += "=" * padding
-
-        payload = json.loads(base64.urlsafe_b64decode(payload_b64))
-        return payload.get("sub")
-    except Exception:
+        return resolve_token_claims(scope, auth_header[7:])
+    except (InvalidTokenError, TokenExpiredError):
         return None
 
 
-def is_admin_request(headers: Headers) -> bool:
+def is_admin_request(scope: Scope) -> bool:
     """
     Check if request is from an admin user.
 
-    Uses proper JWT signature verification via decode_token() instead of
-    raw base64 decoding, which would accept forged/unsigned tokens.
+    Uses proper JWT signature verification (via get_token_claims()) instead
+    of raw base64 decoding, which would accept forged/unsigned tokens.
 
     Args:
-        headers: Request headers
+        scope: ASGI scope
 
     Returns:
         True if admin, False otherwise
     """
-    from backend.auth.jwt import decode_token, InvalidTokenError, TokenExpiredError
-
-    auth_header = headers.get("authorization", "")
-    if auth_header.startswith("Bearer "):
-        try:
-            token = auth_header[7:]
-            payload = decode_token(token)
-            return payload.get("role") == "admin" or payload.get("is_admin", False)
-        except (InvalidTokenError, TokenExpiredError):
-            return False
+    payload = get_token_claims(scope)
+    if payload is None:
+        return False
 
-    return False
+    return payload.get("role") == "admin" or bool(payload.get("is_admin", False))
 
 
 class RateLimitMiddleware:
@@ -375,7 +871,7 @@ class RateLimitMiddleware:
 
     Args:
         app: ASGI application
-        storage: Storage backend (MemoryStorage or RedisStorage)
+        storage: Storage backend (MemoryStorage, RedisStorage or HybridStorage)
         default_limit: Default requests per window (default: 100)
         window_seconds: Default time window in seconds (default: 60)
         endpoint_limits: Dict of endpoint path -> limit override
@@ -388,7 +884,7 @@ class RateLimitMiddleware:
     def __init__(
         self,
         app: ASGIApp,
-        storage: Optional[MemoryStorage | RedisStorage] = None,
+        storage: Optional[MemoryStorage | RedisStorage | HybridStorage] = None,
         default_limit: int = 100,
         window_seconds: int = 60,
         endpoint_limits: Optional[dict[str, int]] = None,
@@ -399,7 +895,7 @@ class RateLimitMiddleware:
     ):
         """Initialize rate limit middleware."""
         self.app = app
-        self.storage = storage or MemoryStorage()
+        self.storage = storage if storage is not None else MemoryStorage()
         self.default_limit = default_limit
         self.window_seconds = window_seconds
         self.endpoint_limits = endpoint_limits or {}
@@ -428,37 +924,35 @@ class RateLimitMiddleware:
             await self.app(scope, receive, send)
             return
 
-        headers = Headers(scope=scope)
-
         # Get client identifier
-        client_key = self._get_client_key(scope, headers)
+        client_key = self._get_client_key(scope)
 
         # Get endpoint-specific configuration
         limit = self._get_limit_for_path(path)
         window = self._get_window_for_path(path)
 
         # Apply admin multiplier
-        if is_admin_request(headers):
+        if is_admin_request(scope):
             limit *= self.admin_multiplier
 
         # Build rate limit key
-        rate_limit_key = f"rate_limit:{client_key}:{self._get_path_category(path)}"
+        category = self._get_path_category(path)
+        rate_limit_key = f"rate_limit:{client_key}:{category}"
 
-        # Check and increment counter
-        current_count = self.storage.increment(rate_limit_key, window)
-        reset_time = self.storage.get_reset_time(rate_limit_key)
-        remaining = max(0, limit - current_count)
+        # Count the request and decide (one storage call)
+        result = self._hit(rate_limit_key, limit, window)
 
         # Prepare rate limit headers
         rate_limit_headers = {
             "X-RateLimit-Limit": str(limit),
-            "X-RateLimit-Remaining": str(remaining),
-            "X-RateLimit-Reset": str(reset_time),
+            "X-RateLimit-Remaining": str(result.remaining),
+            "X-RateLimit-Reset": str(result.reset_time),
         }
 
         # Check if rate limited
-        if current_count > limit:
-            retry_after = max(1, reset_time - int(time.time()))
+        if not result.allowed:
+            RATE_LIMIT_REJECTIONS.inc(category=category)
+            retry_after = max(1, result.reset_time - int(time.time()))
             rate_limit_headers["Retry-After"] = str(retry_after)
 
             # Get custom error message if configured
@@ -485,6 +979,24 @@ class RateLimitMiddleware:
 
         await self.app(scope, receive, send_with_headers)
 
+    def _hit(self, key: str, limit: int, window: int) -> RateLimitResult:
+        """
+        Count a request via the storage's hit() when it has one.
+
+        Storages without hit() use increment() and get_reset_time().
+        """
+        hit = getattr(self.storage, "hit", None)
+        if hit is not None:
+            return hit(key, limit, window)
+
+        count = self.storage.increment(key, window)
+        return RateLimitResult(
+            count=count,
+            limit=limit,
+            reset_time=self.storage.get_reset_time(key),
+            allowed=count <= limit,
+        )
+
     def _is_excluded_path(self, path: str) -> bool:
         """Check if path is excluded from rate limiting."""
         for excluded in self.excluded_paths:
@@ -492,23 +1004,26 @@ class RateLimitMiddleware:
                 return True
         return False
 
-    def _get_client_key(self, scope: Scope, headers: Headers) -> str:
+    def _get_client_key(self, scope: Scope) -> str:
         """
         Get unique client identifier for rate limiting.
 
-        Uses user ID for authenticated requests, IP for anonymous.
+        Uses the user ID from verified token claims (sub, or user_id as
+        issued by /auth/login) for authenticated requests, IP otherwise.
+        Unverified tokens fall back to IP, so a forged token cannot pick
+        its own bucket.
 
         Args:
             scope: ASGI scope
-            headers: Request headers
 
         Returns:
             Client identifier string
         """
-        # Try to get user ID from JWT
-        user_id = get_user_from_token(headers)
-        if user_id:
-            return f"user:{user_id}"
+        claims = get_token_claims(scope)
+        if claims:
+            user_id = claims.get("sub") or claims.get("user_id")
+            if user_id:
+                return f"user:{user_id}"
 
         # Fall back to IP address
         client_ip = get_client_ip(scope)
@@ -0,0 +1,35 @@
+"""
+Route context middleware for PCF Calculator Backend.
+
+Exposes the ASGI scope of the current request through the
+backend.database.pool_metrics.request_scope context variable. FastAPI
+records the matched route in the scope during routing, so code running
+for the request (e.g. pool checkout events, including in the threadpool
+used by sync endpoints) can label metrics with the route template
+instead of the raw path.
+
+Usage:
+    app.add_middleware(RouteContextMiddleware)
+"""
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from backend.database.pool_metrics import request_scope
+
+
+class RouteContextMiddleware:
+    """Pure ASGI middleware setting request_scope for HTTP requests."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        token = request_scope.set(scope)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            request_scope.reset(token)
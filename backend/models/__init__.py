@@ -467,6 +467,16 @@ class PCFCalculation(Base):
         cascade="all, delete-orphan"
     )
 
+    @property
+    def error_message(self) -> Optional[str]:
+        """Error recorded by a failed calculation (metadata, then input_data)."""
+        error_msg = None
+        if self.calculation_metadata:
+            error_msg = self.calculation_metadata.get("error_message")
+        if not error_msg and self.input_data:
+            error_msg = self.input_data.get("error_message")
+        return error_msg
+
     # Provide instance-level access: .metadata -> .calculation_metadata
     def __getattr__(self, name):
         if name == 'metadata':
@@ -581,6 +591,9 @@ from backend.models.user import User
 from backend.models.data_source_license import DataSourceLicense
 from backend.models.emission_factor_provenance import EmissionFactorProvenance
 
+# Precomputed admin coverage aggregates
+from backend.models.coverage_rollup import CoverageRollup
+
 # Export all models
 __all__ = [
     'Base',
@@ -599,4 +612,6 @@ __all__ = [
     # Phase 8 Compliance models (TASK-DB-P8-002)
     'DataSourceLicense',
     'EmissionFactorProvenance',
+    # Admin coverage rollups
+    'CoverageRollup',
 ]
@@ -0,0 +1,90 @@
+"""
+CoverageRollup model - Precomputed emission factor coverage aggregates
+
+Stores the grouped counts behind GET /admin/emission-factors/coverage so
+the endpoint answers from a few hundred rows instead of re-aggregating
+emission_factors and products on every dashboard refresh. Rollups are
+rebuilt after each data sync (see backend.services.coverage_rollups).
+
+Each row belongs to one dimension; unused key columns are NULL:
+    factors:              (data_source_id, geography, category,
+                           reference_year, is_active) cells with
+                           factor count and data quality sum/count
+    activities:           distinct activity names per data_source_id;
+                          is_active=True counts active factors only,
+                          NULL counts all factors
+    activities_total:     distinct activity names across all sources,
+                          same is_active convention
+    product_categories:   product count per category_id (stored in
+                          the category column)
+    product_geographies:  product count per country_of_origin (stored
+                          in the geography column)
+
+Attributes:
+    id: UUID primary key
+    dimension: Rollup dimension (see above)
+    data_source_id: Data source of the aggregated factors
+    geography: Geography code
+    category: Emission factor category or product category ID
+    reference_year: Factor reference year
+    is_active: Factor active flag (or active-only filter)
+    item_count: Number of factors, activities or products
+    quality_sum: Sum of data_quality_rating over rated factors
+    quality_count: Number of rated factors
+    refreshed_at: When the rollups were computed
+"""
+
+from sqlalchemy import (
+    Boolean,
+    Column,
+    DateTime,
+    Integer,
+    Numeric,
+    String,
+    Index,
+)
+
+from backend.models.base import Base, generate_uuid
+
+
+class CoverageRollup(Base):
+    """
+    CoverageRollup model - One precomputed coverage aggregate cell.
+
+    All rows of a refresh share the same refreshed_at timestamp.
+    """
+    __tablename__ = "coverage_rollups"
+
+    # Primary key - UUID hex string
+    id = Column(
+        String(32),
+        primary_key=True,
+        default=generate_uuid
+    )
+
+    # Rollup dimension: factors, activities, activities_total,
+    # product_categories, product_geographies
+    dimension = Column(String(30), nullable=False)
+
+    # Grouping keys (NULL when not part of the dimension)
+    data_source_id = Column(String(32), nullable=True)
+    geography = Column(String(50), nullable=True)
+    category = Column(String(50), nullable=True)
+    reference_year = Column(Integer, nullable=True)
+    is_active = Column(Boolean, nullable=True)
+
+    # Aggregates
+    item_count = Column(Integer, nullable=False, default=0)
+    quality_sum = Column(Numeric(18, 4), nullable=True)
+    quality_count = Column(Integer, nullable=False, default=0)
+
+    # Staleness timestamp
+    refreshed_at = Column(DateTime(timezone=True), nullable=False)
+
+    # Table indexes
+    __table_args__ = (
+        Index('idx_coverage_rollup_refreshed', 'refreshed_at'),
+    )
+
+    def __repr__(self) -> str:
+        return f"<CoverageRollup(dimension='{self.dimension}', count={self.item_count})>"
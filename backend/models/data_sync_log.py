@@ -114,7 +114,8 @@ class DataSyncLog(Base):
 
     # Table indexes
     __table_args__ = (
-        Index('idx_sync_log_source', 'data_source_id'),
+        # Leading data_source_id also serves plain source lookups
+        Index('idx_sync_log_source_started', 'data_source_id', 'started_at'),
         Index('idx_sync_log_status', 'status'),
         Index('idx_sync_log_started', 'started_at'),
         Index('idx_sync_log_celery_task', 'celery_task_id'),
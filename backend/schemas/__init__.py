@@ -301,6 +301,40 @@ class EmissionFactorUpdateRequest(BaseModel):
         return v
 
 
+class EmissionFactorSuggestItem(BaseModel):
+    """Single component to resolve in a batch suggestion request"""
+    component_name: str = Field(..., min_length=1, max_length=255, description="BOM component name")
+    unit: str = Field(default="kg", min_length=1, max_length=20, description="Unit of measurement")
+    geography: Optional[str] = Field(None, max_length=50, description="Geographic region (optional)")
+
+
+class EmissionFactorSuggestBatchRequest(BaseModel):
+    """Request body for resolving many components at once"""
+    components: List[EmissionFactorSuggestItem] = Field(
+        ...,
+        min_length=1,
+        max_length=5000,
+        description="Components to resolve (max 5000)"
+    )
+
+
+class EmissionFactorSuggestResult(BaseModel):
+    """Suggested emission factor for one requested component"""
+    component_name: str = Field(..., description="Requested component name")
+    unit: str = Field(..., description="Requested unit")
+    geography: Optional[str] = Field(None, description="Requested geography")
+    emission_factor: Optional[EmissionFactorListItemResponse] = Field(
+        None, description="Matching emission factor, or null if none found"
+    )
+
+
+class EmissionFactorSuggestBatchResponse(BaseModel):
+    """Batch suggestion results in request order"""
+    results: List[EmissionFactorSuggestResult] = Field(..., description="One result per requested component")
+    matched_count: int = Field(..., ge=0, description="Components with a suggested factor")
+    unmatched_count: int = Field(..., ge=0, description="Components without a suggested factor")
+
+
 class DataSourceAttribution(BaseModel):
     """Attribution information for a single data source."""
     id: str
@@ -346,6 +380,10 @@ __all__ = [
     "EmissionFactorCreateRequest",
     "EmissionFactorCreateResponse",
     "EmissionFactorUpdateRequest",
+    "EmissionFactorSuggestItem",
+    "EmissionFactorSuggestBatchRequest",
+    "EmissionFactorSuggestResult",
+    "EmissionFactorSuggestBatchResponse",
     # Attributions
     "DataSourceAttribution",
     "AttributionResponse",
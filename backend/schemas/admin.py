@@ -8,6 +8,7 @@ Pydantic models for admin API request/response validation:
 - Sync trigger requests and responses
 - Sync logs with filtering and pagination
 - Coverage statistics
+- Request profiles
 """
 
 from datetime import datetime, date
@@ -398,6 +399,73 @@ class CoverageResponse(BaseModel):
     by_geography: List[CoverageByGeography]
     by_category: List[CoverageByCategory]
     gaps: CoverageGaps
+    refreshed_at: Optional[datetime] = Field(
+        None, description="When the coverage rollups were computed"
+    )
+    stale: bool = Field(
+        False, description="True if factors changed or a sync completed after refreshed_at"
+    )
+
+
+# ============================================================================
+# Profile Schemas
+# ============================================================================
+
+
+class ProfileStatement(BaseModel):
+    """SQL statement executed during a profiled request."""
+    statement: str
+    count: int = Field(..., description="Executions of this statement")
+    total_ms: float
+
+
+class ProfileQueryEntry(BaseModel):
+    """Single statement execution in a profile's SQL log."""
+    statement: str
+    offset_ms: float = Field(..., description="Start, relative to the request start")
+    duration_ms: float
+    executemany: bool
+    error: Optional[str] = None
+
+
+class ProfileQueries(BaseModel):
+    """SQL query log of a profiled request."""
+    count: int
+    total_ms: float
+    distinct: int
+    dropped: int = Field(..., description="Executions counted but not logged")
+    top: List[ProfileStatement]
+    entries: Optional[List[ProfileQueryEntry]] = None
+
+
+class ProfileFrame(BaseModel):
+    """Leaf frame of the sampled stack profile."""
+    frame: str
+    samples: int
+
+
+class ProfileItem(BaseModel):
+    """Profile of one request."""
+    id: str
+    created_at: datetime
+    trigger: str = Field(..., description="header (X-Profile) or slow (threshold)")
+    mode: str = Field(..., description="sample or cprofile")
+    method: str
+    path: str
+    route: Optional[str] = None
+    user: Optional[str] = None
+    status: int
+    duration_ms: float
+    response_ms: Optional[float] = None
+    queries: ProfileQueries
+    samples: int
+    top_frames: List[ProfileFrame]
+    files: List[str] = Field(..., description="Downloadable artifact file names")
+
+
+class ProfileListResponse(BaseModel):
+    """Response for GET /admin/profiles."""
+    items: List[ProfileItem]
 
 
 # ============================================================================
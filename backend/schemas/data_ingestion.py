@@ -7,6 +7,8 @@ This module provides validation schemas for:
 - ValidationError: Records validation errors during ingestion
 - SyncResult: Result of a sync operation with statistics
 - SyncRequest: Request parameters for initiating a sync
+- SourceSyncResult: Per-source result inside a composite sync
+- CompositeSyncResult: Result of a concurrent multi-source sync run
 
 Usage:
     from backend.schemas.data_ingestion import (
@@ -207,8 +209,116 @@ class SyncRequest(BaseModel):
     )
 
 
+class SourceSyncResult(SyncResult):
+    """
+    Result for one connector job inside a composite sync.
+
+    Extends SyncResult with the job identity and per-phase timings so
+    slow sources can be spotted in a concurrent run.
+
+    Attributes:
+        job_key: Orchestrator job key (e.g. "epa_fuels", "defra")
+        source_name: Data source name as registered in the connector registry
+        fetch_seconds: Time spent downloading (or reading) the raw file
+        parse_seconds: Time spent parsing and transforming records
+        write_seconds: Time spent in the bulk writer
+        error_message: Error message if the job failed
+    """
+    job_key: str = Field(
+        ...,
+        description="Orchestrator job key (e.g. epa_fuels, defra)"
+    )
+    source_name: str = Field(
+        ...,
+        description="Data source name as registered in the connector registry"
+    )
+    fetch_seconds: float = Field(
+        default=0.0,
+        ge=0,
+        description="Seconds spent fetching raw data"
+    )
+    parse_seconds: float = Field(
+        default=0.0,
+        ge=0,
+        description="Seconds spent parsing and transforming records"
+    )
+    write_seconds: float = Field(
+        default=0.0,
+        ge=0,
+        description="Seconds spent writing records"
+    )
+    error_message: Optional[str] = Field(
+        default=None,
+        description="Error message if the job failed"
+    )
+
+
+class CompositeSyncResult(BaseModel):
+    """
+    Result of a concurrent multi-source sync run.
+
+    All per-source sync logs written by one run share the same
+    composite_sync_id (stored in DataSyncLog.metadata).
+
+    Attributes:
+        composite_sync_id: UUID shared by every sync log of the run
+        status: completed, partial (some jobs failed) or failed
+        started_at: When the run started
+        completed_at: When the run completed
+        duration_seconds: Wall-clock duration of the run
+        sources: Per-job results with timings
+
+    Example:
+        result = await SyncOrchestrator(session_factory).run()
+        for source in result.sources:
+            print(source.job_key, source.fetch_seconds, source.write_seconds)
+    """
+    composite_sync_id: str = Field(
+        ...,
+        description="UUID shared by all sync logs of this run"
+    )
+    status: str = Field(
+        ...,
+        description="Overall status: completed, partial, or failed"
+    )
+    started_at: datetime = Field(
+        ...,
+        description="Timestamp when the run started"
+    )
+    completed_at: datetime = Field(
+        ...,
+        description="Timestamp when the run completed"
+    )
+    duration_seconds: float = Field(
+        default=0.0,
+        ge=0,
+        description="Wall-clock duration of the run in seconds"
+    )
+    sources: List[SourceSyncResult] = Field(
+        default_factory=list,
+        description="Per-job results with timings"
+    )
+
+    @property
+    def records_created(self) -> int:
+        """Total records created across all jobs."""
+        return sum(s.records_created for s in self.sources)
+
+    @property
+    def records_updated(self) -> int:
+        """Total records updated across all jobs."""
+        return sum(s.records_updated for s in self.sources)
+
+    @property
+    def records_failed(self) -> int:
+        """Total records that failed validation across all jobs."""
+        return sum(s.records_failed for s in self.sources)
+
+
 __all__ = [
     "ValidationError",
     "SyncResult",
     "SyncRequest",
+    "SourceSyncResult",
+    "CompositeSyncResult",
 ]
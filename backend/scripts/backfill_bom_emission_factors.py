@@ -8,16 +8,17 @@ import asyncio
 import sys
 sys.path.insert(0, '/home/mydev/projects/PCF/product-lca-carbon-calculator')
 
-from sqlalchemy import select, update
+from sqlalchemy import bindparam, select, update
 from backend.database.connection import get_async_session
 from backend.models import BillOfMaterials, Product
 from backend.services.data_ingestion.emission_factor_mapper import EmissionFactorMapper
+from backend.services.data_ingestion.factor_resolution_cache import get_resolution_cache
 
 
 async def backfill_emission_factors():
     """Backfill emission_factor_id for all BOM entries with null values."""
     async with get_async_session() as session:
-        mapper = EmissionFactorMapper(db=session)
+        mapper = EmissionFactorMapper(db=session, resolution_cache=get_resolution_cache())
 
         # Get all BOM entries with null emission_factor_id
         query = (
@@ -30,29 +31,35 @@ async def backfill_emission_factors():
 
         print(f"Found {len(bom_entries)} BOM entries with null emission_factor_id")
 
-        updated = 0
+        # Resolve every distinct (component, unit) pair against the in-memory
+        # factor index instead of querying per BOM entry
+        factors = await mapper.get_factors_for_components(
+            (child_name, bom.unit or 'kg', None) for bom, child_name in bom_entries
+        )
+
+        updates = []
         not_found = 0
 
         for bom, child_name in bom_entries:
-            # Look up emission factor for this component
-            factor = await mapper.get_factor_for_component(
-                component_name=child_name,
-                unit=bom.unit or 'kg',
-            )
+            factor = factors[(child_name, bom.unit or 'kg', None)]
 
             if factor:
-                # Update the BOM entry
-                await session.execute(
-                    update(BillOfMaterials)
-                    .where(BillOfMaterials.id == bom.id)
-                    .values(emission_factor_id=factor.id)
-                )
-                updated += 1
+                updates.append({"b_id": bom.id, "factor_id": factor.id})
             else:
                 not_found += 1
                 if not_found <= 10:
                     print(f"  No factor found for: {child_name} ({bom.unit})")
 
+        if updates:
+            # Single executemany UPDATE for all resolved entries
+            await session.execute(
+                update(BillOfMaterials.__table__)
+                .where(BillOfMaterials.__table__.c.id == bindparam("b_id"))
+                .values(emission_factor_id=bindparam("factor_id")),
+                updates,
+            )
+        updated = len(updates)
+
         await session.commit()
 
         print(f"\nResults:")
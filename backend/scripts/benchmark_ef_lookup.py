@@ -0,0 +1,150 @@
+"""
+Benchmark partial emission factor lookups with and without trigram indexes.
+
+Seeds a large synthetic emission_factors table inside a transaction, runs the
+ranked ILIKE partial-match query used by EmissionFactorMapper against it, and
+reports latency percentiles plus the plan node PostgreSQL chose. Runs once
+with the pg_trgm GIN index and once with it dropped (when pg_trgm is
+installed). The transaction is rolled back, so the database is unchanged.
+
+Usage:
+    python -m backend.scripts.benchmark_ef_lookup
+    python -m backend.scripts.benchmark_ef_lookup --rows 100000 --repeat 50
+"""
+import argparse
+import json
+import random
+import statistics
+import time
+from typing import Dict, List
+
+from sqlalchemy import insert, select, text
+
+from backend.database.connection import engine
+from backend.database.trigram import partial_match_order
+from backend.models import EmissionFactor
+
+
+MATERIALS = [
+    "steel", "aluminum", "copper", "cotton", "polyester", "glass", "rubber",
+    "plastic abs", "plastic hdpe", "paper", "cardboard", "concrete", "cement",
+    "lithium", "nickel", "wood", "leather", "wool", "nylon", "silicon",
+]
+PROCESSES = [
+    "hot rolled", "cold rolled", "primary", "recycled", "virgin", "cast",
+    "extruded", "woven", "knitted", "molded", "blown", "coated", "sheet",
+]
+SEARCH_TERMS = ["hot rolled", "recycled alu", "cotton", "plastic hdpe", "lithium", "zzz"]
+
+
+def synthetic_factors(rows: int, seed: int = 42) -> List[Dict]:
+    """Generate synthetic emission factor rows."""
+    rng = random.Random(seed)
+    return [
+        {
+            "id": f"bench{i:027d}",
+            "activity_name": (
+                f"{rng.choice(MATERIALS).title()}, {rng.choice(PROCESSES)} "
+                f"variant {i}"
+            ),
+            "co2e_factor": round(rng.uniform(0.1, 25.0), 4),
+            "unit": rng.choice(["kg", "kg", "kg", "L", "kWh"]),
+            "data_source": "BENCHMARK",
+            "geography": rng.choice(["GLO", "US", "GB", "EU"]),
+            "category": "material",
+            "is_active": True,
+        }
+        for i in range(rows)
+    ]
+
+
+def partial_match_query(term: str, use_trigram: bool):
+    """The ranked partial-match query issued by EmissionFactorMapper."""
+    return (
+        select(EmissionFactor.id)
+        .where(
+            EmissionFactor.activity_name.ilike(f"%{term}%"),
+            EmissionFactor.unit == "kg",
+            EmissionFactor.is_active == True,  # noqa: E712
+        )
+        .order_by(*partial_match_order(EmissionFactor.activity_name, term, use_trigram))
+        .limit(1)
+    )
+
+
+def run_lookups(conn, use_trigram: bool, repeat: int) -> Dict:
+    """Time repeated lookups for every search term."""
+    timings_ms = []
+    plans = set()
+
+    for term in SEARCH_TERMS:
+        query = partial_match_query(term, use_trigram)
+        compiled = query.compile(conn, compile_kwargs={"literal_binds": True})
+        plan = conn.execute(text(f"EXPLAIN {compiled}")).scalars().all()
+        plans.update(
+            line.strip().lstrip("-> ").split("  ")[0]
+            for line in plan
+            if "Scan" in line
+        )
+
+        for _ in range(repeat):
+            started = time.perf_counter()
+            conn.execute(query).first()
+            timings_ms.append((time.perf_counter() - started) * 1000)
+
+    timings_ms.sort()
+    return {
+        "lookups": len(timings_ms),
+        "p50_ms": round(statistics.median(timings_ms), 3),
+        "p95_ms": round(timings_ms[int(len(timings_ms) * 0.95) - 1], 3),
+        "max_ms": round(timings_ms[-1], 3),
+        "scan_nodes": sorted(plans),
+    }
+
+
+def benchmark(rows: int, repeat: int) -> Dict:
+    """Seed rows in a rolled-back transaction and benchmark both variants."""
+    results: Dict = {"rows": rows, "repeat_per_term": repeat, "terms": SEARCH_TERMS}
+
+    with engine.connect() as conn:
+        trans = conn.begin()
+        try:
+            has_trgm = conn.execute(text(
+                "SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'"
+            )).scalar() is not None
+            results["pg_trgm"] = has_trgm
+
+            factors = synthetic_factors(rows)
+            started = time.perf_counter()
+            for start in range(0, rows, 5000):
+                conn.execute(insert(EmissionFactor), factors[start:start + 5000])
+            results["seed_seconds"] = round(time.perf_counter() - started, 2)
+
+            if has_trgm:
+                conn.execute(text("""
+                    CREATE INDEX IF NOT EXISTS idx_ef_activity_name_trgm
+                    ON emission_factors USING gin (activity_name gin_trgm_ops)
+                """))
+                conn.execute(text("ANALYZE emission_factors"))
+                results["trigram_index"] = run_lookups(conn, True, repeat)
+                conn.execute(text("DROP INDEX idx_ef_activity_name_trgm"))
+
+            conn.execute(text("ANALYZE emission_factors"))
+            results["no_index"] = run_lookups(conn, False, repeat)
+        finally:
+            trans.rollback()
+
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=100_000, help="Synthetic factors to seed")
+    parser.add_argument("--repeat", type=int, default=20, help="Lookups per search term")
+    args = parser.parse_args()
+
+    print(json.dumps(benchmark(args.rows, args.repeat), indent=2))
+
+
+if __name__ == "__main__":
+    main()
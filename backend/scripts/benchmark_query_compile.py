@@ -0,0 +1,201 @@
+"""
+Benchmark statement construction, compilation and execution of hot queries.
+
+Compares the per-request ORM Query construction the hot paths used before
+(product search, calculation status lookup, emission factor by category)
+with the cached lambda statements that replaced them. For each query and
+variant it reports:
+
+- build_us: constructing the statement and its cache key, paid on every
+  request (what remains when the compiled SQL is served from the cache)
+- compile_us: compiling the SQL string from scratch (a compiled-cache miss)
+- execute_ms: median end-to-end execution against the database
+
+Runs read-only queries against DATABASE_URL; results depend on its data.
+
+Usage:
+    python -m backend.scripts.benchmark_query_compile
+    python -m backend.scripts.benchmark_query_compile --repeat 2000
+"""
+import argparse
+import json
+import statistics
+import time
+from typing import Any, Callable, Dict
+
+from sqlalchemy import case, exists, func, not_, or_, select
+from sqlalchemy.orm import Session, joinedload
+
+from backend.api.routes.calculations import calculation_by_id
+from backend.api.routes.product_search import ValidatedParams, _build_search_query
+from backend.calculator.sqlalchemy_provider import (
+    category_exact_statement,
+    category_fallback_statement,
+)
+from backend.database.connection import SessionLocal
+from backend.models import BillOfMaterials, EmissionFactor, PCFCalculation, Product, ProductCategory
+
+
+SEARCH_PARAMS = ValidatedParams(
+    query="laptop", category_id=None, industry="electronics", manufacturer=None,
+    country_of_origin=None, is_finished_product=True, has_bom=True,
+    limit=50, offset=0, error=None,
+)
+
+
+def legacy_search_query(db: Session, params: ValidatedParams):
+    """The pre-lambda _build_search_query (ORM Query rebuilt per request)."""
+    query = db.query(Product).options(joinedload(Product.product_category))
+    if params.query:
+        pattern = f"%{params.query.lower()}%"
+        query = query.filter(or_(
+            func.lower(Product.name).like(pattern),
+            func.lower(Product.description).like(pattern),
+            func.lower(Product.code).like(pattern),
+            func.lower(Product.search_vector).like(pattern),
+        ))
+    if params.industry is not None:
+        query = query.filter(or_(
+            exists(select(ProductCategory.id).where(
+                ProductCategory.id == Product.category_id,
+                ProductCategory.industry_sector == params.industry,
+            )),
+            func.lower(Product.category) == params.industry.lower(),
+        ))
+    if params.is_finished_product is not None:
+        query = query.filter(Product.is_finished_product == params.is_finished_product)
+    has_bom = exists(select(BillOfMaterials.id).where(BillOfMaterials.parent_product_id == Product.id))
+    if params.has_bom is True:
+        query = query.filter(has_bom)
+    elif params.has_bom is False:
+        query = query.filter(not_(has_bom))
+    return query.order_by(Product.name)
+
+
+def legacy_category_exact(db: Session, category: str):
+    """The pre-lambda exact-category get_by_category query."""
+    return db.query(EmissionFactor).filter(
+        EmissionFactor.category == category,
+        EmissionFactor.is_active == True  # noqa: E712
+    ).limit(1)
+
+
+def legacy_category_fallback(db: Session, category: str):
+    """The pre-lambda case-insensitive get_by_category fallback query."""
+    category_match = EmissionFactor.category.ilike(category)
+    return db.query(EmissionFactor).filter(
+        or_(category_match, EmissionFactor.activity_name.ilike(category)),
+        EmissionFactor.is_active == True  # noqa: E712
+    ).order_by(case((category_match, 0), else_=1)).limit(1)
+
+
+def time_us(fn: Callable[[], Any], repeat: int) -> float:
+    """Median microseconds per call."""
+    timings = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - t0) * 1e6)
+    return round(statistics.median(timings), 1)
+
+
+def measure(
+    db: Session,
+    build: Callable[[], Any],
+    execute: Callable[[], Any],
+    repeat: int,
+) -> Dict:
+    """Build/cache-key, cold compile and execution timings for one variant."""
+    dialect = db.get_bind().dialect
+
+    def build_and_key():
+        statement = build()
+        statement = getattr(statement, "statement", statement)
+        statement._generate_cache_key()
+
+    def compile_cold():
+        statement = build()
+        statement = getattr(statement, "statement", statement)
+        str(statement.compile(dialect=dialect))
+
+    execute()  # warm the compiled cache and connection
+    return {
+        "build_us": time_us(build_and_key, repeat),
+        "compile_us": time_us(compile_cold, max(1, repeat // 10)),
+        "execute_ms": round(time_us(execute, max(1, repeat // 10)) / 1000, 3),
+    }
+
+
+def benchmark(repeat: int) -> Dict:
+    """Benchmark legacy and cached variants of each hot query."""
+    db = SessionLocal()
+    calculation_id = db.scalar(select(PCFCalculation.id).limit(1)) or "missing"
+    category = "Not A Category"  # exercises the exact-miss fallback path
+
+    queries = {
+        "product_search": {
+            "before": measure(
+                db,
+                lambda: legacy_search_query(db, SEARCH_PARAMS).offset(0).limit(50),
+                lambda: legacy_search_query(db, SEARCH_PARAMS).offset(0).limit(50).all(),
+                repeat,
+            ),
+            "after": measure(
+                db,
+                lambda: _build_search_query(SEARCH_PARAMS),
+                lambda: db.scalars(
+                    _build_search_query(SEARCH_PARAMS) + (lambda s: s.offset(0).limit(50))
+                ).all(),
+                repeat,
+            ),
+        },
+        "calculation_status": {
+            "before": measure(
+                db,
+                lambda: db.query(PCFCalculation).filter_by(id=calculation_id).limit(1),
+                lambda: db.query(PCFCalculation).filter_by(id=calculation_id).first(),
+                repeat,
+            ),
+            "after": measure(
+                db,
+                lambda: calculation_by_id(calculation_id),
+                lambda: db.scalars(calculation_by_id(calculation_id)).first(),
+                repeat,
+            ),
+        },
+        "emission_factor_by_category": {
+            "before": measure(
+                db,
+                lambda: legacy_category_fallback(db, category),
+                lambda: (
+                    legacy_category_exact(db, category).first()
+                    or legacy_category_fallback(db, category).first()
+                ),
+                repeat,
+            ),
+            "after": measure(
+                db,
+                lambda: category_fallback_statement(category),
+                lambda: (
+                    db.scalars(category_exact_statement(category)).first()
+                    or db.scalars(category_fallback_statement(category)).first()
+                ),
+                repeat,
+            ),
+        },
+    }
+    db.close()
+
+    return {"repeat": repeat, "queries": queries}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--repeat", type=int, default=1000, help="Iterations per construction timing")
+    args = parser.parse_args()
+
+    print(json.dumps(benchmark(args.repeat), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+Benchmark Redis rate limiting: per-request round trips and latency.
+
+Compares the original two-call check (increment() pipeline plus EXPIRE,
+then a separate get_reset_time() TTL call) with RedisStorage.hit(), which
+decides in one atomic Lua script, for each algorithm and for the
+pipelined fallback used when scripting is disabled.
+
+Requires a running Redis; keys are written to the given database and
+deleted afterwards.
+
+Usage:
+    python -m backend.scripts.benchmark_rate_limiter
+    python -m backend.scripts.benchmark_rate_limiter --redis-url redis://localhost:6379/15 --requests 20000
+"""
+import argparse
+import json
+import statistics
+import time
+from typing import Any, Callable, Dict, List
+
+import redis
+
+from backend.middleware.rate_limiting import RATE_LIMIT_SCRIPTS, RedisStorage
+
+
+def legacy_check(client: Any, key: str, limit: int, window: int) -> bool:
+    """The pre-Lua check: INCR+TTL pipeline, EXPIRE on new keys, then TTL."""
+    pipe = client.pipeline()
+    pipe.incr(key)
+    pipe.ttl(key)
+    count, ttl = pipe.execute()
+    if ttl == -1:
+        client.expire(key, window)
+    client.ttl(key)
+    return count <= limit
+
+
+def count_round_trips(client: Any) -> Callable[[], int]:
+    """Patch the client's connection pool to count commands sent."""
+    sent = {"count": 0}
+    original = client.connection_pool.get_connection
+
+    def get_connection(*args, **kwargs):
+        sent["count"] += 1
+        return original(*args, **kwargs)
+
+    client.connection_pool.get_connection = get_connection
+    return lambda: sent["count"]
+
+
+def run(check: Callable[[str], Any], keys: List[str], requests: int) -> Dict:
+    """Time `requests` checks spread over `keys`."""
+    timings_us = []
+    started = time.perf_counter()
+    for i in range(requests):
+        t0 = time.perf_counter()
+        check(keys[i % len(keys)])
+        timings_us.append((time.perf_counter() - t0) * 1e6)
+    elapsed = time.perf_counter() - started
+
+    timings_us.sort()
+    return {
+        "requests_per_second": round(requests / elapsed),
+        "p50_us": round(statistics.median(timings_us), 1),
+        "p99_us": round(timings_us[int(len(timings_us) * 0.99) - 1], 1),
+    }
+
+
+def benchmark(redis_url: str, requests: int, clients: int, limit: int) -> Dict:
+    """Benchmark every variant against the same Redis."""
+    client = redis.from_url(redis_url)
+    client.ping()
+    keys = [f"bench:rate_limit:ip:10.0.{i // 256}.{i % 256}" for i in range(clients)]
+    window = 60
+
+    variants: Dict[str, Callable[[str], Any]] = {
+        "legacy_two_calls": lambda key: legacy_check(client, key, limit, window),
+    }
+    for algorithm in RATE_LIMIT_SCRIPTS:
+        storage = RedisStorage(client, algorithm=algorithm)
+        variants[f"lua_{algorithm}"] = (
+            lambda key, storage=storage: storage.hit(key, limit, window)
+        )
+    fallback = RedisStorage(client, algorithm="fixed_window")
+    fallback._scripting = False
+    variants["pipelined_fallback"] = lambda key: fallback.hit(key, limit, window)
+
+    round_trips = count_round_trips(client)
+    results: Dict = {"redis_url": redis_url, "requests": requests, "clients": clients}
+    try:
+        for name, check in variants.items():
+            client.delete(*client.keys("bench:rate_limit:*") or ["bench:rate_limit:none"])
+            before = round_trips()
+            results[name] = run(check, keys, requests)
+            results[name]["round_trips_per_request"] = round(
+                (round_trips() - before) / requests, 2
+            )
+    finally:
+        stale = client.keys("bench:rate_limit:*")
+        if stale:
+            client.delete(*stale)
+        client.close()
+
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--redis-url", default="redis://localhost:6379/15", help="Redis to benchmark against")
+    parser.add_argument("--requests", type=int, default=10_000, help="Checks per variant")
+    parser.add_argument("--clients", type=int, default=100, help="Distinct client keys")
+    parser.add_argument("--limit", type=int, default=100, help="Requests per window")
+    args = parser.parse_args()
+
+    print(json.dumps(
+        benchmark(args.redis_url, args.requests, args.clients, args.limit), indent=2
+    ))
+
+
+if __name__ == "__main__":
+    main()
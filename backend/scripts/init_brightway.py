@@ -7,6 +7,7 @@ It initializes the Brightway2 project and syncs emission factors.
 
 Usage:
     python backend/scripts/init_brightway.py
+    python backend/scripts/init_brightway.py --force  # full rewrite instead of incremental sync
 """
 
 import sys
@@ -43,8 +44,12 @@ def main():
         # Step 2: Sync emission factors from SQLite to Brightway2
         logger.info("Step 2: Syncing emission factors to Brightway2...")
         with db_context() as session:
-            result = sync_emission_factors(db_session=session)
-            logger.info(f"✓ Synced {result['synced_count']} emission factors")
+            result = sync_emission_factors(db_session=session, force="--force" in sys.argv)
+            logger.info(
+                f"✓ Synced {result['synced_count']} emission factors ({result['mode']}: "
+                f"{result['created']} created, {result['updated']} updated, "
+                f"{result['deleted']} deleted)"
+            )
 
         logger.info("=" * 60)
         logger.info("BRIGHTWAY2 INITIALIZATION COMPLETE")
@@ -355,6 +355,7 @@ async def generate_production_catalog() -> dict:
     """
     from backend.services.data_ingestion.product_generator import ProductGenerator
     from backend.services.data_ingestion.emission_factor_mapper import EmissionFactorMapper
+    from backend.services.data_ingestion.factor_resolution_cache import get_resolution_cache
 
     async_url = settings.async_database_url
 
@@ -376,7 +377,10 @@ async def generate_production_catalog() -> dict:
     async with async_session_maker() as session:
         generator = ProductGenerator(session)
         # Set mapper to enable emission factor assignment during BOM creation
-        generator.mapper = EmissionFactorMapper(db=session)
+        generator.mapper = EmissionFactorMapper(
+            db=session,
+            resolution_cache=get_resolution_cache(),
+        )
         catalog = await generator.generate_full_catalog(distribution)
         stats = generator.get_stats()
 
@@ -0,0 +1,194 @@
+"""
+Load test the product, emission factor and calculation endpoints with many
+concurrent clients, comparing the sync (threadpool) handlers with the
+AsyncSession handlers enabled by ASYNC_ROUTES.
+
+Each simulated client loops over the hot endpoints (product list, product
+detail, emission factor list, calculation status) and starts a calculation
+every --calculate-every requests. Results are reported as JSON: throughput,
+latency percentiles and error counts per mode.
+
+Without --base-url, two uvicorn servers are started against the configured
+DATABASE_URL, one with ASYNC_ROUTES=false and one with ASYNC_ROUTES=true,
+with rate limits raised so the limiter does not reject the load. The
+database must already hold seed data.
+
+Usage:
+    python -m backend.scripts.load_test_async_routes --clients 1000 --duration 30
+    python -m backend.scripts.load_test_async_routes --base-url http://localhost:8000 --clients 200
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List, Optional
+
+import httpx
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """Value at `fraction` of an already sorted list (0 when empty)."""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(len(sorted_values) * fraction))
+    return sorted_values[index]
+
+
+async def discover_ids(http: httpx.AsyncClient) -> Dict[str, str]:
+    """Pick a product with a BOM and start one calculation to poll."""
+    response = await http.get("/api/v1/products", params={"limit": 50, "is_finished_product": True})
+    response.raise_for_status()
+    items = response.json()["items"]
+    if not items:
+        raise SystemExit("No finished products found; seed the database first")
+    product_id = items[0]["id"]
+
+    response = await http.post("/api/v1/calculate", json={"product_id": product_id})
+    response.raise_for_status()
+    return {"product_id": product_id, "calculation_id": response.json()["calculation_id"]}
+
+
+async def simulate_client(
+    http: httpx.AsyncClient,
+    ids: Dict[str, str],
+    deadline: float,
+    calculate_every: int,
+    latencies_ms: List[float],
+    errors: Dict[str, int],
+) -> None:
+    """Issue requests in a loop until the deadline."""
+    endpoints = [
+        ("GET", "/api/v1/products", {"params": {"limit": 20}}),
+        ("GET", f"/api/v1/products/{ids['product_id']}", {}),
+        ("GET", "/api/v1/emission-factors", {"params": {"limit": 20}}),
+        ("GET", f"/api/v1/calculations/{ids['calculation_id']}", {}),
+    ]
+    sent = 0
+    while time.perf_counter() < deadline:
+        sent += 1
+        if calculate_every and sent % calculate_every == 0:
+            method, path, kwargs = "POST", "/api/v1/calculate", {"json": {"product_id": ids["product_id"]}}
+        else:
+            method, path, kwargs = endpoints[sent % len(endpoints)]
+
+        started = time.perf_counter()
+        try:
+            response = await http.request(method, path, **kwargs)
+            if response.status_code >= 400:
+                errors[str(response.status_code)] = errors.get(str(response.status_code), 0) + 1
+        except httpx.HTTPError as e:
+            errors[type(e).__name__] = errors.get(type(e).__name__, 0) + 1
+        latencies_ms.append((time.perf_counter() - started) * 1000)
+
+
+async def load_test(base_url: str, clients: int, duration: float, calculate_every: int) -> Dict:
+    """Run `clients` concurrent clients against `base_url` for `duration` seconds."""
+    limits = httpx.Limits(max_connections=clients, max_keepalive_connections=clients)
+    timeout = httpx.Timeout(60.0)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=timeout) as http:
+        ids = await discover_ids(http)
+
+        latencies_ms: List[float] = []
+        errors: Dict[str, int] = {}
+        started = time.perf_counter()
+        deadline = started + duration
+        await asyncio.gather(*(
+            simulate_client(http, ids, deadline, calculate_every, latencies_ms, errors)
+            for _ in range(clients)
+        ))
+        elapsed = time.perf_counter() - started
+
+    latencies_ms.sort()
+    return {
+        "requests": len(latencies_ms),
+        "requests_per_second": round(len(latencies_ms) / elapsed, 1),
+        "mean_ms": round(statistics.fmean(latencies_ms), 1) if latencies_ms else 0.0,
+        "p50_ms": round(percentile(latencies_ms, 0.50), 1),
+        "p95_ms": round(percentile(latencies_ms, 0.95), 1),
+        "p99_ms": round(percentile(latencies_ms, 0.99), 1),
+        "errors": errors,
+    }
+
+
+def start_server(port: int, async_routes: bool, workers: int) -> subprocess.Popen:
+    """Start uvicorn serving backend.main:app with ASYNC_ROUTES set."""
+    env = dict(os.environ)
+    env.update({
+        "ASYNC_ROUTES": "true" if async_routes else "false",
+        "RATE_LIMIT_GENERAL": "100000000",
+        "RATE_LIMIT_CALCULATION": "100000000",
+        "RATE_LIMIT_STORAGE": "memory",
+    })
+    return subprocess.Popen(
+        [
+            sys.executable, "-m", "uvicorn", "backend.main:app",
+            "--port", str(port), "--workers", str(workers),
+            "--log-level", "warning", "--no-access-log",
+        ],
+        env=env,
+    )
+
+
+async def wait_until_ready(base_url: str, timeout: float = 60.0) -> None:
+    """Poll /health until the server answers."""
+    deadline = time.perf_counter() + timeout
+    async with httpx.AsyncClient(base_url=base_url) as http:
+        while time.perf_counter() < deadline:
+            try:
+                if (await http.get("/health")).status_code < 500:
+                    return
+            except httpx.HTTPError:
+                pass
+            await asyncio.sleep(0.5)
+    raise SystemExit(f"Server at {base_url} did not become ready")
+
+
+async def compare(port: int, clients: int, duration: float, calculate_every: int, workers: int) -> Dict:
+    """Load test a sync-routes server, then an async-routes server."""
+    results: Dict = {"clients": clients, "duration_s": duration, "workers": workers}
+    for mode, async_routes in (("sync", False), ("async", True)):
+        server = start_server(port, async_routes, workers)
+        base_url = f"http://127.0.0.1:{port}"
+        try:
+            await wait_until_ready(base_url)
+            results[mode] = await load_test(base_url, clients, duration, calculate_every)
+        finally:
+            server.terminate()
+            server.wait(timeout=30)
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--base-url", help="Load test a running server instead of comparing modes")
+    parser.add_argument("--clients", type=int, default=1000, help="Concurrent clients")
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds per run")
+    parser.add_argument("--calculate-every", type=int, default=20,
+                        help="Start a calculation every N requests per client (0 disables)")
+    parser.add_argument("--port", type=int, default=8765, help="Port for the servers started without --base-url")
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn workers per server")
+    args = parser.parse_args(argv)
+
+    if args.base_url:
+        results = {
+            "base_url": args.base_url,
+            "clients": args.clients,
+            "duration_s": args.duration,
+            "result": asyncio.run(
+                load_test(args.base_url, args.clients, args.duration, args.calculate_every)
+            ),
+        }
+    else:
+        results = asyncio.run(
+            compare(args.port, args.clients, args.duration, args.calculate_every, args.workers)
+        )
+
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
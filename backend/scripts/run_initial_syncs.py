@@ -33,6 +33,9 @@ Usage:
 
     # Limit records (for testing)
     python backend/scripts/run_initial_syncs.py --max-records 10
+
+    # Fetch/parse all sources concurrently as one composite sync
+    python backend/scripts/run_initial_syncs.py --concurrent
 """
 
 import argparse
@@ -241,6 +244,85 @@ class SyncRunner:
                 "message": str(e),
             }
 
+    def ensure_data_sources(self):
+        """Seed data sources if they are missing."""
+        self.log("Verifying data sources are seeded...")
+        from sqlalchemy.orm import Session as SyncSession
+        from sqlalchemy import create_engine as create_sync_engine
+
+        sync_engine = create_sync_engine(settings.database_url, echo=False)
+        with SyncSession(sync_engine) as sync_session:
+            if not verify_data_sources(sync_session):
+                self.log("Seeding data sources...")
+                count = seed_data_sources(sync_session)
+                self.log(f"Created {count} data sources")
+            else:
+                self.log("Data sources already exist")
+
+        self.log("")
+
+    async def run_concurrent_syncs(self, sources: list = None):
+        """
+        Run all sources as one composite sync via SyncOrchestrator.
+
+        Fetching and parsing run concurrently; writes are serialized
+        through a single bulk writer.
+
+        Args:
+            sources: List of source keys to sync (default: all)
+        """
+        from backend.services.data_ingestion.sync_orchestrator import SyncOrchestrator
+
+        if sources is None:
+            sources = list(DATA_SOURCE_NAMES.keys())
+
+        self.log("=" * 60)
+        self.log("PCF Calculator - Concurrent External Data Sync")
+        self.log("=" * 60)
+
+        self.ensure_data_sources()
+
+        engine = create_async_engine(settings.async_database_url, echo=False)
+        async_session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+        orchestrator = SyncOrchestrator(
+            session_factory=async_session,
+            source_names=[DATA_SOURCE_NAMES[key] for key in sources],
+            sync_type="initial",
+            max_records=self.max_records,
+            local_files={} if self.force_download else LOCAL_FILES,
+        )
+        composite = await orchestrator.run()
+        await engine.dispose()
+
+        for source in composite.sources:
+            source_key = source.job_key.split("_")[0]
+            merged = self.results.setdefault(source_key, {
+                "source": source.source_name,
+                "status": "completed",
+                "records_created": 0,
+                "records_updated": 0,
+                "records_failed": 0,
+            })
+            if source.status != "completed":
+                merged["status"] = "error"
+                merged["message"] = source.error_message
+            merged["records_created"] += source.records_created
+            merged["records_updated"] += source.records_updated
+            merged["records_failed"] += source.records_failed
+
+            self.log(
+                f"{source.job_key}: fetch {source.fetch_seconds:.2f}s, "
+                f"parse {source.parse_seconds:.2f}s, write {source.write_seconds:.2f}s "
+                f"[{source.status}]"
+            )
+
+        self.log(f"Composite sync {composite.composite_sync_id}: "
+                 f"{composite.status} in {composite.duration_seconds:.2f}s")
+        self.log("")
+
+        self.print_summary()
+
     async def run_all_syncs(self, sources: list = None):
         """
         Run syncs for specified sources or all sources.
@@ -271,20 +353,7 @@ class SyncRunner:
 
         async with async_session() as session:
             # First, ensure data sources exist
-            self.log("Verifying data sources are seeded...")
-            from sqlalchemy.orm import Session as SyncSession
-            from sqlalchemy import create_engine as create_sync_engine
-
-            sync_engine = create_sync_engine(settings.database_url, echo=False)
-            with SyncSession(sync_engine) as sync_session:
-                if not verify_data_sources(sync_session):
-                    self.log("Seeding data sources...")
-                    count = seed_data_sources(sync_session)
-                    self.log(f"Created {count} data sources")
-                else:
-                    self.log("Data sources already exist")
-
-            self.log("")
+            self.ensure_data_sources()
 
             # Run syncs for each source
             for source_key in sources:
@@ -392,6 +461,11 @@ def parse_args():
         default=None,
         help="Limit number of records per source (for testing)"
     )
+    parser.add_argument(
+        "--concurrent",
+        action="store_true",
+        help="Fetch and parse all sources concurrently as one composite sync"
+    )
     parser.add_argument(
         "--quiet",
         action="store_true",
@@ -415,7 +489,10 @@ async def main():
         force_download=args.download,
     )
 
-    await runner.run_all_syncs(sources)
+    if args.concurrent and not args.dry_run:
+        await runner.run_concurrent_syncs(sources)
+    else:
+        await runner.run_all_syncs(sources)
 
 
 if __name__ == "__main__":
@@ -28,6 +28,16 @@ Usage:
     # Verbose output
     python -m backend.scripts.seed_production_catalog --verbose
 
+    # Large load-test catalog with bulk inserts (100k products)
+    python -m backend.scripts.seed_production_catalog --bulk \
+        --electronics=20000 --apparel=20000 --automotive=20000 \
+        --construction=20000 --food-beverage=20000
+
+    # Reproducible 1M-product catalog synthesized on 8 processes
+    python -m backend.scripts.seed_production_catalog --bulk --seed 42 --workers 8 \
+        --electronics=200000 --apparel=200000 --automotive=200000 \
+        --construction=200000 --food-beverage=200000
+
 Requirements:
     - Database must have emission factors loaded (run seed_data.py first)
     - Async database support (aiosqlite for SQLite, asyncpg for PostgreSQL)
@@ -38,7 +48,7 @@ import argparse
 import logging
 import sys
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 # Add project root to Python path
 project_root = Path(__file__).parent.parent.parent
@@ -146,6 +156,10 @@ async def seed_production_catalog(
     distribution: Dict[str, int],
     dry_run: bool = False,
     verbose: bool = False,
+    bulk: bool = False,
+    chunk_size: Optional[int] = None,
+    seed: Optional[int] = None,
+    workers: int = 1,
 ) -> Dict[str, Any]:
     """
     Generate production product catalog.
@@ -154,6 +168,10 @@ async def seed_production_catalog(
         distribution: Dict mapping industry to product count
         dry_run: If True, simulate only without database changes
         verbose: If True, enable verbose logging
+        bulk: If True, use ProductGenerator.generate_catalog_bulk
+        chunk_size: Rows per INSERT in bulk mode
+        seed: Seed for a reproducible catalog in bulk mode
+        workers: Synthesis processes in bulk mode
 
     Returns:
         Summary dict with generation results
@@ -219,7 +237,12 @@ async def seed_production_catalog(
 
             # Generate catalog
             logger.info("Starting product generation...")
-            catalog = await generator.generate_full_catalog(distribution)
+            if bulk:
+                await generator.generate_catalog_bulk(
+                    distribution, chunk_size, seed=seed, workers=workers
+                )
+            else:
+                await generator.generate_full_catalog(distribution)
 
             # Get final statistics
             stats = generator.get_stats()
@@ -334,6 +357,33 @@ Examples:
         help=f"Food & Beverage product count (default: {DEFAULT_DISTRIBUTION['food_beverage']})",
     )
 
+    parser.add_argument(
+        "--bulk",
+        action="store_true",
+        help="Write products and BOMs with chunked multi-row INSERTs (large catalogs)",
+    )
+
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=ProductGenerator.BULK_CHUNK_SIZE,
+        help=f"Rows per INSERT in bulk mode (default: {ProductGenerator.BULK_CHUNK_SIZE})",
+    )
+
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=None,
+        help="Seed for a reproducible catalog in bulk mode (default: random)",
+    )
+
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Processes used to synthesize products in bulk mode (default: 1)",
+    )
+
     return parser.parse_args()
 
 
@@ -355,6 +405,10 @@ def main() -> int:
                 distribution=distribution,
                 dry_run=args.dry_run,
                 verbose=args.verbose,
+                bulk=args.bulk,
+                chunk_size=args.chunk_size,
+                seed=args.seed,
+                workers=args.workers,
             )
         )
 
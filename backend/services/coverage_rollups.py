@@ -0,0 +1,272 @@
+"""
+Coverage Rollup Service
+
+Precomputes the aggregates behind GET /admin/emission-factors/coverage.
+
+The coverage report used to issue a long series of count/distinct/avg
+queries and per-category loops on every request. Instead, five grouped
+queries build a small set of rollup cells (see CoverageRollup) that are
+persisted with a shared refreshed_at timestamp. The endpoint reads the
+newest set and derives every breakdown in memory.
+
+Rollups are refreshed after each data sync (Celery task
+refresh_coverage_rollups) and on demand when the table is empty. Admin
+emission factor writes drop them (invalidate_coverage_rollups), so the next
+report is rebuilt; other writes show up as stale through
+latest_data_change_at.
+
+Usage:
+    from backend.services.coverage_rollups import (
+        load_coverage_rollups,
+        refresh_coverage_rollups,
+    )
+
+    refreshed_at = refresh_coverage_rollups(db)
+    rollups = load_coverage_rollups(db)
+"""
+
+import logging
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import delete, distinct, func, insert, select
+from sqlalchemy.orm import Session
+
+from backend.models import (
+    CoverageRollup,
+    DataSyncLog,
+    EmissionFactor,
+    Product,
+    generate_uuid,
+)
+
+
+logger = logging.getLogger(__name__)
+
+
+# Rollup dimensions (CoverageRollup.dimension)
+FACTORS = "factors"
+ACTIVITIES = "activities"
+ACTIVITIES_TOTAL = "activities_total"
+PRODUCT_CATEGORIES = "product_categories"
+PRODUCT_GEOGRAPHIES = "product_geographies"
+
+
+def _row(dimension: str, refreshed_at: datetime, **values: Any) -> Dict[str, Any]:
+    """Build a rollup row dict with unused keys set to NULL."""
+    row = {
+        "id": generate_uuid(),
+        "dimension": dimension,
+        "data_source_id": None,
+        "geography": None,
+        "category": None,
+        "reference_year": None,
+        "is_active": None,
+        "item_count": 0,
+        "quality_sum": None,
+        "quality_count": 0,
+        "refreshed_at": refreshed_at,
+    }
+    row.update(values)
+    return row
+
+
+def compute_coverage_rollups(db: Session, refreshed_at: datetime) -> List[Dict[str, Any]]:
+    """
+    Compute rollup rows with five grouped queries.
+
+    Args:
+        db: Database session
+        refreshed_at: Timestamp to stamp on every row
+
+    Returns:
+        List of CoverageRollup row dicts
+    """
+    rows: List[Dict[str, Any]] = []
+    active = EmissionFactor.is_active == True  # noqa: E712
+
+    factor_cells = (
+        db.query(
+            EmissionFactor.data_source_id,
+            EmissionFactor.geography,
+            EmissionFactor.category,
+            EmissionFactor.reference_year,
+            EmissionFactor.is_active,
+            func.count(EmissionFactor.id),
+            func.sum(EmissionFactor.data_quality_rating),
+            func.count(EmissionFactor.data_quality_rating),
+        )
+        .group_by(
+            EmissionFactor.data_source_id,
+            EmissionFactor.geography,
+            EmissionFactor.category,
+            EmissionFactor.reference_year,
+            EmissionFactor.is_active,
+        )
+        .all()
+    )
+    for source_id, geography, category, year, is_active, count, q_sum, q_count in factor_cells:
+        rows.append(_row(
+            FACTORS, refreshed_at,
+            data_source_id=source_id,
+            geography=geography,
+            category=category,
+            reference_year=year,
+            is_active=is_active,
+            item_count=count,
+            quality_sum=q_sum,
+            quality_count=q_count,
+        ))
+
+    # Distinct counts are not additive, so store them per source and overall
+    # for both the all-factors (is_active NULL) and active-only filters
+    activity_count = func.count(distinct(EmissionFactor.activity_name))
+    per_source = (
+        db.query(
+            EmissionFactor.data_source_id,
+            activity_count,
+            activity_count.filter(active),
+        )
+        .group_by(EmissionFactor.data_source_id)
+        .all()
+    )
+    overall = db.query(activity_count, activity_count.filter(active)).one()
+    for source_id, all_count, active_count in per_source:
+        rows.append(_row(ACTIVITIES, refreshed_at, data_source_id=source_id, item_count=all_count))
+        rows.append(_row(
+            ACTIVITIES, refreshed_at,
+            data_source_id=source_id, is_active=True, item_count=active_count,
+        ))
+    rows.append(_row(ACTIVITIES_TOTAL, refreshed_at, item_count=overall[0]))
+    rows.append(_row(ACTIVITIES_TOTAL, refreshed_at, is_active=True, item_count=overall[1]))
+
+    for category_id, count in (
+        db.query(Product.category_id, func.count(Product.id))
+        .group_by(Product.category_id)
+        .all()
+    ):
+        rows.append(_row(PRODUCT_CATEGORIES, refreshed_at, category=category_id, item_count=count))
+
+    for country, count in (
+        db.query(Product.country_of_origin, func.count(Product.id))
+        .filter(Product.country_of_origin.isnot(None))
+        .group_by(Product.country_of_origin)
+        .all()
+    ):
+        rows.append(_row(PRODUCT_GEOGRAPHIES, refreshed_at, geography=country, item_count=count))
+
+    return rows
+
+
+def refresh_coverage_rollups(db: Session) -> datetime:
+    """
+    Recompute and persist coverage rollups.
+
+    The new set is inserted before older sets are deleted, in one
+    transaction, so readers always see a complete set. Readers only use
+    the newest refreshed_at, which keeps overlapping refreshes consistent.
+
+    Args:
+        db: Database session (committed on success)
+
+    Returns:
+        The refreshed_at timestamp of the new rollups
+    """
+    refreshed_at = datetime.now(timezone.utc)
+    rows = compute_coverage_rollups(db, refreshed_at)
+
+    try:
+        if rows:
+            db.execute(insert(CoverageRollup.__table__), rows)
+        db.execute(
+            delete(CoverageRollup).where(CoverageRollup.refreshed_at < refreshed_at)
+        )
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+
+    logger.info(f"Refreshed {len(rows)} coverage rollups at {refreshed_at.isoformat()}")
+    return refreshed_at
+
+
+def load_coverage_rollups(db: Session) -> List[CoverageRollup]:
+    """
+    Load the newest set of coverage rollups.
+
+    Args:
+        db: Database session
+
+    Returns:
+        Rollup rows sharing the latest refreshed_at (empty if never refreshed)
+    """
+    latest = select(func.max(CoverageRollup.refreshed_at)).scalar_subquery()
+    return (
+        db.query(CoverageRollup)
+        .filter(CoverageRollup.refreshed_at == latest)
+        .all()
+    )
+
+
+def invalidate_coverage_rollups(db: Session) -> None:
+    """
+    Delete all coverage rollups so the next report recomputes them.
+
+    Used after admin emission factor writes, whose deletes leave no
+    updated_at behind for latest_data_change_at to see. Failing to delete
+    must not fail the write itself.
+
+    Args:
+        db: Database session (committed on success)
+    """
+    try:
+        db.execute(delete(CoverageRollup))
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        logger.warning(f"Could not invalidate coverage rollups: {e}")
+
+
+def _as_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """Treat naive database timestamps as UTC."""
+    if value is not None and value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+def latest_data_change_at(db: Session) -> Optional[datetime]:
+    """
+    Time of the latest change the rollups may not reflect.
+
+    The later of the most recent successful data sync and the newest
+    emission factor updated_at, so factors written outside a sync are
+    noticed too.
+
+    Args:
+        db: Database session
+
+    Returns:
+        Timezone-aware timestamp, or None if there is neither
+    """
+    last_sync = (
+        db.query(func.max(DataSyncLog.completed_at))
+        .filter(DataSyncLog.status == "completed")
+        .scalar()
+    )
+    last_update = db.query(func.max(EmissionFactor.updated_at)).scalar()
+    changes = [_as_utc(value) for value in (last_sync, last_update) if value is not None]
+    return max(changes) if changes else None
+
+
+__all__ = [
+    "ACTIVITIES",
+    "ACTIVITIES_TOTAL",
+    "FACTORS",
+    "PRODUCT_CATEGORIES",
+    "PRODUCT_GEOGRAPHIES",
+    "compute_coverage_rollups",
+    "invalidate_coverage_rollups",
+    "latest_data_change_at",
+    "load_coverage_rollups",
+    "refresh_coverage_rollups",
+]
@@ -16,6 +16,7 @@ This package provides the foundation for data ingestion from external sources:
 - Custom exceptions for error handling
 - Pydantic schemas for validation
 - Connector Registry: Maps data source names to connector classes
+- SyncOrchestrator: Concurrent composite sync of all registered connectors
 
 Product Catalog Expansion (TASK-DATA-P5-005):
 - CategoryLoader: Load hierarchical product categories
@@ -24,6 +25,8 @@ Product Catalog Expansion (TASK-DATA-P5-005):
 
 Emission Factor Mapping (TASK-DATA-P8-004):
 - EmissionFactorMapper: Maps BOM component names to emission factors
+- EmissionFactorIndex: In-memory index for batch component resolution
+- FactorResolutionCache: Shared, versioned cache of resolution decisions
 - Proxy Factor Loader: Loads calculated proxy factors (EPA + DEFRA only)
 
 Usage:
@@ -42,6 +45,8 @@ Usage:
         CONNECTOR_REGISTRY,
         is_connector_available,
         list_registered_connectors,
+        # Composite sync
+        SyncOrchestrator,
         # Product Catalog Expansion
         CategoryLoader,
         ProductGenerator,
@@ -72,6 +77,10 @@ Usage:
     connector = ConnectorClass(db=session, data_source_id=source_id)
     result = await connector.execute_sync()
 
+    # Concurrent sync of every registered connector
+    orchestrator = SyncOrchestrator(session_factory=async_session_maker)
+    composite = await orchestrator.run()
+
     # Product Catalog Expansion
     loader = CategoryLoader()
     tree = loader.generate_category_tree()
@@ -88,6 +97,7 @@ Usage:
     mapper = EmissionFactorMapper(db=async_session)
     factor = await mapper.get_factor_for_component("aluminum", "kg", "US")
     warnings = mapper.get_warnings()
+    factors = await mapper.get_factors_for_components([("steel", "kg", None)])
 
     # Load proxy factors
     count = await load_proxy_factors_async(async_session)
@@ -107,45 +117,61 @@ Usage:
             ...
 """
 
-from backend.services.data_ingestion.base import BaseDataIngestion
-from backend.services.data_ingestion.epa_ingestion import (
-    EPAEmissionFactorsIngestion
-)
-from backend.services.data_ingestion.defra_ingestion import (
-    DEFRAEmissionFactorsIngestion
-)
-from backend.services.data_ingestion.http_client import DataIngestionHTTPClient
-from backend.services.data_ingestion.exceptions import (
-    DataIngestionError,
-    FetchError,
-    ParseError,
-    TransformError,
-    ValidationError,
-)
-
-# TASK-BE-P7-002: Connector Registry
-from backend.services.data_ingestion.registry import (
-    CONNECTOR_REGISTRY,
-    get_connector_class,
-    is_connector_available,
-    list_registered_connectors,
-)
-
-# TASK-DATA-P5-005: Product Catalog Expansion
-from backend.services.data_ingestion.category_loader import CategoryLoader
-from backend.services.data_ingestion.product_generator import ProductGenerator
-from backend.services.data_ingestion.fts_indexer import FullTextSearchIndexer
-
-# TASK-DATA-P8-004: Emission Factor Mapping Infrastructure
-from backend.services.data_ingestion.emission_factor_mapper import (
-    EmissionFactorMapper,
-)
-from backend.services.data_ingestion.proxy_factor_loader import (
-    load_proxy_factors,
-    load_proxy_factors_async,
-    validate_source_factors,
-    get_proxy_factor_count,
-)
+import importlib
+from typing import Any
+
+# Exports are imported on first access (PEP 562) so that importing one
+# submodule, as the API routes do, does not load every connector, openpyxl
+# and the numpy-based catalog generator at startup.
+_EXPORTS = {
+    # Base class
+    "BaseDataIngestion": "base",
+    # Connectors
+    "EPAEmissionFactorsIngestion": "epa_ingestion",
+    "DEFRAEmissionFactorsIngestion": "defra_ingestion",
+    # HTTP client
+    "DataIngestionHTTPClient": "http_client",
+    # Exceptions
+    "DataIngestionError": "exceptions",
+    "FetchError": "exceptions",
+    "ParseError": "exceptions",
+    "TransformError": "exceptions",
+    "ValidationError": "exceptions",
+    # TASK-BE-P7-002: Connector Registry
+    "CONNECTOR_REGISTRY": "registry",
+    "get_connector_class": "registry",
+    "is_connector_available": "registry",
+    "list_registered_connectors": "registry",
+    # Concurrent multi-source sync orchestrator
+    "BulkEmissionFactorWriter": "sync_orchestrator",
+    "SyncOrchestrator": "sync_orchestrator",
+    # TASK-DATA-P5-005: Product Catalog Expansion
+    "CategoryLoader": "category_loader",
+    "ProductGenerator": "product_generator",
+    "FullTextSearchIndexer": "fts_indexer",
+    # TASK-DATA-P8-004: Emission Factor Mapping Infrastructure
+    "EmissionFactorMapper": "emission_factor_mapper",
+    "EmissionFactorIndex": "emission_factor_index",
+    "FactorResolutionCache": "factor_resolution_cache",
+    "get_resolution_cache": "factor_resolution_cache",
+    "load_proxy_factors": "proxy_factor_loader",
+    "load_proxy_factors_async": "proxy_factor_loader",
+    "validate_source_factors": "proxy_factor_loader",
+    "get_proxy_factor_count": "proxy_factor_loader",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(list(globals()) + list(_EXPORTS))
 
 
 __all__ = [
@@ -167,12 +193,18 @@ __all__ = [
     "get_connector_class",
     "is_connector_available",
     "list_registered_connectors",
+    # Composite sync
+    "BulkEmissionFactorWriter",
+    "SyncOrchestrator",
     # Product Catalog Expansion (TASK-DATA-P5-005)
     "CategoryLoader",
     "ProductGenerator",
     "FullTextSearchIndexer",
     # Emission Factor Mapping (TASK-DATA-P8-004)
     "EmissionFactorMapper",
+    "EmissionFactorIndex",
+    "FactorResolutionCache",
+    "get_resolution_cache",
     "load_proxy_factors",
     "load_proxy_factors_async",
     "validate_source_factors",
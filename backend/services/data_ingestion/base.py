@@ -11,7 +11,9 @@ Features:
 - Record validation with error collection
 - Upsert pattern supporting both SQLite and PostgreSQL
 - Sync log lifecycle management
+- SSRF-validated downloads (download_file) sharing the process-wide DNS cache
 - Transaction handling with rollback on error
+- Committed record counts exported as pcf_ingestion_records_total
 
 Usage:
     from backend.services.data_ingestion.base import BaseDataIngestion
@@ -42,8 +44,57 @@ from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 
 from backend.models import DataSource, DataSyncLog, EmissionFactor
+from backend.services.data_ingestion.security import (
+    SafeHTTPClient,
+    URLValidator,
+    get_allowed_domains,
+)
 from backend.schemas.data_ingestion import SyncResult
 from backend.schemas.data_ingestion import ValidationError as ValidationErrorSchema
+from backend.utils.metrics import INGESTION_RECORDS
+
+# Largest source file download accepted (the EPA and DEFRA workbooks are
+# tens of MB at most)
+MAX_DOWNLOAD_BYTES = 200 * 1024 * 1024
+
+
+def build_emission_factor_values(
+    factor_data: Dict[str, Any],
+    data_source_id: Optional[str],
+    sync_batch_id: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Map a transformed record to EmissionFactor column values.
+
+    Shared by the per-record upsert in BaseDataIngestion and the
+    bulk writer used by the sync orchestrator.
+
+    Args:
+        factor_data: Validated, transformed emission factor record
+        data_source_id: UUID of the data source being synced
+        sync_batch_id: ID of the DataSyncLog for this sync (if any)
+
+    Returns:
+        Dictionary of EmissionFactor column values
+    """
+    return {
+        "activity_name": factor_data.get("activity_name"),
+        "co2e_factor": factor_data.get("co2e_factor"),
+        "unit": factor_data.get("unit"),
+        "external_id": factor_data.get("external_id"),
+        "category": factor_data.get("category"),
+        "geography": factor_data.get("geography", "GLO"),
+        "data_source": factor_data.get("data_source", ""),
+        "reference_year": factor_data.get("reference_year"),
+        "data_quality_rating": factor_data.get("data_quality_rating"),
+        "data_source_id": data_source_id,
+        "sync_batch_id": sync_batch_id,
+        # Unit normalization audit fields
+        "original_unit": factor_data.get("original_unit"),
+        "original_co2e_factor": factor_data.get("original_co2e_factor"),
+        "conversion_factor": factor_data.get("conversion_factor", 1.0),
+        "normalized_at": factor_data.get("normalized_at"),
+    }
 
 
 class BaseDataIngestion(ABC):
@@ -98,8 +149,10 @@ class BaseDataIngestion(ABC):
         self._known_external_ids: set = set()
 
         # Detect if we're running with mock session (unit tests)
-        # by checking if execute method is an AsyncMock
-        execute_type = type(db.execute).__name__
+        # by checking if execute method is an AsyncMock.
+        # db may be None when a connector is only used to parse/transform
+        # (e.g. in a SyncOrchestrator worker process).
+        execute_type = type(getattr(db, "execute", None)).__name__
         self._is_mock_session = 'AsyncMock' in execute_type or 'Mock' in execute_type
 
     @abstractmethod
@@ -116,6 +169,35 @@ class BaseDataIngestion(ABC):
         """
         pass
 
+    async def download_file(self, url: str, timeout: float = 60.0) -> bytes:
+        """
+        Download a source file through the SSRF-validated client.
+
+        The URL and every redirect target must be on the allowlist and
+        resolve to a public IP; DNS outcomes come from the process-wide
+        cache, so repeated syncs skip resolver latency.
+
+        Args:
+            url: File URL
+            timeout: Request timeout in seconds
+
+        Returns:
+            Response body
+
+        Raises:
+            SSRFBlockedError: If the URL or a redirect target is blocked
+            httpx.HTTPStatusError: On HTTP error responses
+        """
+        client = SafeHTTPClient(
+            validator=URLValidator(allowed_domains=get_allowed_domains()),
+            timeout=timeout,
+            max_size=MAX_DOWNLOAD_BYTES,
+            follow_redirects=True,
+        )
+        response = await client.get(url)
+        response.raise_for_status()
+        return response.content
+
     @abstractmethod
     async def parse_data(self, raw_data: bytes) -> List[Dict[str, Any]]:
         """
@@ -219,24 +301,11 @@ class BaseDataIngestion(ABC):
             "created" for new record, "updated" for existing, None if skipped
         """
         # Prepare the data for insertion
-        insert_data = {
-            "activity_name": factor_data.get("activity_name"),
-            "co2e_factor": factor_data.get("co2e_factor"),
-            "unit": factor_data.get("unit"),
-            "external_id": factor_data.get("external_id"),
-            "category": factor_data.get("category"),
-            "geography": factor_data.get("geography", "GLO"),
-            "data_source": factor_data.get("data_source", ""),
-            "reference_year": factor_data.get("reference_year"),
-            "data_quality_rating": factor_data.get("data_quality_rating"),
-            "data_source_id": self.data_source_id,
-            "sync_batch_id": self.sync_log.id if self.sync_log else None,
-            # Unit normalization audit fields
-            "original_unit": factor_data.get("original_unit"),
-            "original_co2e_factor": factor_data.get("original_co2e_factor"),
-            "conversion_factor": factor_data.get("conversion_factor", 1.0),
-            "normalized_at": factor_data.get("normalized_at"),
-        }
+        insert_data = build_emission_factor_values(
+            factor_data,
+            data_source_id=self.data_source_id,
+            sync_batch_id=self.sync_log.id if self.sync_log else None,
+        )
 
         external_id = factor_data.get("external_id")
 
@@ -349,6 +418,14 @@ class BaseDataIngestion(ABC):
 
             await self.db.flush()
 
+    def _record_ingestion_metrics(self) -> None:
+        """Add this sync's committed record counts to /metrics."""
+        connector = type(self).__name__
+        for outcome in ("created", "updated", "skipped", "failed"):
+            count = self.stats[f"records_{outcome}"]
+            if count:
+                INGESTION_RECORDS.inc(count, connector=connector, outcome=outcome)
+
     async def execute_sync(
         self, max_records: Optional[int] = None
     ) -> SyncResult:
@@ -414,6 +491,7 @@ class BaseDataIngestion(ABC):
 
             # Commit transaction
             await self.db.commit()
+            self._record_ingestion_metrics()
 
             # Update sync log with success
             await self._update_sync_log("completed")
@@ -453,4 +531,5 @@ class BaseDataIngestion(ABC):
 
 __all__ = [
     "BaseDataIngestion",
+    "build_emission_factor_values",
 ]
@@ -49,7 +49,7 @@ Data Sources:
     - Food & Beverage: Academic LCAs, USDA database, packaging standards
 """
 
-from .base import BOMTemplate, ComponentSpec
+from .base import BOMTemplate, ComponentSpec, QuantitySample
 from .electronics_boms import ELECTRONICS_TEMPLATES
 from .apparel_boms import APPAREL_TEMPLATES
 from .automotive_boms import AUTOMOTIVE_TEMPLATES
@@ -95,6 +95,7 @@ __all__ = [
     # Base classes
     "BOMTemplate",
     "ComponentSpec",
+    "QuantitySample",
 
     # Industry template collections
     "ELECTRONICS_TEMPLATES",
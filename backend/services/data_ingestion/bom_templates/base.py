@@ -9,6 +9,7 @@ Bill of Materials (BOM) templates for product carbon footprint calculations.
 Classes:
     ComponentSpec: Specification for a single BOM component with quantity ranges
     BOMTemplate: Template for generating complete product BOMs with variants
+    QuantitySample: Quantities sampled for many products at once (NumPy)
 
 Usage:
     from backend.services.data_ingestion.bom_templates.base import (
@@ -32,13 +33,26 @@ Usage:
 
     # Generate BOM
     bom_components = template.get_components(variant="gaming")
+
+    # Sample quantities for many products at once
+    import numpy as np
+
+    sample = template.sample_quantities(
+        ["gaming", None, "gaming"],
+        rng=np.random.default_rng(42),
+    )
+    for spec, quantity in sample.components_for(0):
+        print(spec.name, quantity)
 """
 
 from dataclasses import dataclass, field
-from typing import Optional, List, Dict, Tuple
+from functools import cached_property
+from typing import Iterator, Optional, List, Dict, Sequence, Tuple
 from decimal import Decimal
 import random
 
+import numpy as np
+
 
 @dataclass
 class ComponentSpec:
@@ -79,10 +93,13 @@ class ComponentSpec:
     optional: bool = False  # If True, may be omitted from some products
     probability: float = 1.0  # Probability of inclusion if optional
 
-    def generate_quantity(self) -> Decimal:
+    def generate_quantity(self, rng: Optional[random.Random] = None) -> Decimal:
         """
         Generate random quantity within the specified range.
 
+        Args:
+            rng: Optional random stream (default: the global random module)
+
         Returns:
             Decimal: Random quantity rounded to 4 decimal places
 
@@ -92,7 +109,7 @@ class ComponentSpec:
             >>> isinstance(qty, Decimal)
             True
         """
-        qty = random.uniform(self.qty_range[0], self.qty_range[1])
+        qty = (rng or random).uniform(self.qty_range[0], self.qty_range[1])
         return Decimal(str(round(qty, 4)))
 
 
@@ -142,7 +159,8 @@ class BOMTemplate:
 
     def get_components(
         self,
-        variant: Optional[str] = None
+        variant: Optional[str] = None,
+        rng: Optional[random.Random] = None,
     ) -> List[ComponentSpec]:
         """
         Get components with variant modifiers applied.
@@ -152,6 +170,8 @@ class BOMTemplate:
 
         Args:
             variant: Optional variant name for applying modifiers
+            rng: Optional random stream for optional-component draws
+                (default: the global random module)
 
         Returns:
             List[ComponentSpec]: Modified component specifications
@@ -179,7 +199,7 @@ class BOMTemplate:
                 continue  # Skip this component for this variant
 
             # Check if optional component should be included
-            if comp.optional and random.random() > comp.probability:
+            if comp.optional and (rng or random).random() > comp.probability:
                 continue
 
             # Create modified component
@@ -198,6 +218,111 @@ class BOMTemplate:
 
         return components
 
+    @cached_property
+    def _sampling_plan(self) -> Tuple[
+        List[ComponentSpec], np.ndarray, np.ndarray, np.ndarray, np.ndarray
+    ]:
+        """
+        Precompute the arrays used by sample_quantities.
+
+        Built once per template from base_components plus transport for
+        typical_mass_kg. Templates are treated as immutable after this.
+
+        Returns:
+            Tuple of (specs, bounds, optional_probability, aggregation,
+            modifiers): one representative spec per distinct component name,
+            (2, m) low/high bounds of the m raw components, (m,) inclusion
+            probabilities (1.0 for required components), (m, k) 0/1 matrix
+            mapping raw components to distinct names, and (v + 1, m) variant
+            modifiers with the last row for the base product.
+        """
+        raw = self.base_components + self.calculate_transport(self.typical_mass_kg)
+
+        specs: List[ComponentSpec] = []
+        columns: Dict[str, int] = {}
+        for comp in raw:
+            if comp.name not in columns:
+                columns[comp.name] = len(specs)
+                specs.append(comp)
+
+        bounds = np.array([[c.qty_range[0] for c in raw], [c.qty_range[1] for c in raw]])
+        probability = np.array([c.probability if c.optional else 1.0 for c in raw])
+
+        aggregation = np.zeros((len(raw), len(specs)))
+        for j, comp in enumerate(raw):
+            aggregation[j, columns[comp.name]] = 1.0
+
+        modifiers = np.ones((len(self.variants) + 1, len(raw)))
+        for v, mods in enumerate(self.variants.values()):
+            for j, comp in enumerate(raw):
+                modifiers[v, j] = mods.get(comp.name, 1.0)
+
+        return specs, bounds, probability, aggregation, modifiers
+
+    def sample_quantities(
+        self,
+        variants: Sequence[Optional[str]],
+        rng: Optional[np.random.Generator] = None,
+    ) -> "QuantitySample":
+        """
+        Sample BOM quantities for many products in one vectorized pass.
+
+        Equivalent to calling get_components(variant) plus transport for
+        each product, merging components that share a name, and calling
+        generate_quantity() on each, but computed with NumPy arrays:
+        variant modifiers are gathered per product, optional components are
+        dropped with a probability mask, and a modifier of 0 excludes a
+        component. Quantities stay floats (rounded to 4 decimal places);
+        convert with QuantitySample.components_for() when persisting.
+
+        Args:
+            variants: Variant name (or None for base) for each product
+            rng: NumPy random generator (default: a fresh unseeded one)
+
+        Returns:
+            QuantitySample: Quantities for len(variants) products
+
+        Raises:
+            KeyError: If a variant is not defined on this template
+
+        Example:
+            >>> template = BOMTemplate(
+            ...     name="test",
+            ...     industry="test",
+            ...     base_components=[ComponentSpec("steel", (1.0, 2.0), "kg")],
+            ...     variants={"heavy": {"steel": 2.0}},
+            ... )
+            >>> sample = template.sample_quantities(["heavy", None])
+            >>> sample.quantities.shape
+            (2, 3)
+        """
+        rng = rng if rng is not None else np.random.default_rng()
+        specs, bounds, probability, aggregation, modifiers = self._sampling_plan
+
+        variant_rows = {name: v for v, name in enumerate(self.variants)}
+        base_row = len(self.variants)
+        rows = np.array(
+            [base_row if v is None else variant_rows[v] for v in variants],
+            dtype=np.intp,
+        )
+
+        # (n, m) per-product modifiers; raw components with modifier 0 or a
+        # failed optional draw contribute nothing
+        mods = modifiers[rows]
+        draws = rng.random(mods.shape)
+        included_raw = (mods != 0) & (draws <= probability)
+        scale = np.where(included_raw, mods, 0.0)
+
+        # Sum the ranges of same-named components, then draw once per name
+        low = (scale * bounds[0]) @ aggregation
+        high = (scale * bounds[1]) @ aggregation
+        included = (included_raw.astype(float) @ aggregation) > 0
+
+        quantities = low + rng.random(low.shape) * (high - low)
+        quantities = np.where(included, np.round(quantities, 4), 0.0)
+
+        return QuantitySample(specs=specs, quantities=quantities, included=included)
+
     def calculate_transport(
         self,
         mass_kg: float,
@@ -257,7 +382,42 @@ class BOMTemplate:
         ]
 
 
+@dataclass
+class QuantitySample:
+    """
+    BOM quantities sampled for a batch of products.
+
+    Attributes:
+        specs: One ComponentSpec per column (distinct component names)
+        quantities: (n_products, n_columns) float quantities, rounded to
+            4 decimal places, 0.0 where the component is not included
+        included: (n_products, n_columns) mask of components in each BOM
+    """
+
+    specs: List[ComponentSpec]
+    quantities: np.ndarray
+    included: np.ndarray
+
+    def __len__(self) -> int:
+        return self.quantities.shape[0]
+
+    def components_for(self, product: int) -> Iterator[Tuple[ComponentSpec, Decimal]]:
+        """
+        Yield (spec, Decimal quantity) for one product's included components.
+
+        Args:
+            product: Row index of the product in the sample
+
+        Yields:
+            Tuple[ComponentSpec, Decimal]: Component and its quantity
+        """
+        row = self.quantities[product]
+        for column in np.flatnonzero(self.included[product]):
+            yield self.specs[column], Decimal(str(float(row[column])))
+
+
 __all__ = [
     "ComponentSpec",
     "BOMTemplate",
+    "QuantitySample",
 ]
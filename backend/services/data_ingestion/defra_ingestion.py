@@ -38,9 +38,6 @@ import io
 import re
 from typing import List, Dict, Any, Optional
 
-import httpx
-from openpyxl import load_workbook
-
 from backend.services.data_ingestion.base import BaseDataIngestion
 from backend.services.data_ingestion.transformers.unit_normalizer import normalize_unit
 
@@ -171,23 +168,18 @@ class DEFRAEmissionFactorsIngestion(BaseDataIngestion):
         """
         Download DEFRA Excel file.
 
-        Uses httpx with redirect following enabled since DEFRA site
-        may redirect to CDN or different URL.
+        Redirects are followed since the DEFRA site may redirect to a CDN
+        or different URL; each target is validated against the allowlist.
 
         Returns:
             Raw bytes of the Excel file
 
         Raises:
+            SSRFBlockedError: If the URL or a redirect target is blocked
             httpx.HTTPStatusError: On HTTP error responses
             httpx.ConnectError: On connection failures
         """
-        async with httpx.AsyncClient(timeout=120.0) as client:
-            response = await client.get(
-                self.DEFRA_URL,
-                follow_redirects=True
-            )
-            response.raise_for_status()
-            return response.content
+        return await self.download_file(self.DEFRA_URL, timeout=120.0)
 
     async def parse_data(self, raw_data: bytes) -> List[Dict[str, Any]]:
         """
@@ -202,6 +194,10 @@ class DEFRAEmissionFactorsIngestion(BaseDataIngestion):
         Returns:
             List of parsed records with sheet metadata included
         """
+        # Import here: openpyxl (and the numpy it pulls in) would otherwise
+        # load with every API process that imports the connectors
+        from openpyxl import load_workbook
+
         workbook = load_workbook(io.BytesIO(raw_data), read_only=True)
         records: List[Dict[str, Any]] = []
 
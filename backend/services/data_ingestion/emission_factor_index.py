@@ -0,0 +1,380 @@
+"""
+Emission Factor Index
+
+In-memory index of active emission factors used by EmissionFactorMapper to
+resolve many BOM components without a database round trip per component.
+
+The index is built from a single query over active factors and provides:
+- Exact-name hash map (activity_name -> factors)
+- Trigram index over lowercased activity names for partial (ILIKE-style)
+  matches, verified against the full pattern
+- Category/unit map for category fallbacks
+- Proxy factor map (data_source == "PROXY")
+
+Partial matching mirrors the SQL ``ILIKE '%pattern%'`` used by the mapper:
+matching is case-insensitive, ``_`` matches any single character and ``%``
+matches any run of characters. Among candidates the shortest activity_name
+wins, as with the database lookups.
+
+A process-wide shared index is available for request handlers that would
+otherwise build a fresh mapper per request. It is keyed on the emission
+factor snapshot used by the resolution cache (row count, latest updated_at,
+co2e_factor sum), re-checked at most every SNAPSHOT_TTL_SECONDS, so a sync
+run by a Celery worker or another API process is picked up without an
+explicit invalidation. It is also rebuilt after SHARED_INDEX_TTL_SECONDS.
+Rebuilds are serialized by an asyncio.Lock, so concurrent requests that find
+the index stale wait for one load instead of each running their own.
+
+Usage:
+    from backend.services.data_ingestion.emission_factor_index import (
+        EmissionFactorIndex,
+        get_shared_index,
+    )
+
+    index = await EmissionFactorIndex.load(async_session)
+    factor = index.find_partial("aluminum", unit="kg")
+
+    shared = await get_shared_index(async_session)
+"""
+
+import asyncio
+import logging
+import re
+import time
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.models import EmissionFactor
+from backend.services.data_ingestion.factor_resolution_cache import (
+    SNAPSHOT_TTL_SECONDS,
+    get_factor_snapshot,
+)
+
+
+logger = logging.getLogger(__name__)
+
+# Seconds before the shared index is rebuilt from the database
+SHARED_INDEX_TTL_SECONDS = 300.0
+
+# Characters treated as wildcards by SQL LIKE patterns
+_LIKE_WILDCARDS = re.compile(r"[_%]")
+
+
+def _trigrams(text: str) -> Set[str]:
+    """Return the set of 3-character substrings of text."""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def _like_to_regex(pattern: str) -> "re.Pattern[str]":
+    """
+    Compile a LIKE pattern into an equivalent case-insensitive regex.
+
+    Args:
+        pattern: LIKE pattern without the surrounding '%' wildcards
+
+    Returns:
+        Compiled regex matching the pattern anywhere in a string
+    """
+    parts = []
+    for char in pattern:
+        if char == "_":
+            parts.append(".")
+        elif char == "%":
+            parts.append(".*")
+        else:
+            parts.append(re.escape(char))
+    return re.compile("".join(parts), re.IGNORECASE | re.DOTALL)
+
+
+class EmissionFactorIndex:
+    """
+    Read-only lookup structures over a snapshot of active emission factors.
+
+    Factors are kept in load order, so "first match" semantics (category
+    fallback) follow the order the database returned them in.
+
+    Attributes:
+        factors: All indexed factors in load order
+        loaded_at: time.monotonic() timestamp of when the index was built
+        version: Emission factor snapshot the index was built from, if known
+        checked_at: time.monotonic() timestamp of the last snapshot check
+    """
+
+    def __init__(self, factors: Iterable[EmissionFactor]) -> None:
+        """
+        Build the index.
+
+        Args:
+            factors: Active EmissionFactor objects to index
+        """
+        self.factors: List[EmissionFactor] = list(factors)
+        self.loaded_at = time.monotonic()
+        self.version: Optional[str] = None
+        self.checked_at = self.loaded_at
+
+        self._by_id: Dict[str, EmissionFactor] = {}
+        self._by_name: Dict[str, List[EmissionFactor]] = defaultdict(list)
+        self._by_category_unit: Dict[Tuple[str, str], EmissionFactor] = {}
+        self._proxies: Dict[str, EmissionFactor] = {}
+        self._lower_names: List[str] = []
+        self._trigram_postings: Dict[str, Set[int]] = defaultdict(set)
+
+        for position, factor in enumerate(self.factors):
+            name = factor.activity_name
+            self._by_id[factor.id] = factor
+            self._by_name[name].append(factor)
+
+            if factor.category:
+                self._by_category_unit.setdefault(
+                    (factor.category, factor.unit), factor
+                )
+
+            if factor.data_source == "PROXY":
+                self._proxies.setdefault(name, factor)
+
+            lower_name = name.lower()
+            self._lower_names.append(lower_name)
+            for trigram in _trigrams(lower_name):
+                self._trigram_postings[trigram].add(position)
+
+    @classmethod
+    async def load(cls, db: AsyncSession) -> "EmissionFactorIndex":
+        """
+        Load all active emission factors in a single query and index them.
+
+        The loaded factors are expunged from the session so they stay usable
+        (with all columns loaded) after the session commits or closes.
+
+        Args:
+            db: Async session to query with
+
+        Returns:
+            EmissionFactorIndex over the active factors
+        """
+        started = time.perf_counter()
+        result = await db.execute(
+            select(EmissionFactor).where(EmissionFactor.is_active == True)
+        )
+        factors = result.scalars().all()
+        for factor in factors:
+            db.expunge(factor)
+
+        index = cls(factors)
+        logger.info(
+            f"Indexed {len(index)} active emission factors in "
+            f"{time.perf_counter() - started:.3f}s"
+        )
+        return index
+
+    def __len__(self) -> int:
+        return len(self.factors)
+
+    @staticmethod
+    def _matches(
+        factor: EmissionFactor,
+        unit: Optional[str],
+        geography: Optional[str],
+    ) -> bool:
+        """Check optional unit/geography filters."""
+        if unit is not None and factor.unit != unit:
+            return False
+        if geography and factor.geography != geography:
+            return False
+        return True
+
+    def get(self, factor_id: str) -> Optional[EmissionFactor]:
+        """Return the indexed factor with the given ID, or None."""
+        return self._by_id.get(factor_id)
+
+    def find_exact(
+        self,
+        activity_name: str,
+        unit: Optional[str] = None,
+        geography: Optional[str] = None,
+    ) -> Optional[EmissionFactor]:
+        """
+        Find a factor whose activity_name equals the given name.
+
+        Args:
+            activity_name: Exact activity name (case-sensitive)
+            unit: Optional unit filter
+            geography: Optional geography filter
+
+        Returns:
+            First matching EmissionFactor or None
+        """
+        for factor in self._by_name.get(activity_name, ()):
+            if self._matches(factor, unit, geography):
+                return factor
+        return None
+
+    def find_partial(
+        self,
+        pattern: str,
+        unit: Optional[str] = None,
+        geography: Optional[str] = None,
+    ) -> Optional[EmissionFactor]:
+        """
+        Find the best factor whose activity_name ILIKE '%pattern%'.
+
+        Candidates are narrowed with the trigram index and verified with
+        the full pattern. The shortest activity_name (most specific) wins.
+
+        Args:
+            pattern: Substring pattern (LIKE wildcards honoured)
+            unit: Optional unit filter
+            geography: Optional geography filter
+
+        Returns:
+            Best matching EmissionFactor or None
+        """
+        regex = _like_to_regex(pattern)
+        best: Optional[EmissionFactor] = None
+
+        for position in self._candidates(pattern.lower()):
+            if not regex.search(self._lower_names[position]):
+                continue
+            factor = self.factors[position]
+            if not self._matches(factor, unit, geography):
+                continue
+            if best is None or len(factor.activity_name) < len(best.activity_name):
+                best = factor
+
+        return best
+
+    def find_by_category(
+        self,
+        category: str,
+        unit: str,
+    ) -> Optional[EmissionFactor]:
+        """
+        Return the first factor in a category with the given unit.
+
+        Args:
+            category: Factor category (material, energy, transport, other)
+            unit: Unit of measurement
+
+        Returns:
+            EmissionFactor or None
+        """
+        return self._by_category_unit.get((category, unit))
+
+    def find_proxy(self, activity_name: str) -> Optional[EmissionFactor]:
+        """
+        Return the proxy factor (data_source == "PROXY") for a name.
+
+        Args:
+            activity_name: Exact activity name
+
+        Returns:
+            Proxy EmissionFactor or None
+        """
+        return self._proxies.get(activity_name)
+
+    def _candidates(self, lower_pattern: str) -> Iterable[int]:
+        """
+        Return factor positions that may match a lowercased pattern.
+
+        Every literal run of 3+ characters in the pattern contributes its
+        trigrams; a matching name must contain all of them. Patterns with
+        no such run fall back to a full scan.
+        """
+        required: Set[str] = set()
+        for segment in _LIKE_WILDCARDS.split(lower_pattern):
+            required |= _trigrams(segment)
+
+        if not required:
+            return range(len(self.factors))
+
+        postings = sorted(
+            (self._trigram_postings.get(trigram, set()) for trigram in required),
+            key=len,
+        )
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            if not candidates:
+                break
+            candidates &= posting
+        return sorted(candidates)
+
+
+_shared_index: Optional[EmissionFactorIndex] = None
+
+# Serializes shared index rebuilds
+_shared_index_lock = asyncio.Lock()
+
+
+def _is_current(
+    index: Optional[EmissionFactorIndex],
+    max_age_seconds: float,
+    check_interval_seconds: float,
+) -> bool:
+    """Whether index can be served without checking the snapshot."""
+    if index is None:
+        return False
+    now = time.monotonic()
+    return (
+        now - index.loaded_at <= max_age_seconds
+        and now - index.checked_at < check_interval_seconds
+    )
+
+
+async def get_shared_index(
+    db: AsyncSession,
+    max_age_seconds: float = SHARED_INDEX_TTL_SECONDS,
+    check_interval_seconds: float = SNAPSHOT_TTL_SECONDS,
+) -> EmissionFactorIndex:
+    """
+    Return the process-wide index, rebuilding it when the factors changed.
+
+    Args:
+        db: Async session used to check the snapshot and (re)load the index
+        max_age_seconds: Maximum age of the shared index in seconds
+        check_interval_seconds: How long the index is served before the
+            emission factor snapshot is queried again
+
+    Returns:
+        Shared EmissionFactorIndex
+    """
+    global _shared_index
+
+    index = _shared_index
+    if _is_current(index, max_age_seconds, check_interval_seconds):
+        return index
+
+    async with _shared_index_lock:
+        # Another request may have refreshed the index while we waited
+        index = _shared_index
+        if _is_current(index, max_age_seconds, check_interval_seconds):
+            return index
+
+        version = await get_factor_snapshot(db)
+        if (
+            index is not None
+            and index.version == version
+            and time.monotonic() - index.loaded_at <= max_age_seconds
+        ):
+            index.checked_at = time.monotonic()
+            return index
+
+        index = await EmissionFactorIndex.load(db)
+        index.version = version
+        _shared_index = index
+        return index
+
+
+def invalidate_shared_index() -> None:
+    """Drop the process-wide index so the next lookup reloads it."""
+    global _shared_index
+    _shared_index = None
+
+
+__all__ = [
+    "EmissionFactorIndex",
+    "SHARED_INDEX_TTL_SECONDS",
+    "get_shared_index",
+    "invalidate_shared_index",
+]
@@ -16,6 +16,16 @@ Mapping Strategy:
 
 Proxy factors are derived from EPA and DEFRA data only.
 
+Batch Resolution:
+    Once an EmissionFactorIndex is attached (load_index() or use_index()),
+    every strategy above is answered from memory instead of the database,
+    so thousands of components resolve without per-component queries.
+
+Shared Resolution Cache:
+    The mapping config is parsed once per process (re-read only when the
+    file changes). Passing a FactorResolutionCache lets decisions, including
+    "not found", survive across mapper instances, requests and workers.
+
 Usage:
     from backend.services.data_ingestion.emission_factor_mapper import (
         EmissionFactorMapper
@@ -33,17 +43,33 @@ Usage:
 
     # Clear cache for fresh lookups
     mapper.clear_cache()
+
+    # Resolve many components against an in-memory index
+    factors = await mapper.get_factors_for_components([
+        ("aluminum", "kg", "US"),
+        ("steel", "kg", None),
+    ])
 """
 
+import hashlib
 import json
 import logging
+import threading
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterable, Tuple
 
 from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.models import EmissionFactor, DataSource
+from backend.database.trigram import partial_match_order, trigram_available_async
+from backend.services.data_ingestion.emission_factor_index import (
+    EmissionFactorIndex,
+)
+from backend.services.data_ingestion.factor_resolution_cache import (
+    FactorResolutionCache,
+)
 
 
 logger = logging.getLogger(__name__)
@@ -51,6 +77,86 @@ logger = logging.getLogger(__name__)
 # Path to mapping configuration
 MAPPING_CONFIG_PATH = Path(__file__).parent.parent.parent / "data" / "emission_factor_mappings.json"
 
+# (component_name, unit, geography) request for batch resolution
+ComponentKey = Tuple[str, str, Optional[str]]
+
+# Aliases used when the mapping config file is missing
+DEFAULT_ALIASES = {
+    "aluminium": "aluminum",
+    "aluminium_sheet": "aluminum",
+    "steel_cold_rolled": "steel",
+    "hdpe": "plastic_abs",
+    "ldpe": "plastic_abs",
+}
+
+
+@dataclass(frozen=True)
+class MappingConfig:
+    """
+    Parsed emission_factor_mappings.json, shared by all mapper instances.
+
+    Attributes:
+        mappings: Canonical component name -> ordered activity_names
+        aliases: Alternate name -> canonical name
+        category_defaults: Category -> default activity_name
+        config_hash: Hash of the file contents (cache version input)
+    """
+    mappings: Dict[str, List[str]] = field(default_factory=dict)
+    aliases: Dict[str, str] = field(default_factory=dict)
+    category_defaults: Dict[str, str] = field(default_factory=dict)
+    config_hash: str = "empty"
+
+
+_config_cache: Dict[Path, Tuple[Tuple[int, int], MappingConfig]] = {}
+_config_lock = threading.Lock()
+
+
+def load_mapping_config(path: Optional[Path] = None) -> MappingConfig:
+    """
+    Return the parsed mapping config, re-reading the file only if it changed.
+
+    The file is identified by its modification time and size; the parsed
+    result is shared process-wide.
+
+    Args:
+        path: Config file path (defaults to MAPPING_CONFIG_PATH)
+
+    Returns:
+        MappingConfig (with DEFAULT_ALIASES if the file does not exist)
+
+    Raises:
+        OSError, ValueError: If the file exists but cannot be read or parsed
+    """
+    path = path or MAPPING_CONFIG_PATH
+
+    if not path.exists():
+        logger.warning(f"Mapping config not found at {path}, using defaults")
+        return MappingConfig(aliases=dict(DEFAULT_ALIASES), config_hash="defaults")
+
+    stat = path.stat()
+    signature = (stat.st_mtime_ns, stat.st_size)
+
+    with _config_lock:
+        cached = _config_cache.get(path)
+        if cached and cached[0] == signature:
+            return cached[1]
+
+        raw = path.read_bytes()
+        config = json.loads(raw)
+        parsed = MappingConfig(
+            mappings=config.get("mappings", {}),
+            aliases=config.get("aliases", {}),
+            category_defaults=config.get("category_defaults", {}),
+            config_hash=hashlib.sha256(raw).hexdigest()[:16],
+        )
+        _config_cache[path] = (signature, parsed)
+
+    logger.info(
+        f"Loaded mapping config: {len(parsed.mappings)} mappings, "
+        f"{len(parsed.aliases)} aliases"
+    )
+    return parsed
+
 
 class EmissionFactorMapper:
     """
@@ -72,14 +178,21 @@ class EmissionFactorMapper:
         _aliases: Dict mapping alternate names to canonical names
         _mappings: Dict mapping canonical names to activity_names
         _category_defaults: Dict of category default factors
+        _index: Optional in-memory EmissionFactorIndex used instead of queries
+        _resolution_cache: Optional shared FactorResolutionCache
     """
 
-    def __init__(self, db: AsyncSession) -> None:
+    def __init__(
+        self,
+        db: AsyncSession,
+        resolution_cache: Optional[FactorResolutionCache] = None,
+    ) -> None:
         """
         Initialize the mapper.
 
         Args:
             db: SQLAlchemy async session for database operations
+            resolution_cache: Optional shared cache of resolution decisions
         """
         self.db = db
         self._mapping_cache: Dict[str, Optional[EmissionFactor]] = {}
@@ -87,42 +200,29 @@ class EmissionFactorMapper:
         self._aliases: Dict[str, str] = {}
         self._mappings: Dict[str, List[str]] = {}
         self._category_defaults: Dict[str, str] = {}
+        self._index: Optional[EmissionFactorIndex] = None
+        self._config_hash = "empty"
+        self._resolution_cache = resolution_cache
+        self._cache_version: Optional[str] = None
+        self._pending_decisions: Dict[str, Optional[str]] = {}
 
         # Load mapping configuration
         self._load_mappings()
 
     def _load_mappings(self) -> None:
-        """Load mapping configuration from JSON file."""
+        """Load mapping configuration (parsed once per process)."""
         try:
-            if MAPPING_CONFIG_PATH.exists():
-                with open(MAPPING_CONFIG_PATH, 'r') as f:
-                    config = json.load(f)
-
-                self._mappings = config.get("mappings", {})
-                self._aliases = config.get("aliases", {})
-                self._category_defaults = config.get("category_defaults", {})
-
-                logger.info(
-                    f"Loaded mapping config: {len(self._mappings)} mappings, "
-                    f"{len(self._aliases)} aliases"
-                )
-            else:
-                logger.warning(
-                    f"Mapping config not found at {MAPPING_CONFIG_PATH}, using defaults"
-                )
-                # Default aliases for common variations
-                self._aliases = {
-                    "aluminium": "aluminum",
-                    "aluminium_sheet": "aluminum",
-                    "steel_cold_rolled": "steel",
-                    "hdpe": "plastic_abs",
-                    "ldpe": "plastic_abs",
-                }
+            config = load_mapping_config()
+            self._mappings = config.mappings
+            self._aliases = config.aliases
+            self._category_defaults = config.category_defaults
+            self._config_hash = config.config_hash
         except Exception as e:
             logger.error(f"Error loading mapping config: {e}")
             self._mappings = {}
             self._aliases = {}
             self._category_defaults = {}
+            self._config_hash = "error"
 
     def _resolve_alias(self, component_name: str) -> str:
         """
@@ -137,6 +237,172 @@ class EmissionFactorMapper:
         lower_name = component_name.lower().strip()
         return self._aliases.get(lower_name, component_name)
 
+    def _cache_key(self, component_name: str, unit: str, geography: Optional[str]) -> str:
+        """Build the cache key for a component after alias resolution."""
+        resolved_name = self._resolve_alias(component_name)
+        return f"{resolved_name}:{unit}:{geography or 'any'}"
+
+    @property
+    def index(self) -> Optional[EmissionFactorIndex]:
+        """In-memory index used for lookups, or None for database queries."""
+        return self._index
+
+    async def load_index(self, force: bool = False) -> EmissionFactorIndex:
+        """
+        Load all active emission factors into an in-memory index.
+
+        After loading, lookups no longer query the database. The index is
+        only built once per mapper unless force is set; forcing a reload
+        also clears this mapper's cached lookups.
+
+        Args:
+            force: Rebuild the index even if one is already attached
+
+        Returns:
+            The attached EmissionFactorIndex
+        """
+        if self._index is None or force:
+            if force:
+                self._mapping_cache.clear()
+            self.use_index(await EmissionFactorIndex.load(self.db))
+        return self._index
+
+    def use_index(self, index: Optional[EmissionFactorIndex]) -> None:
+        """
+        Attach a prebuilt (e.g. shared) index, or None to query the database.
+
+        Args:
+            index: EmissionFactorIndex to use for lookups
+        """
+        self._index = index
+
+    async def get_factors_for_components(
+        self,
+        components: Iterable[ComponentKey],
+    ) -> Dict[ComponentKey, Optional[EmissionFactor]]:
+        """
+        Resolve many components at once.
+
+        Cached decisions (including the shared resolution cache, if set)
+        are fetched first in one round trip. The in-memory index is loaded
+        only if some components remain unresolved, then the same matching
+        priority as get_factor_for_component() is applied to each of them
+        without further database queries. Duplicate components are resolved
+        once.
+
+        Args:
+            components: Iterable of (component_name, unit, geography) tuples
+
+        Returns:
+            Dict mapping each requested tuple to its EmissionFactor or None
+        """
+        keys = list(dict.fromkeys(components))
+
+        await self._prefetch_shared_decisions(keys)
+
+        if any(self._cache_key(*key) not in self._mapping_cache for key in keys):
+            await self.load_index()
+
+        results: Dict[ComponentKey, Optional[EmissionFactor]] = {}
+        for component_name, unit, geography in keys:
+            results[(component_name, unit, geography)] = await self._get_factor(
+                component_name, unit, geography
+            )
+
+        await self._flush_shared_decisions()
+        return results
+
+    async def _prefetch_shared_decisions(self, keys: List[ComponentKey]) -> None:
+        """
+        Populate the local cache from the shared resolution cache.
+
+        Cached factor IDs are loaded with one query (or from the index).
+        Decisions pointing at factors that no longer exist are ignored.
+
+        Args:
+            keys: (component_name, unit, geography) tuples to look up
+        """
+        if self._resolution_cache is None:
+            return
+
+        pending: Dict[str, List[ComponentKey]] = {}
+        for key in keys:
+            cache_key = self._cache_key(*key)
+            if cache_key not in self._mapping_cache:
+                pending.setdefault(cache_key, []).append(key)
+        if not pending:
+            return
+
+        if self._cache_version is None:
+            self._cache_version = await self._resolution_cache.get_version(
+                self.db, self._config_hash
+            )
+        decisions = await self._resolution_cache.get_many(
+            self._cache_version, pending
+        )
+        factors = await self._load_factors_by_id(
+            {factor_id for factor_id in decisions.values() if factor_id}
+        )
+
+        for cache_key, factor_id in decisions.items():
+            if factor_id is None:
+                self._mapping_cache[cache_key] = None
+                for component_name, unit, geography in pending[cache_key]:
+                    self._record_unmapped(component_name, unit, geography)
+            elif factor_id in factors:
+                self._mapping_cache[cache_key] = factors[factor_id]
+
+    async def _flush_shared_decisions(self) -> None:
+        """Write newly resolved decisions to the shared resolution cache."""
+        if self._resolution_cache is None or not self._pending_decisions:
+            return
+        decisions, self._pending_decisions = self._pending_decisions, {}
+        await self._resolution_cache.set_many(self._cache_version, decisions)
+
+    async def _load_factors_by_id(
+        self,
+        factor_ids: Iterable[str],
+    ) -> Dict[str, EmissionFactor]:
+        """
+        Load active emission factors by ID.
+
+        Args:
+            factor_ids: Emission factor IDs
+
+        Returns:
+            Dict of ID -> EmissionFactor for the IDs that exist
+        """
+        factor_ids = list(factor_ids)
+        if not factor_ids:
+            return {}
+
+        if self._index is not None:
+            found = (self._index.get(factor_id) for factor_id in factor_ids)
+            return {factor.id: factor for factor in found if factor is not None}
+
+        result = await self.db.execute(
+            select(EmissionFactor).where(
+                EmissionFactor.id.in_(factor_ids),
+                EmissionFactor.is_active == True,
+            )
+        )
+        return {factor.id: factor for factor in result.scalars().all()}
+
+    def _record_unmapped(
+        self,
+        component_name: str,
+        unit: str,
+        geography: Optional[str],
+    ) -> None:
+        """Record a warning for a component with no emission factor."""
+        self._warnings.append({
+            "component_name": component_name,
+            "unit": unit,
+            "geography": geography,
+            "message": "No emission factor found",
+        })
+        logger.warning(f"No emission factor found for: {component_name} ({unit})")
+
     async def _mapping_lookup(
         self,
         component_name: str,
@@ -164,6 +430,16 @@ class EmissionFactorMapper:
         # Check if component has configured mappings
         activity_names = self._mappings.get(component_name, [])
 
+        if self._index is not None:
+            for activity_name in activity_names:
+                factor = (
+                    self._index.find_exact(activity_name, geography=geography)
+                    or self._index.find_partial(activity_name, geography=geography)
+                )
+                if factor:
+                    return factor
+            return None
+
         for activity_name in activity_names:
             # Try exact match on this activity_name
             query = select(EmissionFactor).where(
@@ -189,6 +465,7 @@ class EmissionFactorMapper:
             )
             if geography:
                 query = query.where(EmissionFactor.geography == geography)
+            query = await self._rank_partial(query, activity_name)
 
             result = await self.db.execute(query)
             factors = result.scalars().all()
@@ -220,6 +497,31 @@ class EmissionFactorMapper:
         6. Proxy factor
         7. Return None and log warning
 
+        Args:
+            component_name: Name of BOM component
+            unit: Unit of measurement
+            geography: Optional geographic region
+
+        Returns:
+            Matching EmissionFactor or None if not found
+        """
+        await self._prefetch_shared_decisions([(component_name, unit, geography)])
+        factor = await self._get_factor(component_name, unit, geography)
+        await self._flush_shared_decisions()
+        return factor
+
+    async def _get_factor(
+        self,
+        component_name: str,
+        unit: str,
+        geography: Optional[str],
+    ) -> Optional[EmissionFactor]:
+        """
+        Resolve one component using the local cache and matching strategies.
+
+        New decisions are queued for the shared resolution cache and written
+        by _flush_shared_decisions().
+
         Args:
             component_name: Name of BOM component
             unit: Unit of measurement
@@ -232,61 +534,69 @@ class EmissionFactorMapper:
         resolved_name = self._resolve_alias(component_name)
 
         # Build cache key
-        cache_key = f"{resolved_name}:{unit}:{geography or 'any'}"
+        cache_key = self._cache_key(component_name, unit, geography)
 
         # Check cache first
         if cache_key in self._mapping_cache:
             return self._mapping_cache[cache_key]
 
+        factor = await self._match(resolved_name, unit, geography)
+
+        if factor is None:
+            # Log warning for unmapped component
+            self._record_unmapped(component_name, unit, geography)
+
+        # Cache the result (misses too, to avoid repeated lookups)
+        self._mapping_cache[cache_key] = factor
+        if self._resolution_cache is not None:
+            self._pending_decisions[cache_key] = factor.id if factor else None
+        return factor
+
+    async def _match(
+        self,
+        resolved_name: str,
+        unit: str,
+        geography: Optional[str],
+    ) -> Optional[EmissionFactor]:
+        """
+        Apply the matching strategies in priority order.
+
+        Args:
+            resolved_name: Component name after alias resolution
+            unit: Unit of measurement
+            geography: Optional geographic region
+
+        Returns:
+            First matching EmissionFactor or None
+        """
         # Try configured mappings first (highest priority)
         factor = await self._mapping_lookup(resolved_name, unit, geography)
         if factor:
-            self._mapping_cache[cache_key] = factor
             return factor
 
         # Try exact match
         factor = await self._exact_match(resolved_name, unit, geography)
         if factor:
-            self._mapping_cache[cache_key] = factor
             return factor
 
         # Try partial match
         factor = await self._partial_match(resolved_name, unit, geography)
         if factor:
-            self._mapping_cache[cache_key] = factor
             return factor
 
         # Try category fallback
         factor = await self._category_fallback(resolved_name, unit)
         if factor:
-            self._mapping_cache[cache_key] = factor
             return factor
 
         # Try geographic fallback (GLO) if not already GLO
         if geography and geography != "GLO":
             factor = await self._exact_match(resolved_name, unit, "GLO")
             if factor:
-                self._mapping_cache[cache_key] = factor
                 return factor
 
         # Try proxy factor
-        factor = await self._get_proxy_factor(resolved_name, unit)
-        if factor:
-            self._mapping_cache[cache_key] = factor
-            return factor
-
-        # Log warning for unmapped component
-        self._warnings.append({
-            "component_name": component_name,
-            "unit": unit,
-            "geography": geography,
-            "message": "No emission factor found",
-        })
-        logger.warning(f"No emission factor found for: {component_name} ({unit})")
-
-        # Cache the miss to avoid repeated lookups
-        self._mapping_cache[cache_key] = None
-        return None
+        return await self._get_proxy_factor(resolved_name, unit)
 
     async def _exact_match(
         self,
@@ -305,6 +615,9 @@ class EmissionFactorMapper:
         Returns:
             EmissionFactor if found, None otherwise
         """
+        if self._index is not None:
+            return self._index.find_exact(component_name, unit, geography)
+
         query = select(EmissionFactor).where(
             EmissionFactor.activity_name == component_name,
             EmissionFactor.unit == unit,
@@ -326,6 +639,8 @@ class EmissionFactorMapper:
         Find partial match using ILIKE (case-insensitive).
 
         Returns the factor with the shortest activity_name (most specific match).
+        Ranking happens in SQL (pg_trgm similarity when available) so only the
+        best row is fetched.
 
         Args:
             component_name: Name to search for (substring)
@@ -335,6 +650,9 @@ class EmissionFactorMapper:
         Returns:
             Best matching EmissionFactor or None
         """
+        if self._index is not None:
+            return self._index.find_partial(component_name, unit, geography)
+
         query = select(EmissionFactor).where(
             EmissionFactor.activity_name.ilike(f"%{component_name}%"),
             EmissionFactor.unit == unit,
@@ -342,6 +660,7 @@ class EmissionFactorMapper:
         )
         if geography:
             query = query.where(EmissionFactor.geography == geography)
+        query = await self._rank_partial(query, component_name)
 
         result = await self.db.execute(query)
         factors = result.scalars().all()
@@ -351,6 +670,22 @@ class EmissionFactorMapper:
             return min(factors, key=lambda f: len(f.activity_name))
         return None
 
+    async def _rank_partial(self, query, term: str):
+        """
+        Order a partial-match query best-first and keep only the top row.
+
+        Args:
+            query: Select over EmissionFactor filtered by ILIKE on term
+            term: Search term
+
+        Returns:
+            Ranked and limited select
+        """
+        use_trigram = await trigram_available_async(self.db)
+        return query.order_by(
+            *partial_match_order(EmissionFactor.activity_name, term, use_trigram)
+        ).limit(1)
+
     async def _category_fallback(
         self,
         component_name: str,
@@ -371,6 +706,9 @@ class EmissionFactorMapper:
         if not category:
             return None
 
+        if self._index is not None:
+            return self._index.find_by_category(category, unit)
+
         query = select(EmissionFactor).where(
             EmissionFactor.category == category,
             EmissionFactor.unit == unit,
@@ -420,6 +758,9 @@ class EmissionFactorMapper:
         Returns:
             Proxy EmissionFactor or None
         """
+        if self._index is not None:
+            return self._index.find_proxy(component_name)
+
         query = select(EmissionFactor).where(
             EmissionFactor.activity_name == component_name,
             EmissionFactor.data_source == "PROXY",
@@ -542,4 +883,6 @@ class EmissionFactorMapper:
 
 __all__ = [
     "EmissionFactorMapper",
+    "MappingConfig",
+    "load_mapping_config",
 ]
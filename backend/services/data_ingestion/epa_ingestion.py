@@ -36,9 +36,6 @@ import io
 import re
 from typing import List, Dict, Any, Optional, Tuple
 
-from openpyxl import load_workbook
-import httpx
-
 from backend.services.data_ingestion.base import BaseDataIngestion
 from backend.services.data_ingestion.transformers.unit_normalizer import normalize_unit
 
@@ -123,15 +120,11 @@ class EPAEmissionFactorsIngestion(BaseDataIngestion):
             Raw bytes of the Excel file content
 
         Raises:
+            SSRFBlockedError: If the URL or a redirect target is blocked
             httpx.HTTPStatusError: On HTTP errors (4xx, 5xx)
             httpx.TimeoutException: On request timeout
         """
-        url = self.file_config["url"]
-
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.get(url)
-            response.raise_for_status()
-            return response.content
+        return await self.download_file(self.file_config["url"], timeout=60.0)
 
     async def parse_data(self, raw_data: bytes) -> List[Dict[str, Any]]:
         """
@@ -150,6 +143,10 @@ class EPAEmissionFactorsIngestion(BaseDataIngestion):
         Raises:
             Exception: On corrupted or invalid Excel file
         """
+        # Import here: openpyxl (and the numpy it pulls in) would otherwise
+        # load with every API process that imports the connectors
+        from openpyxl import load_workbook
+
         workbook = load_workbook(io.BytesIO(raw_data), read_only=True)
         records = []
 
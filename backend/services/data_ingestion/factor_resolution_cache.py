@@ -0,0 +1,326 @@
+"""
+Factor Resolution Cache
+
+Shared cache of EmissionFactorMapper decisions, so a component that was
+resolved once is not re-matched by every new mapper instance, request or
+worker.
+
+A decision maps a mapper cache key ("{component}:{unit}:{geography}", after
+alias resolution) to an emission_factor_id, or to None when no factor was
+found (negative results are cached too).
+
+Decisions are stored in two tiers:
+- Process-wide LRU dict (always)
+- Redis hash per cache version (when Redis is reachable)
+
+Versioning:
+    Every decision is namespaced by a version derived from the mapping
+    config hash and an emission factor snapshot (row count, latest
+    updated_at and co2e_factor sum). Editing emission_factor_mappings.json or syncing factors
+    changes the version, so stale decisions are never read; old Redis
+    hashes simply expire. The snapshot itself is re-queried at most every
+    SNAPSHOT_TTL_SECONDS per process.
+
+Usage:
+    from backend.services.data_ingestion.factor_resolution_cache import (
+        get_resolution_cache,
+    )
+
+    mapper = EmissionFactorMapper(
+        db=async_session,
+        resolution_cache=get_resolution_cache(),
+    )
+"""
+
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.models import EmissionFactor
+
+
+logger = logging.getLogger(__name__)
+
+# Redis key prefix; one hash per cache version
+REDIS_KEY_PREFIX = "ef_resolution"
+
+# Lifetime of a version's Redis hash (seconds)
+RESOLUTION_CACHE_TTL_SECONDS = 24 * 60 * 60
+
+# How long a process trusts its emission factor snapshot (seconds)
+SNAPSHOT_TTL_SECONDS = 30.0
+
+# Maximum decisions kept in the process-wide tier
+DEFAULT_LOCAL_MAX_ENTRIES = 50_000
+
+# Back-off after a Redis error before trying Redis again (seconds)
+REDIS_RETRY_AFTER_SECONDS = 60.0
+
+# Redis encoding of a cached "no factor found" decision
+_NEGATIVE = ""
+
+RedisClientFactory = Callable[[], Awaitable[object]]
+
+
+async def get_factor_snapshot(db: AsyncSession) -> str:
+    """
+    Return a fingerprint of the emission factor table.
+
+    Uses the row count, latest updated_at and the sum of co2e_factor, which
+    together change on inserts, deletes, value updates and (de)activation,
+    even when several writes share a timestamp.
+
+    Args:
+        db: Async session to query with
+
+    Returns:
+        Snapshot string such as "1523:2026-01-04T10:22:31:48210.53"
+    """
+    result = await db.execute(
+        select(
+            func.count(EmissionFactor.id),
+            func.max(EmissionFactor.updated_at),
+            func.sum(EmissionFactor.co2e_factor),
+        )
+    )
+    count, last_updated, factor_sum = result.one()
+    stamp = last_updated.isoformat() if last_updated else "none"
+    return f"{count}:{stamp}:{factor_sum}"
+
+
+def _default_redis_client_factory() -> RedisClientFactory:
+    """Return the shared async Redis client getter from utils.cache."""
+    from backend.utils.cache import get_redis_client
+
+    return get_redis_client
+
+
+class FactorResolutionCache:
+    """
+    Versioned two-tier cache of component -> emission_factor_id decisions.
+
+    Redis failures never propagate: the cache falls back to the process
+    tier and retries Redis after REDIS_RETRY_AFTER_SECONDS.
+
+    Attributes:
+        hits: Decisions served from either tier
+        misses: Keys with no cached decision
+    """
+
+    def __init__(
+        self,
+        redis_client_factory: Optional[RedisClientFactory] = None,
+        local_max_entries: int = DEFAULT_LOCAL_MAX_ENTRIES,
+        snapshot_ttl_seconds: float = SNAPSHOT_TTL_SECONDS,
+        redis_ttl_seconds: int = RESOLUTION_CACHE_TTL_SECONDS,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            redis_client_factory: Async callable returning a Redis client,
+                or None to keep decisions in-process only
+            local_max_entries: Maximum decisions kept in-process
+            snapshot_ttl_seconds: How long an EF snapshot is reused
+            redis_ttl_seconds: Expiry for each version's Redis hash
+        """
+        self._redis_client_factory = redis_client_factory
+        self.local_max_entries = local_max_entries
+        self.snapshot_ttl_seconds = snapshot_ttl_seconds
+        self.redis_ttl_seconds = redis_ttl_seconds
+
+        self._local: "OrderedDict[Tuple[str, str], Optional[str]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._snapshot: Optional[str] = None
+        self._snapshot_expires_at = 0.0
+        self._redis_disabled_until = 0.0
+        self.hits = 0
+        self.misses = 0
+
+    async def get_version(self, db: AsyncSession, mapping_hash: str) -> str:
+        """
+        Return the current cache version.
+
+        Args:
+            db: Async session used to refresh the EF snapshot if expired
+            mapping_hash: Hash of the mapping configuration in use
+
+        Returns:
+            Short version string namespacing all decisions
+        """
+        now = time.monotonic()
+        if self._snapshot is None or now >= self._snapshot_expires_at:
+            self._snapshot = await get_factor_snapshot(db)
+            self._snapshot_expires_at = now + self.snapshot_ttl_seconds
+
+        digest = hashlib.sha256(f"{mapping_hash}:{self._snapshot}".encode())
+        return digest.hexdigest()[:16]
+
+    async def get_many(
+        self,
+        version: str,
+        keys: Iterable[str],
+    ) -> Dict[str, Optional[str]]:
+        """
+        Look up cached decisions.
+
+        Args:
+            version: Cache version from get_version()
+            keys: Mapper cache keys
+
+        Returns:
+            Dict of key -> emission_factor_id (None for cached negatives)
+            containing only keys that have a decision
+        """
+        unique_keys = list(dict.fromkeys(keys))
+        found: Dict[str, Optional[str]] = {}
+        missing = []
+
+        with self._lock:
+            for key in unique_keys:
+                local_key = (version, key)
+                if local_key in self._local:
+                    self._local.move_to_end(local_key)
+                    found[key] = self._local[local_key]
+                else:
+                    missing.append(key)
+
+        if missing:
+            remote = await self._redis_get(version, missing)
+            if remote:
+                self._store_local(version, remote)
+                found.update(remote)
+
+        self.hits += len(found)
+        self.misses += len(unique_keys) - len(found)
+        return found
+
+    async def set_many(
+        self,
+        version: str,
+        decisions: Dict[str, Optional[str]],
+    ) -> None:
+        """
+        Record resolution decisions in both tiers.
+
+        Args:
+            version: Cache version from get_version()
+            decisions: Dict of key -> emission_factor_id or None
+        """
+        if not decisions:
+            return
+        self._store_local(version, decisions)
+        await self._redis_set(version, decisions)
+
+    def invalidate(self) -> None:
+        """Forget the EF snapshot and all in-process decisions."""
+        with self._lock:
+            self._local.clear()
+            self._snapshot = None
+            self._snapshot_expires_at = 0.0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._local)
+
+    def _store_local(self, version: str, decisions: Dict[str, Optional[str]]) -> None:
+        """Insert decisions into the LRU tier, evicting the oldest if full."""
+        with self._lock:
+            for key, factor_id in decisions.items():
+                self._local[(version, key)] = factor_id
+                self._local.move_to_end((version, key))
+            while len(self._local) > self.local_max_entries:
+                self._local.popitem(last=False)
+
+    async def _get_redis(self):
+        """Return a Redis client, or None if disabled or backing off."""
+        if self._redis_client_factory is None:
+            return None
+        if time.monotonic() < self._redis_disabled_until:
+            return None
+        return await self._redis_client_factory()
+
+    def _redis_failed(self, error: Exception) -> None:
+        """Back off from Redis after an error."""
+        self._redis_disabled_until = time.monotonic() + REDIS_RETRY_AFTER_SECONDS
+        logger.warning(f"Factor resolution cache Redis unavailable: {error}")
+
+    async def _redis_get(
+        self,
+        version: str,
+        keys: List[str],
+    ) -> Dict[str, Optional[str]]:
+        """Fetch decisions for keys from the version's Redis hash."""
+        try:
+            client = await self._get_redis()
+            if client is None:
+                return {}
+            values = await client.hmget(f"{REDIS_KEY_PREFIX}:{version}", keys)
+        except Exception as e:
+            self._redis_failed(e)
+            return {}
+
+        decisions: Dict[str, Optional[str]] = {}
+        for key, value in zip(keys, values):
+            if value is None:
+                continue
+            if isinstance(value, bytes):
+                value = value.decode()
+            decisions[key] = value if value != _NEGATIVE else None
+        return decisions
+
+    async def _redis_set(
+        self,
+        version: str,
+        decisions: Dict[str, Optional[str]],
+    ) -> None:
+        """Write decisions to the version's Redis hash and refresh its TTL."""
+        try:
+            client = await self._get_redis()
+            if client is None:
+                return
+            redis_key = f"{REDIS_KEY_PREFIX}:{version}"
+            await client.hset(
+                redis_key,
+                mapping={
+                    key: factor_id if factor_id is not None else _NEGATIVE
+                    for key, factor_id in decisions.items()
+                },
+            )
+            await client.expire(redis_key, self.redis_ttl_seconds)
+        except Exception as e:
+            self._redis_failed(e)
+
+
+_resolution_cache: Optional[FactorResolutionCache] = None
+
+
+def get_resolution_cache() -> FactorResolutionCache:
+    """
+    Return the process-wide FactorResolutionCache (Redis-backed).
+
+    Returns:
+        Shared FactorResolutionCache instance
+    """
+    global _resolution_cache
+    if _resolution_cache is None:
+        _resolution_cache = FactorResolutionCache(
+            redis_client_factory=_default_redis_client_factory(),
+        )
+    return _resolution_cache
+
+
+__all__ = [
+    "FactorResolutionCache",
+    "REDIS_KEY_PREFIX",
+    "RESOLUTION_CACHE_TTL_SECONDS",
+    "SNAPSHOT_TTL_SECONDS",
+    "get_factor_snapshot",
+    "get_resolution_cache",
+]
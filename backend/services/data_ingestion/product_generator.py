@@ -10,10 +10,15 @@ industry-specific BOM templates with emission factor mapping.
 Features:
 - Async database session support
 - BOM template-based generation
-- Emission factor mapping via EmissionFactorMapper
+- Emission factor mapping via EmissionFactorMapper (in-memory factor index)
 - Transport calculation per template mass
 - Variant selection for product customization
 - Batch commits every 50 products
+- Bulk mode for large catalogs (generate_catalog_bulk): component codes are
+  preloaded in one query and products/BOM rows are written with multi-row
+  INSERTs in configurable chunks
+- Reproducible bulk catalogs: products are synthesized in independently
+  seeded shards, optionally across a process pool
 - Statistics tracking
 
 Usage:
@@ -28,6 +33,13 @@ Usage:
         await session.commit()
         print(generator.get_stats())
 
+        # Large, reproducible catalogs (e.g. for load testing)
+        counts = await generator.generate_catalog_bulk(
+            {"electronics": 500000, "apparel": 500000},
+            seed=42,
+            workers=8,
+        )
+
 Product Code Pattern:
     {IND}-{TMPL}-{VAR}-{INDEX}
     - IND: First 3 chars of industry (uppercase)
@@ -36,19 +48,26 @@ Product Code Pattern:
     - INDEX: 4-digit zero-padded index
 """
 
+import asyncio
 import logging
 import random
-from typing import Optional, List, Dict, Any, Tuple
-from uuid import uuid4
+import zlib
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Optional, List, Dict, Any, Deque, Tuple
+from uuid import UUID, uuid4
 from decimal import Decimal
 
-from sqlalchemy import select
+import numpy as np
+from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.models import Product, BillOfMaterials, EmissionFactor, ProductCategory
 from backend.services.data_ingestion.bom_templates import (
     BOMTemplate,
     ComponentSpec,
+    QuantitySample,
     ALL_TEMPLATES,
 )
 from backend.services.data_ingestion.product_name_pools import ProductNameGenerator
@@ -57,6 +76,17 @@ from backend.services.data_ingestion.product_name_pools import ProductNameGenera
 logger = logging.getLogger(__name__)
 
 
+def _new_id(rng: Optional[random.Random] = None) -> str:
+    """
+    Return a UUID hex string for a new row.
+
+    Drawn from rng when given, so seeded catalogs get reproducible IDs.
+    """
+    if rng is None:
+        return str(uuid4()).replace("-", "")
+    return UUID(int=rng.getrandbits(128), version=4).hex
+
+
 class ProductGenerator:
     """
     Generate finished products with complete BOMs.
@@ -88,6 +118,22 @@ class ProductGenerator:
     # Batch size for database commits
     BATCH_SIZE = 50
 
+    # Rows per multi-row INSERT in bulk mode
+    BULK_CHUNK_SIZE = 5000
+
+    # Products per seeded synthesis shard in bulk mode. Shard boundaries
+    # determine the random streams, so changing this changes seeded output.
+    SHARD_SIZE = 10000
+
+    # Default catalog distribution (total: 725)
+    DEFAULT_DISTRIBUTION = {
+        "electronics": 175,
+        "apparel": 175,
+        "automotive": 125,
+        "construction": 175,
+        "food_beverage": 75,
+    }
+
     # Valid units per Product model CHECK constraint
     # 'unit', 'kg', 'g', 'L', 'mL', 'm', 'cm', 'kWh', 'MJ', 'tkm'
     VALID_UNITS = {'unit', 'kg', 'g', 'L', 'mL', 'm', 'cm', 'kWh', 'MJ', 'tkm'}
@@ -173,6 +219,43 @@ class ProductGenerator:
                 product_index=1,
             )
         """
+        product = Product(
+            **self._finished_product_fields(template, variant, product_index)
+        )
+
+        self.db.add(product)
+        await self.db.flush()
+
+        # Create BOM entries for each aggregated component
+        for comp in self._product_components(template, variant):
+            bom_entry = await self._create_bom_entry(product, comp, variant)
+            if bom_entry:
+                self.stats["bom_entries_created"] += 1
+
+        self.stats["products_created"] += 1
+
+        return product
+
+    def _finished_product_fields(
+        self,
+        template: BOMTemplate,
+        variant: Optional[str],
+        product_index: int,
+        rng: Optional[random.Random] = None,
+    ) -> Dict[str, Any]:
+        """
+        Build the column values for a finished product.
+
+        Args:
+            template: BOMTemplate defining the product structure
+            variant: Optional variant name
+            product_index: Index number for unique code generation
+            rng: Optional random stream for the id and country of origin
+                (default: uuid4 and the global random module)
+
+        Returns:
+            Dict[str, Any]: Product attribute values (including a new id)
+        """
         # Generate unique product code
         industry_code = self.INDUSTRY_CODES.get(
             template.industry, template.industry[:3].upper()
@@ -189,38 +272,41 @@ class ProductGenerator:
             product_index=product_index,
         )
 
-        # Create product
-        product = Product(
-            id=str(uuid4()).replace("-", ""),
-            code=product_code,
-            name=product_name,
-            description=f"{product_name} - {template.name.replace('_', ' ').title()} by {brand_name}",
-            unit="unit",
-            category=template.industry,  # Set category for product selector grouping
-            is_finished_product=True,
-            manufacturer=brand_name,
-            country_of_origin=random.choice(["US", "CN", "DE", "JP", "GB", "KR"]),
-            product_metadata={
+        return {
+            "id": _new_id(rng),
+            "code": product_code,
+            "name": product_name,
+            "description": f"{product_name} - {template.name.replace('_', ' ').title()} by {brand_name}",
+            "unit": "unit",
+            "category": template.industry,  # Set category for product selector grouping
+            "is_finished_product": True,
+            "manufacturer": brand_name,
+            "country_of_origin": (rng or random).choice(["US", "CN", "DE", "JP", "GB", "KR"]),
+            "product_metadata": {
                 "template": template.name,
                 "variant": variant,
                 "industry": template.industry,
                 "typical_mass_kg": template.typical_mass_kg,
             },
-        )
+        }
 
-        self.db.add(product)
-        await self.db.flush()
+    @staticmethod
+    def _aggregate_components(
+        components: List[ComponentSpec],
+    ) -> List[ComponentSpec]:
+        """
+        Merge components that share a name.
 
-        # Get template components with variant modifiers
-        components = template.get_components(variant=variant)
+        When multiple components have the same name (e.g., textile_polyester
+        for both outer shell and insulation), their quantity ranges are summed
+        so the product gets a single BOM entry per component.
 
-        # Add transport components based on typical mass
-        transport_components = template.calculate_transport(template.typical_mass_kg)
-        components.extend(transport_components)
+        Args:
+            components: Component specifications, possibly with repeated names
 
-        # Aggregate components with same name to avoid unique constraint violation
-        # When multiple components have the same name (e.g., textile_polyester for
-        # both outer shell and insulation), we sum their quantities
+        Returns:
+            List[ComponentSpec]: One specification per component name
+        """
         aggregated_components: Dict[str, ComponentSpec] = {}
         for comp in components:
             if comp.name in aggregated_components:
@@ -237,16 +323,56 @@ class ProductGenerator:
                 )
             else:
                 aggregated_components[comp.name] = comp
+        return list(aggregated_components.values())
 
-        # Create BOM entries for each aggregated component
-        for comp in aggregated_components.values():
-            bom_entry = await self._create_bom_entry(product, comp, variant)
-            if bom_entry:
-                self.stats["bom_entries_created"] += 1
+    def _product_components(
+        self,
+        template: BOMTemplate,
+        variant: Optional[str],
+        rng: Optional[random.Random] = None,
+    ) -> List[ComponentSpec]:
+        """
+        Get the aggregated BOM components for one product.
 
-        self.stats["products_created"] += 1
+        Applies variant modifiers and adds transport components based on
+        the template's typical mass.
 
-        return product
+        Args:
+            template: BOMTemplate defining the product structure
+            variant: Optional variant name for component modifiers
+            rng: Optional random stream for optional-component draws
+
+        Returns:
+            List[ComponentSpec]: Components for the product's BOM
+        """
+        components = template.get_components(variant=variant, rng=rng)
+        components.extend(template.calculate_transport(template.typical_mass_kg))
+        return self._aggregate_components(components)
+
+    def _component_product_fields(self, component: ComponentSpec) -> Dict[str, Any]:
+        """
+        Build the column values for a component product.
+
+        Args:
+            component: ComponentSpec defining the component
+
+        Returns:
+            Dict[str, Any]: Product attribute values (including a new id)
+        """
+        normalized_unit = self._normalize_unit(component.unit)
+        return {
+            "id": str(uuid4()).replace("-", ""),
+            "code": component.name,
+            "name": component.name.replace("_", " ").title(),
+            "description": component.description or f"{component.name} component",
+            "unit": normalized_unit,
+            "is_finished_product": False,
+            "product_metadata": {
+                "category": component.category,
+                "is_component": True,
+                "original_unit": component.unit if component.unit != normalized_unit else None,
+            },
+        }
 
     async def _create_bom_entry(
         self,
@@ -362,23 +488,8 @@ class ProductGenerator:
                 )
                 return None
 
-        # Normalize unit to valid Product unit
-        normalized_unit = self._normalize_unit(component.unit)
-
         # Create new component product
-        component_product = Product(
-            id=str(uuid4()).replace("-", ""),
-            code=component.name,
-            name=component.name.replace("_", " ").title(),
-            description=component.description or f"{component.name} component",
-            unit=normalized_unit,
-            is_finished_product=False,
-            product_metadata={
-                "category": component.category,
-                "is_component": True,
-                "original_unit": component.unit if component.unit != normalized_unit else None,
-            },
-        )
+        component_product = Product(**self._component_product_fields(component))
 
         self.db.add(component_product)
         await self.db.flush()
@@ -425,6 +536,10 @@ class ProductGenerator:
         templates = list(ALL_TEMPLATES[industry].values())
         products = []
 
+        # Resolve emission factors from memory rather than per-component queries
+        if self.mapper is not None:
+            await self.mapper.load_index()
+
         # Initialize industry counter
         if industry not in self.stats["by_industry"]:
             self.stats["by_industry"][industry] = 0
@@ -493,13 +608,7 @@ class ProductGenerator:
             total = sum(len(p) for p in catalog.values())
         """
         if distribution is None:
-            distribution = {
-                "electronics": 175,
-                "apparel": 175,
-                "automotive": 125,
-                "construction": 175,
-                "food_beverage": 75,
-            }
+            distribution = self.DEFAULT_DISTRIBUTION
 
         catalog = {}
         for industry, count in distribution.items():
@@ -511,6 +620,262 @@ class ProductGenerator:
 
         return catalog
 
+    async def generate_catalog_bulk(
+        self,
+        distribution: Optional[Dict[str, int]] = None,
+        chunk_size: Optional[int] = None,
+        seed: Optional[int] = None,
+        workers: int = 1,
+    ) -> Dict[str, int]:
+        """
+        Generate a large catalog with bulk writes.
+
+        Unlike generate_full_catalog, no ORM objects are kept per product:
+        existing component codes are loaded in one query and missing
+        components are inserted up front. Products are then synthesized in
+        shards of SHARD_SIZE (see synthesize_catalog_shard), each with its
+        own seeded random stream, optionally across a process pool. Shards
+        are merged in order: their product and BOM rows are written with
+        multi-row INSERTs of chunk_size rows and committed once per shard.
+        Emission factors (when a mapper is set) are resolved in batch.
+
+        For a given seed the generated rows are identical regardless of the
+        number of workers.
+
+        Args:
+            distribution: Optional dict mapping industry to count
+                (default: DEFAULT_DISTRIBUTION)
+            chunk_size: Rows per INSERT statement (default: BULK_CHUNK_SIZE)
+            seed: Seed for reproducible catalogs (default: random)
+            workers: Worker processes for synthesis (1 = no process pool)
+
+        Returns:
+            Dict[str, int]: Number of products generated per industry
+
+        Example:
+            counts = await generator.generate_catalog_bulk(
+                {"electronics": 500000, "automotive": 500000},
+                seed=42,
+                workers=8,
+            )
+        """
+        if distribution is None:
+            distribution = self.DEFAULT_DISTRIBUTION
+        chunk_size = chunk_size or self.BULK_CHUNK_SIZE
+        if seed is None:
+            seed = random.getrandbits(63)
+
+        industries = []
+        for industry in distribution:
+            if industry in ALL_TEMPLATES:
+                industries.append(industry)
+            else:
+                logger.warning(f"Skipping unknown industry: {industry}")
+
+        # Every component any product can use, including optional ones
+        specs: List[ComponentSpec] = []
+        for industry in industries:
+            for template in ALL_TEMPLATES[industry].values():
+                specs.extend(self._aggregate_components(
+                    template.base_components
+                    + template.calculate_transport(template.typical_mass_kg)
+                ))
+        components = await self._ensure_components_bulk(specs, chunk_size)
+
+        shards: List[CatalogShard] = []
+        for industry in industries:
+            first_index = self._product_index_counter.get(industry, 0) + 1
+            shards.extend(plan_catalog_shards(
+                industry, distribution[industry], seed, first_index, self.SHARD_SIZE
+            ))
+            self._product_index_counter[industry] = first_index - 1 + distribution[industry]
+            self.stats["by_industry"].setdefault(industry, 0)
+
+        logger.info(
+            f"Synthesizing {sum(distribution[i] for i in industries)} products "
+            f"in {len(shards)} shards (seed={seed}, workers={workers})"
+        )
+
+        factor_ids: Dict[Tuple[str, str], Optional[str]] = {}
+        loop = asyncio.get_running_loop()
+        pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+        try:
+            # Keep a bounded number of shards in flight, written in plan order
+            pending: Deque = deque()
+            for shard in shards:
+                pending.append((shard, loop.run_in_executor(
+                    pool, synthesize_catalog_shard, shard
+                )))
+                if len(pending) > workers:
+                    done, future = pending.popleft()
+                    await self._write_shard(done, await future, components, factor_ids, chunk_size)
+            while pending:
+                done, future = pending.popleft()
+                await self._write_shard(done, await future, components, factor_ids, chunk_size)
+        finally:
+            if pool is not None:
+                pool.shutdown(cancel_futures=True)
+
+        return {industry: distribution[industry] for industry in industries}
+
+    async def _write_shard(
+        self,
+        shard: "CatalogShard",
+        rows: Tuple[List[Dict[str, Any]], List[Dict[str, Any]]],
+        components: Dict[str, Tuple[str, str]],
+        factor_ids: Dict[Tuple[str, str], Optional[str]],
+        chunk_size: int,
+    ) -> None:
+        """
+        Link a synthesized shard to component products and bulk insert it.
+
+        Args:
+            shard: The shard the rows were generated for
+            rows: (product rows, BOM rows) from synthesize_catalog_shard
+            components: Component code -> (product id, name)
+            factor_ids: Cache of resolved (name, unit) -> factor id
+            chunk_size: Rows per INSERT statement
+        """
+        product_rows, shard_bom_rows = rows
+
+        bom_rows: List[Dict[str, Any]] = []
+        for row in shard_bom_rows:
+            component = components.get(row.pop("component_code"))
+            if component is None:
+                self.stats["mapping_failures"] += 1
+                continue
+            row["child_product_id"] = component[0]
+            row["quantity"] = Decimal(str(row["quantity"]))
+            # Resolved below, once per (name, unit)
+            row["emission_factor_id"] = (component[1], row["unit"])
+            bom_rows.append(row)
+
+        await self._assign_factor_ids_bulk(bom_rows, factor_ids)
+        await self._insert_rows(Product, product_rows, chunk_size)
+        await self._insert_rows(BillOfMaterials, bom_rows, chunk_size)
+        await self.db.commit()
+
+        self.stats["products_created"] += len(product_rows)
+        self.stats["bom_entries_created"] += len(bom_rows)
+        self.stats["by_industry"][shard.industry] += len(product_rows)
+        logger.info(
+            f"Generated {shard.industry} products "
+            f"{shard.first_index}-{shard.first_index + shard.count - 1}"
+        )
+
+    async def _ensure_components_bulk(
+        self,
+        specs: List[ComponentSpec],
+        chunk_size: int,
+    ) -> Dict[str, Tuple[str, str]]:
+        """
+        Load existing component products and insert the missing ones.
+
+        Existing codes are fetched with a single query. If a mapper is set,
+        components without an emission factor are not created (as in
+        _get_or_create_component_product) and are absent from the result.
+
+        Args:
+            specs: Component specifications (first spec per name wins)
+            chunk_size: Rows per INSERT statement
+
+        Returns:
+            Dict[str, Tuple[str, str]]: Component code -> (product id, name)
+        """
+        unique: Dict[str, ComponentSpec] = {}
+        for spec in specs:
+            unique.setdefault(spec.name, spec)
+
+        result = await self.db.execute(
+            select(Product.code, Product.id, Product.name)
+            .where(Product.code.in_(list(unique)))
+        )
+        components = {code: (id_, name) for code, id_, name in result.all()}
+
+        missing = [spec for name, spec in unique.items() if name not in components]
+        if missing and self.mapper is not None:
+            factors = await self.mapper.get_factors_for_components(
+                (spec.name, spec.unit, None) for spec in missing
+            )
+            for spec in missing:
+                if factors.get((spec.name, spec.unit, None)) is None:
+                    logger.warning(
+                        f"No emission factor found for component: {spec.name} ({spec.unit})"
+                    )
+            missing = [
+                spec for spec in missing
+                if factors.get((spec.name, spec.unit, None)) is not None
+            ]
+
+        rows = [self._component_product_fields(spec) for spec in missing]
+        await self._insert_rows(Product, rows, chunk_size)
+        await self.db.commit()
+
+        for row in rows:
+            components[row["code"]] = (row["id"], row["name"])
+        self.stats["components_created"] += len(rows)
+
+        return components
+
+    async def _assign_factor_ids_bulk(
+        self,
+        bom_rows: List[Dict[str, Any]],
+        factor_ids: Dict[Tuple[str, str], Optional[str]],
+    ) -> None:
+        """
+        Replace (component name, unit) placeholders with emission factor IDs.
+
+        Keys not yet in factor_ids are resolved with one batch mapper call.
+        Without a mapper every BOM row gets no factor, as in _create_bom_entry.
+
+        Args:
+            bom_rows: BOM row dicts whose emission_factor_id holds the
+                (component name, unit) key
+            factor_ids: Cache of resolved keys, updated in place
+        """
+        if self.mapper is not None:
+            pending = {
+                row["emission_factor_id"] for row in bom_rows
+            } - factor_ids.keys()
+            if pending:
+                factors = await self.mapper.get_factors_for_components(
+                    (name, unit, None) for name, unit in pending
+                )
+                for name, unit in pending:
+                    factor = factors.get((name, unit, None))
+                    factor_ids[(name, unit)] = factor.id if factor else None
+
+        for row in bom_rows:
+            row["emission_factor_id"] = factor_ids.get(row["emission_factor_id"])
+
+    async def _insert_rows(
+        self,
+        model,
+        rows: List[Dict[str, Any]],
+        chunk_size: int,
+    ) -> None:
+        """
+        Insert row dicts in chunks with multi-row INSERT statements.
+
+        Rows go through a Core insert on the table, so the ORM does not ask
+        for server-generated timestamps back with RETURNING.
+
+        Args:
+            model: Mapped class to insert into (Product, BillOfMaterials)
+            rows: Attribute dicts for the new rows
+            chunk_size: Rows per statement
+        """
+        # Attribute names differ from column names (product_metadata -> metadata)
+        column_keys = {
+            attr.key: attr.columns[0].key for attr in model.__mapper__.column_attrs
+        }
+        statement = insert(model.__table__)
+        for start in range(0, len(rows), chunk_size):
+            await self.db.execute(statement, [
+                {column_keys[key]: value for key, value in row.items()}
+                for row in rows[start:start + chunk_size]
+            ])
+
     def get_stats(self) -> Dict[str, Any]:
         """
         Get copy of generation statistics.
@@ -526,4 +891,144 @@ class ProductGenerator:
         return self.stats.copy()
 
 
-__all__ = ["ProductGenerator"]
+@dataclass(frozen=True)
+class CatalogShard:
+    """
+    A contiguous run of one industry's products with its own random stream.
+
+    The stream is seeded from (seed, industry, first_index) only, so a shard
+    produces the same rows in any process and in any order.
+
+    Attributes:
+        industry: Industry whose templates are used
+        first_index: Product index of the shard's first product
+        count: Number of products in the shard
+        seed: Catalog seed
+    """
+
+    industry: str
+    first_index: int
+    count: int
+    seed: int
+
+    def rng(self) -> random.Random:
+        """Return a fresh random stream for this shard."""
+        return random.Random(f"{self.seed}:{self.industry}:{self.first_index}")
+
+    def numpy_rng(self) -> np.random.Generator:
+        """Return a fresh NumPy stream for this shard's quantity sampling."""
+        return np.random.default_rng([
+            self.seed % 2**64,
+            zlib.crc32(self.industry.encode()),
+            self.first_index,
+        ])
+
+
+def plan_catalog_shards(
+    industry: str,
+    count: int,
+    seed: int,
+    first_index: int = 1,
+    shard_size: int = ProductGenerator.SHARD_SIZE,
+) -> List[CatalogShard]:
+    """
+    Split an industry's products into fixed-size shards.
+
+    Args:
+        industry: Industry name
+        count: Number of products to generate
+        seed: Catalog seed
+        first_index: Product index of the first product
+        shard_size: Products per shard
+
+    Returns:
+        List[CatalogShard]: Shards in product index order
+    """
+    return [
+        CatalogShard(
+            industry=industry,
+            first_index=first_index + offset,
+            count=min(shard_size, count - offset),
+            seed=seed,
+        )
+        for offset in range(0, count, shard_size)
+    ]
+
+
+def synthesize_catalog_shard(
+    shard: CatalogShard,
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """
+    Build product and BOM rows for one shard without touching the database.
+
+    Runs in worker processes during bulk generation. Templates rotate by
+    product index exactly as in generate_industry_products; variants and
+    IDs are drawn from the shard's stream, and quantities for all of a
+    template's products are sampled at once with
+    BOMTemplate.sample_quantities. Product names are unique within a shard.
+
+    BOM rows carry the child's component code under "component_code" and a
+    float "quantity"; the caller replaces the code with the component
+    product ID and converts the quantity to Decimal when persisting.
+
+    Args:
+        shard: Shard to synthesize
+
+    Returns:
+        Tuple of (product rows, BOM rows)
+    """
+    rng = shard.rng()
+    generator = ProductGenerator(db=None)
+    templates = list(ALL_TEMPLATES[shard.industry].values())
+    product_indexes = range(shard.first_index, shard.first_index + shard.count)
+
+    # Choose every product's template and variant, then sample quantities
+    # per template in one vectorized call
+    chosen: List[Tuple[BOMTemplate, Optional[str]]] = []
+    positions: Dict[str, List[int]] = {}
+    for position, product_index in enumerate(product_indexes):
+        template = templates[(product_index - 1) % len(templates)]
+        chosen.append((template, rng.choice(list(template.variants.keys()) + [None])))
+        positions.setdefault(template.name, []).append(position)
+
+    np_rng = shard.numpy_rng()
+    samples: Dict[int, Tuple[QuantitySample, int, List[str]]] = {}
+    for template in templates:
+        members = positions.get(template.name)
+        if not members:
+            continue
+        sample = template.sample_quantities(
+            [chosen[position][1] for position in members], rng=np_rng
+        )
+        units = [generator._normalize_unit(spec.unit) for spec in sample.specs]
+        for row_index, position in enumerate(members):
+            samples[position] = (sample, row_index, units)
+
+    product_rows: List[Dict[str, Any]] = []
+    bom_rows: List[Dict[str, Any]] = []
+
+    for position, product_index in enumerate(product_indexes):
+        template, variant = chosen[position]
+        row = generator._finished_product_fields(template, variant, product_index, rng)
+        product_rows.append(row)
+
+        sample, row_index, units = samples[position]
+        quantities = sample.quantities[row_index].tolist()
+        for column in np.flatnonzero(sample.included[row_index]).tolist():
+            bom_rows.append({
+                "id": _new_id(rng),
+                "parent_product_id": row["id"],
+                "component_code": sample.specs[column].name,
+                "quantity": quantities[column],
+                "unit": units[column],
+            })
+
+    return product_rows, bom_rows
+
+
+__all__ = [
+    "CatalogShard",
+    "ProductGenerator",
+    "plan_catalog_shards",
+    "synthesize_catalog_shard",
+]
@@ -10,6 +10,8 @@ Components:
 - SSRFBlockedError: Exception raised when a URL is blocked.
 - URLValidator: Validates URLs against SSRF rules.
 - SafeHTTPClient: HTTP client with built-in SSRF protection.
+- DNSResolutionCache: TTL-bounded cache of per-host DNS validation outcomes.
+- get_dns_cache: Returns the process-wide DNSResolutionCache.
 - get_allowed_domains: Returns list of allowed domains.
 
 Usage:
@@ -44,8 +46,9 @@ from .allowed_domains import (
     remove_allowed_domain,
     ALLOWED_DOMAINS,
 )
+from .dns_cache import DNSResolutionCache, get_dns_cache
 from .url_validator import URLValidator
-from .safe_http_client import SafeHTTPClient
+from .safe_http_client import SafeHTTPClient, PinnedDNSTransport
 
 __all__ = [
     # Exceptions
@@ -58,4 +61,7 @@ __all__ = [
     # Core classes
     "URLValidator",
     "SafeHTTPClient",
+    "PinnedDNSTransport",
+    "DNSResolutionCache",
+    "get_dns_cache",
 ]
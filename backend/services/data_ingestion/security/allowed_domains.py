@@ -24,6 +24,8 @@ ALLOWED_DOMAINS: List[str] = [
     # DEFRA (UK Department for Environment, Food & Rural Affairs)
     "api.defra.gov.uk",
     "naei.beis.gov.uk",
+    # GOV.UK asset CDN serving the DEFRA conversion factor workbooks
+    "assets.publishing.service.gov.uk",
 ]
 
 
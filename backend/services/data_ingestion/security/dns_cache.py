@@ -0,0 +1,194 @@
+"""
+DNS resolution cache for SSRF validation.
+
+Memoizes per-host DNS validation outcomes so repeated syncs (and every
+redirect hop) against the same EPA/DEFRA hosts do not pay resolver
+latency each time.
+
+Entries store either the validated public IP (which SafeHTTPClient pins
+for the connection) or the reason the host was blocked. Blocked outcomes
+use a shorter TTL since DNS failures are often transient.
+
+URLValidators created without a cache share the process-wide one from
+get_dns_cache(), so validators built per download still reuse resolutions.
+Outcomes do not depend on the allowlist, so sharing is safe.
+
+Usage:
+    from backend.services.data_ingestion.security import (
+        DNSResolutionCache,
+        URLValidator,
+        get_dns_cache,
+    )
+
+    # Shared cache (the default)
+    validator = URLValidator(allowed_domains=[...])
+    assert validator.dns_cache is get_dns_cache()
+
+    # Private cache
+    cache = DNSResolutionCache(ttl_seconds=300.0)
+    validator = URLValidator(allowed_domains=[...], dns_cache=cache)
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
+
+from .exceptions import SSRFBlockedError
+
+
+# Default TTL for successfully validated hosts (seconds)
+DEFAULT_DNS_CACHE_TTL = 300.0
+
+# Default TTL for blocked/failed hosts (seconds)
+DEFAULT_DNS_NEGATIVE_TTL = 30.0
+
+# Default maximum number of cached hosts
+DEFAULT_DNS_CACHE_MAX_ENTRIES = 1024
+
+
+@dataclass(frozen=True)
+class DNSCacheEntry:
+    """
+    Cached validation outcome for one hostname.
+
+    Attributes:
+        ip: Validated public IP address (None if blocked)
+        error: SSRF error message if the host was blocked
+        expires_at: time.monotonic() deadline for this entry
+    """
+    ip: Optional[str]
+    error: Optional[str]
+    expires_at: float
+
+
+class DNSResolutionCache:
+    """
+    Thread-safe, TTL-bounded LRU cache of per-host DNS validation outcomes.
+
+    Attributes:
+        ttl_seconds: Lifetime of a validated (public IP) entry
+        negative_ttl_seconds: Lifetime of a blocked entry
+        max_entries: Maximum number of hosts kept (LRU eviction)
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = DEFAULT_DNS_CACHE_TTL,
+        negative_ttl_seconds: float = DEFAULT_DNS_NEGATIVE_TTL,
+        max_entries: int = DEFAULT_DNS_CACHE_MAX_ENTRIES,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl_seconds: Lifetime of a validated entry in seconds
+            negative_ttl_seconds: Lifetime of a blocked entry in seconds
+            max_entries: Maximum number of cached hosts
+        """
+        self.ttl_seconds = ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, DNSCacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def lookup(self, hostname: str) -> Optional[str]:
+        """
+        Return the cached validated IP for a hostname.
+
+        Args:
+            hostname: Lowercase hostname
+
+        Returns:
+            Validated IP string, or None on cache miss/expiry
+
+        Raises:
+            SSRFBlockedError: If the host is cached as blocked
+        """
+        with self._lock:
+            entry = self._entries.get(hostname)
+            if entry is None or entry.expires_at <= time.monotonic():
+                if entry is not None:
+                    del self._entries[hostname]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(hostname)
+            self.hits += 1
+
+        if entry.error is not None:
+            raise SSRFBlockedError(entry.error)
+        return entry.ip
+
+    def store(self, hostname: str, ip: str) -> None:
+        """
+        Cache a validated public IP for a hostname.
+
+        Args:
+            hostname: Lowercase hostname
+            ip: Validated IP address
+        """
+        self._put(hostname, DNSCacheEntry(
+            ip=ip,
+            error=None,
+            expires_at=time.monotonic() + self.ttl_seconds,
+        ))
+
+    def store_blocked(self, hostname: str, error: str) -> None:
+        """
+        Cache a blocked outcome for a hostname.
+
+        Args:
+            hostname: Lowercase hostname
+            error: SSRFBlockedError message to re-raise on lookup
+        """
+        self._put(hostname, DNSCacheEntry(
+            ip=None,
+            error=error,
+            expires_at=time.monotonic() + self.negative_ttl_seconds,
+        ))
+
+    def invalidate(self, hostname: str) -> None:
+        """Remove a single hostname from the cache."""
+        with self._lock:
+            self._entries.pop(hostname, None)
+
+    def clear(self) -> None:
+        """Remove all entries and reset hit/miss counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def _put(self, hostname: str, entry: DNSCacheEntry) -> None:
+        """Insert an entry, evicting the least recently used if full."""
+        with self._lock:
+            self._entries[hostname] = entry
+            self._entries.move_to_end(hostname)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+_default_cache: Optional[DNSResolutionCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def get_dns_cache() -> DNSResolutionCache:
+    """
+    Process-wide DNS cache used by URLValidators created without one.
+
+    Returns:
+        The shared DNSResolutionCache (created on first use)
+    """
+    global _default_cache
+    if _default_cache is None:
+        with _default_cache_lock:
+            if _default_cache is None:
+                _default_cache = DNSResolutionCache()
+    return _default_cache
@@ -10,6 +10,9 @@ client instead of making direct HTTP requests.
 Features:
 - Pre-request URL validation
 - Redirect validation (each redirect target is validated)
+- DNS pinning: connections go only to the IPs the validator approved,
+  so a second DNS answer cannot race the check
+- Non-blocking DNS resolution with per-host caching (see dns_cache.py)
 - Response size limits
 - Configurable timeouts
 - Maximum redirect limits
@@ -26,13 +29,181 @@ Usage:
     response = await client.get("https://api.epa.gov/data")
 """
 
-from typing import Optional
+from typing import AsyncIterable, AsyncIterator, Dict, Iterable, Iterator, Optional
+import contextlib
 import httpx
+import httpcore
 
 from .url_validator import URLValidator
 from .exceptions import SSRFBlockedError
 
 
+class PinnedNetworkBackend(httpcore.AsyncNetworkBackend):
+    """
+    httpcore network backend that connects only to pre-validated IPs.
+
+    TCP connections to a hostname are opened against the IP recorded for
+    it in pinned_hosts; TLS still uses the hostname for SNI and certificate
+    verification. Hosts that were not validated are refused.
+    """
+
+    def __init__(
+        self,
+        pinned_hosts: Dict[str, str],
+        backend: Optional[httpcore.AsyncNetworkBackend] = None,
+    ):
+        """
+        Initialize the backend.
+
+        Args:
+            pinned_hosts: Mapping of hostname to validated IP address.
+            backend: Underlying backend used for the actual connections.
+        """
+        self.pinned_hosts = pinned_hosts
+        self._backend = backend or httpcore.AnyIOBackend()
+
+    async def connect_tcp(
+        self,
+        host: str,
+        port: int,
+        timeout: Optional[float] = None,
+        local_address: Optional[str] = None,
+        socket_options: Optional[Iterable] = None,
+    ) -> httpcore.AsyncNetworkStream:
+        pinned_ip = self.pinned_hosts.get(host.lower())
+        if pinned_ip is None:
+            raise SSRFBlockedError(f"Connection to unvalidated host blocked: {host}")
+        return await self._backend.connect_tcp(
+            pinned_ip,
+            port,
+            timeout=timeout,
+            local_address=local_address,
+            socket_options=socket_options,
+        )
+
+    async def connect_unix_socket(self, path: str, timeout=None, socket_options=None):
+        raise SSRFBlockedError("Unix socket connections are not allowed")
+
+    async def sleep(self, seconds: float) -> None:
+        await self._backend.sleep(seconds)
+
+
+# httpcore errors raised while sending, mapped to their httpx equivalents
+# (most specific first) so callers only see httpx exceptions
+_HTTPCORE_EXCEPTIONS = (
+    (httpcore.ConnectTimeout, httpx.ConnectTimeout),
+    (httpcore.ReadTimeout, httpx.ReadTimeout),
+    (httpcore.WriteTimeout, httpx.WriteTimeout),
+    (httpcore.PoolTimeout, httpx.PoolTimeout),
+    (httpcore.TimeoutException, httpx.TimeoutException),
+    (httpcore.ConnectError, httpx.ConnectError),
+    (httpcore.ReadError, httpx.ReadError),
+    (httpcore.WriteError, httpx.WriteError),
+    (httpcore.NetworkError, httpx.NetworkError),
+    (httpcore.UnsupportedProtocol, httpx.UnsupportedProtocol),
+    (httpcore.LocalProtocolError, httpx.LocalProtocolError),
+    (httpcore.RemoteProtocolError, httpx.RemoteProtocolError),
+    (httpcore.ProtocolError, httpx.ProtocolError),
+)
+
+
+@contextlib.contextmanager
+def _map_httpcore_exceptions() -> Iterator[None]:
+    """Re-raise httpcore errors as the matching httpx exception."""
+    try:
+        yield
+    except Exception as exc:
+        for httpcore_exc, httpx_exc in _HTTPCORE_EXCEPTIONS:
+            if isinstance(exc, httpcore_exc):
+                raise httpx_exc(str(exc)) from exc
+        raise
+
+
+class _PinnedResponseStream(httpx.AsyncByteStream):
+    """httpx response stream over an httpcore response body."""
+
+    def __init__(self, httpcore_stream: AsyncIterable[bytes]):
+        self._httpcore_stream = httpcore_stream
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        with _map_httpcore_exceptions():
+            async for part in self._httpcore_stream:
+                yield part
+
+    async def aclose(self) -> None:
+        if hasattr(self._httpcore_stream, "aclose"):
+            await self._httpcore_stream.aclose()
+
+
+class PinnedDNSTransport(httpx.AsyncBaseTransport):
+    """
+    httpx transport over an httpcore pool that uses a PinnedNetworkBackend.
+
+    The pool is built here with network_backend set, rather than patched
+    into httpx.AsyncHTTPTransport, so pinning does not depend on httpx or
+    httpcore internals.
+    """
+
+    def __init__(
+        self,
+        pinned_hosts: Dict[str, str],
+        network_backend: Optional[httpcore.AsyncNetworkBackend] = None,
+    ):
+        """
+        Initialize the transport.
+
+        Args:
+            pinned_hosts: Mapping of hostname to validated IP address.
+                The dict is shared, so pins added for redirect targets
+                apply to the same client.
+            network_backend: Underlying backend used for the actual
+                connections (default: httpcore.AnyIOBackend).
+        """
+        self.pinned_hosts = pinned_hosts
+        self._pool = httpcore.AsyncConnectionPool(
+            ssl_context=httpx.create_ssl_context(),
+            network_backend=PinnedNetworkBackend(pinned_hosts, network_backend),
+        )
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """
+        Send a request through the pinned connection pool.
+
+        Args:
+            request: The httpx request to send.
+
+        Returns:
+            httpx.Response streaming the httpcore response body.
+
+        Raises:
+            SSRFBlockedError: If the request's host has no pinned IP.
+        """
+        core_request = httpcore.Request(
+            method=request.method,
+            url=httpcore.URL(
+                scheme=request.url.raw_scheme,
+                host=request.url.raw_host,
+                port=request.url.port,
+                target=request.url.raw_path,
+            ),
+            headers=request.headers.raw,
+            content=request.stream,
+            extensions=request.extensions,
+        )
+        with _map_httpcore_exceptions():
+            core_response = await self._pool.handle_async_request(core_request)
+
+        return httpx.Response(
+            status_code=core_response.status,
+            headers=core_response.headers,
+            stream=_PinnedResponseStream(core_response.stream),
+            extensions=core_response.extensions,
+        )
+
+    async def aclose(self) -> None:
+        await self._pool.aclose()
+
+
 class SafeHTTPClient:
     """
     HTTP client with built-in SSRF protection.
@@ -104,19 +275,22 @@ class SafeHTTPClient:
             SSRFBlockedError: If the URL or any redirect target fails validation.
             httpx.TimeoutException: If the request times out.
         """
-        # Validate original URL before making request
-        self.validator.validate(url)
+        # Validate original URL before making request and pin its IP
+        pinned_hosts: Dict[str, str] = {}
+        pinned_hosts[httpx.URL(url).host] = await self.validator.validate_async(url)
 
         # Create client with follow_redirects=False to handle manually
         async with httpx.AsyncClient(
             timeout=self.timeout,
             follow_redirects=False,
+            transport=PinnedDNSTransport(pinned_hosts),
         ) as client:
             response = await self._fetch_with_redirect_validation(
                 client=client,
                 url=url,
                 headers=headers,
                 redirect_count=0,
+                pinned_hosts=pinned_hosts,
                 **kwargs
             )
             return response
@@ -127,19 +301,23 @@ class SafeHTTPClient:
         url: str,
         headers: Optional[dict],
         redirect_count: int,
+        pinned_hosts: Optional[Dict[str, str]] = None,
         **kwargs
     ) -> httpx.Response:
         """
         Fetch URL with redirect validation.
 
         Each redirect target is validated against SSRF rules before
-        following.
+        following. Repeat hops to an already validated host are served
+        from the validator's DNS cache.
 
         Args:
             client: httpx.AsyncClient instance.
             url: The URL to fetch.
             headers: Optional headers.
             redirect_count: Current redirect count.
+            pinned_hosts: Hostname -> validated IP map shared with the
+                client's PinnedDNSTransport.
             **kwargs: Additional arguments.
 
         Returns:
@@ -172,18 +350,22 @@ class SafeHTTPClient:
 
             # Validate redirect target
             try:
-                self.validator.validate(redirect_url)
+                redirect_ip = await self.validator.validate_async(redirect_url)
             except SSRFBlockedError as e:
                 raise SSRFBlockedError(
                     f"Redirect target blocked: {str(e)}"
                 )
 
+            if pinned_hosts is not None:
+                pinned_hosts[httpx.URL(redirect_url).host] = redirect_ip
+
             # Follow redirect
             return await self._fetch_with_redirect_validation(
                 client=client,
                 url=redirect_url,
                 headers=headers,
                 redirect_count=redirect_count + 1,
+                pinned_hosts=pinned_hosts,
                 **kwargs
             )
 
@@ -227,12 +409,13 @@ class SafeHTTPClient:
             SSRFBlockedError: If the URL fails validation.
             httpx.TimeoutException: If the request times out.
         """
-        # Validate URL before making request
-        self.validator.validate(url)
+        # Validate URL before making request and pin its IP
+        pinned_hosts = {httpx.URL(url).host: await self.validator.validate_async(url)}
 
         async with httpx.AsyncClient(
             timeout=self.timeout,
             follow_redirects=False,
+            transport=PinnedDNSTransport(pinned_hosts),
         ) as client:
             response = await client.post(
                 url,
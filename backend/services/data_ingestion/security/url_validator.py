@@ -14,6 +14,11 @@ Request Forgery (SSRF) attacks. It validates URLs against:
 6. DNS resolution verification (prevents DNS rebinding)
 7. URL encoding attack prevention
 
+DNS outcomes are memoized per host in a TTL-bounded DNSResolutionCache,
+shared process-wide unless a validator is given its own.
+validate_async() resolves off the event loop and returns the validated IP
+so SafeHTTPClient can pin the connection to it.
+
 Note: IP and hostname checks are performed BEFORE scheme checks to provide
 more informative error messages for SSRF attempts.
 
@@ -22,12 +27,14 @@ References:
   https://cheatsheetseries.owasp.org/cheatsheets/Server_Side_Request_Forgery_Prevention_Cheat_Sheet.html
 """
 
+import asyncio
 import ipaddress
 import re
 import socket
 from typing import List, Optional, Set, Union
 from urllib.parse import urlparse, unquote
 
+from .dns_cache import DNSResolutionCache, get_dns_cache
 from .exceptions import SSRFBlockedError
 
 
@@ -86,14 +93,21 @@ class URLValidator:
     # Allowed ports
     ALLOWED_PORTS: Set[int] = {80, 443}
 
-    def __init__(self, allowed_domains: List[str]):
+    def __init__(
+        self,
+        allowed_domains: List[str],
+        dns_cache: Optional[DNSResolutionCache] = None,
+    ):
         """
         Initialize URLValidator with allowed domains.
 
         Args:
             allowed_domains: List of domain names that are allowed.
+            dns_cache: Cache of per-host DNS outcomes. Defaults to the
+                process-wide cache from get_dns_cache().
         """
         self.allowed_domains: Set[str] = set(d.lower() for d in allowed_domains)
+        self.dns_cache = dns_cache if dns_cache is not None else get_dns_cache()
 
     def validate(self, url: str) -> bool:
         """
@@ -112,6 +126,62 @@ class URLValidator:
         Raises:
             SSRFBlockedError: If the URL fails any security check.
         """
+        hostname = self._validate_url_rules(url)
+
+        # 6. DNS REBINDING PROTECTION - resolve and validate IP
+        self._validate_dns_resolution(hostname)
+
+        return True
+
+    async def validate_async(self, url: str) -> str:
+        """
+        Validate a URL without blocking the event loop.
+
+        Runs the same checks as validate(); DNS resolution (on cache miss)
+        runs in the default executor.
+
+        Args:
+            url: The URL to validate.
+
+        Returns:
+            The validated public IP the hostname resolved to. Callers
+            should connect to this IP so the check cannot be raced by
+            a second DNS answer.
+
+        Raises:
+            SSRFBlockedError: If the URL fails any security check.
+        """
+        hostname = self._validate_url_rules(url)
+
+        cached_ip = self.dns_cache.lookup(hostname)
+        if cached_ip is not None:
+            return cached_ip
+
+        loop = asyncio.get_running_loop()
+        try:
+            ip_string = await loop.run_in_executor(
+                None, self._resolve_and_check, hostname
+            )
+        except SSRFBlockedError as e:
+            self.dns_cache.store_blocked(hostname, str(e))
+            raise
+
+        self.dns_cache.store(hostname, ip_string)
+        return ip_string
+
+    def _validate_url_rules(self, url: str) -> str:
+        """
+        Run all non-DNS checks on a URL.
+
+        Args:
+            url: The URL to validate.
+
+        Returns:
+            The lowercase hostname of the URL.
+
+        Raises:
+            SSRFBlockedError: If the URL fails any check.
+        """
         # Decode URL to prevent encoding bypass attacks
         decoded_url = unquote(url)
 
@@ -153,10 +223,7 @@ class URLValidator:
         port = parsed.port or (443 if parsed.scheme == "https" else 80)
         self._validate_port(port)
 
-        # 6. DNS REBINDING PROTECTION - resolve and validate IP
-        self._validate_dns_resolution(hostname)
-
-        return True
+        return hostname
 
     def _validate_scheme(self, scheme: str) -> None:
         """
@@ -379,16 +446,45 @@ class URLValidator:
                         f"URL points to private/internal IP address: {ip_addr}"
                     )
 
-    def _validate_dns_resolution(self, hostname: str) -> None:
+    def _validate_dns_resolution(self, hostname: str) -> str:
         """
         Resolve hostname and validate the IP is not private.
 
         This prevents DNS rebinding attacks where an attacker's DNS
-        returns a private IP.
+        returns a private IP. Outcomes are memoized in dns_cache.
 
         Args:
             hostname: The hostname to resolve.
 
+        Returns:
+            The validated IP address.
+
+        Raises:
+            SSRFBlockedError: If DNS resolution fails or returns private IP.
+        """
+        cached_ip = self.dns_cache.lookup(hostname)
+        if cached_ip is not None:
+            return cached_ip
+
+        try:
+            ip_string = self._resolve_and_check(hostname)
+        except SSRFBlockedError as e:
+            self.dns_cache.store_blocked(hostname, str(e))
+            raise
+
+        self.dns_cache.store(hostname, ip_string)
+        return ip_string
+
+    def _resolve_and_check(self, hostname: str) -> str:
+        """
+        Resolve hostname (uncached) and check the IP is public.
+
+        Args:
+            hostname: The hostname to resolve.
+
+        Returns:
+            The resolved IP address.
+
         Raises:
             SSRFBlockedError: If DNS resolution fails or returns private IP.
         """
@@ -407,3 +503,5 @@ class URLValidator:
             raise SSRFBlockedError(
                 f"DNS resolution returned private IP for hostname: {hostname}"
             )
+
+        return ip_string
@@ -10,19 +10,34 @@ The async versions in category_loader.py and product_generator.py are used
 for production code with AsyncSession. This sync version is specifically
 for test fixtures using standard Session.
 
+Categories and products are built as row dicts in memory (category IDs are
+assigned up front so children can reference parents) and written with
+multi-row INSERTs in chunks of BULK_CHUNK_SIZE rows, instead of one
+flush per category.
+
+Pass a seed for reproducible catalogs: each category draws from its own
+random stream keyed by (seed, category code), so output does not depend on
+the order categories are processed in.
+
 Usage:
     from backend.services.data_ingestion.sync_catalog_loader import SyncCatalogLoader
 
     loader = SyncCatalogLoader()
     result = loader.load_full_catalog(session, products_per_category=5)
+
+    # Reproducible
+    SyncCatalogLoader(seed=42).load_full_catalog(session)
 """
 
 import random
-from typing import List, Dict, Optional, Tuple
+from typing import Any, List, Dict, Optional, Tuple
+from uuid import UUID
 
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
 from backend.models import Product, ProductCategory
+from backend.models.base import generate_uuid
 from backend.services.data_ingestion.category_loader import CategoryLoader
 from backend.services.data_ingestion.product_generator import LegacyProductGenerator
 
@@ -37,6 +52,9 @@ class SyncCatalogLoader:
     Generates 1000+ categories across 10+ industries with 5 levels of hierarchy.
     """
 
+    # Rows per multi-row INSERT statement
+    BULK_CHUNK_SIZE = 1000
+
     # Valid units according to Product model's CHECK constraint
     VALID_UNITS = {'unit', 'kg', 'g', 'L', 'mL', 'm', 'cm', 'kWh', 'MJ', 'tkm'}
 
@@ -358,10 +376,48 @@ class SyncCatalogLoader:
         },
     }
 
-    def __init__(self):
-        """Initialize with CategoryLoader for tree generation."""
+    def __init__(self, chunk_size: Optional[int] = None, seed: Optional[int] = None):
+        """
+        Initialize with CategoryLoader for tree generation.
+
+        Args:
+            chunk_size: Rows per INSERT statement (default: BULK_CHUNK_SIZE)
+            seed: Optional seed for reproducible IDs and random choices
+        """
         self._category_loader = CategoryLoader()
         self._product_generator = LegacyProductGenerator()
+        self.chunk_size = chunk_size or self.BULK_CHUNK_SIZE
+        self.seed = seed
+
+    def _rng(self, key: str):
+        """
+        Return the random stream for a key (e.g. a category code).
+
+        Seeded loaders get an independent stream per key; unseeded loaders
+        use the global random module.
+        """
+        if self.seed is None:
+            return random
+        return random.Random(f"{self.seed}:{key}")
+
+    def _new_id(self, rng) -> str:
+        """Return a UUID hex primary key, drawn from rng when seeded."""
+        if self.seed is None:
+            return generate_uuid()
+        return UUID(int=rng.getrandbits(128), version=4).hex
+
+    def _insert_rows(self, db: Session, table, rows: List[Dict[str, Any]]) -> None:
+        """
+        Insert row dicts in chunks with multi-row INSERT statements.
+
+        Args:
+            db: Session database connection
+            table: Table to insert into
+            rows: Column dicts for the new rows
+        """
+        statement = insert(table)
+        for start in range(0, len(rows), self.chunk_size):
+            db.execute(statement, rows[start:start + self.chunk_size])
 
     def _normalize_unit(self, unit: str) -> str:
         """
@@ -449,7 +505,9 @@ class SyncCatalogLoader:
         level: int = 0
     ) -> int:
         """
-        Recursively load categories from JSON structure (synchronous version).
+        Load categories from JSON structure (synchronous version).
+
+        The tree is flattened parent-first into row dicts and bulk inserted.
 
         Args:
             db: Session database connection
@@ -460,30 +518,46 @@ class SyncCatalogLoader:
         Returns:
             int: Total count of categories created
         """
-        count = 0
+        rows: List[Dict[str, Any]] = []
+        self._collect_category_rows(categories_data, parent_id, level, rows)
+        self._insert_rows(db, ProductCategory.__table__, rows)
+        return len(rows)
+
+    def _collect_category_rows(
+        self,
+        categories_data: List[Dict],
+        parent_id: Optional[str],
+        level: int,
+        rows: List[Dict[str, Any]],
+    ) -> None:
+        """
+        Recursively flatten a category tree into row dicts.
 
+        Args:
+            categories_data: List of category dictionaries with optional 'children'
+            parent_id: Parent category ID (None for root categories)
+            level: Current hierarchy level (0 for root)
+            rows: Output list, appended to in parent-before-child order
+        """
         for cat_data in categories_data:
-            category = ProductCategory(
-                code=cat_data["code"],
-                name=cat_data["name"],
-                parent_id=parent_id,
-                level=level,
-                industry_sector=cat_data.get("industry_sector"),
-            )
-            db.add(category)
-            db.flush()
-            count += 1
+            category_id = self._new_id(self._rng(f"category:{cat_data['code']}"))
+            rows.append({
+                "id": category_id,
+                "code": cat_data["code"],
+                "name": cat_data["name"],
+                "parent_id": parent_id,
+                "level": level,
+                "industry_sector": cat_data.get("industry_sector"),
+            })
 
             if "children" in cat_data:
-                count += self.load_categories_from_json(
-                    db,
+                self._collect_category_rows(
                     cat_data["children"],
-                    parent_id=category.id,
-                    level=level + 1
+                    parent_id=category_id,
+                    level=level + 1,
+                    rows=rows,
                 )
 
-        return count
-
     def generate_products(
         self,
         db: Session,
@@ -501,9 +575,10 @@ class SyncCatalogLoader:
         Returns:
             int: Total count of products created
         """
-        count = 0
+        rows: List[Dict[str, Any]] = []
 
         for category in categories:
+            rng = self._rng(category.code)
             industry = category.industry_sector or "other"
             templates = self._product_generator.PRODUCT_TEMPLATES.get(industry, [])
 
@@ -520,7 +595,7 @@ class SyncCatalogLoader:
             for i in range(products_per_category):
                 if templates == self._product_generator.PRODUCT_TEMPLATES.get(industry, []):
                     # Use standard templates
-                    template, unit = random.choice(templates)
+                    template, unit = rng.choice(templates)
                     product_name = self._product_generator._fill_template(template)
                     description = self._product_generator._generate_description(product_name, industry)
                 else:
@@ -532,21 +607,20 @@ class SyncCatalogLoader:
                 # Normalize unit to a valid value
                 normalized_unit = self._normalize_unit(unit)
 
-                product = Product(
-                    code=f"{category.code}-{i+1:03d}",
-                    name=product_name,
-                    description=description,
-                    unit=normalized_unit,
-                    category_id=category.id,
-                    manufacturer=random.choice(self._product_generator._BRAND_VALUES),
-                    country_of_origin=random.choice(["US", "CN", "DE", "JP", "GB", "KR", "IN", "MX", "IT", "FR"]),
-                    is_finished_product=category.level >= 2,
-                )
-                db.add(product)
-                count += 1
-
-        db.flush()
-        return count
+                rows.append({
+                    "id": self._new_id(rng),
+                    "code": f"{category.code}-{i+1:03d}",
+                    "name": product_name,
+                    "description": description,
+                    "unit": normalized_unit,
+                    "category_id": category.id,
+                    "manufacturer": rng.choice(self._product_generator._BRAND_VALUES),
+                    "country_of_origin": rng.choice(["US", "CN", "DE", "JP", "GB", "KR", "IN", "MX", "IT", "FR"]),
+                    "is_finished_product": category.level >= 2,
+                })
+
+        self._insert_rows(db, Product.__table__, rows)
+        return len(rows)
 
     def load_full_catalog(
         self,
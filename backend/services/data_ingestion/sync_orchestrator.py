@@ -0,0 +1,564 @@
+"""
+Concurrent multi-source sync orchestrator.
+
+Runs every registered connector (see registry.py) as one composite sync
+job instead of syncing EPA files and DEFRA one after the other.
+
+Pipeline per run:
+- Fetch: raw files for all jobs are downloaded concurrently, bounded by
+  max_concurrent_fetches (local files may be supplied instead)
+- Parse: parse_data() + transform_data() run in parallel in an executor
+  (a process pool by default, since openpyxl parsing is CPU-bound)
+- Write: parsed jobs are handed to a single BulkEmissionFactorWriter
+  through a queue, so writes to emission_factors are serialized and
+  performed in chunked multi-row statements instead of per record
+
+Each job gets its own DataSyncLog (data_sync_logs requires a data source),
+and all logs of a run share a composite_sync_id plus per-phase timings
+in their metadata.
+
+Usage:
+    from backend.services.data_ingestion.sync_orchestrator import (
+        SyncOrchestrator,
+    )
+
+    orchestrator = SyncOrchestrator(
+        session_factory=async_session_maker,
+        max_concurrent_fetches=4,
+    )
+    result = await orchestrator.run()
+    for source in result.sources:
+        print(source.job_key, source.fetch_seconds, source.write_seconds)
+"""
+
+import asyncio
+import logging
+import time
+import uuid
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Type
+
+from sqlalchemy import insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.models import DataSource, EmissionFactor
+from backend.schemas.data_ingestion import CompositeSyncResult, SourceSyncResult
+from backend.services.data_ingestion.base import (
+    BaseDataIngestion,
+    build_emission_factor_values,
+)
+from backend.services.data_ingestion.registry import (
+    get_connector_class,
+    list_registered_connectors,
+)
+
+
+logger = logging.getLogger(__name__)
+
+
+# Short job key prefixes per registered data source name.
+# Connectors exposing several files (EPA FILES) get one job per file:
+# "epa_fuels", "epa_egrid". Matches LOCAL_FILES keys in run_initial_syncs.py.
+JOB_KEY_PREFIXES: Dict[str, str] = {
+    "EPA GHG Emission Factors Hub": "epa",
+    "DEFRA Conversion Factors": "defra",
+}
+
+# Default number of rows per multi-row INSERT/UPDATE statement
+DEFAULT_WRITE_BATCH_SIZE = 500
+
+
+@dataclass
+class SyncJob:
+    """
+    One unit of work for the orchestrator (one connector + file).
+
+    Attributes:
+        key: Job key (e.g. "epa_fuels", "defra")
+        source_name: Data source name as registered in CONNECTOR_REGISTRY
+        connector_class: Connector class used to fetch/parse/transform
+        connector_kwargs: Extra constructor kwargs (e.g. file_key)
+    """
+    key: str
+    source_name: str
+    connector_class: Type[BaseDataIngestion]
+    connector_kwargs: Dict[str, Any] = field(default_factory=dict)
+
+
+def build_sync_jobs(source_names: Optional[List[str]] = None) -> List[SyncJob]:
+    """
+    Expand registered connectors into orchestrator jobs.
+
+    Args:
+        source_names: Data source names to include (default: all registered)
+
+    Returns:
+        List of SyncJob, one per connector file
+
+    Raises:
+        ValueError: If a name has no registered connector
+    """
+    names = source_names if source_names is not None else list_registered_connectors()
+    jobs: List[SyncJob] = []
+
+    for name in names:
+        connector_class = get_connector_class(name)
+        prefix = JOB_KEY_PREFIXES.get(name, name.split()[0].lower())
+        files = getattr(connector_class, "FILES", None)
+
+        if files:
+            for file_key in files:
+                jobs.append(SyncJob(
+                    key=f"{prefix}_{file_key}",
+                    source_name=name,
+                    connector_class=connector_class,
+                    connector_kwargs={"file_key": file_key},
+                ))
+        else:
+            jobs.append(SyncJob(
+                key=prefix,
+                source_name=name,
+                connector_class=connector_class,
+            ))
+
+    return jobs
+
+
+def parse_and_transform(
+    connector_class: Type[BaseDataIngestion],
+    connector_kwargs: Dict[str, Any],
+    raw_data: bytes,
+) -> List[Dict[str, Any]]:
+    """
+    Parse and transform raw data outside the event loop.
+
+    Module-level so it can be pickled into a ProcessPoolExecutor. The
+    connector is built without a database session; parse_data() and
+    transform_data() never touch the database.
+
+    Args:
+        connector_class: Connector class to instantiate
+        connector_kwargs: Extra constructor kwargs (e.g. file_key)
+        raw_data: Raw bytes returned by fetch_raw_data()
+
+    Returns:
+        Transformed records ready for validation and writing
+    """
+    connector = connector_class(db=None, data_source_id="", **connector_kwargs)
+
+    async def _run() -> List[Dict[str, Any]]:
+        parsed = await connector.parse_data(raw_data)
+        return await connector.transform_data(parsed)
+
+    return asyncio.run(_run())
+
+
+class BulkEmissionFactorWriter:
+    """
+    Single writer that upserts emission factors in chunked statements.
+
+    Existing rows are matched on (data_source_id, external_id) with one
+    lookup query per job; updates and inserts are then issued as
+    executemany batches of batch_size rows.
+    """
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        batch_size: int = DEFAULT_WRITE_BATCH_SIZE,
+    ) -> None:
+        """
+        Initialize the writer.
+
+        Args:
+            db: Async session owned by the writer
+            batch_size: Rows per INSERT/UPDATE batch
+        """
+        self.db = db
+        self.batch_size = batch_size
+
+    async def write(
+        self,
+        data_source_id: str,
+        records: List[Dict[str, Any]],
+        sync_batch_id: Optional[str] = None,
+    ) -> Dict[str, int]:
+        """
+        Upsert validated records for one data source.
+
+        Args:
+            data_source_id: UUID of the data source
+            records: Validated, transformed records
+            sync_batch_id: DataSyncLog ID stored on each row
+
+        Returns:
+            Dict with "created" and "updated" counts
+        """
+        result = await self.db.execute(
+            select(EmissionFactor.external_id, EmissionFactor.id).where(
+                EmissionFactor.data_source_id == data_source_id,
+                EmissionFactor.external_id.isnot(None),
+            )
+        )
+        existing_ids: Dict[str, str] = {row[0]: row[1] for row in result.all()}
+
+        now = datetime.now()  # Naive datetime for TIMESTAMP WITHOUT TIME ZONE
+        to_insert: List[Dict[str, Any]] = []
+        to_update: Dict[str, Dict[str, Any]] = {}
+        pending_inserts: Dict[str, int] = {}
+
+        for record in records:
+            values = build_emission_factor_values(
+                record, data_source_id=data_source_id, sync_batch_id=sync_batch_id
+            )
+            external_id = values["external_id"]
+
+            if external_id and external_id in existing_ids:
+                values.pop("external_id")
+                values.pop("data_source_id")
+                values["id"] = existing_ids[external_id]
+                values["updated_at"] = now
+                # Last record wins for duplicate external IDs within a file
+                to_update[external_id] = values
+            elif external_id and external_id in pending_inserts:
+                to_insert[pending_inserts[external_id]] = values
+            else:
+                if external_id:
+                    pending_inserts[external_id] = len(to_insert)
+                to_insert.append(values)
+
+        updates = list(to_update.values())
+        for start in range(0, len(updates), self.batch_size):
+            await self.db.execute(
+                update(EmissionFactor), updates[start:start + self.batch_size]
+            )
+
+        for start in range(0, len(to_insert), self.batch_size):
+            await self.db.execute(
+                insert(EmissionFactor), to_insert[start:start + self.batch_size]
+            )
+
+        await self.db.flush()
+
+        return {"created": len(to_insert), "updated": len(updates)}
+
+
+@dataclass
+class _JobState:
+    """
+    Mutable per-job state tracked during a run.
+
+    Sync log fields are copied here as the log is written: a rollback for
+    another job expires every instance in the shared session, so the
+    DataSyncLog objects cannot be read once the session is closed.
+    """
+    job: SyncJob
+    connector: Optional[BaseDataIngestion] = None
+    data_source_id: Optional[str] = None
+    sync_log_id: str = ""
+    started_at: Optional[datetime] = None
+    completed_at: Optional[datetime] = None
+    records: Optional[List[Dict[str, Any]]] = None
+    error: Optional[str] = None
+    fetch_seconds: float = 0.0
+    parse_seconds: float = 0.0
+    write_seconds: float = 0.0
+
+
+class SyncOrchestrator:
+    """
+    Runs all registered connectors as one concurrent composite sync.
+
+    Attributes:
+        session_factory: Callable returning an AsyncSession context manager
+        max_concurrent_fetches: Upper bound on simultaneous downloads
+        max_parse_workers: Process pool size for parsing (0 parses inline)
+        write_batch_size: Rows per multi-row INSERT/UPDATE
+        local_files: Optional job key -> Path overrides for fetching
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Any],
+        source_names: Optional[List[str]] = None,
+        max_concurrent_fetches: int = 4,
+        max_parse_workers: Optional[int] = None,
+        write_batch_size: int = DEFAULT_WRITE_BATCH_SIZE,
+        sync_type: str = "scheduled",
+        max_records: Optional[int] = None,
+        local_files: Optional[Dict[str, Path]] = None,
+        executor: Optional[Executor] = None,
+    ) -> None:
+        """
+        Initialize the orchestrator.
+
+        Args:
+            session_factory: Callable returning an AsyncSession context manager
+                (e.g. an async_sessionmaker)
+            source_names: Data source names to sync (default: all registered)
+            max_concurrent_fetches: Maximum simultaneous fetches
+            max_parse_workers: Process pool size for parsing. None uses the
+                number of jobs; 0 parses inline on the event loop.
+            write_batch_size: Rows per multi-row INSERT/UPDATE statement
+            sync_type: Sync type recorded on each DataSyncLog
+            max_records: Optional per-job record limit (smoke testing)
+            local_files: Optional mapping of job key to a local file to read
+                instead of calling fetch_raw_data()
+            executor: Optional executor for parsing. Use a thread pool where
+                child processes are not allowed (e.g. Celery prefork workers).
+        """
+        self.session_factory = session_factory
+        self.jobs = build_sync_jobs(source_names)
+        self.max_concurrent_fetches = max(1, max_concurrent_fetches)
+        self.max_parse_workers = max_parse_workers
+        self.write_batch_size = write_batch_size
+        self.sync_type = sync_type
+        self.max_records = max_records
+        self.local_files = local_files or {}
+        self.executor = executor
+
+    async def run(self) -> CompositeSyncResult:
+        """
+        Execute the composite sync.
+
+        Returns:
+            CompositeSyncResult with one SourceSyncResult per job
+        """
+        composite_sync_id = uuid.uuid4().hex
+        started_at = datetime.now(timezone.utc)
+        run_start = time.perf_counter()
+        states = [_JobState(job=job) for job in self.jobs]
+
+        executor = self.executor
+        owns_executor = False
+        if executor is None and self.max_parse_workers != 0:
+            executor = ProcessPoolExecutor(
+                max_workers=self.max_parse_workers or max(1, len(states))
+            )
+            owns_executor = True
+
+        try:
+            async with self.session_factory() as db:
+                await self._prepare_jobs(db, states)
+
+                queue: asyncio.Queue = asyncio.Queue()
+                semaphore = asyncio.Semaphore(self.max_concurrent_fetches)
+                writer = BulkEmissionFactorWriter(db, batch_size=self.write_batch_size)
+
+                writer_task = asyncio.create_task(
+                    self._write_loop(db, writer, queue, composite_sync_id)
+                )
+                await asyncio.gather(*(
+                    self._fetch_and_parse(state, semaphore, executor, queue)
+                    for state in states
+                    if state.connector is not None
+                ))
+                await queue.put(None)
+                await writer_task
+        finally:
+            if owns_executor:
+                executor.shutdown(wait=False)
+
+        sources = [self._to_source_result(state) for state in states]
+        failed = sum(1 for s in sources if s.status == "failed")
+        if failed == 0:
+            status = "completed"
+        elif failed == len(sources):
+            status = "failed"
+        else:
+            status = "partial"
+
+        return CompositeSyncResult(
+            composite_sync_id=composite_sync_id,
+            status=status,
+            started_at=started_at,
+            completed_at=datetime.now(timezone.utc),
+            duration_seconds=time.perf_counter() - run_start,
+            sources=sources,
+        )
+
+    async def _prepare_jobs(
+        self, db: AsyncSession, states: List[_JobState]
+    ) -> None:
+        """
+        Resolve data sources in one query and open a sync log per job.
+
+        Jobs whose data source is missing or inactive are marked failed
+        and skipped.
+        """
+        names = sorted({state.job.source_name for state in states})
+        result = await db.execute(
+            select(DataSource).where(DataSource.name.in_(names))
+        )
+        sources = {source.name: source for source in result.scalars().all()}
+
+        for state in states:
+            source = sources.get(state.job.source_name)
+            if source is None:
+                state.error = f"Data source not found: {state.job.source_name}"
+                continue
+            if not source.is_active:
+                state.error = f"Data source is inactive: {state.job.source_name}"
+                continue
+
+            state.data_source_id = source.id
+            state.connector = state.job.connector_class(
+                db=db,
+                data_source_id=source.id,
+                sync_type=self.sync_type,
+                **state.job.connector_kwargs,
+            )
+            sync_log = await state.connector._create_sync_log()
+            state.connector.sync_log = sync_log
+            state.sync_log_id = sync_log.id
+            state.started_at = sync_log.started_at
+
+        await db.commit()
+
+    async def _fetch_and_parse(
+        self,
+        state: _JobState,
+        semaphore: asyncio.Semaphore,
+        executor: Optional[Executor],
+        queue: asyncio.Queue,
+    ) -> None:
+        """Fetch (bounded) then parse one job and hand it to the writer."""
+        job = state.job
+        try:
+            fetch_start = time.perf_counter()
+            async with semaphore:
+                local_path = self.local_files.get(job.key)
+                if local_path is not None and Path(local_path).exists():
+                    raw_data = await asyncio.to_thread(Path(local_path).read_bytes)
+                else:
+                    raw_data = await state.connector.fetch_raw_data()
+            state.fetch_seconds = time.perf_counter() - fetch_start
+
+            parse_start = time.perf_counter()
+            if executor is None:
+                parsed = await state.connector.parse_data(raw_data)
+                records = await state.connector.transform_data(parsed)
+            else:
+                loop = asyncio.get_running_loop()
+                records = await loop.run_in_executor(
+                    executor,
+                    parse_and_transform,
+                    job.connector_class,
+                    job.connector_kwargs,
+                    raw_data,
+                )
+            state.parse_seconds = time.perf_counter() - parse_start
+
+            if self.max_records is not None and self.max_records > 0:
+                records = records[:self.max_records]
+            state.records = records
+
+        except Exception as e:
+            logger.warning("Sync job %s failed before write: %s", job.key, e)
+            state.error = str(e)
+
+        await queue.put(state)
+
+    async def _write_loop(
+        self,
+        db: AsyncSession,
+        writer: BulkEmissionFactorWriter,
+        queue: asyncio.Queue,
+        composite_sync_id: str,
+    ) -> None:
+        """Consume parsed jobs and write them one at a time."""
+        while True:
+            state = await queue.get()
+            if state is None:
+                return
+            await self._write_job(db, writer, state, composite_sync_id)
+
+    async def _write_job(
+        self,
+        db: AsyncSession,
+        writer: BulkEmissionFactorWriter,
+        state: _JobState,
+        composite_sync_id: str,
+    ) -> None:
+        """Validate and bulk write one job, then close its sync log."""
+        connector = state.connector
+        write_start = time.perf_counter()
+
+        if state.error is None:
+            try:
+                valid_records = []
+                for record in state.records or []:
+                    connector.stats["records_processed"] += 1
+                    if await connector.validate_record(record):
+                        valid_records.append(record)
+                    else:
+                        connector.stats["records_failed"] += 1
+
+                counts = await writer.write(
+                    state.data_source_id,
+                    valid_records,
+                    sync_batch_id=state.sync_log_id,
+                )
+                await db.commit()
+                connector.stats["records_created"] += counts["created"]
+                connector.stats["records_updated"] += counts["updated"]
+                connector._record_ingestion_metrics()
+            except Exception as e:
+                logger.warning("Sync job %s failed during write: %s", state.job.key, e)
+                await db.rollback()
+                state.error = str(e)
+
+        state.write_seconds = time.perf_counter() - write_start
+
+        connector.sync_log.sync_metadata = {
+            "composite_sync_id": composite_sync_id,
+            "job_key": state.job.key,
+            "timings": {
+                "fetch_seconds": round(state.fetch_seconds, 3),
+                "parse_seconds": round(state.parse_seconds, 3),
+                "write_seconds": round(state.write_seconds, 3),
+            },
+        }
+        if state.error is None:
+            await connector._update_sync_log("completed")
+        else:
+            await connector._update_sync_log("failed", state.error)
+        state.completed_at = connector.sync_log.completed_at
+        await db.commit()
+
+    def _to_source_result(self, state: _JobState) -> SourceSyncResult:
+        """Build the per-job result."""
+        connector = state.connector
+        stats = connector.stats if connector else {}
+
+        return SourceSyncResult(
+            job_key=state.job.key,
+            source_name=state.job.source_name,
+            sync_log_id=state.sync_log_id,
+            status="failed" if state.error else "completed",
+            records_processed=stats.get("records_processed", 0),
+            records_created=stats.get("records_created", 0),
+            records_updated=stats.get("records_updated", 0),
+            records_skipped=stats.get("records_skipped", 0),
+            records_failed=stats.get("records_failed", 0),
+            errors=connector.errors[:100] if connector else [],
+            started_at=state.started_at,
+            completed_at=state.completed_at,
+            fetch_seconds=state.fetch_seconds,
+            parse_seconds=state.parse_seconds,
+            write_seconds=state.write_seconds,
+            error_message=state.error,
+        )
+
+
+__all__ = [
+    "BulkEmissionFactorWriter",
+    "JOB_KEY_PREFIXES",
+    "SyncJob",
+    "SyncOrchestrator",
+    "build_sync_jobs",
+    "parse_and_transform",
+]
@@ -8,7 +8,9 @@ from external sources (EPA, DEFRA).
 
 Tasks:
 - sync_data_source: Sync emission factors from a data source
+- sync_all_sources: Concurrent composite sync of all registered connectors
 - check_sync_status: Check status of a sync operation
+- refresh_coverage_rollups: Rebuild admin coverage rollups (queued after syncs)
 
 Usage:
     from backend.tasks.data_sync import sync_data_source, check_sync_status
@@ -24,25 +26,39 @@ Usage:
         queue="data_sync"
     )
 
+    # Sync every registered connector as one composite job
+    result = sync_all_sources.delay()
+
     # Check sync status
     status = check_sync_status.delay("sync-log-uuid")
 """
 
 import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
 
 from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
+from backend.config import settings
 from backend.core.celery_app import celery_app, BoundTask
 from backend.database.connection import SessionLocal
 from backend.models import DataSource, DataSyncLog
 from backend.services.data_ingestion import (
     EPAEmissionFactorsIngestion,
     DEFRAEmissionFactorsIngestion,
+    SyncOrchestrator,
+)
+from backend.services.coverage_rollups import (
+    refresh_coverage_rollups as refresh_rollups,
 )
 
 
+logger = logging.getLogger(__name__)
+
+
 # Mapping of data source names to ingestion classes
 INGESTION_CLASSES: Dict[str, type] = {
     "EPA_GHG_HUB": EPAEmissionFactorsIngestion,
@@ -178,9 +194,100 @@ async def _async_sync_data_source(
         # Commit transaction
         db.commit()
 
+        if not dry_run:
+            queue_coverage_refresh()
+
         return sync_result.dict()
 
 
+@celery_app.task(
+    bind=True,
+    base=BoundTask,
+    name="backend.tasks.data_sync.sync_all_sources",
+    autoretry_for=(ConnectionError, TimeoutError, OSError),
+    retry_backoff=True,
+    retry_backoff_max=600,
+    retry_kwargs={"max_retries": 3},
+    acks_late=True,
+)
+def sync_all_sources(
+    self,
+    source_names: Optional[List[str]] = None,
+    max_concurrent_fetches: int = 4,
+) -> Dict[str, Any]:
+    """
+    Sync all registered connectors concurrently as one composite job.
+
+    Fetches run concurrently, parsing runs in parallel threads and all
+    writes go through a single bulk writer (see SyncOrchestrator).
+
+    Args:
+        self: Celery task instance (bound task)
+        source_names: Data source names to sync (default: all registered)
+        max_concurrent_fetches: Maximum simultaneous downloads
+
+    Returns:
+        dict: CompositeSyncResult with per-source statistics and timings
+    """
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        return loop.run_until_complete(
+            _async_sync_all_sources(self, source_names, max_concurrent_fetches)
+        )
+    finally:
+        loop.close()
+
+
+async def _async_sync_all_sources(
+    task_instance,
+    source_names: Optional[List[str]],
+    max_concurrent_fetches: int,
+) -> Dict[str, Any]:
+    """
+    Async implementation of sync_all_sources.
+
+    Uses a task-local async engine because each Celery task runs on its
+    own event loop. Parsing uses a thread pool since prefork worker
+    processes may not spawn child processes.
+
+    Args:
+        task_instance: Celery task instance for state updates
+        source_names: Data source names to sync
+        max_concurrent_fetches: Maximum simultaneous downloads
+
+    Returns:
+        dict: Composite sync result
+    """
+    engine = create_async_engine(settings.async_database_url)
+    session_factory = async_sessionmaker(
+        engine, class_=AsyncSession, expire_on_commit=False
+    )
+    sync_type = "manual" if task_instance.request.id else "scheduled"
+
+    task_instance.update_state(
+        state="SYNCING",
+        meta={"sources": source_names or "all", "started": True}
+    )
+
+    try:
+        with ThreadPoolExecutor(max_workers=max_concurrent_fetches) as executor:
+            orchestrator = SyncOrchestrator(
+                session_factory=session_factory,
+                source_names=source_names,
+                max_concurrent_fetches=max_concurrent_fetches,
+                sync_type=sync_type,
+                executor=executor,
+            )
+            result = await orchestrator.run()
+    finally:
+        await engine.dispose()
+
+    queue_coverage_refresh()
+
+    return result.model_dump(mode="json")
+
+
 @celery_app.task(
     bind=True,
     base=BoundTask,
@@ -246,3 +353,41 @@ async def _async_check_sync_status(sync_log_id: str) -> Dict[str, Any]:
             "records_failed": sync_log.records_failed,
             "error_message": sync_log.error_message,
         }
+
+
+def queue_coverage_refresh() -> None:
+    """
+    Queue a coverage rollup refresh after a sync.
+
+    Failing to queue the refresh must not fail the sync itself; the
+    coverage endpoint reports the rollups as stale until the next refresh.
+    """
+    try:
+        refresh_coverage_rollups.delay()
+    except Exception as e:
+        logger.warning(f"Could not queue coverage rollup refresh: {e}")
+
+
+@celery_app.task(
+    bind=True,
+    base=BoundTask,
+    name="backend.tasks.data_sync.refresh_coverage_rollups",
+    acks_late=True,
+)
+def refresh_coverage_rollups(self) -> Dict[str, Any]:
+    """
+    Rebuild the precomputed admin coverage rollups.
+
+    Args:
+        self: Celery task instance (bound task)
+
+    Returns:
+        dict: refreshed_at timestamp (ISO 8601)
+    """
+    db = SessionLocal()
+    try:
+        refreshed_at = refresh_rollups(db)
+    finally:
+        db.close()
+
+    return {"refreshed_at": refreshed_at.isoformat()}
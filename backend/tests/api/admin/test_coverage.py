@@ -888,3 +888,175 @@ class TestCoverageErrorResponses:
 
         # Assert - no results (in API this would return 422)
         assert result == 0
+
+
+class TestCoverageRollups:
+    """Tests for the coverage report served from precomputed rollups."""
+
+    @staticmethod
+    def _get_coverage(db: Session, **kwargs):
+        """Call the endpoint function with explicit query parameters."""
+        from backend.api.routes.admin.coverage import get_coverage
+        from backend.schemas.admin import GroupByEnum
+
+        params = {
+            "group_by": GroupByEnum.source,
+            "data_source_id": None,
+            "include_inactive": False,
+            "refresh": False,
+        }
+        params.update(kwargs)
+        return get_coverage(db=db, **params)
+
+    def test_summary_from_rollups(
+        self, clean_db_session: Session, emission_factors_multi_source: list[EmissionFactor]
+    ):
+        """First request computes rollups; summary matches the factors."""
+        response = self._get_coverage(clean_db_session)
+
+        assert response.summary.total_emission_factors == 5
+        assert response.summary.active_emission_factors == 5
+        assert response.summary.unique_activities == 5
+        assert response.summary.geographies_covered == 3
+        assert response.summary.average_quality_rating == pytest.approx(0.89)
+        assert response.refreshed_at is not None
+        assert response.stale is False
+
+    def test_filters_applied_to_rollups(
+        self,
+        clean_db_session: Session,
+        sample_data_sources: list[DataSource],
+        emission_factors_multi_source: list[EmissionFactor],
+    ):
+        """include_inactive and data_source_id are answered from the same rollups."""
+        with_inactive = self._get_coverage(clean_db_session, include_inactive=True)
+        defra_only = self._get_coverage(
+            clean_db_session, data_source_id=sample_data_sources[1].id
+        )
+
+        assert with_inactive.summary.total_emission_factors == 6
+        assert with_inactive.summary.unique_activities == 6
+        epa = next(s for s in with_inactive.by_source if s.source_id == sample_data_sources[0].id)
+        assert epa.total_factors == 4
+        assert epa.active_factors == 3
+        assert epa.geographies == ["GLO", "US"]
+        assert epa.year_range.min == 2022
+        assert defra_only.summary.total_emission_factors == 2
+        assert [s.source_name for s in defra_only.by_source] == ["DEFRA Conversion Factors"]
+
+    def test_gaps_from_rollups(
+        self,
+        clean_db_session: Session,
+        emission_factors_multi_source: list[EmissionFactor],
+        products_with_categories: list[Product],
+    ):
+        """Missing geographies and outdated factors are derived from rollup cells."""
+        from backend.api.routes.admin.coverage import build_coverage_response
+        from backend.services.coverage_rollups import (
+            load_coverage_rollups,
+            refresh_coverage_rollups,
+        )
+
+        refresh_coverage_rollups(clean_db_session)
+        source_names = dict(clean_db_session.query(DataSource.id, DataSource.name).all())
+        categories = [
+            tuple(row) for row in clean_db_session.query(
+                ProductCategory.id, ProductCategory.name, ProductCategory.code
+            ).all()
+        ]
+
+        response = build_coverage_response(
+            load_coverage_rollups(clean_db_session),
+            source_names,
+            categories,
+            current_year=2026,
+        )
+
+        missing = {g.geography: g.products_affected for g in response.gaps.missing_geographies}
+        assert missing == {"CN": 2, "BD": 1, "VN": 1, "DE": 1, "BR": 1}
+        assert [(o.source_name, o.count, o.oldest_year) for o in response.gaps.outdated_factors] == [
+            ("EPA GHG Emission Factors Hub", 1, 2022)
+        ]
+        assert sum(c.products_count for c in response.by_category) == 7
+
+    def test_stale_until_refreshed(
+        self,
+        clean_db_session: Session,
+        sample_data_sources: list[DataSource],
+        emission_factors_multi_source: list[EmissionFactor],
+    ):
+        """A sync completing after the rollups marks them stale until refresh."""
+        from backend.models import CoverageRollup, DataSyncLog
+
+        first = self._get_coverage(clean_db_session)
+        rollup_count = clean_db_session.query(CoverageRollup).count()
+
+        clean_db_session.add(EmissionFactor(
+            id=uuid.uuid4().hex,
+            activity_name="Biodiesel",
+            category="Transport",
+            co2e_factor=1.2,
+            unit="L",
+            data_source="DEFRA",
+            geography="GB",
+            reference_year=2024,
+            data_source_id=sample_data_sources[1].id,
+            is_active=True,
+        ))
+        clean_db_session.add(DataSyncLog(
+            id=uuid.uuid4().hex,
+            data_source_id=sample_data_sources[1].id,
+            sync_type="manual",
+            status="completed",
+            started_at=first.refreshed_at,
+            completed_at=datetime.now(timezone.utc),
+        ))
+        clean_db_session.commit()
+
+        cached = self._get_coverage(clean_db_session)
+        refreshed = self._get_coverage(clean_db_session, refresh=True)
+
+        assert cached.stale is True
+        assert cached.summary.total_emission_factors == 5
+        assert refreshed.stale is False
+        assert refreshed.summary.total_emission_factors == 6
+        # Previous rollup set replaced, not accumulated
+        assert clean_db_session.query(CoverageRollup).count() == rollup_count
+
+    def test_stale_after_factor_update(
+        self, clean_db_session: Session, emission_factors_multi_source: list[EmissionFactor]
+    ):
+        """A factor written outside a sync marks the rollups stale."""
+        first = self._get_coverage(clean_db_session)
+
+        factor = clean_db_session.get(EmissionFactor, emission_factors_multi_source[0].id)
+        factor.is_active = False
+        # now() is fixed for the test's outer transaction, so set it explicitly
+        factor.updated_at = datetime.now(timezone.utc)
+        clean_db_session.commit()
+
+        cached = self._get_coverage(clean_db_session)
+
+        assert first.stale is False
+        assert cached.stale is True
+        assert cached.summary.active_emission_factors == 5
+
+    def test_admin_delete_invalidates_rollups(
+        self, clean_db_session: Session, emission_factors_multi_source: list[EmissionFactor]
+    ):
+        """Deleting a factor through the admin API drops the rollups."""
+        from backend.api.routes.emission_factors import delete_emission_factor
+        from backend.services.coverage_rollups import load_coverage_rollups
+
+        first = self._get_coverage(clean_db_session)
+        delete_emission_factor(
+            factor_id=emission_factors_multi_source[0].id,
+            db=clean_db_session,
+            current_user=None,
+        )
+
+        assert load_coverage_rollups(clean_db_session) == []
+        after = self._get_coverage(clean_db_session)
+        assert first.summary.total_emission_factors == 5
+        assert after.summary.total_emission_factors == 4
+        assert after.stale is False
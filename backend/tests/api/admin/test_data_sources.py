@@ -762,3 +762,93 @@ class TestPerformance:
 
         # Assert
         assert len(result) == 10
+
+
+class TestDataSourceStatisticsQueries:
+    """Tests for the aggregated statistics and latest-sync queries."""
+
+    @staticmethod
+    def _count_statements(session: Session) -> list:
+        """Record SQL statements executed on the session's connection."""
+        from sqlalchemy import event
+
+        statements = []
+        connection = session.connection()
+        event.listen(
+            connection, "before_cursor_execute",
+            lambda conn, cursor, statement, *args: statements.append(statement),
+        )
+        return statements
+
+    def test_statistics_map_matches_factors(
+        self, clean_db_session: Session, data_source_with_emission_factors
+    ):
+        """Grouped aggregate reproduces per-source statistics, zeros for empty sources."""
+        from backend.api.routes.admin.data_sources import get_data_source_statistics_map
+
+        data_source, _ = data_source_with_emission_factors
+        empty_source = DataSource(
+            id=uuid.uuid4().hex,
+            name="Empty Source",
+            source_type="manual",
+            is_active=True,
+        )
+        clean_db_session.add(empty_source)
+        clean_db_session.commit()
+
+        stats = get_data_source_statistics_map(
+            clean_db_session, [data_source.id, empty_source.id]
+        )
+
+        assert stats[data_source.id].total_factors == 3
+        assert stats[data_source.id].active_factors == 2
+        assert stats[data_source.id].average_quality == pytest.approx(0.89)
+        assert stats[data_source.id].geographies_covered == 1
+        assert stats[data_source.id].oldest_reference_year == 2023
+        assert stats[data_source.id].newest_reference_year == 2023
+        assert stats[empty_source.id].total_factors == 0
+        assert stats[empty_source.id].average_quality is None
+
+    def test_list_uses_constant_number_of_queries(
+        self, clean_db_session: Session, data_source_with_sync_logs
+    ):
+        """Listing runs two queries however many sources exist."""
+        from backend.api.routes.admin.data_sources import list_data_sources
+
+        data_source, logs = data_source_with_sync_logs
+        unsynced_sources = [
+            DataSource(
+                id=uuid.uuid4().hex,
+                name=f"Unsynced Source {i}",
+                source_type="api",
+                sync_frequency="weekly",
+                is_active=True,
+            )
+            for i in range(5)
+        ]
+        clean_db_session.add_all(unsynced_sources)
+        clean_db_session.commit()
+        statements = self._count_statements(clean_db_session)
+
+        response = list_data_sources(is_active=None, source_type=None, db=clean_db_session)
+
+        assert len(statements) == 2
+        assert response.total == len(unsynced_sources) + 1
+        by_id = {ds.id: ds for ds in response.data_sources}
+        assert by_id[data_source.id].last_sync.sync_id == logs[0].id
+        assert all(
+            by_id[source.id].last_sync is None for source in unsynced_sources
+        )
+
+    def test_get_detail_uses_latest_sync(
+        self, clean_db_session: Session, data_source_with_sync_logs
+    ):
+        """Detail endpoint picks the most recent sync log from the lateral join."""
+        from backend.api.routes.admin.data_sources import get_data_source
+
+        data_source, logs = data_source_with_sync_logs
+
+        response = get_data_source(data_source.id, db=clean_db_session)
+
+        assert response.last_sync.sync_id == logs[0].id
+        assert response.last_sync.status == "completed"
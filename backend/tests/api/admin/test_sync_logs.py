@@ -958,3 +958,72 @@ class TestSyncLogsErrorResponses:
 
         # Assert - in API this would return 422 after validation
         assert len(result) == 0
+
+
+class TestSyncLogsQueryCount:
+    """Tests for the single-pass summary and two-query listing."""
+
+    @staticmethod
+    def _list(db: Session, **kwargs):
+        """Call the endpoint function with explicit query parameters."""
+        from backend.api.routes.admin.sync_logs import list_sync_logs
+        from backend.schemas.admin import SortOrderEnum, SyncLogSortByEnum
+
+        params = {
+            "data_source_id": None,
+            "status_filter": None,
+            "sync_type": None,
+            "start_date": None,
+            "end_date": None,
+            "has_errors": None,
+            "limit": 2,
+            "offset": 0,
+            "sort_by": SyncLogSortByEnum.started_at,
+            "sort_order": SortOrderEnum.desc,
+        }
+        params.update(kwargs)
+        return list_sync_logs(db=db, **params)
+
+    def test_summary_matches_filtered_logs(
+        self, clean_db_session: Session, multiple_sync_logs: list[DataSyncLog]
+    ):
+        """Summary aggregates agree with the logs matching the filters."""
+        from backend.schemas.admin import SyncStatusEnum
+
+        response = self._list(clean_db_session, status_filter=SyncStatusEnum.completed)
+
+        completed = [log for log in multiple_sync_logs if log.status == "completed"]
+        durations = [
+            (log.completed_at - log.started_at).total_seconds()
+            for log in completed if log.completed_at
+        ]
+        assert response.total == len(completed)
+        assert response.summary.completed_syncs == len(completed)
+        assert response.summary.failed_syncs == 0
+        assert response.summary.total_records_processed == sum(
+            log.records_processed or 0 for log in completed
+        )
+        assert response.summary.average_duration_seconds == pytest.approx(
+            sum(durations) / len(durations)
+        )
+
+    def test_listing_runs_two_queries(
+        self, clean_db_session: Session, multiple_sync_logs: list[DataSyncLog]
+    ):
+        """Filters, summary and data source details cost two statements."""
+        from sqlalchemy import event
+
+        statements = []
+        event.listen(
+            clean_db_session.connection(), "before_cursor_execute",
+            lambda conn, cursor, statement, *args: statements.append(statement),
+        )
+
+        response = self._list(
+            clean_db_session,
+            data_source_id=multiple_sync_logs[0].data_source_id,
+            has_errors=False,
+        )
+
+        assert len(statements) == 2
+        assert all(item.data_source.name for item in response.items)
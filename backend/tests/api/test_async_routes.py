@@ -0,0 +1,252 @@
+"""
+Async Route Tests (ASYNC_ROUTES)
+
+Tests for the AsyncSession handlers in products, emission_factors and
+calculations, served from an in-memory aiosqlite database:
+1. Product list/detail responses match the sync endpoints' contract
+2. Emission factor list filters and pagination
+3. Async calculation start, background execution and status polling
+   (including per-phase calculation metrics)
+"""
+
+from decimal import Decimal
+from unittest.mock import AsyncMock, patch
+from uuid import uuid4
+
+import httpx
+import pytest
+import pytest_asyncio
+from fastapi import FastAPI
+
+from backend.api.routes import calculations, emission_factors, products
+from backend.database.connection import get_async_db
+from backend.models import BillOfMaterials, EmissionFactor, PCFCalculation, Product
+from backend.utils.metrics import CALCULATIONS, CALCULATION_PHASE_DURATION
+
+
+@pytest_asyncio.fixture
+async def session_factory():
+    """Async session factory over a seeded in-memory SQLite database."""
+    from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+    from sqlalchemy.ext.asyncio import async_sessionmaker
+    from backend.models import Base
+
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:", echo=False)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    maker = async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+
+    async with maker() as session:
+        cotton = EmissionFactor(
+            id=uuid4().hex, activity_name="cotton", co2e_factor=Decimal("5.0"),
+            unit="kg", data_source="EPA", geography="GLO", category="material",
+        )
+        session.add_all([
+            cotton,
+            EmissionFactor(
+                id=uuid4().hex, activity_name="electricity_us", co2e_factor=Decimal("0.5"),
+                unit="kWh", data_source="EPA", geography="US", category="energy",
+            ),
+            EmissionFactor(
+                id=uuid4().hex, activity_name="cotton, organic", co2e_factor=Decimal("4.0"),
+                unit="kg", data_source="DEFRA", geography="GB", category="material",
+            ),
+            Product(id="shirt", code="TSHIRT-001", name="T-Shirt", unit="unit",
+                    is_finished_product=True),
+            Product(id="cotton", code="COTTON-001", name="Cotton", unit="kg",
+                    is_finished_product=False),
+            Product(id="power", code="ELECTRICITY-US-001", name="Electricity US",
+                    unit="kWh", is_finished_product=False),
+        ])
+        await session.flush()
+        session.add_all([
+            BillOfMaterials(parent_product_id="shirt", child_product_id="cotton",
+                            quantity=Decimal("0.2"), unit="kg", emission_factor_id=cotton.id),
+            # No linked factor: resolved by name fallback (electricity_us)
+            BillOfMaterials(parent_product_id="shirt", child_product_id="power",
+                            quantity=Decimal("2"), unit="kWh"),
+        ])
+        await session.commit()
+
+    yield maker
+
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def client(session_factory):
+    """HTTP client for an app serving only the async routers."""
+    app = FastAPI()
+    app.include_router(products.async_router)
+    app.include_router(calculations.async_router)
+    app.include_router(emission_factors.async_router)
+
+    async def override_get_async_db():
+        async with session_factory() as session:
+            yield session
+
+    app.dependency_overrides[get_async_db] = override_get_async_db
+
+    transport = httpx.ASGITransport(app=app)
+    with patch.object(products, "get_cached_response", AsyncMock(return_value=None)), \
+            patch.object(products, "cache_response", AsyncMock(return_value=True)):
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as http:
+            yield http
+
+
+class TestAsyncProductRoutes:
+    """Tests for list_products_async and get_product_async."""
+
+    @pytest.mark.asyncio
+    async def test_list_products(self, client):
+        """Products are listed by name with total and pagination echoed."""
+        response = await client.get("/api/v1/products", params={"limit": 2})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 3
+        assert data["limit"] == 2
+        assert [item["name"] for item in data["items"]] == ["Cotton", "Electricity US"]
+
+    @pytest.mark.asyncio
+    async def test_list_products_finished_filter(self, client):
+        """is_finished_product (and its is_finished alias) filter the list."""
+        for params in ({"is_finished_product": True}, {"is_finished": True}):
+            data = (await client.get("/api/v1/products", params=params)).json()
+            assert data["total"] == 1
+            assert data["items"][0]["code"] == "TSHIRT-001"
+
+    @pytest.mark.asyncio
+    async def test_get_product_with_bom(self, client):
+        """Product detail includes BOM items with child product names."""
+        response = await client.get("/api/v1/products/shirt")
+
+        assert response.status_code == 200
+        bom = {item["child_product_name"]: item for item in response.json()["bill_of_materials"]}
+        assert set(bom) == {"Cotton", "Electricity US"}
+        assert bom["Cotton"]["quantity"] == 0.2
+
+    @pytest.mark.asyncio
+    async def test_get_product_errors(self, client):
+        """Unknown IDs return 404 and malformed IDs 400, as in the sync route."""
+        missing = await client.get("/api/v1/products/no-such-product")
+        malformed = await client.get("/api/v1/products/not-a-uuid")
+
+        assert missing.status_code == 404
+        assert missing.json()["error"]["code"] == "PRODUCT_NOT_FOUND"
+        assert malformed.status_code == 400
+        assert malformed.json()["error"]["code"] == "INVALID_ID_FORMAT"
+
+
+class TestAsyncEmissionFactorRoutes:
+    """Tests for list_emission_factors_async."""
+
+    @pytest.mark.asyncio
+    async def test_filters_and_total(self, client):
+        """Exact and partial-match filters apply to both items and total."""
+        response = await client.get(
+            "/api/v1/emission-factors",
+            params={"activity_name": "COTTON", "data_source": "EPA"},
+        )
+
+        data = response.json()
+        assert response.status_code == 200
+        assert data["total"] == 1
+        assert data["items"][0]["activity_name"] == "cotton"
+        assert data["items"][0]["co2e_factor"] == 5.0
+
+    @pytest.mark.asyncio
+    async def test_partial_match_ranks_best_first(self, client):
+        """An exact activity name ranks ahead of longer partial matches."""
+        data = (await client.get(
+            "/api/v1/emission-factors", params={"activity_name": "cotton"}
+        )).json()
+
+        assert [item["activity_name"] for item in data["items"]] == [
+            "cotton", "cotton, organic"
+        ]
+
+
+class TestAsyncCalculationRoutes:
+    """Tests for the async calculation start/poll flow."""
+
+    @pytest.mark.asyncio
+    async def test_calculation_lifecycle(self, client, session_factory):
+        """A started calculation is queued, executed and reported completed."""
+        with patch.object(calculations, "execute_calculation_async", AsyncMock()) as task:
+            response = await client.post(
+                "/api/v1/calculate", json={"product_id": "shirt"}
+            )
+
+        assert response.status_code == 202
+        calc_id = response.json()["calculation_id"]
+        task.assert_awaited_once_with(calc_id, "shirt", "cradle_to_gate")
+
+        pending = (await client.get(f"/api/v1/calculations/{calc_id}")).json()
+        assert pending["status"] == "pending"
+
+        phases = ("bom_fetch", "ef_resolution", "compute", "persist")
+        phase_counts = {p: CALCULATION_PHASE_DURATION.labels(phase=p).count for p in phases}
+        completed = CALCULATIONS.value(status="completed")
+
+        await calculations.execute_calculation_async(
+            calc_id, "shirt", "cradle_to_gate", session_factory=session_factory
+        )
+
+        # Each phase is timed once and the outcome counted for /metrics
+        for p in phases:
+            assert CALCULATION_PHASE_DURATION.labels(phase=p).count == phase_counts[p] + 1
+        assert CALCULATIONS.value(status="completed") == completed + 1
+
+        result = (await client.get(f"/api/v1/calculations/{calc_id}")).json()
+        assert result["status"] == "completed"
+        assert result["total_co2e_kg"] == pytest.approx(2.0)
+        assert result["materials_co2e"] == pytest.approx(1.0)
+        assert result["energy_co2e"] == pytest.approx(1.0)
+        assert result["breakdown"] == {"Cotton": 1.0, "Electricity US": 1.0}
+
+    @pytest.mark.asyncio
+    async def test_missing_product_fails_calculation(self, session_factory):
+        """A product deleted after queuing marks the calculation failed."""
+        async with session_factory() as session:
+            session.add(PCFCalculation(
+                id="calc-1", product_id="shirt", calculation_type="cradle_to_gate",
+                status="pending", total_co2e_kg=0.0,
+            ))
+            await session.commit()
+
+        await calculations.execute_calculation_async(
+            "calc-1", "gone", "cradle_to_gate", session_factory=session_factory
+        )
+
+        async with session_factory() as session:
+            calculation = await session.get(PCFCalculation, "calc-1")
+            assert calculation.status == "failed"
+            assert "gone" in calculation.calculation_metadata["error_message"]
+
+    @pytest.mark.asyncio
+    async def test_failed_status_reports_error(self, client, session_factory):
+        """A failed calculation's status carries its recorded error message."""
+        async with session_factory() as session:
+            session.add(PCFCalculation(
+                id="calc-failed", product_id="shirt", calculation_type="cradle_to_gate",
+                status="failed", total_co2e_kg=0.0,
+                calculation_metadata={"error_message": "Product gone not found"},
+            ))
+            await session.commit()
+
+        data = (await client.get("/api/v1/calculations/calc-failed")).json()
+
+        assert data["status"] == "failed"
+        assert data["error_message"] == "Product gone not found"
+
+    @pytest.mark.asyncio
+    async def test_not_found_responses(self, client):
+        """Unknown products and calculations return 404."""
+        start = await client.post("/api/v1/calculate", json={"product_id": "nope"})
+        status = await client.get("/api/v1/calculations/nope")
+
+        assert start.status_code == 404
+        assert status.status_code == 404
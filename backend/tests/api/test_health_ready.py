@@ -0,0 +1,166 @@
+"""
+Test suite for lazy Brightway2 initialization and the readiness probe.
+
+This test suite validates:
+- Startup does not initialize Brightway2 unless BRIGHTWAY_EAGER_INIT is set
+- get_legacy_calculator() initializes the legacy engine on first use
+- get_legacy_engine_status() tracks cold / warm / failed states
+- GET /health/ready reports "serving" separately from the legacy engine,
+  and ?legacy=true requires a warm engine
+- /health/ready is public; the Celery and database endpoints are admin-only
+"""
+
+import sys
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend.api.routes.health import router as health_router
+from backend.calculator import pcf_calculator
+from backend.config import settings
+
+
+@pytest.fixture
+def cold_engine(monkeypatch):
+    """Legacy engine state reset to cold (restored after the test)."""
+    monkeypatch.setattr(pcf_calculator, "_calculator_instance", None)
+    monkeypatch.setattr(pcf_calculator, "_initialized", False)
+    monkeypatch.setattr(pcf_calculator, "_init_status", "cold")
+    monkeypatch.setattr(pcf_calculator, "_init_error", None)
+    monkeypatch.setattr(pcf_calculator, "_init_seconds", None)
+
+
+class TestStartup:
+    """Tests for Brightway2 staying off the startup path"""
+
+    def test_startup_skips_brightway_by_default(self, monkeypatch, cold_engine):
+        """The app serves without touching the legacy engine"""
+        init = AsyncMock()
+        monkeypatch.setattr(pcf_calculator, "initialize_pcf_calculator", init)
+        monkeypatch.setattr(settings, "BRIGHTWAY_EAGER_INIT", False)
+        from backend.main import app
+
+        with TestClient(app) as client:
+            response = client.get("/health/ready")
+
+        init.assert_not_called()
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == "serving"
+        assert data["ready"] is True
+        assert data["database"] == "ok"
+        assert data["legacy_engine"]["status"] in ("cold", "unavailable")
+
+    def test_eager_init_warms_in_background(self, monkeypatch, cold_engine):
+        """BRIGHTWAY_EAGER_INIT starts initialization without awaiting it in startup"""
+        init = AsyncMock()
+        monkeypatch.setattr(pcf_calculator, "initialize_pcf_calculator", init)
+        monkeypatch.setattr(settings, "BRIGHTWAY_EAGER_INIT", True)
+        from backend.main import app
+
+        with TestClient(app) as client:
+            client.get("/health")
+
+        init.assert_awaited_once()
+
+
+class TestLegacyEngine:
+    """Tests for lazy legacy calculator initialization"""
+
+    @pytest.mark.asyncio
+    async def test_initialized_on_first_use(self, monkeypatch, cold_engine):
+        """The first get_legacy_calculator() call runs the initialization once"""
+        calls = []
+        calculator = object()
+
+        def fake_init():
+            calls.append(1)
+            pcf_calculator._calculator_instance = calculator
+            pcf_calculator._initialized = True
+            pcf_calculator._init_status = "warm"
+
+        monkeypatch.setattr(pcf_calculator, "_initialize_brightway_sync", fake_init)
+
+        assert await pcf_calculator.get_legacy_calculator() is calculator
+        assert await pcf_calculator.get_legacy_calculator() is calculator
+        assert calls == [1]
+        assert pcf_calculator.get_legacy_engine_status()["status"] == "warm"
+
+    @pytest.mark.asyncio
+    async def test_failure_is_reported(self, monkeypatch, cold_engine):
+        """A failed initialization is visible in the engine status"""
+        monkeypatch.setitem(sys.modules, "backend.calculator.brightway_setup", None)
+
+        with pytest.raises(ImportError):
+            await pcf_calculator.get_legacy_calculator()
+
+        status = pcf_calculator.get_legacy_engine_status()
+        assert status["status"] == "failed"
+        assert "brightway_setup" in status["error"]
+
+
+class TestReadiness:
+    """Tests for GET /health/ready"""
+
+    def _client(self, startup_complete: bool) -> TestClient:
+        app = FastAPI()
+        app.include_router(health_router)
+        if startup_complete:
+            app.state.startup_complete = True
+        return TestClient(app)
+
+    def test_starting_until_startup_completes(self, cold_engine):
+        """Before the startup event finishes the probe returns 503"""
+        response = self._client(startup_complete=False).get("/health/ready")
+
+        assert response.status_code == 503
+        assert response.json()["status"] == "starting"
+
+    def test_legacy_requires_warm_engine(self, monkeypatch, cold_engine):
+        """?legacy=true is only ready once the legacy engine is warm"""
+        client = self._client(startup_complete=True)
+
+        cold = client.get("/health/ready", params={"legacy": True})
+        monkeypatch.setattr(pcf_calculator, "_init_status", "warm")
+        warm = client.get("/health/ready", params={"legacy": True})
+
+        assert cold.status_code == 503
+        assert cold.json()["status"] == "serving"
+        assert cold.json()["ready"] is False
+        assert warm.status_code == 200
+        assert warm.json()["legacy_engine"]["status"] == "warm"
+
+
+class TestHealthAccess:
+    """Tests for which health endpoints are public"""
+
+    @pytest.mark.parametrize("path", ["/health/celery", "/health/db", "/health/db/pool"])
+    def test_detail_endpoints_require_admin(self, client, auth_headers, admin_auth_headers, path):
+        """Pool, replica and worker details need an admin token"""
+        with patch("backend.api.routes.health.celery_app") as mock_celery:
+            mock_celery.control.ping.return_value = []
+            anonymous = client.get(path)
+            user = client.get(path, headers=auth_headers)
+            admin = client.get(path, headers=admin_auth_headers)
+
+        assert anonymous.status_code in (401, 403)
+        assert user.status_code == 403
+        assert admin.status_code == 200
+
+    def test_readiness_is_public(self, client):
+        """Probes can reach /health/ready without a token"""
+        assert client.get("/health/ready").status_code != 401
+
+    def test_metrics_requires_admin_without_scrape_token(
+        self, client, auth_headers, admin_auth_headers, monkeypatch
+    ):
+        """/metrics exposes pool internals too, so it is admin-only by default"""
+        from backend.config import settings
+
+        monkeypatch.setattr(settings, "METRICS_TOKEN", None)
+
+        assert client.get("/metrics").status_code == 401
+        assert client.get("/metrics", headers=auth_headers).status_code == 403
+        assert client.get("/metrics", headers=admin_auth_headers).status_code == 200
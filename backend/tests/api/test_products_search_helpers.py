@@ -315,8 +315,8 @@ class TestBuildSearchQuery:
             error=None
         )
 
-        query = _build_search_query(db_session, params)
-        results = query.all()
+        query = _build_search_query(params)
+        results = db_session.scalars(query).all()
 
         # Should find products with "laptop" in name or description
         assert len(results) >= 2, "Should find at least 2 laptops"
@@ -340,8 +340,8 @@ class TestBuildSearchQuery:
             error=None
         )
 
-        query = _build_search_query(db_session, params)
-        results = query.all()
+        query = _build_search_query(params)
+        results = db_session.scalars(query).all()
 
         assert len(results) == 1, "Should find 1 apparel product"
         assert results[0].id == "prod-tshirt-1"
@@ -363,8 +363,8 @@ class TestBuildSearchQuery:
             error=None
         )
 
-        query = _build_search_query(db_session, params)
-        results = query.all()
+        query = _build_search_query(params)
+        results = db_session.scalars(query).all()
 
         assert len(results) == 3, "Should find 3 electronics products"
 
@@ -385,8 +385,8 @@ class TestBuildSearchQuery:
             error=None
         )
 
-        query = _build_search_query(db_session, params)
-        results = query.all()
+        query = _build_search_query(params)
+        results = db_session.scalars(query).all()
 
         assert len(results) == 1, "Should find 1 Acme product"
         assert "Acme" in results[0].manufacturer
@@ -408,8 +408,8 @@ class TestBuildSearchQuery:
             error=None
         )
 
-        query = _build_search_query(db_session, params)
-        results = query.all()
+        query = _build_search_query(params)
+        results = db_session.scalars(query).all()
 
         assert len(results) == 1, "Should find 1 product from CN"
         assert results[0].country_of_origin == "CN"
@@ -431,8 +431,8 @@ class TestBuildSearchQuery:
             error=None
         )
 
-        query = _build_search_query(db_session, params)
-        results = query.all()
+        query = _build_search_query(params)
+        results = db_session.scalars(query).all()
 
         assert len(results) == 1, "Should find 1 component"
         assert results[0].is_finished_product is False
@@ -454,8 +454,8 @@ class TestBuildSearchQuery:
             error=None
         )
 
-        query = _build_search_query(db_session, params)
-        results = query.all()
+        query = _build_search_query(params)
+        results = db_session.scalars(query).all()
 
         # Only prod-laptop-1 has BOM entries as parent
         assert len(results) == 1, "Should find 1 product with BOM"
@@ -478,8 +478,8 @@ class TestBuildSearchQuery:
             error=None
         )
 
-        query = _build_search_query(db_session, params)
-        results = query.all()
+        query = _build_search_query(params)
+        results = db_session.scalars(query).all()
 
         # All products except prod-laptop-1 have no BOM
         assert len(results) == 3, "Should find 3 products without BOM"
@@ -503,8 +503,8 @@ class TestBuildSearchQuery:
             error=None
         )
 
-        query = _build_search_query(db_session, params)
-        results = query.all()
+        query = _build_search_query(params)
+        results = db_session.scalars(query).all()
 
         # Should find finished laptops in electronics
         assert len(results) >= 2
@@ -0,0 +1,195 @@
+"""
+Authentication Cache Tests
+
+Tests for backend.auth.cache:
+1. Verified-token LRU cache (expiry at exp, eviction)
+2. One verification per request shared by middleware and dependencies
+3. Short-TTL user cache attaching users without a SELECT
+"""
+
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+
+from fastapi import Depends, FastAPI, Request
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from backend.auth import cache
+from backend.auth.cache import (
+    REQUEST_CLAIMS_STATE,
+    UserCache,
+    VerifiedTokenCache,
+    decode_token_cached,
+)
+from backend.auth.jwt import (
+    InvalidTokenError,
+    TokenExpiredError,
+    create_access_token,
+    decode_token,
+)
+
+
+def _token(**claims):
+    data = {"user_id": "u-1", "username": "cached", "role": "user"}
+    data.update(claims)
+    return create_access_token(data=data)
+
+
+class TestVerifiedTokenCache:
+    """Tests for the verified token -> claims LRU cache."""
+
+    def test_cached_token_is_verified_once(self):
+        """Repeated lookups of the same token reuse the verified claims."""
+        token = _token()
+
+        with patch.object(cache, "decode_token", wraps=decode_token) as spy:
+            first = decode_token_cached(token)
+            second = decode_token_cached(token)
+
+        assert spy.call_count == 1
+        assert first is second
+        assert first["username"] == "cached"
+
+    def test_entry_expires_at_token_exp(self):
+        """A cached token is not served once its exp has passed."""
+        token_cache = VerifiedTokenCache(maxsize=10)
+        claims = decode_token(_token())
+        token_cache.put("token", claims)
+
+        assert token_cache.get("token") is claims
+
+        with patch.object(cache.time, "time", return_value=claims["exp"] + 1):
+            assert token_cache.get("token") is None
+        assert len(token_cache) == 0
+
+    def test_least_recently_used_token_is_evicted(self):
+        """The cache never holds more than maxsize tokens."""
+        token_cache = VerifiedTokenCache(maxsize=2)
+        claims = decode_token(_token())
+
+        token_cache.put("a", claims)
+        token_cache.put("b", claims)
+        token_cache.get("a")
+        token_cache.put("c", claims)
+
+        assert token_cache.get("a") is claims
+        assert token_cache.get("b") is None
+        assert len(token_cache) == 2
+
+    def test_expired_tokens_are_not_cached(self):
+        """Rejected tokens raise every time and leave the cache empty."""
+        expired = create_access_token(
+            data={"user_id": "u-1", "role": "user"},
+            expires_delta=timedelta(seconds=-1),
+        )
+
+        for _ in range(2):
+            with pytest.raises(TokenExpiredError):
+                decode_token_cached(expired)
+
+        assert len(cache.token_cache) == 0
+
+
+class TestRequestScopedClaims:
+    """Tests for sharing verified claims through request state."""
+
+    def test_middleware_and_dependency_share_one_verification(self):
+        """RateLimitMiddleware and the endpoint see claims from one decode."""
+        from backend.middleware.rate_limiting import (
+            MemoryStorage,
+            RateLimitMiddleware,
+            get_token_claims,
+        )
+
+        app = FastAPI()
+
+        def claims_dependency(request: Request):
+            return get_token_claims(request.scope)
+
+        @app.get("/whoami")
+        async def whoami(request: Request, claims=Depends(claims_dependency)):
+            token, shared = getattr(request.state, REQUEST_CLAIMS_STATE)
+            return {"role": claims["role"], "shared": shared is claims}
+
+        app.add_middleware(RateLimitMiddleware, storage=MemoryStorage())
+        client = TestClient(app)
+        headers = {"Authorization": f"Bearer {_token(role='admin')}"}
+
+        with patch.object(cache, "decode_token", wraps=decode_token) as spy:
+            response = client.get("/whoami", headers=headers)
+            assert response.json() == {"role": "admin", "shared": True}
+            assert response.headers["X-RateLimit-Limit"] == "1000"
+
+            client.get("/whoami", headers=headers)
+
+        # First request verifies the token; the second is served from cache
+        assert spy.call_count == 1
+
+    def test_invalid_token_outcome_is_shared(self):
+        """A rejected token is verified once per request, not per caller."""
+        scope = {"type": "http", "headers": []}
+
+        with patch.object(cache, "decode_token", wraps=decode_token) as spy:
+            for _ in range(3):
+                with pytest.raises(InvalidTokenError):
+                    cache.resolve_token_claims(scope, "not.a.token")
+
+        assert spy.call_count == 1
+        assert scope["state"][REQUEST_CLAIMS_STATE][0] == "not.a.token"
+
+
+class TestUserCache:
+    """Tests for the short-TTL user cache."""
+
+    def _count_selects(self, session):
+        statements = []
+
+        def before_cursor_execute(conn, cursor, statement, *args):
+            if statement.lstrip().upper().startswith("SELECT"):
+                statements.append(statement)
+
+        event.listen(session.connection(), "before_cursor_execute", before_cursor_execute)
+        return statements
+
+    def test_cached_user_is_attached_without_query(self, db_session, test_user):
+        """A cached user is merged into the session without a SELECT."""
+        user_cache = UserCache(ttl=60)
+        user_id = test_user.id
+        db_session.expunge_all()
+        selects = self._count_selects(db_session)
+
+        first = user_cache.get(db_session, user_id)
+        db_session.expunge_all()
+        second = user_cache.get(db_session, user_id)
+
+        assert len(selects) == 1
+        assert second is not first
+        assert second in db_session
+        assert second.username == test_user.username
+        assert second.role == "user"
+
+    def test_expired_and_invalidated_users_are_reloaded(self, db_session, test_user):
+        """TTL expiry and invalidate() both force a fresh lookup."""
+        user_cache = UserCache(ttl=60)
+        user_cache.get(db_session, test_user.id)
+        assert len(user_cache) == 1
+
+        user_cache.invalidate(test_user.id)
+        assert len(user_cache) == 0
+
+        user_cache.get(db_session, test_user.id)
+        now = cache.time.monotonic() + 61
+        with patch.object(cache.time, "monotonic", return_value=now):
+            db_session.expunge_all()
+            selects = self._count_selects(db_session)
+            user_cache.get(db_session, test_user.id)
+        assert len(selects) == 1
+
+    def test_missing_user_is_not_cached(self, db_session):
+        """Unknown user IDs return None and are looked up again next time."""
+        user_cache = UserCache(ttl=60)
+
+        assert user_cache.get(db_session, "no-such-user") is None
+        assert len(user_cache) == 0
@@ -0,0 +1,67 @@
+"""
+Test suite for the synthetic benchmark catalog.
+
+This test suite validates:
+- The catalog is seeded into its own schema, not the application tables
+- The schema is dropped on exit
+"""
+
+import pytest
+from sqlalchemy import create_engine, func, select, text
+
+from backend.benchmarks.catalog import SyntheticCatalog
+from backend.config import settings
+from backend.models import DataSource, EmissionFactor, Product
+
+TABLES = {
+    "data_sources": DataSource,
+    "emission_factors": EmissionFactor,
+    "products": Product,
+}
+
+
+def _counts(conn, schema: str) -> dict:
+    return {
+        name: conn.execute(
+            text(f'SELECT count(*) FROM "{schema}"."{name}"')
+        ).scalar()
+        for name in TABLES
+    }
+
+
+class TestSyntheticCatalog:
+    """Tests for schema isolation of the benchmark catalog"""
+
+    @pytest.mark.asyncio
+    async def test_public_tables_untouched(self):
+        """Seeding writes only to the benchmark schema, which is dropped on exit"""
+        engine = create_engine(settings.sync_database_url)
+        with engine.connect() as conn:
+            before = _counts(conn, "public")
+
+        async with SyntheticCatalog(products=4, seed=1) as catalog:
+            with engine.connect() as conn:
+                during_public = _counts(conn, "public")
+                seeded = _counts(conn, catalog.schema)
+            with catalog.session() as session:
+                in_session = {
+                    name: session.execute(select(func.count()).select_from(model)).scalar()
+                    for name, model in TABLES.items()
+                }
+
+        with engine.connect() as conn:
+            after = _counts(conn, "public")
+            schema_left = conn.execute(
+                text("SELECT count(*) FROM information_schema.schemata WHERE schema_name = :s"),
+                {"s": catalog.schema},
+            ).scalar()
+        engine.dispose()
+
+        assert during_public == before
+        assert after == before
+        assert seeded["data_sources"] == 1
+        assert seeded["emission_factors"] > 0
+        assert seeded["products"] >= 4
+        assert in_session == seeded
+        assert len(catalog.product_ids) == 4
+        assert schema_left == 0
@@ -0,0 +1,101 @@
+"""
+Test suite for the benchmark harness and synthetic ingestion workbooks.
+
+This test suite validates:
+- summarize() statistics and measure() warmup/iteration handling
+- compare_results() flags metrics worse than the threshold, in the right
+  direction for latencies and throughput
+- Synthetic EPA and DEFRA workbooks parse into one record per row
+
+Benchmarks that need a catalog schema are exercised by running
+`python -m backend.benchmarks` rather than in the test suite.
+"""
+
+import pytest
+
+from backend.benchmarks.harness import compare_results, measure, summarize
+from backend.benchmarks.ingestion import SOURCES
+
+
+def _document(**benchmarks):
+    return {"schema": 1, "benchmarks": benchmarks}
+
+
+class TestSummarize:
+    """Tests for latency summaries"""
+
+    def test_percentiles_and_throughput(self):
+        """Percentiles come from the sorted latencies"""
+        stats = summarize([float(ms) for ms in range(100, 0, -1)], elapsed=2.0)
+
+        assert stats["operations"] == 100
+        assert stats["ops_per_second"] == 50.0
+        assert stats["min_ms"] == 1.0
+        assert stats["p50_ms"] == 51.0
+        assert stats["p95_ms"] == 96.0
+        assert stats["max_ms"] == 100.0
+
+    def test_empty(self):
+        """No operations summarizes to zeros"""
+        stats = summarize([], elapsed=0.0)
+
+        assert stats["operations"] == 0
+        assert stats["ops_per_second"] == 0.0
+        assert stats["p99_ms"] == 0.0
+
+    def test_measure_runs_warmup_first(self):
+        """Warmup calls are made but not timed"""
+        calls = []
+        stats = measure(calls.append, iterations=10, warmup=3)
+
+        assert calls == list(range(13))
+        assert stats["operations"] == 10
+
+
+class TestCompareResults:
+    """Tests for regression detection between result documents"""
+
+    def test_slower_latency_is_regression(self):
+        """p95 above the threshold regresses; within it does not"""
+        baseline = _document(search={"p50_ms": 10.0, "p95_ms": 20.0, "ops_per_second": 100.0})
+        current = _document(search={"p50_ms": 11.0, "p95_ms": 30.0, "ops_per_second": 95.0})
+
+        rows = compare_results(baseline, current, threshold=0.15)
+        regressions = {row["metric"]: row["regression"] for row in rows}
+
+        assert regressions == {"p50_ms": False, "p95_ms": True, "ops_per_second": False}
+        assert rows[0]["metric"] == "p95_ms"
+        assert rows[0]["change"] == 0.5
+
+    def test_lower_throughput_is_regression(self):
+        """Throughput regresses when it drops, not when it rises"""
+        baseline = _document(a={"ops_per_second": 100.0}, b={"ops_per_second": 100.0})
+        current = _document(a={"ops_per_second": 50.0}, b={"ops_per_second": 200.0})
+
+        rows = compare_results(baseline, current)
+
+        assert [(row["benchmark"], row["regression"]) for row in rows] == [
+            ("a", True), ("b", False),
+        ]
+
+    def test_benchmarks_missing_from_either_side_are_skipped(self):
+        """Only benchmarks present in both documents are compared"""
+        baseline = _document(old={"p50_ms": 1.0}, both={"p50_ms": 1.0})
+        current = _document(new={"p50_ms": 1.0}, both={"p50_ms": 1.0})
+
+        assert [row["benchmark"] for row in compare_results(baseline, current)] == ["both"]
+
+
+class TestSyntheticWorkbooks:
+    """Tests for the generated EPA and DEFRA workbooks"""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("source", sorted(SOURCES))
+    async def test_workbook_parses_one_record_per_row(self, source):
+        """Connectors transform every generated row"""
+        connector, build_workbook = SOURCES[source]
+        parser = connector(None, "benchmark-source")
+
+        records = await parser.transform_data(await parser.parse_data(build_workbook(25)))
+
+        assert len(records) == 25
@@ -0,0 +1,133 @@
+"""
+Test suite for the HTTP load test scenario pack.
+
+This test suite validates:
+- Recorder counts latencies and errors per endpoint, including transport errors
+- find_saturation() picks the last scaling stage and reports what limited it
+- Scenarios drive the expected endpoint flow against an in-process app
+
+Full stepped runs against uvicorn are exercised with
+`python -m backend.benchmarks load`.
+"""
+
+import random
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from backend.benchmarks.load import (
+    LoadContext,
+    Recorder,
+    ShopperScenario,
+    find_saturation,
+)
+
+
+def _stage(users, rps, error_rate=0.0, p95_ms=10.0):
+    return {
+        "users": users,
+        "total": {"ops_per_second": rps, "error_rate": error_rate, "p95_ms": p95_ms},
+    }
+
+
+def _shop_app() -> FastAPI:
+    app = FastAPI()
+    polls = {"count": 0}
+
+    @app.get("/api/v1/products/search")
+    def search():
+        return {"items": [{"id": "p1"}]}
+
+    @app.get("/api/v1/products/{product_id}")
+    def detail(product_id: str):
+        return {"id": product_id}
+
+    @app.post("/api/v1/calculate", status_code=202)
+    def calculate():
+        return {"calculation_id": "c1"}
+
+    @app.get("/api/v1/calculations/{calculation_id}")
+    def calculation_status(calculation_id: str):
+        polls["count"] += 1
+        return {"status": "completed" if polls["count"] >= 2 else "in_progress"}
+
+    return app
+
+
+class TestRecorder:
+    """Tests for per-endpoint recording"""
+
+    @pytest.mark.asyncio
+    async def test_errors_counted_per_endpoint(self):
+        """4xx responses and transport errors count as errors"""
+        def handler(request):
+            if request.url.path == "/boom":
+                raise httpx.ConnectError("refused")
+            return httpx.Response(404 if request.url.path == "/missing" else 200)
+
+        recorder = Recorder()
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler),
+                                     base_url="http://test") as http:
+            assert await recorder.request(http, "ok", "GET", "/ok") is not None
+            assert await recorder.request(http, "ok", "GET", "/missing") is None
+            assert await recorder.request(http, "boom", "GET", "/boom") is None
+
+        report = recorder.report(elapsed=1.0)
+
+        assert report["endpoints"]["ok"]["operations"] == 2
+        assert report["endpoints"]["ok"]["errors"] == {"404": 1}
+        assert report["endpoints"]["ok"]["error_rate"] == 0.5
+        assert report["endpoints"]["boom"]["errors"] == {"ConnectError": 1}
+        assert report["total"]["operations"] == 3
+        assert report["total"]["errors"] == {"404": 1, "ConnectError": 1}
+
+
+class TestFindSaturation:
+    """Tests for locating the saturation point"""
+
+    def test_throughput_plateau(self):
+        """The stage before throughput stops growing is the saturation point"""
+        stages = [_stage(10, 100), _stage(50, 400), _stage(100, 410), _stage(200, 500)]
+
+        result = find_saturation(stages, min_gain=0.05)
+
+        assert result == {"stage": 1, "users": 50, "throughput_rps": 400, "limited_by": "throughput"}
+
+    def test_error_and_latency_limits(self):
+        """Stages over the error rate or p95 limit end the search"""
+        errors = [_stage(10, 100), _stage(50, 300, error_rate=0.2)]
+        latency = [_stage(10, 100), _stage(50, 300, p95_ms=900.0)]
+
+        assert find_saturation(errors, max_error_rate=0.01)["limited_by"] == "errors"
+        assert find_saturation(latency, p95_limit_ms=500.0)["limited_by"] == "latency"
+        assert find_saturation(latency, p95_limit_ms=500.0)["users"] == 10
+
+    def test_still_scaling_and_failing_first_stage(self):
+        """No limit reached reports the last stage; a failing first stage reports none"""
+        assert find_saturation([_stage(10, 100), _stage(50, 400)])["limited_by"] is None
+        assert find_saturation([_stage(10, 100, error_rate=1.0)])["stage"] is None
+
+
+class TestShopperScenario:
+    """Tests for the search -> detail -> calculate -> poll flow"""
+
+    @pytest.mark.asyncio
+    async def test_flow_polls_until_completed(self):
+        """Every step is recorded and polling stops at a final status"""
+        recorder = Recorder()
+        context = LoadContext(product_ids=["p1"], terms=["chair"], poll_interval=0.0)
+        scenario = ShopperScenario(context, recorder, random.Random(0))
+
+        transport = httpx.ASGITransport(app=_shop_app())
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as http:
+            await scenario.run(http, deadline=float("inf"))
+
+        assert {name: len(ms) for name, ms in recorder.latencies_ms.items()} == {
+            "product_search": 1,
+            "product_detail": 1,
+            "calculate": 1,
+            "calculation_status": 2,
+        }
+        assert recorder.errors == {}
+        assert recorder.flows == {"calculation_completed": 1}
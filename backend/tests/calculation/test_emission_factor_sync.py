@@ -6,7 +6,8 @@ Tests the sync_emission_factors() function to ensure:
 2. Each factor has correct CO2e exchange with biosphere
 3. Sync is idempotent (no duplicates on re-run)
 4. Updates to database factors are reflected in Brightway2
-5. Error handling for missing biosphere database
+5. Resyncs only write created, changed and deleted activities
+6. Error handling for missing biosphere database
 
 Following TDD methodology - tests written BEFORE implementation.
 
@@ -395,6 +396,154 @@ class TestSyncUpdatesModifiedFactors:
             "Cotton CO2e should have changed"
 
 
+class TestIncrementalSync:
+    """Test that resyncs only write changed activities."""
+
+    def test_unchanged_resync_writes_nothing(self, clean_brightway_project, db_session, seed_emission_factors):
+        """
+        Given: Emission factors synced
+        When: sync_emission_factors() is called again without changes
+        Then: Sync is incremental, nothing is written and is_sync_needed() is False
+        """
+        from backend.calculator.emission_factor_sync import (
+            is_sync_needed,
+            sync_emission_factors,
+        )
+
+        first = sync_emission_factors(db_session=db_session)
+        second = sync_emission_factors(db_session=db_session)
+
+        assert first["mode"] == "full"
+        assert second["mode"] == "incremental"
+        assert second["created"] == second["updated"] == second["deleted"] == 0
+        assert second["unchanged"] == first["created"]
+        assert second["watermark"] == first["watermark"]
+        assert is_sync_needed(db_session) is False
+
+    def test_changed_factor_rewrites_only_that_activity(self, clean_brightway_project, db_session, seed_emission_factors):
+        """
+        Given: Emission factors synced, then cotton updated in database
+        When: sync_emission_factors() is called again
+        Then: Only cotton is updated and the other activities are untouched
+        """
+        from backend.calculator.emission_factor_sync import (
+            is_sync_needed,
+            sync_emission_factors,
+        )
+
+        first = sync_emission_factors(db_session=db_session)
+        bw.projects.set_current("pcf_calculator")
+        other = next(act for act in bw.Database("pcf_emission_factors") if act["code"] != "cotton")
+
+        db_session.execute(
+            text("UPDATE emission_factors SET co2e_factor = co2e_factor + 1 WHERE activity_name = 'cotton'")
+        )
+        db_session.commit()
+        assert is_sync_needed(db_session) is True
+
+        result = sync_emission_factors(db_session=db_session)
+
+        assert result["mode"] == "incremental"
+        assert result["updated"] == 1
+        assert result["unchanged"] == first["created"] - 1
+        ef_db = bw.Database("pcf_emission_factors")
+        assert len(ef_db) == first["created"]
+        assert ef_db.get(other["code"])._document.id == other._document.id
+        cotton = ef_db.get("cotton")
+        amount = [ex for ex in cotton.exchanges() if ex["type"] == "biosphere"][0]["amount"]
+        expected = db_session.execute(
+            text("SELECT co2e_factor FROM emission_factors WHERE activity_name = 'cotton'")
+        ).scalar()
+        assert amount == float(expected)
+
+    def test_deleted_factor_removed(self, clean_brightway_project, db_session, seed_emission_factors):
+        """
+        Given: Emission factors synced, then cotton deleted from database
+        When: sync_emission_factors() is called again
+        Then: The cotton activity is removed from Brightway2
+        """
+        from backend.calculator.emission_factor_sync import (
+            get_emission_factor_activity,
+            sync_emission_factors,
+        )
+
+        first = sync_emission_factors(db_session=db_session)
+        db_session.execute(text("DELETE FROM emission_factors WHERE activity_name = 'cotton'"))
+        db_session.commit()
+
+        result = sync_emission_factors(db_session=db_session)
+
+        assert result["deleted"] == 1
+        assert get_emission_factor_activity("cotton") is None
+        assert len(bw.Database("pcf_emission_factors")) == first["created"] - 1
+
+    def test_force_rewrites_everything(self, clean_brightway_project, db_session, seed_emission_factors):
+        """
+        Given: Emission factors synced
+        When: sync_emission_factors(force=True) is called
+        Then: The database is rewritten in full and the watermark recorded
+        """
+        from backend.calculator.emission_factor_sync import (
+            get_sync_state,
+            sync_emission_factors,
+            synced_hashes,
+        )
+
+        first = sync_emission_factors(db_session=db_session)
+        result = sync_emission_factors(db_session=db_session, force=True)
+
+        assert result["mode"] == "full"
+        assert result["created"] == first["created"]
+        state = get_sync_state()
+        assert state["digest"] == result["watermark"]["digest"]
+        assert state["factor_count"] == result["synced_count"]
+        assert len(synced_hashes()) == len(bw.Database("pcf_emission_factors"))
+
+    def test_watermark_kept_out_of_database_metadata(self, clean_brightway_project, db_session, seed_emission_factors):
+        """
+        Given: Emission factors synced
+        When: The Brightway2 database metadata is inspected
+        Then: No sync state is stored there; the hashes live on the activities
+        """
+        from backend.calculator.emission_factor_sync import (
+            LEGACY_SYNC_STATE_KEY,
+            SYNC_STATE_FILE,
+            sync_emission_factors,
+            synced_hashes,
+        )
+
+        sync_emission_factors(db_session=db_session)
+
+        bw.projects.set_current("pcf_calculator")
+        assert LEGACY_SYNC_STATE_KEY not in bw.databases["pcf_emission_factors"]
+        assert os.path.exists(os.path.join(bw.projects.dir, SYNC_STATE_FILE))
+        assert None not in synced_hashes().values()
+
+    def test_activity_without_hash_is_rewritten(self, clean_brightway_project, db_session, seed_emission_factors):
+        """
+        Given: Emission factors synced, then cotton saved without a content hash
+        When: sync_emission_factors() is called again
+        Then: Only cotton is rewritten
+        """
+        from backend.calculator.emission_factor_sync import (
+            is_sync_needed,
+            sync_emission_factors,
+        )
+
+        sync_emission_factors(db_session=db_session)
+        bw.projects.set_current("pcf_calculator")
+        cotton = bw.Database("pcf_emission_factors").get("cotton")
+        del cotton["content_hash"]
+        cotton.save()
+        assert is_sync_needed(db_session) is True
+
+        result = sync_emission_factors(db_session=db_session)
+
+        assert result["mode"] == "incremental"
+        assert result["updated"] == 1
+        assert is_sync_needed(db_session) is False
+
+
 class TestErrorHandling:
     """Test error handling for missing dependencies."""
 
@@ -0,0 +1,87 @@
+"""
+Test suite for SQLAlchemyEmissionFactorProvider.get_by_category lookups.
+
+Tests that verify the cached lambda statements keep the lookup chain:
+1. Exact category match wins
+2. Case-insensitive category match, ranked ahead of activity_name matches
+3. activity_name fallback when no category matches
+4. Inactive factors are never returned
+5. Repeated lookups with different categories bind fresh parameters
+"""
+
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from backend.calculator.sqlalchemy_provider import SQLAlchemyEmissionFactorProvider
+from backend.models import Base, EmissionFactor
+
+
+def _factor(activity_name, category, co2e, is_active=True):
+    return EmissionFactor(
+        id=uuid4().hex, activity_name=activity_name, co2e_factor=Decimal(co2e),
+        unit="kg", data_source="EPA", geography="GLO", category=category,
+        is_active=is_active,
+    )
+
+
+@pytest.fixture
+def provider():
+    """Provider over an in-memory SQLite database with a few factors."""
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    session = Session(engine)
+    session.add_all([
+        _factor("steel_hot_rolled", "Steel", "1.8"),
+        _factor("steel_recycled", "metals", "0.9"),
+        _factor("aluminum", "metals", "8.2"),
+        _factor("copper", "copper", "4.0", is_active=False),
+    ])
+    session.commit()
+
+    yield SQLAlchemyEmissionFactorProvider(session)
+
+    session.close()
+    engine.dispose()
+
+
+class TestGetByCategory:
+    """Tests for the exact / case-insensitive / activity_name chain."""
+
+    @pytest.mark.asyncio
+    async def test_exact_category_match(self, provider):
+        """An exact category match is returned."""
+        result = await provider.get_by_category("Steel")
+
+        assert result.co2e_kg == pytest.approx(1.8)
+
+    @pytest.mark.asyncio
+    async def test_case_insensitive_category_match(self, provider):
+        """Category matching falls back to case-insensitive."""
+        result = await provider.get_by_category("METALS")
+
+        assert result.category == "metals"
+
+    @pytest.mark.asyncio
+    async def test_activity_name_fallback(self, provider):
+        """With no category match, activity_name is matched."""
+        result = await provider.get_by_category("Aluminum")
+
+        assert result.co2e_kg == pytest.approx(8.2)
+
+    @pytest.mark.asyncio
+    async def test_inactive_factor_not_returned(self, provider):
+        """Inactive factors are excluded from every lookup."""
+        assert await provider.get_by_category("copper") is None
+
+    @pytest.mark.asyncio
+    async def test_repeated_lookups_bind_new_category(self, provider):
+        """The cached statement is re-bound for each category."""
+        first = await provider.get_by_category("steel")
+        second = await provider.get_by_category("aluminum")
+
+        assert first.co2e_kg == pytest.approx(1.8)
+        assert second.co2e_kg == pytest.approx(8.2)
@@ -26,6 +26,12 @@ Redis Availability:
     Integration tests that require Redis should use this fixture with
     `pytest.mark.skipif` to gracefully skip when Redis is unavailable.
 
+Connector Downloads:
+    EPA and DEFRA downloads are SSRF-validated, which resolves the host
+    before the (mocked) request. Tests mocking those downloads with respx
+    use `resolved_source_hosts`, which seeds the shared DNS cache with a
+    public IP for every allowed domain so no real DNS lookup happens.
+
 Authentication Fixtures (TASK-QA-P7-029):
     The following fixtures provide authentication for tests accessing protected endpoints:
     - `test_user_factory`: Factory fixture to create test users
@@ -436,6 +442,21 @@ def client(db_session) -> Generator[TestClient, None, None]:
 # ============================================================================
 
 
+@pytest.fixture(autouse=True)
+def clear_auth_caches():
+    """
+    Empty the verified-token and user caches before each test.
+
+    Users are rolled back between tests, so a cached user must not
+    outlive the test that created it.
+    """
+    from backend.auth.cache import clear_auth_caches as clear
+
+    clear()
+    yield
+    clear()
+
+
 @pytest.fixture(scope="function")
 def test_user_factory(db_session) -> Generator[Callable, None, None]:
     """
@@ -665,13 +686,15 @@ def clean_db_session(db_session) -> Generator[Session, None, None]:
     """
     from backend.models import (
         Product, BillOfMaterials, EmissionFactor, PCFCalculation,
-        CalculationDetail, DataSource, DataSyncLog, ProductCategory
+        CalculationDetail, DataSource, DataSyncLog, ProductCategory,
+        CoverageRollup,
     )
 
     # Truncate tables in dependency order (children first)
     tables = [
         CalculationDetail, PCFCalculation, BillOfMaterials,
-        Product, EmissionFactor, DataSyncLog, DataSource, ProductCategory
+        Product, EmissionFactor, DataSyncLog, DataSource, ProductCategory,
+        CoverageRollup,
     ]
 
     for table in tables:
@@ -683,3 +706,26 @@ def clean_db_session(db_session) -> Generator[Session, None, None]:
     db_session.commit()
 
     yield db_session
+
+
+# =============================================================================
+# Connector Download Fixtures
+# =============================================================================
+
+# Public address used for allowed source hosts in tests (never connected to)
+SOURCE_HOST_TEST_IP = "93.184.216.34"
+
+
+@pytest.fixture
+def resolved_source_hosts():
+    """Seed the shared DNS cache so allowed source hosts skip real DNS."""
+    from backend.services.data_ingestion.security import (
+        get_allowed_domains,
+        get_dns_cache,
+    )
+
+    cache = get_dns_cache()
+    for domain in get_allowed_domains():
+        cache.store(domain, SOURCE_HOST_TEST_IP)
+    yield cache
+    cache.clear()
@@ -0,0 +1,179 @@
+"""
+Test suite for connection pool instrumentation and adaptive sizing.
+
+This test suite validates:
+- Histogram bucket counts and quantile estimates
+- Checkout wait, timeout and overflow recording on an instrumented pool
+- Hold time labelled with the route template of the request
+- In-place pool resizing and PoolTuner grow/shrink decisions
+
+Pools are built on SQLite files so the tests need no PostgreSQL server.
+"""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, exc, text
+
+from backend.database.pool_metrics import (
+    Histogram,
+    InstrumentedQueuePool,
+    NO_ENDPOINT,
+    PoolTuner,
+    instrument_engine,
+)
+from backend.middleware import RouteContextMiddleware
+
+
+@pytest.fixture
+def make_engine(tmp_path):
+    """Factory for instrumented SQLite engines with a given pool size."""
+    engines = []
+
+    def _make(pool_size=1, max_overflow=0, pool_timeout=0.05):
+        engine = create_engine(
+            f"sqlite:///{tmp_path / 'pool.db'}",
+            poolclass=InstrumentedQueuePool,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_timeout=pool_timeout,
+        )
+        engines.append(engine)
+        return engine, instrument_engine(engine)
+
+    yield _make
+    for engine in engines:
+        engine.dispose()
+
+
+class TestHistogram:
+    """Tests for the fixed-bucket histogram."""
+
+    def test_snapshot_is_cumulative(self):
+        """Bucket counts are cumulative with a +Inf total."""
+        histogram = Histogram((0.1, 1.0))
+        for value in (0.05, 0.5, 0.7, 5.0):
+            histogram.observe(value)
+
+        snapshot = histogram.snapshot()
+
+        assert snapshot["buckets"] == {"0.1": 1, "1.0": 3, "+Inf": 4}
+        assert snapshot["count"] == 4
+        assert snapshot["sum"] == pytest.approx(6.25)
+
+    def test_quantile_is_bucket_upper_bound(self):
+        """Quantiles resolve to the upper bound of their bucket."""
+        histogram = Histogram((0.1, 1.0))
+        assert histogram.quantile(0.5) == 0.0
+
+        for value in [0.01] * 90 + [0.5] * 10:
+            histogram.observe(value)
+
+        assert histogram.quantile(0.5) == 0.1
+        assert histogram.quantile(0.95) == 1.0
+
+
+class TestPoolInstrumentation:
+    """Tests for metrics recorded by InstrumentedQueuePool and pool events."""
+
+    def test_checkout_wait_and_hold_recorded(self, make_engine):
+        """Each checkout records a wait; checkin records a hold time."""
+        engine, metrics = make_engine()
+
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+
+        assert metrics.checkouts == 1
+        assert metrics.wait.count == 1
+        assert metrics.hold[NO_ENDPOINT].count == 1
+
+    def test_timeout_counted(self, make_engine):
+        """A checkout failing with pool_timeout is counted."""
+        engine, metrics = make_engine(pool_size=1, max_overflow=0)
+
+        with engine.connect():
+            with pytest.raises(exc.TimeoutError):
+                engine.connect()
+
+        assert metrics.timeouts == 1
+        assert metrics.recent()["timeouts"] == 1
+
+    def test_overflow_event_counted(self, make_engine):
+        """Opening a connection beyond pool_size is an overflow event."""
+        engine, metrics = make_engine(pool_size=1, max_overflow=1)
+
+        with engine.connect(), engine.connect():
+            pass
+
+        assert metrics.overflow_events == 1
+        assert metrics.peak_checked_out == 2
+
+    def test_hold_time_labelled_by_route(self, make_engine):
+        """Connections held during a request are labelled with its route template."""
+        engine, metrics = make_engine()
+        app = FastAPI()
+        app.add_middleware(RouteContextMiddleware)
+
+        @app.get("/items/{item_id}")
+        def read_item(item_id: str):
+            with engine.connect() as conn:
+                return {"value": conn.execute(text("SELECT 1")).scalar()}
+
+        client = TestClient(app)
+        client.get("/items/a")
+        client.get("/items/b")
+
+        assert metrics.hold["/items/{item_id}"].count == 2
+        assert NO_ENDPOINT not in metrics.hold
+
+
+class TestAdaptiveSizing:
+    """Tests for InstrumentedQueuePool.resize and PoolTuner."""
+
+    def test_resize_grows_and_shrinks(self, make_engine):
+        """resize() changes capacity and closes idle connections beyond it."""
+        engine, _ = make_engine(pool_size=1, max_overflow=0)
+        pool = engine.pool
+
+        pool.resize(3, 0)
+        connections = [engine.connect() for _ in range(3)]
+        for conn in connections:
+            conn.close()
+        assert pool.checkedin() == 3
+
+        pool.resize(1, 0)
+        assert pool.size() == 1
+        assert pool.checkedin() == 1
+        assert pool.overflow() == 0
+
+    def test_tuner_grows_pool_then_overflow(self, make_engine):
+        """Slow checkouts grow pool_size up to max_size, then max_overflow."""
+        engine, metrics = make_engine(pool_size=2, max_overflow=1)
+        tuner = PoolTuner(engine.pool, min_size=2, max_size=4, max_overflow_limit=3,
+                          target_wait=0.05, step=2)
+        metrics.record_wait(0.2, checked_out=2)
+
+        tuner.adjust()
+        assert (engine.pool.size(), engine.pool._max_overflow) == (4, 1)
+
+        tuner.adjust()
+        assert (engine.pool.size(), engine.pool._max_overflow) == (4, 3)
+        assert len(tuner.status()["adjustments"]) == 2
+
+    def test_tuner_shrinks_idle_pool(self, make_engine):
+        """Fast checkouts with spare connections shrink the pool toward min_size."""
+        engine, metrics = make_engine(pool_size=6, max_overflow=0)
+        tuner = PoolTuner(engine.pool, min_size=2, max_size=10, max_overflow_limit=0,
+                          target_wait=0.05, step=2)
+        metrics.record_wait(0.0001, checked_out=1)
+        metrics.reset_peak(1)
+
+        tuner.adjust()
+        assert engine.pool.size() == 4
+
+    def test_tuner_requires_instrumented_pool(self, tmp_path):
+        """PoolTuner refuses a pool without metrics attached."""
+        engine = create_engine(f"sqlite:///{tmp_path / 'x.db'}", poolclass=InstrumentedQueuePool)
+        with pytest.raises(ValueError):
+            PoolTuner(engine.pool, min_size=1, max_size=2, max_overflow_limit=0)
+        engine.dispose()
@@ -0,0 +1,238 @@
+"""
+Test suite for read-replica routing.
+
+This test suite validates:
+- Round-robin replica choice with health-aware failover to the primary
+- RoutingSession reads from a replica and pins to the primary after a write
+- Read-your-writes across requests via get_db/get_read_db stickiness
+- Optional: routing against two live PostgreSQL instances
+
+The unit tests use separate SQLite files holding different rows for the
+primary and each replica, so the rows a query returns show where it ran.
+Set PCF_TEST_REPLICA_DATABASE_URL (a second Postgres, e.g. on port 5433)
+to run the live test.
+"""
+
+import os
+from unittest.mock import patch
+
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, select, text, update
+from sqlalchemy.orm import Session, sessionmaker
+
+from backend.database import connection, replicas
+from backend.database.replicas import (
+    RecentWrites,
+    ReplicaRouter,
+    RoutingSession,
+    SESSION_WROTE,
+    track_writes,
+)
+from backend.models import Base, Product
+
+
+pytestmark = pytest.mark.database
+
+
+def _sqlite_engine(path, product_name=None):
+    """SQLite file engine, optionally seeded with one product."""
+    engine = create_engine(f"sqlite:///{path}")
+    if product_name is not None:
+        Base.metadata.create_all(engine)
+        with Session(engine) as session:
+            session.add(Product(
+                id=product_name, code=product_name.upper(), name=product_name,
+                unit="kg", is_finished_product=False,
+            ))
+            session.commit()
+    return engine
+
+
+@pytest.fixture
+def engines(tmp_path):
+    """Primary, two replicas and an unreachable replica."""
+    created = {
+        "primary": _sqlite_engine(tmp_path / "primary.db", "primary"),
+        "replica_a": _sqlite_engine(tmp_path / "a.db", "replica_a"),
+        "replica_b": _sqlite_engine(tmp_path / "b.db", "replica_b"),
+        "dead": _sqlite_engine(tmp_path / "missing" / "dead.db"),
+    }
+    yield created
+    for engine in created.values():
+        engine.dispose()
+
+
+def _names(session):
+    return [name for name in session.scalars(select(Product.name))]
+
+
+class TestReplicaRouter:
+    """Tests for replica choice and failover."""
+
+    def test_round_robin(self, engines):
+        """Healthy replicas are used in turn."""
+        router = ReplicaRouter(engines["primary"], [engines["replica_a"], engines["replica_b"]])
+
+        chosen = [router.read_engine() for _ in range(4)]
+
+        assert chosen == [engines["replica_a"], engines["replica_b"]] * 2
+
+    def test_failed_replica_is_skipped(self, engines):
+        """An unreachable replica is skipped until retry_after passes."""
+        router = ReplicaRouter(
+            engines["primary"], [engines["dead"], engines["replica_a"]], retry_after=30
+        )
+
+        assert [router.read_engine() for _ in range(3)] == [engines["replica_a"]] * 3
+        assert [r["healthy"] for r in router.status()] == [False, True]
+
+        # Once retry_after has passed, the failed replica is probed again
+        later = replicas.time.monotonic() + 31
+        with patch.object(replicas.time, "monotonic", return_value=later), \
+                patch.object(router, "_probe", wraps=router._probe) as probe:
+            router.read_engine()
+            router.read_engine()
+        assert 0 in [call.args[0] for call in probe.call_args_list]
+
+    def test_falls_back_to_primary(self, engines):
+        """With no healthy replica, reads go to the primary."""
+        router = ReplicaRouter(engines["primary"], [engines["dead"]])
+
+        assert router.read_engine() is engines["primary"]
+
+    def test_mark_down_removes_replica_from_rotation(self, engines):
+        """mark_down() (e.g. on a disconnect error) skips the replica."""
+        router = ReplicaRouter(engines["primary"], [engines["replica_a"], engines["replica_b"]])
+
+        router.mark_down(engines["replica_a"])
+
+        assert {router.read_engine() for _ in range(4)} == {engines["replica_b"]}
+
+
+class TestRoutingSession:
+    """Tests for per-session read/write routing."""
+
+    def test_reads_from_replica_and_pins_after_write(self, engines):
+        """Reads use one replica until the session writes, then the primary."""
+        router = ReplicaRouter(engines["primary"], [engines["replica_a"]])
+        session = RoutingSession(router=router)
+
+        assert _names(session) == ["replica_a"]
+
+        session.add(Product(id="new", code="NEW", name="new", unit="kg"))
+        session.commit()
+
+        assert session.info[SESSION_WROTE] is True
+        assert sorted(_names(session)) == ["new", "primary"]
+        session.close()
+
+    def test_bulk_update_runs_on_primary(self, engines):
+        """ORM UPDATE statements are routed to the primary."""
+        router = ReplicaRouter(engines["primary"], [engines["replica_a"]])
+        session = RoutingSession(router=router)
+
+        session.execute(update(Product).values(unit="g"))
+        session.commit()
+
+        with Session(engines["primary"]) as primary:
+            assert primary.scalar(select(Product.unit)) == "g"
+        with Session(engines["replica_a"]) as replica:
+            assert replica.scalar(select(Product.unit)) == "kg"
+        session.close()
+
+    def test_textual_sql_runs_on_primary_without_pinning(self, engines):
+        """text() statements run on the primary but later reads stay on the replica."""
+        router = ReplicaRouter(engines["primary"], [engines["replica_a"]])
+        session = RoutingSession(router=router)
+
+        assert session.execute(text("SELECT name FROM products")).scalar() == "primary"
+        assert _names(session) == ["replica_a"]
+        assert SESSION_WROTE not in session.info
+        session.close()
+
+
+class TestRecentWrites:
+    """Tests for cross-request read-your-writes tracking."""
+
+    def test_window_expires(self):
+        """A writer is sticky for `window` seconds."""
+        writes = RecentWrites(window=5)
+        writes.record("user:1")
+
+        assert writes.is_recent("user:1")
+        assert not writes.is_recent("user:2")
+
+        later = replicas.time.monotonic() + 6
+        with patch.object(replicas.time, "monotonic", return_value=later):
+            assert not writes.is_recent("user:1")
+        assert len(writes) == 0
+
+
+class TestReadDependency:
+    """Tests for get_read_db with replicas configured."""
+
+    @pytest.fixture
+    def client(self, engines, monkeypatch):
+        router = ReplicaRouter(engines["primary"], [engines["replica_a"]])
+        primary_sessions = sessionmaker(bind=engines["primary"], autoflush=False)
+        track_writes(primary_sessions)
+
+        monkeypatch.setattr(connection, "SessionLocal", primary_sessions)
+        monkeypatch.setattr(
+            connection, "ReadSessionLocal",
+            sessionmaker(class_=RoutingSession, router=router, autoflush=False),
+        )
+        monkeypatch.setattr(connection, "recent_writes", RecentWrites(window=5))
+
+        app = FastAPI()
+
+        @app.get("/names")
+        def names(db: Session = Depends(connection.get_read_db)):
+            return sorted(_names(db))
+
+        @app.post("/products")
+        def create(db: Session = Depends(connection.get_db)):
+            db.add(Product(id="new", code="NEW", name="new", unit="kg"))
+            db.commit()
+            return {"ok": True}
+
+        return TestClient(app)
+
+    def test_reads_are_routed_to_replica(self, client):
+        """Read-only dependencies are served from the replica."""
+        assert client.get("/names").json() == ["replica_a"]
+
+    def test_writer_reads_own_writes(self, client):
+        """After a write through get_db, the caller's reads use the primary."""
+        client.post("/products")
+
+        assert client.get("/names").json() == ["new", "primary"]
+
+        later = replicas.time.monotonic() + 6
+        with patch.object(replicas.time, "monotonic", return_value=later):
+            assert client.get("/names").json() == ["replica_a"]
+
+
+@pytest.mark.skipif(
+    not os.getenv("PCF_TEST_REPLICA_DATABASE_URL"),
+    reason="PCF_TEST_REPLICA_DATABASE_URL not set (second PostgreSQL instance)",
+)
+class TestLiveReplica:
+    """Routing against two live PostgreSQL instances."""
+
+    def test_reads_hit_replica_server(self):
+        """Reads run on the replica server and writes on the primary."""
+        replica = create_engine(os.environ["PCF_TEST_REPLICA_DATABASE_URL"])
+        router = ReplicaRouter(connection.engine, [replica])
+        session = RoutingSession(router=router)
+        port_query = select(text("inet_server_port()"))
+        try:
+            assert session.execute(port_query).scalar() == (replica.url.port or 5432)
+
+            session.execute(text("SELECT 1"))  # textual SQL: primary, not pinned
+            assert session.execute(port_query).scalar() == (replica.url.port or 5432)
+        finally:
+            session.close()
+            replica.dispose()
@@ -0,0 +1,86 @@
+"""
+Test suite for pg_trgm partial-match helpers.
+
+This test suite validates:
+- Non-PostgreSQL databases report pg_trgm as unavailable without querying
+- Fallback ordering ranks the shortest matching name first
+- similarity() ranking is only added when pg_trgm is available
+"""
+
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from backend.database.trigram import partial_match_order, trigram_available
+from backend.models import Base, EmissionFactor
+from backend.models.base import generate_uuid
+
+
+pytestmark = pytest.mark.database
+
+
+@pytest.fixture
+def sqlite_session():
+    """In-memory SQLite session with a few emission factors."""
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+
+    for name in ("Steel, hot rolled coil, galvanized", "Steel, hot rolled", "Aluminum"):
+        session.add(EmissionFactor(
+            id=generate_uuid(),
+            activity_name=name,
+            co2e_factor=Decimal("1.0"),
+            unit="kg",
+            data_source="EPA",
+            geography="GLO",
+            category="material",
+        ))
+    session.commit()
+
+    yield session
+
+    session.close()
+    engine.dispose()
+
+
+class TestTrigramAvailability:
+    """Tests for pg_trgm detection."""
+
+    def test_sqlite_is_not_trigram_capable(self, sqlite_session):
+        """SQLite sessions never use trigram ranking."""
+        assert trigram_available(sqlite_session) is False
+
+
+class TestPartialMatchOrder:
+    """Tests for partial match ORDER BY construction."""
+
+    def test_fallback_prefers_shortest_name(self, sqlite_session):
+        """Without pg_trgm the most specific (shortest) match comes first."""
+        query = (
+            select(EmissionFactor.activity_name)
+            .where(EmissionFactor.activity_name.ilike("%hot rolled%"))
+            .order_by(*partial_match_order(EmissionFactor.activity_name, "hot rolled", False))
+        )
+
+        names = sqlite_session.execute(query).scalars().all()
+
+        assert names == ["Steel, hot rolled", "Steel, hot rolled coil, galvanized"]
+
+    def test_similarity_ranking_added_when_available(self):
+        """With pg_trgm, similarity() leads the ORDER BY."""
+        order = partial_match_order(EmissionFactor.activity_name, "steel", True)
+        sql = str(
+            select(EmissionFactor.id).order_by(*order).compile(dialect=postgresql.dialect())
+        )
+
+        assert "ORDER BY similarity(emission_factors.activity_name" in sql
+        assert len(order) == 3
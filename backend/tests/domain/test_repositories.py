@@ -60,6 +60,12 @@ class TestProductRepositoryInterface:
 
         assert hasattr(ProductRepository, 'create')
 
+    def test_product_repository_has_count_method(self):
+        """ProductRepository should define count abstract method."""
+        from backend.domain.repositories.interfaces import ProductRepository
+
+        assert hasattr(ProductRepository, 'count')
+
     def test_product_repository_has_get_with_bom_method(self):
         """ProductRepository should define get_with_bom abstract method."""
         from backend.domain.repositories.interfaces import ProductRepository
@@ -411,6 +417,26 @@ class TestSQLAlchemyCalculationRepository:
         assert result.status == "pending"
 
 
+    async def test_create_pending_stores_calculation_type(self):
+        """create_pending should add a pending record of the requested type."""
+        from backend.infrastructure.repositories.sqlalchemy_calculation_repository import (
+            SQLAlchemyCalculationRepository
+        )
+
+        mock_session = AsyncMock()
+        mock_session.add = MagicMock()
+
+        repo = SQLAlchemyCalculationRepository(mock_session)
+        result = await repo.create_pending("prod-123", "cradle_to_grave")
+
+        orm_calc = mock_session.add.call_args.args[0]
+        assert orm_calc.id == result.id
+        assert orm_calc.calculation_type == "cradle_to_grave"
+        assert orm_calc.status == "pending"
+        assert orm_calc.created_at.tzinfo is None
+        assert mock_session.commit.called
+
+
 class TestRepositoryInterfaceModulePurity:
     """Test that repository interfaces module has no infrastructure imports."""
 
@@ -137,6 +137,31 @@ class TestProductService:
         assert all(isinstance(p, Product) for p in products)
         mock_repo.list_all.assert_called_once_with(limit=10, offset=0)
 
+    async def test_list_products_page(self):
+        """list_products_page should return the filtered page and total count."""
+        from backend.domain.services.product_service import ProductService
+        from backend.domain.repositories.interfaces import ProductRepository
+        from backend.domain.entities.product import Product
+
+        mock_repo = AsyncMock(spec=ProductRepository)
+        mock_repo.list_all.return_value = [
+            Product(id="prod-1", code="P1", name="Product 1", unit="kg",
+                    is_finished_product=True),
+        ]
+        mock_repo.count.return_value = 7
+
+        service = ProductService(product_repo=mock_repo)
+        products, total = await service.list_products_page(
+            limit=1, offset=2, is_finished_product=True
+        )
+
+        assert [p.id for p in products] == ["prod-1"]
+        assert total == 7
+        mock_repo.list_all.assert_called_once_with(
+            limit=1, offset=2, is_finished_product=True
+        )
+        mock_repo.count.assert_called_once_with(is_finished_product=True)
+
     async def test_create_product(self):
         """create_product should validate and create product."""
         from backend.domain.services.product_service import ProductService
@@ -276,6 +301,59 @@ class TestCalculationService:
         # Verify create was NOT called
         mock_calc_repo.create.assert_not_called()
 
+    async def test_start_calculation_creates_pending_record(self):
+        """start_calculation should check the product, then create a pending record."""
+        from backend.domain.services.calculation_service import CalculationService
+        from backend.domain.repositories.interfaces import (
+            CalculationRepository,
+            ProductRepository
+        )
+        from backend.domain.entities.calculation import CalculationResult
+        from backend.domain.entities.product import Product
+
+        mock_calc_repo = AsyncMock(spec=CalculationRepository)
+        mock_product_repo = AsyncMock(spec=ProductRepository)
+        mock_product_repo.get_by_id.return_value = Product(
+            id="prod-123", code="WIDGET-001", name="Steel Widget", unit="kg"
+        )
+        mock_calc_repo.create_pending.return_value = CalculationResult(
+            id="calc-456", status="pending", product_id="prod-123"
+        )
+
+        service = CalculationService(
+            calculation_repo=mock_calc_repo,
+            product_repo=mock_product_repo
+        )
+        result = await service.start_calculation("prod-123", "cradle_to_grave")
+
+        assert result.id == "calc-456"
+        mock_calc_repo.create_pending.assert_called_once_with(
+            "prod-123", "cradle_to_grave"
+        )
+
+    async def test_start_calculation_raises_for_nonexistent_product(self):
+        """start_calculation should raise without creating a record."""
+        from backend.domain.services.calculation_service import CalculationService
+        from backend.domain.repositories.interfaces import (
+            CalculationRepository,
+            ProductRepository
+        )
+        from backend.domain.entities.errors import ProductNotFoundError
+
+        mock_calc_repo = AsyncMock(spec=CalculationRepository)
+        mock_product_repo = AsyncMock(spec=ProductRepository)
+        mock_product_repo.get_by_id.return_value = None
+
+        service = CalculationService(
+            calculation_repo=mock_calc_repo,
+            product_repo=mock_product_repo
+        )
+
+        with pytest.raises(ProductNotFoundError):
+            await service.start_calculation("missing", "cradle_to_gate")
+
+        mock_calc_repo.create_pending.assert_not_called()
+
     async def test_get_calculation(self):
         """get_calculation should return Calculation domain entity."""
         from backend.domain.services.calculation_service import CalculationService
@@ -32,7 +32,10 @@ from sqlalchemy.orm import Session
 
 
 # Mark all tests in this module as integration tests
-pytestmark = pytest.mark.integration
+pytestmark = [
+    pytest.mark.integration,
+    pytest.mark.usefixtures("resolved_source_hosts"),
+]
 # Uses db_session fixture from conftest.py (PostgreSQL with transaction rollback)
 
 @pytest.fixture
@@ -35,6 +35,9 @@ from sqlalchemy.pool import StaticPool
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 
+# Downloads are SSRF-validated; resolve source hosts from the DNS cache
+pytestmark = pytest.mark.usefixtures("resolved_source_hosts")
+
 
 # =============================================================================
 # Test Fixtures
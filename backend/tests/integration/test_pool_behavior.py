@@ -39,8 +39,8 @@ from fastapi.testclient import TestClient
 
 
 @pytest.fixture
-def client(db_session):
-    """TestClient with database override."""
+def client(db_session, admin_auth_headers):
+    """TestClient with database override, authenticated as admin for /health/db."""
     from backend.main import app
     from backend.database.connection import get_db
 
@@ -52,6 +52,7 @@ def client(db_session):
 
     app.dependency_overrides[get_db] = override_get_db
     with TestClient(app) as test_client:
+        test_client.headers.update(admin_auth_headers)
         yield test_client
     app.dependency_overrides.clear()
 
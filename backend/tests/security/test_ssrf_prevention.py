@@ -35,6 +35,16 @@ from typing import List
 # Test Fixtures
 # ============================================================================
 
+@pytest.fixture(autouse=True)
+def clear_shared_dns_cache():
+    """Validators share the process-wide DNS cache; isolate each test."""
+    from backend.services.data_ingestion.security import get_dns_cache
+
+    get_dns_cache().clear()
+    yield
+    get_dns_cache().clear()
+
+
 @pytest.fixture
 def allowed_domains() -> List[str]:
     """Standard allowed domains for emission factor data sources."""
@@ -1171,8 +1181,13 @@ class TestAllowedDomainsConfiguration:
             pytest.skip("get_allowed_domains not yet implemented")
 
         domains = get_allowed_domains()
-        # Only EPA and DEFRA domains should be in allowed list
-        assert all("epa.gov" in d or "defra" in d or "beis" in d for d in domains)
+        # Only EPA and DEFRA domains (and the GOV.UK CDN hosting the DEFRA
+        # workbooks) should be in allowed list
+        assert all(
+            "epa.gov" in d or "defra" in d or "beis" in d
+            or d == "assets.publishing.service.gov.uk"
+            for d in domains
+        )
 
     def test_get_allowed_domains_returns_copy(self):
         """Test that get_allowed_domains returns a copy (not original list)."""
@@ -1281,3 +1296,172 @@ class TestSafeHTTPClientIntegration:
         )
 
         assert client.max_size == max_size
+
+
+# ============================================================================
+# DNS Resolution Cache and Pinning
+# ============================================================================
+
+class TestDNSResolutionCache:
+    """Test that DNS outcomes are memoized and connections pinned."""
+
+    def test_repeated_validation_resolves_once(self, url_validator):
+        """Test that a host is resolved once within the cache TTL."""
+        with patch('socket.gethostbyname', return_value='52.0.0.1') as mock_dns:
+            url_validator.validate("https://api.epa.gov/a")
+            url_validator.validate("https://api.epa.gov/b")
+
+        assert mock_dns.call_count == 1
+
+    def test_blocked_outcome_is_memoized(self, url_validator):
+        """Test that a private-IP answer keeps blocking from cache."""
+        from backend.services.data_ingestion.security.exceptions import (
+            SSRFBlockedError
+        )
+
+        with patch('socket.gethostbyname', return_value='10.0.0.1') as mock_dns:
+            for _ in range(2):
+                with pytest.raises(SSRFBlockedError) as exc_info:
+                    url_validator.validate("https://api.epa.gov/data")
+                assert "private" in str(exc_info.value).lower()
+
+        assert mock_dns.call_count == 1
+
+    def test_expired_entry_is_resolved_again(self, allowed_domains):
+        """Test that entries expire after the TTL."""
+        from backend.services.data_ingestion.security import (
+            DNSResolutionCache,
+            URLValidator,
+        )
+
+        validator = URLValidator(
+            allowed_domains=allowed_domains,
+            dns_cache=DNSResolutionCache(ttl_seconds=0.0),
+        )
+
+        with patch('socket.gethostbyname', return_value='52.0.0.1') as mock_dns:
+            validator.validate("https://api.epa.gov/a")
+            validator.validate("https://api.epa.gov/b")
+
+        assert mock_dns.call_count == 2
+
+    def test_validators_share_process_cache(self, allowed_domains):
+        """Test that validators built per download reuse one cache."""
+        from backend.services.data_ingestion.security import (
+            URLValidator,
+            get_dns_cache,
+        )
+
+        first = URLValidator(allowed_domains=allowed_domains)
+        second = URLValidator(allowed_domains=allowed_domains)
+
+        with patch('socket.gethostbyname', return_value='52.0.0.1') as mock_dns:
+            first.validate("https://api.epa.gov/a")
+            second.validate("https://api.epa.gov/b")
+
+        assert first.dns_cache is second.dns_cache is get_dns_cache()
+        assert mock_dns.call_count == 1
+
+    def test_cache_is_bounded(self):
+        """Test that the least recently used host is evicted."""
+        from backend.services.data_ingestion.security import DNSResolutionCache
+
+        cache = DNSResolutionCache(max_entries=2)
+        cache.store("a.example", "52.0.0.1")
+        cache.store("b.example", "52.0.0.2")
+        cache.store("c.example", "52.0.0.3")
+
+        assert len(cache) == 2
+        assert cache.lookup("a.example") is None
+        assert cache.lookup("c.example") == "52.0.0.3"
+
+    @pytest.mark.asyncio
+    async def test_validate_async_returns_pinned_ip(self, url_validator):
+        """Test that async validation returns the validated IP."""
+        with patch('socket.gethostbyname', return_value='52.0.0.1'):
+            ip = await url_validator.validate_async("https://api.epa.gov/data")
+
+        assert ip == "52.0.0.1"
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_redirect_hops_reuse_cached_resolution(self, safe_http_client):
+        """Test that redirects to the same host do not re-resolve."""
+        respx.get("https://api.epa.gov/start").mock(
+            return_value=httpx.Response(302, headers={"Location": "/next"})
+        )
+        respx.get("https://api.epa.gov/next").mock(
+            return_value=httpx.Response(200, content=b"ok")
+        )
+
+        with patch('socket.gethostbyname', return_value='52.0.0.1') as mock_dns:
+            response = await safe_http_client.get("https://api.epa.gov/start")
+
+        assert response.status_code == 200
+        assert mock_dns.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_pinned_backend_connects_to_validated_ip(self):
+        """Test that connections go to the pinned IP, not a new DNS answer."""
+        from backend.services.data_ingestion.security.safe_http_client import (
+            PinnedNetworkBackend
+        )
+
+        inner = AsyncMock()
+        backend = PinnedNetworkBackend({"api.epa.gov": "52.0.0.1"}, inner)
+
+        await backend.connect_tcp("api.epa.gov", 443)
+
+        assert inner.connect_tcp.call_args.args[0] == "52.0.0.1"
+
+    @pytest.mark.asyncio
+    async def test_pinned_backend_refuses_unvalidated_host(self):
+        """Test that hosts without a pin cannot be connected to."""
+        from backend.services.data_ingestion.security.safe_http_client import (
+            PinnedNetworkBackend
+        )
+        from backend.services.data_ingestion.security.exceptions import (
+            SSRFBlockedError
+        )
+
+        backend = PinnedNetworkBackend({}, AsyncMock())
+
+        with pytest.raises(SSRFBlockedError):
+            await backend.connect_tcp("evil.example", 443)
+
+    @pytest.mark.asyncio
+    async def test_client_request_connects_to_pinned_ip(self, safe_http_client):
+        """Test that a SafeHTTPClient request is sent to the validated IP."""
+        import asyncio
+
+        requests_seen = []
+
+        async def serve(reader, writer):
+            head = await reader.readuntil(b"\r\n\r\n")
+            requests_seen.append(head.decode())
+            writer.write(
+                b"HTTP/1.1 200 OK\r\nContent-Length: 6\r\n"
+                b"Connection: close\r\n\r\npinned"
+            )
+            await writer.drain()
+            writer.close()
+
+        server = await asyncio.start_server(serve, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+
+        # The hostname only reaches the local server through the pin
+        validate = AsyncMock(return_value="127.0.0.1")
+        try:
+            with patch.object(safe_http_client.validator, "validate_async", validate):
+                response = await safe_http_client.get(
+                    f"http://api.epa.gov:{port}/data"
+                )
+        finally:
+            server.close()
+            await server.wait_closed()
+
+        assert response.status_code == 200
+        assert response.content == b"pinned"
+        assert len(requests_seen) == 1
+        assert requests_seen[0].startswith("GET /data HTTP/1.1")
+        assert f"Host: api.epa.gov:{port}" in requests_seen[0]
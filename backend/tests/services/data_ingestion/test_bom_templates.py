@@ -371,6 +371,83 @@ class TestBOMTemplateTransport:
         assert ship.qty_range[1] == pytest.approx(expected_ship_mid * 1.1, rel=0.01)
 
 
+class TestBOMTemplateSampleQuantities:
+    """Test vectorized quantity sampling."""
+
+    @staticmethod
+    def _template():
+        from backend.services.data_ingestion.bom_templates.base import (
+            BOMTemplate,
+            ComponentSpec,
+        )
+
+        return BOMTemplate(
+            name="test",
+            industry="test",
+            base_components=[
+                ComponentSpec("steel", (1.0, 2.0), "kg"),
+                ComponentSpec("steel", (0.5, 0.5), "kg"),
+                ComponentSpec("paint", (0.1, 0.2), "kg", optional=True, probability=0.0),
+                ComponentSpec("glue", (0.1, 0.2), "kg", optional=True, probability=1.0),
+            ],
+            variants={"heavy": {"steel": 2.0}, "bare": {"glue": 0}},
+            typical_mass_kg=1000.0,
+        )
+
+    def test_quantities_within_variant_ranges(self):
+        """Variant modifiers scale the merged range of same-named components."""
+        import numpy as np
+
+        template = self._template()
+        sample = template.sample_quantities(["heavy"] * 500 + [None] * 500, np.random.default_rng(0))
+        steel = [spec.name for spec in sample.specs].index("steel")
+
+        assert sample.quantities.shape == (1000, 5)
+        assert sample.quantities[:500, steel].min() >= 3.0
+        assert sample.quantities[:500, steel].max() <= 5.0
+        assert sample.quantities[500:, steel].min() >= 1.5
+        assert sample.quantities[500:, steel].max() <= 2.5
+
+    def test_masks_exclude_components(self):
+        """Zero modifiers and failed optional draws drop components."""
+        import numpy as np
+
+        template = self._template()
+        sample = template.sample_quantities(["bare", None], np.random.default_rng(0))
+        names = [spec.name for spec in sample.specs]
+
+        assert not sample.included[:, names.index("paint")].any()
+        assert sample.included[:, names.index("glue")].tolist() == [False, True]
+        assert sample.quantities[0, names.index("glue")] == 0.0
+
+    def test_components_for_yields_decimals(self):
+        """Conversion to Decimal happens per product on request."""
+        import numpy as np
+
+        sample = self._template().sample_quantities([None], np.random.default_rng(0))
+        components = dict(
+            (spec.name, qty) for spec, qty in sample.components_for(0)
+        )
+
+        assert set(components) == {"steel", "glue", "transport_truck", "transport_ship"}
+        assert all(isinstance(qty, Decimal) for qty in components.values())
+
+    def test_seeded_sampling_is_reproducible(self):
+        """The same generator seed yields the same quantities."""
+        import numpy as np
+
+        template = self._template()
+        first = template.sample_quantities(["heavy", None], np.random.default_rng(7))
+        second = template.sample_quantities(["heavy", None], np.random.default_rng(7))
+
+        assert (first.quantities == second.quantities).all()
+
+    def test_unknown_variant_raises(self):
+        """Unknown variants raise KeyError."""
+        with pytest.raises(KeyError):
+            self._template().sample_quantities(["missing"])
+
+
 # ============================================================================
 # Industry Template Integration Tests
 # ============================================================================
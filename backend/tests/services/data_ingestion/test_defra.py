@@ -223,6 +223,7 @@ class TestDEFRAIngestionInstantiation:
 # Test Scenario 2: fetch_raw_data Downloads from Correct URL
 # ============================================================================
 
+@pytest.mark.usefixtures("resolved_source_hosts")
 class TestFetchRawData:
     """Test fetch_raw_data method downloads from correct URL."""
 
@@ -232,6 +233,8 @@ class TestFetchRawData:
     ):
         """Test that fetch_raw_data downloads Excel file."""
         try:
+            import httpx
+            import respx
             from backend.services.data_ingestion.defra_ingestion import (
                 DEFRAEmissionFactorsIngestion
             )
@@ -243,19 +246,10 @@ class TestFetchRawData:
             data_source_id=data_source_id
         )
 
-        # Mock httpx response
-        with patch('httpx.AsyncClient') as mock_client:
-            mock_response = MagicMock()
-            mock_response.content = sample_defra_workbook
-            mock_response.raise_for_status = MagicMock()
-
-            mock_client_instance = AsyncMock()
-            mock_client_instance.get = AsyncMock(return_value=mock_response)
-            mock_client_instance.__aenter__ = AsyncMock(
-                return_value=mock_client_instance
+        with respx.mock:
+            respx.get(DEFRAEmissionFactorsIngestion.DEFRA_URL).mock(
+                return_value=httpx.Response(200, content=sample_defra_workbook)
             )
-            mock_client_instance.__aexit__ = AsyncMock(return_value=None)
-            mock_client.return_value = mock_client_instance
 
             result = await ingestion.fetch_raw_data()
 
@@ -269,6 +263,8 @@ class TestFetchRawData:
     ):
         """Test that fetch_raw_data uses the DEFRA_URL."""
         try:
+            import httpx
+            import respx
             from backend.services.data_ingestion.defra_ingestion import (
                 DEFRAEmissionFactorsIngestion
             )
@@ -280,32 +276,24 @@ class TestFetchRawData:
             data_source_id=data_source_id
         )
 
-        with patch('httpx.AsyncClient') as mock_client:
-            mock_response = MagicMock()
-            mock_response.content = b"test"
-            mock_response.raise_for_status = MagicMock()
-
-            mock_client_instance = AsyncMock()
-            mock_client_instance.get = AsyncMock(return_value=mock_response)
-            mock_client_instance.__aenter__ = AsyncMock(
-                return_value=mock_client_instance
+        with respx.mock:
+            route = respx.get(DEFRAEmissionFactorsIngestion.DEFRA_URL).mock(
+                return_value=httpx.Response(200, content=b"test")
             )
-            mock_client_instance.__aexit__ = AsyncMock(return_value=None)
-            mock_client.return_value = mock_client_instance
 
             await ingestion.fetch_raw_data()
 
-            # Verify the URL was called
-            mock_client_instance.get.assert_called_once()
-            called_url = mock_client_instance.get.call_args[0][0]
-            assert called_url == DEFRAEmissionFactorsIngestion.DEFRA_URL
+        # Verify the URL was called
+        assert route.call_count == 1
 
     @pytest.mark.asyncio
     async def test_fetch_raw_data_follows_redirects(
         self, mock_async_session, data_source_id
     ):
-        """Test that fetch_raw_data follows redirects."""
+        """Test that fetch_raw_data follows redirects to allowed hosts."""
         try:
+            import httpx
+            import respx
             from backend.services.data_ingestion.defra_ingestion import (
                 DEFRAEmissionFactorsIngestion
             )
@@ -316,25 +304,49 @@ class TestFetchRawData:
             db=mock_async_session,
             data_source_id=data_source_id
         )
+        moved_url = "https://assets.publishing.service.gov.uk/media/moved.xlsx"
+
+        with respx.mock:
+            respx.get(DEFRAEmissionFactorsIngestion.DEFRA_URL).mock(
+                return_value=httpx.Response(302, headers={"Location": moved_url})
+            )
+            respx.get(moved_url).mock(
+                return_value=httpx.Response(200, content=b"moved")
+            )
 
-        with patch('httpx.AsyncClient') as mock_client:
-            mock_response = MagicMock()
-            mock_response.content = b"test"
-            mock_response.raise_for_status = MagicMock()
+            result = await ingestion.fetch_raw_data()
 
-            mock_client_instance = AsyncMock()
-            mock_client_instance.get = AsyncMock(return_value=mock_response)
-            mock_client_instance.__aenter__ = AsyncMock(
-                return_value=mock_client_instance
+        assert result == b"moved"
+
+    @pytest.mark.asyncio
+    async def test_fetch_raw_data_blocks_redirect_off_allowlist(
+        self, mock_async_session, data_source_id
+    ):
+        """Test that redirect targets are SSRF-validated."""
+        try:
+            import httpx
+            import respx
+            from backend.services.data_ingestion.defra_ingestion import (
+                DEFRAEmissionFactorsIngestion
             )
-            mock_client_instance.__aexit__ = AsyncMock(return_value=None)
-            mock_client.return_value = mock_client_instance
+            from backend.services.data_ingestion.security import SSRFBlockedError
+        except ImportError:
+            pytest.skip("DEFRAEmissionFactorsIngestion not yet implemented")
 
-            await ingestion.fetch_raw_data()
+        ingestion = DEFRAEmissionFactorsIngestion(
+            db=mock_async_session,
+            data_source_id=data_source_id
+        )
+
+        with respx.mock:
+            respx.get(DEFRAEmissionFactorsIngestion.DEFRA_URL).mock(
+                return_value=httpx.Response(
+                    302, headers={"Location": "http://169.254.169.254/latest/meta-data"}
+                )
+            )
 
-            # Verify follow_redirects was set
-            call_kwargs = mock_client_instance.get.call_args[1]
-            assert call_kwargs.get('follow_redirects') is True
+            with pytest.raises(SSRFBlockedError):
+                await ingestion.fetch_raw_data()
 
 
 # ============================================================================
@@ -0,0 +1,242 @@
+"""
+Test suite for EmissionFactorIndex and batch resolution in EmissionFactorMapper.
+
+This test suite validates:
+- Exact, partial (ILIKE semantics), category and proxy lookups from memory
+- Partial matches prefer the shortest activity_name
+- Inactive factors are not indexed
+- get_factors_for_components() resolves many components with one query
+- Index-backed results match the per-component database lookups
+- The shared index is reused until invalidated or the factors change
+- Concurrent callers share one rebuild of the shared index
+"""
+
+import asyncio
+from decimal import Decimal
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import event
+
+from backend.models import EmissionFactor
+from backend.services.data_ingestion.emission_factor_index import (
+    EmissionFactorIndex,
+    get_shared_index,
+    invalidate_shared_index,
+)
+from backend.services.data_ingestion.emission_factor_mapper import (
+    EmissionFactorMapper,
+)
+
+
+def make_factor(activity_name, unit="kg", geography="GLO", **kwargs):
+    """Create an EmissionFactor with sensible defaults."""
+    values = {
+        "id": uuid4().hex,
+        "activity_name": activity_name,
+        "co2e_factor": Decimal("1.0"),
+        "unit": unit,
+        "data_source": "EPA",
+        "geography": geography,
+        "category": "material",
+        "is_active": True,
+    }
+    values.update(kwargs)
+    return EmissionFactor(**values)
+
+
+SAMPLE_FACTORS = [
+    ("aluminum", {"geography": "US"}),
+    ("Aluminum ingot, primary", {}),
+    ("steel", {}),
+    ("Steel, hot rolled coil", {}),
+    ("plastic abs", {}),
+    ("Electricity grid mix", {"unit": "kWh", "category": "energy"}),
+    ("Cotton fibre", {"category": None}),
+    ("copper_proxy", {"data_source": "PROXY", "category": None}),
+    ("retired steel", {"is_active": False}),
+]
+
+
+@pytest_asyncio.fixture
+async def async_session():
+    """Async in-memory SQLite session seeded with sample factors."""
+    from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+    from sqlalchemy.ext.asyncio import async_sessionmaker
+    from backend.models import Base
+
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:", echo=False)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    maker = async_sessionmaker(
+        bind=engine,
+        class_=AsyncSession,
+        expire_on_commit=False,
+    )
+
+    async with maker() as session:
+        session.add_all([
+            make_factor(name, **kwargs) for name, kwargs in SAMPLE_FACTORS
+        ])
+        await session.commit()
+        session.expunge_all()
+        session.statement_count = 0
+
+        @event.listens_for(engine.sync_engine, "before_cursor_execute")
+        def count_statements(*args):
+            session.statement_count += 1
+
+        yield session
+
+    await engine.dispose()
+
+
+@pytest.fixture(autouse=True)
+def reset_shared_index():
+    """Ensure each test starts without a shared index."""
+    invalidate_shared_index()
+    yield
+    invalidate_shared_index()
+
+
+class TestEmissionFactorIndex:
+    """Tests for in-memory lookups."""
+
+    @pytest.fixture
+    def index(self):
+        return EmissionFactorIndex(
+            make_factor(name, **kwargs)
+            for name, kwargs in SAMPLE_FACTORS
+            if kwargs.get("is_active", True)
+        )
+
+    def test_find_exact_filters_unit_and_geography(self, index):
+        """Exact lookups honour optional unit and geography filters."""
+        assert index.find_exact("aluminum", "kg", "US").geography == "US"
+        assert index.find_exact("aluminum", "kg", "GLO") is None
+        assert index.find_exact("aluminum", "kWh") is None
+
+    def test_find_partial_is_case_insensitive_and_shortest(self, index):
+        """Partial lookups ignore case and prefer the shortest name."""
+        assert index.find_partial("STEEL", "kg").activity_name == "steel"
+        assert index.find_partial("ingot", "kg").activity_name == (
+            "Aluminum ingot, primary"
+        )
+
+    def test_find_partial_underscore_is_wildcard(self, index):
+        """An underscore matches any character, as with ILIKE."""
+        assert index.find_partial("plastic_abs", "kg").activity_name == "plastic abs"
+
+    def test_find_partial_short_pattern_scans(self, index):
+        """Patterns shorter than a trigram still match."""
+        assert index.find_partial("gr", "kWh").activity_name == (
+            "Electricity grid mix"
+        )
+
+    def test_find_partial_no_match(self, index):
+        """Unknown substrings return None."""
+        assert index.find_partial("titanium", "kg") is None
+
+    def test_category_and_proxy_lookups(self, index):
+        """Category fallback and proxy maps return the indexed factors."""
+        assert index.find_by_category("energy", "kWh").unit == "kWh"
+        assert index.find_by_category("energy", "kg") is None
+        assert index.find_proxy("copper_proxy").data_source == "PROXY"
+
+
+@pytest.mark.asyncio
+class TestBatchResolution:
+    """Tests for EmissionFactorMapper.get_factors_for_components()."""
+
+    COMPONENTS = [
+        ("aluminum", "kg", "US"),
+        ("steel", "kg", None),
+        ("Steel, hot", "kg", None),
+        ("plastic_abs", "kg", None),
+        ("Electricity grid mix", "kWh", None),
+        ("cotton", "kg", None),
+        ("copper_proxy", "kg", None),
+        ("unobtainium", "kg", None),
+    ]
+
+    async def test_load_skips_inactive_factors(self, async_session):
+        """Only active factors are indexed."""
+        index = await EmissionFactorIndex.load(async_session)
+
+        assert len(index) == len(SAMPLE_FACTORS) - 1
+        assert index.find_exact("retired steel") is None
+
+    async def test_batch_uses_single_query(self, async_session):
+        """Resolving many components costs one query for the index."""
+        mapper = EmissionFactorMapper(db=async_session)
+
+        results = await mapper.get_factors_for_components(self.COMPONENTS * 3)
+
+        assert async_session.statement_count == 1
+        assert set(results) == set(self.COMPONENTS)
+        assert results[("unobtainium", "kg", None)] is None
+        assert len(mapper.get_warnings()) == 1
+
+    async def test_batch_matches_database_lookups(self, async_session):
+        """Index-backed resolution agrees with per-component queries."""
+        db_mapper = EmissionFactorMapper(db=async_session)
+        expected = {}
+        for name, unit, geography in self.COMPONENTS:
+            factor = await db_mapper.get_factor_for_component(name, unit, geography)
+            expected[(name, unit, geography)] = factor.id if factor else None
+
+        batch_mapper = EmissionFactorMapper(db=async_session)
+        results = await batch_mapper.get_factors_for_components(self.COMPONENTS)
+
+        assert {
+            key: factor.id if factor else None
+            for key, factor in results.items()
+        } == expected
+
+    async def test_shared_index_reused_until_invalidated(self, async_session):
+        """The shared index loads once and reloads after invalidation."""
+        first = await get_shared_index(async_session)
+        second = await get_shared_index(async_session)
+
+        invalidate_shared_index()
+        third = await get_shared_index(async_session)
+
+        assert first is second
+        assert third is not first
+        # Snapshot query and load for each build, nothing for the reuse
+        assert async_session.statement_count == 4
+
+    async def test_shared_index_rebuilt_after_factor_change(self, async_session):
+        """A write from another process is picked up on the next snapshot check."""
+        first = await get_shared_index(async_session)
+        unchanged = await get_shared_index(async_session, check_interval_seconds=0)
+
+        async_session.add(make_factor("titanium"))
+        await async_session.commit()
+        changed = await get_shared_index(async_session, check_interval_seconds=0)
+
+        assert unchanged is first
+        assert changed is not first
+        assert changed.find_exact("titanium") is not None
+
+    async def test_concurrent_callers_share_one_rebuild(self, async_session):
+        """Callers that find the index missing wait for a single load."""
+        original_load = EmissionFactorIndex.load.__func__
+        loads = []
+
+        async def slow_load(cls, db):
+            loads.append(db)
+            await asyncio.sleep(0.01)
+            return await original_load(cls, db)
+
+        with patch.object(EmissionFactorIndex, "load", classmethod(slow_load)):
+            indexes = await asyncio.gather(
+                *(get_shared_index(async_session) for _ in range(5))
+            )
+
+        assert len(loads) == 1
+        assert all(index is indexes[0] for index in indexes)
@@ -278,6 +278,7 @@ class TestEPAIngestionInstantiation:
 # Test Scenario 2: fetch_raw_data Downloads from Correct URL
 # ============================================================================
 
+@pytest.mark.usefixtures("resolved_source_hosts")
 class TestFetchRawData:
     """Test fetch_raw_data downloads from correct EPA URL."""
 
@@ -0,0 +1,232 @@
+"""
+Test suite for FactorResolutionCache and shared mapping config loading.
+
+This test suite validates:
+- Resolution decisions survive across EmissionFactorMapper instances
+- Negative decisions are cached and still reported as warnings
+- Changing emission factors or the mapping config changes the cache version
+- Decisions are shared between processes through Redis
+- Redis errors fall back to the in-process tier
+- The mapping config file is parsed once and re-read only when it changes
+"""
+
+import json
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import event, update
+
+from backend.models import EmissionFactor
+from backend.services.data_ingestion.emission_factor_mapper import (
+    EmissionFactorMapper,
+    load_mapping_config,
+)
+from backend.services.data_ingestion.factor_resolution_cache import (
+    FactorResolutionCache,
+)
+
+
+class FakeRedis:
+    """Minimal async Redis hash store."""
+
+    def __init__(self, fail: bool = False):
+        self.hashes = {}
+        self.expiry = {}
+        self.fail = fail
+
+    async def hmget(self, key, fields):
+        if self.fail:
+            raise ConnectionError("redis down")
+        stored = self.hashes.get(key, {})
+        return [stored.get(field) for field in fields]
+
+    async def hset(self, key, mapping):
+        if self.fail:
+            raise ConnectionError("redis down")
+        self.hashes.setdefault(key, {}).update(mapping)
+
+    async def expire(self, key, seconds):
+        self.expiry[key] = seconds
+
+
+def redis_factory(client):
+    """Wrap a fake client in the async factory the cache expects."""
+    async def factory():
+        return client
+    return factory
+
+
+@pytest_asyncio.fixture
+async def async_session():
+    """Async in-memory SQLite session with a statement counter."""
+    from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+    from sqlalchemy.ext.asyncio import async_sessionmaker
+    from backend.models import Base
+
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:", echo=False)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    maker = async_sessionmaker(
+        bind=engine,
+        class_=AsyncSession,
+        expire_on_commit=False,
+    )
+
+    async with maker() as session:
+        session.add(EmissionFactor(
+            id=uuid4().hex,
+            activity_name="Steel, hot rolled coil",
+            co2e_factor=Decimal("2.5"),
+            unit="kg",
+            data_source="EPA",
+            geography="GLO",
+            category="material",
+            is_active=True,
+        ))
+        await session.commit()
+        session.statement_count = 0
+
+        @event.listens_for(engine.sync_engine, "before_cursor_execute")
+        def count_statements(*args):
+            session.statement_count += 1
+
+        yield session
+
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+class TestSharedDecisions:
+    """Tests for decisions shared across mapper instances."""
+
+    async def test_second_mapper_skips_matching(self, async_session):
+        """A fresh mapper reuses the decision: version + ID lookup only."""
+        cache = FactorResolutionCache()
+
+        first = await EmissionFactorMapper(
+            db=async_session, resolution_cache=cache
+        ).get_factor_for_component("hot rolled", "kg")
+        async_session.statement_count = 0
+
+        second = await EmissionFactorMapper(
+            db=async_session, resolution_cache=cache
+        ).get_factor_for_component("hot rolled", "kg")
+
+        assert second.id == first.id
+        assert async_session.statement_count == 1
+        assert cache.hits == 1
+
+    async def test_negative_decisions_are_cached(self, async_session):
+        """Misses are cached, and each mapper still reports a warning."""
+        cache = FactorResolutionCache()
+        await EmissionFactorMapper(
+            db=async_session, resolution_cache=cache
+        ).get_factor_for_component("unobtainium", "kg")
+        async_session.statement_count = 0
+
+        mapper = EmissionFactorMapper(db=async_session, resolution_cache=cache)
+        result = await mapper.get_factor_for_component("unobtainium", "kg")
+
+        assert result is None
+        assert async_session.statement_count == 0
+        assert mapper.get_warnings()[0]["component_name"] == "unobtainium"
+
+    async def test_batch_uses_cached_decisions(self, async_session):
+        """Batch resolution skips the index load when all keys are cached."""
+        cache = FactorResolutionCache()
+        components = [("hot rolled", "kg", None), ("unobtainium", "kg", None)]
+        await EmissionFactorMapper(
+            db=async_session, resolution_cache=cache
+        ).get_factors_for_components(components)
+        async_session.statement_count = 0
+
+        mapper = EmissionFactorMapper(db=async_session, resolution_cache=cache)
+        results = await mapper.get_factors_for_components(components)
+
+        assert mapper.index is None
+        assert results[("unobtainium", "kg", None)] is None
+        assert results[("hot rolled", "kg", None)] is not None
+        assert async_session.statement_count == 1
+
+    async def test_factor_change_bumps_version(self, async_session):
+        """Updating emission factors invalidates earlier decisions."""
+        cache = FactorResolutionCache(snapshot_ttl_seconds=0)
+        before = await cache.get_version(async_session, "cfg")
+
+        await async_session.execute(
+            update(EmissionFactor).values(co2e_factor=Decimal("3.0"))
+        )
+        await async_session.commit()
+        after = await cache.get_version(async_session, "cfg")
+
+        assert before != after
+
+    async def test_mapping_hash_changes_version(self, async_session):
+        """A different mapping config hash yields a different version."""
+        cache = FactorResolutionCache()
+
+        assert (
+            await cache.get_version(async_session, "a")
+            != await cache.get_version(async_session, "b")
+        )
+
+
+@pytest.mark.asyncio
+class TestRedisTier:
+    """Tests for the Redis-backed tier."""
+
+    async def test_decisions_shared_between_processes(self, async_session):
+        """A second cache (another worker) reads decisions from Redis."""
+        redis = FakeRedis()
+        worker_a = FactorResolutionCache(redis_client_factory=redis_factory(redis))
+        worker_b = FactorResolutionCache(redis_client_factory=redis_factory(redis))
+
+        await EmissionFactorMapper(
+            db=async_session, resolution_cache=worker_a
+        ).get_factor_for_component("unobtainium", "kg")
+
+        [stored] = redis.hashes.values()
+        assert stored == {"unobtainium:kg:any": ""}
+
+        mapper = EmissionFactorMapper(db=async_session, resolution_cache=worker_b)
+        assert await mapper.get_factor_for_component("unobtainium", "kg") is None
+        assert worker_b.hits == 1
+
+    async def test_redis_errors_fall_back_to_local(self, async_session):
+        """Redis failures do not break resolution."""
+        cache = FactorResolutionCache(
+            redis_client_factory=redis_factory(FakeRedis(fail=True))
+        )
+        mapper = EmissionFactorMapper(db=async_session, resolution_cache=cache)
+
+        factor = await mapper.get_factor_for_component("hot rolled", "kg")
+
+        assert factor is not None
+        assert len(cache) == 1
+
+
+class TestMappingConfigLoading:
+    """Tests for process-wide mapping config parsing."""
+
+    def test_config_parsed_once(self, tmp_path):
+        """Unchanged files return the same parsed config."""
+        path = tmp_path / "mappings.json"
+        path.write_text(json.dumps({"aliases": {"alu": "aluminum"}}))
+
+        assert load_mapping_config(path) is load_mapping_config(path)
+
+    def test_config_reloaded_when_file_changes(self, tmp_path):
+        """Edits produce a new config with a new hash."""
+        path = tmp_path / "mappings.json"
+        path.write_text(json.dumps({"aliases": {"alu": "aluminum"}}))
+        first = load_mapping_config(path)
+
+        path.write_text(json.dumps({"aliases": {"alu": "aluminium", "x": "y"}}))
+        second = load_mapping_config(path)
+
+        assert second.aliases == {"alu": "aluminium", "x": "y"}
+        assert second.config_hash != first.config_hash
@@ -597,6 +597,154 @@ class TestProductNameUniqueness:
             )
 
 
+class TestProductGeneratorBulkCatalog:
+    """Test generate_catalog_bulk method."""
+
+    @pytest.mark.asyncio
+    async def test_generates_products_and_boms(self, async_session):
+        """Writes the requested products with BOM rows in chunks."""
+        from sqlalchemy import func
+        from backend.services.data_ingestion.product_generator import ProductGenerator
+
+        generator = ProductGenerator(async_session)
+
+        counts = await generator.generate_catalog_bulk(
+            {"electronics": 25, "apparel": 5}, chunk_size=10
+        )
+
+        finished = await async_session.scalar(
+            select(func.count()).select_from(Product)
+            .where(Product.is_finished_product == True)  # noqa: E712
+        )
+        bom_count = await async_session.scalar(
+            select(func.count()).select_from(BillOfMaterials)
+        )
+        stats = generator.get_stats()
+
+        assert counts == {"electronics": 25, "apparel": 5}
+        assert finished == 30
+        assert bom_count == stats["bom_entries_created"] > 30
+        assert stats["by_industry"] == {"electronics": 25, "apparel": 5}
+
+    @pytest.mark.asyncio
+    async def test_reuses_existing_component_products(self, async_session):
+        """Preloaded component codes are linked, not recreated."""
+        from backend.services.data_ingestion.product_generator import ProductGenerator
+
+        existing = Product(
+            id=uuid4().hex,
+            code="transport_truck",
+            name="Transport Truck",
+            unit="tkm",
+            is_finished_product=False,
+        )
+        async_session.add(existing)
+        await async_session.commit()
+
+        generator = ProductGenerator(async_session)
+        await generator.generate_catalog_bulk({"electronics": 3})
+
+        result = await async_session.execute(
+            select(BillOfMaterials.child_product_id)
+            .join(Product, BillOfMaterials.child_product_id == Product.id)
+            .where(Product.code == "transport_truck")
+        )
+        assert set(result.scalars().all()) == {existing.id}
+
+    @pytest.mark.asyncio
+    async def test_assigns_factors_in_batch(self, async_session):
+        """BOM rows get factor IDs from batched mapper calls."""
+        from backend.services.data_ingestion.product_generator import ProductGenerator
+
+        batch_calls = []
+
+        async def get_factors(components):
+            keys = list(components)
+            batch_calls.append(keys)
+            return {key: MagicMock(id=f"ef-{key[0]}"[:32]) for key in keys}
+
+        mapper = AsyncMock()
+        mapper.get_factors_for_components = get_factors
+
+        generator = ProductGenerator(async_session)
+        generator.mapper = mapper
+        await generator.generate_catalog_bulk({"electronics": 8}, chunk_size=4)
+
+        result = await async_session.execute(
+            select(BillOfMaterials.emission_factor_id)
+        )
+        assert all(factor_id for factor_id in result.scalars().all())
+        # Component validation + one call per product chunk with new keys
+        assert len(batch_calls) <= 3
+        mapper.get_factor_for_component.assert_not_called()
+
+
+class TestCatalogSharding:
+    """Test seeded, sharded catalog synthesis."""
+
+    def test_shards_cover_count_with_fixed_boundaries(self):
+        """Shard boundaries depend only on count, start and shard size."""
+        from backend.services.data_ingestion.product_generator import plan_catalog_shards
+
+        shards = plan_catalog_shards("apparel", 25, seed=1, first_index=11, shard_size=10)
+
+        assert [(s.first_index, s.count) for s in shards] == [(11, 10), (21, 10), (31, 5)]
+
+    def test_shard_synthesis_is_reproducible(self):
+        """The same shard yields identical rows, including IDs."""
+        from backend.services.data_ingestion.product_generator import (
+            CatalogShard,
+            synthesize_catalog_shard,
+        )
+
+        shard = CatalogShard(industry="electronics", first_index=1, count=20, seed=42)
+
+        assert synthesize_catalog_shard(shard) == synthesize_catalog_shard(shard)
+        assert synthesize_catalog_shard(shard) != synthesize_catalog_shard(
+            CatalogShard(industry="electronics", first_index=1, count=20, seed=43)
+        )
+
+    @pytest.mark.asyncio
+    async def test_output_independent_of_worker_count(self, monkeypatch):
+        """A seeded catalog is identical with one worker or a process pool."""
+        from sqlalchemy.ext.asyncio import (
+            AsyncSession,
+            async_sessionmaker,
+            create_async_engine,
+        )
+        from backend.models import Base
+        from backend.services.data_ingestion.product_generator import ProductGenerator
+
+        monkeypatch.setattr(ProductGenerator, "SHARD_SIZE", 4)
+
+        async def generate(workers):
+            engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+            async with engine.begin() as conn:
+                await conn.run_sync(Base.metadata.create_all)
+            maker = async_sessionmaker(bind=engine, class_=AsyncSession)
+            async with maker() as session:
+                await ProductGenerator(session).generate_catalog_bulk(
+                    {"electronics": 10, "apparel": 6}, seed=7, workers=workers
+                )
+                products = (await session.execute(
+                    select(Product.id, Product.code, Product.name, Product.country_of_origin)
+                    .where(Product.is_finished_product == True)  # noqa: E712
+                )).all()
+                child = Product.__table__.alias("child")
+                boms = (await session.execute(
+                    select(
+                        BillOfMaterials.id,
+                        BillOfMaterials.parent_product_id,
+                        child.c.code,
+                        BillOfMaterials.quantity,
+                    ).join(child, BillOfMaterials.child_product_id == child.c.id)
+                )).all()
+            await engine.dispose()
+            return sorted(products), sorted(boms)
+
+        assert await generate(workers=1) == await generate(workers=2)
+
+
 # ============================================================================
 # Fixtures
 # ============================================================================
@@ -0,0 +1,332 @@
+"""
+Test suite for the concurrent multi-source SyncOrchestrator.
+
+This test suite validates:
+- build_sync_jobs() expands multi-file connectors into one job per file
+- Fetches run concurrently but never exceed max_concurrent_fetches
+- Records from all sources are written through the bulk writer
+- Re-running a sync updates existing rows instead of inserting duplicates
+- All sync logs of a run share one composite_sync_id with timings
+- Missing data sources and failed writes fail their job without failing
+  the whole run
+"""
+
+import asyncio
+from decimal import Decimal
+from typing import Any, Dict, List
+from unittest.mock import patch
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import select, func
+
+from backend.models import DataSource, DataSyncLog, EmissionFactor
+from backend.services.data_ingestion.base import BaseDataIngestion
+from backend.services.data_ingestion.sync_orchestrator import (
+    BulkEmissionFactorWriter,
+    SyncOrchestrator,
+    build_sync_jobs,
+    parse_and_transform,
+)
+
+
+class FakeConnector(BaseDataIngestion):
+    """Connector returning a fixed set of records, tracking fetch concurrency."""
+
+    in_flight = 0
+    max_in_flight = 0
+    co2e_factor = Decimal("1.5")
+    prefix = "FAKE"
+
+    async def fetch_raw_data(self) -> bytes:
+        cls = type(self)
+        cls.in_flight += 1
+        cls.max_in_flight = max(cls.max_in_flight, cls.in_flight)
+        await asyncio.sleep(0.01)
+        cls.in_flight -= 1
+        return b"a,b,c"
+
+    async def parse_data(self, raw_data: bytes) -> List[Dict[str, Any]]:
+        return [{"name": name} for name in raw_data.decode().split(",")]
+
+    async def transform_data(
+        self, parsed_data: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        return [
+            {
+                "activity_name": f"{self.prefix} {record['name']}",
+                "co2e_factor": self.co2e_factor,
+                "unit": "kg",
+                "external_id": f"{self.prefix}-{record['name']}",
+                "data_source": self.prefix,
+                "geography": "GLO",
+            }
+            for record in parsed_data
+        ]
+
+
+class OtherFakeConnector(FakeConnector):
+    """Second connector with distinct records."""
+
+    prefix = "OTHER"
+
+
+class MultiFileConnector(FakeConnector):
+    """Connector exposing several files like the EPA connector."""
+
+    FILES = {"one": {}, "two": {}}
+
+    def __init__(self, *args, file_key: str = "one", **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.file_key = file_key
+
+
+FAKE_REGISTRY = {
+    "Fake Source": FakeConnector,
+    "Other Source": OtherFakeConnector,
+}
+
+
+@pytest.fixture(autouse=True)
+def reset_fake_connectors():
+    """Reset class-level counters between tests."""
+    FakeConnector.in_flight = 0
+    FakeConnector.max_in_flight = 0
+    FakeConnector.co2e_factor = Decimal("1.5")
+    yield
+
+
+@pytest_asyncio.fixture
+async def session_factory():
+    """Async in-memory SQLite session factory with two data sources."""
+    from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+    from sqlalchemy.ext.asyncio import async_sessionmaker
+    from sqlalchemy.pool import StaticPool
+    from backend.models import Base
+
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        echo=False,
+        poolclass=StaticPool,
+    )
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    maker = async_sessionmaker(
+        bind=engine,
+        class_=AsyncSession,
+        expire_on_commit=False,
+    )
+
+    async with maker() as session:
+        session.add_all([
+            DataSource(name="Fake Source", source_type="file"),
+            DataSource(name="Other Source", source_type="file"),
+        ])
+        await session.commit()
+
+    yield maker
+
+    await engine.dispose()
+
+
+class TestBuildSyncJobs:
+    """Tests for expanding registered connectors into jobs."""
+
+    def test_registered_sources_expand_per_file(self):
+        """EPA gets one job per file, DEFRA a single job."""
+        keys = [job.key for job in build_sync_jobs()]
+
+        assert "epa_fuels" in keys
+        assert "epa_egrid" in keys
+        assert "defra" in keys
+
+    def test_file_key_passed_to_connector(self):
+        """Multi-file connectors receive their file_key."""
+        with patch.dict(
+            "backend.services.data_ingestion.registry.CONNECTOR_REGISTRY",
+            {"Multi Source": MultiFileConnector},
+        ):
+            jobs = build_sync_jobs(["Multi Source"])
+
+        assert [job.connector_kwargs for job in jobs] == [
+            {"file_key": "one"},
+            {"file_key": "two"},
+        ]
+
+    def test_unknown_source_raises(self):
+        """Unregistered names raise ValueError like get_connector_class."""
+        with pytest.raises(ValueError):
+            build_sync_jobs(["Nope"])
+
+
+class TestParseAndTransform:
+    """Tests for the executor-side parse helper."""
+
+    def test_runs_without_session(self):
+        """Connectors can parse without a database session."""
+        records = parse_and_transform(FakeConnector, {}, b"x,y")
+
+        assert [r["external_id"] for r in records] == ["FAKE-x", "FAKE-y"]
+
+
+@pytest.mark.asyncio
+class TestSyncOrchestrator:
+    """Tests for the composite sync run."""
+
+    async def _run(self, session_factory, **kwargs):
+        with patch.dict(
+            "backend.services.data_ingestion.registry.CONNECTOR_REGISTRY",
+            FAKE_REGISTRY,
+            clear=True,
+        ):
+            orchestrator = SyncOrchestrator(
+                session_factory=session_factory,
+                max_parse_workers=0,
+                **kwargs,
+            )
+            return await orchestrator.run()
+
+    async def test_syncs_all_sources(self, session_factory):
+        """Every registered source is written in one run."""
+        result = await self._run(session_factory)
+
+        assert result.status == "completed"
+        assert {s.job_key for s in result.sources} == {"fake", "other"}
+        assert result.records_created == 6
+
+        async with session_factory() as db:
+            count = await db.scalar(select(func.count(EmissionFactor.id)))
+        assert count == 6
+
+    async def test_fetch_concurrency_is_bounded(self, session_factory):
+        """max_concurrent_fetches limits simultaneous downloads."""
+        await self._run(session_factory, max_concurrent_fetches=1)
+        assert FakeConnector.max_in_flight == 1
+
+    async def test_rerun_updates_existing_rows(self, session_factory):
+        """A second run updates by external_id instead of inserting."""
+        await self._run(session_factory)
+        FakeConnector.co2e_factor = Decimal("2.5")
+
+        result = await self._run(session_factory)
+
+        assert result.records_created == 0
+        assert result.records_updated == 6
+
+        async with session_factory() as db:
+            factors = (await db.execute(select(EmissionFactor))).scalars().all()
+        assert len(factors) == 6
+        assert {f.co2e_factor for f in factors} == {Decimal("2.5")}
+
+    async def test_sync_logs_share_composite_id(self, session_factory):
+        """Per-source sync logs carry the composite id and timings."""
+        result = await self._run(session_factory)
+
+        async with session_factory() as db:
+            logs = (await db.execute(select(DataSyncLog))).scalars().all()
+
+        assert len(logs) == 2
+        for log in logs:
+            assert log.status == "completed"
+            assert log.sync_metadata["composite_sync_id"] == result.composite_sync_id
+            assert set(log.sync_metadata["timings"]) == {
+                "fetch_seconds", "parse_seconds", "write_seconds",
+            }
+
+    async def test_missing_source_is_partial(self, session_factory):
+        """A missing data source fails only its own job."""
+        async with session_factory() as db:
+            source = await db.scalar(
+                select(DataSource).where(DataSource.name == "Other Source")
+            )
+            await db.delete(source)
+            await db.commit()
+
+        result = await self._run(session_factory)
+
+        assert result.status == "partial"
+        failed = [s for s in result.sources if s.status == "failed"]
+        assert [s.job_key for s in failed] == ["other"]
+        assert "not found" in failed[0].error_message
+
+    async def test_write_failure_is_partial(self, session_factory):
+        """A failed write rolls back only its own job."""
+        original_write = BulkEmissionFactorWriter.write
+
+        async def failing_write(self, data_source_id, records, **kwargs):
+            counts = await original_write(self, data_source_id, records, **kwargs)
+            if any(r["external_id"].startswith("OTHER") for r in records):
+                # Fail after the rows were flushed, so the rollback discards them
+                raise RuntimeError("write failed")
+            return counts
+
+        with patch.object(BulkEmissionFactorWriter, "write", failing_write):
+            result = await self._run(session_factory, max_concurrent_fetches=1)
+
+        assert result.status == "partial"
+        by_key = {s.job_key: s for s in result.sources}
+        assert by_key["fake"].status == "completed"
+        assert by_key["fake"].sync_log_id
+        assert by_key["fake"].completed_at is not None
+        assert by_key["other"].status == "failed"
+        assert by_key["other"].error_message == "write failed"
+
+        async with session_factory() as db:
+            logs = {
+                log.id: log.status
+                for log in (await db.execute(select(DataSyncLog))).scalars().all()
+            }
+            count = await db.scalar(select(func.count(EmissionFactor.id)))
+        assert logs == {
+            by_key["fake"].sync_log_id: "completed",
+            by_key["other"].sync_log_id: "failed",
+        }
+        assert count == 3
+
+
+@pytest.mark.asyncio
+class TestBulkEmissionFactorWriter:
+    """Tests for the chunked bulk writer."""
+
+    async def test_writes_in_batches(self, session_factory):
+        """Records larger than batch_size are all written."""
+        async with session_factory() as db:
+            source = await db.scalar(select(DataSource).limit(1))
+            writer = BulkEmissionFactorWriter(db, batch_size=2)
+            records = [
+                {
+                    "activity_name": f"item {i}",
+                    "co2e_factor": Decimal("1.0"),
+                    "unit": "kg",
+                    "external_id": f"ID-{i}",
+                    "data_source": "TEST",
+                }
+                for i in range(5)
+            ]
+
+            counts = await writer.write(source.id, records)
+            await db.commit()
+
+            total = await db.scalar(select(func.count(EmissionFactor.id)))
+
+        assert counts == {"created": 5, "updated": 0}
+        assert total == 5
+
+    async def test_duplicate_external_ids_collapse(self, session_factory):
+        """Duplicate new external IDs in one batch insert a single row."""
+        async with session_factory() as db:
+            source = await db.scalar(select(DataSource).limit(1))
+            writer = BulkEmissionFactorWriter(db)
+            record = {
+                "activity_name": "dup",
+                "co2e_factor": Decimal("1.0"),
+                "unit": "kg",
+                "external_id": "DUP",
+                "data_source": "TEST",
+            }
+
+            counts = await writer.write(source.id, [record, dict(record)])
+
+        assert counts["created"] == 1
@@ -0,0 +1,173 @@
+"""
+Test suite for in-process metrics and the /metrics endpoint.
+
+This test suite validates:
+- Counter, Gauge and HistogramFamily rendering in the Prometheus text format
+- MetricsMiddleware labels requests with the route template and status
+- Rate limiter rejections and emission factor cache lookups are counted
+  (calculation phases are covered in tests/api/test_async_routes.py)
+- GET /metrics serves the registry with the exposition content type
+- GET /metrics requires the METRICS_TOKEN bearer token, or an admin JWT
+  when no token is configured
+
+Application metrics are process-global, so tests compare before/after values.
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend.api import dependencies
+from backend.api.routes.metrics import router as metrics_router
+from backend.config import settings
+from backend.middleware import MemoryStorage, MetricsMiddleware, RateLimitMiddleware
+from backend.utils import metrics
+from backend.utils.metrics import (
+    Counter,
+    Gauge,
+    HistogramFamily,
+    MetricsRegistry,
+)
+
+
+class TestRendering:
+    """Tests for the Prometheus text exposition output."""
+
+    def test_counter_and_gauge(self):
+        """Counters and gauges render HELP, TYPE and one line per label set."""
+        registry = MetricsRegistry()
+        counter = registry.register(Counter("jobs_total", "Jobs run", ("status",)))
+        gauge = registry.register(Gauge("queue_depth", "Queued jobs"))
+        counter.inc(status="ok")
+        counter.inc(2, status="ok")
+        counter.inc(status='say "hi"')
+        gauge.set(4)
+        gauge.dec()
+
+        text = registry.render()
+
+        assert "# TYPE jobs_total counter" in text
+        assert 'jobs_total{status="ok"} 3.0' in text
+        assert 'jobs_total{status="say \\"hi\\""} 1.0' in text
+        assert "# TYPE queue_depth gauge" in text
+        assert "queue_depth 3.0" in text
+
+    def test_histogram_family(self):
+        """Histograms render cumulative buckets with le, plus _sum and _count."""
+        histogram = HistogramFamily("latency_seconds", "Latency", ("route",), buckets=(0.1, 1.0))
+        for value in (0.05, 0.5, 2.0):
+            histogram.observe(value, route="/a")
+
+        lines = histogram.render().splitlines()
+
+        assert 'latency_seconds_bucket{route="/a",le="0.1"} 1.0' in lines
+        assert 'latency_seconds_bucket{route="/a",le="1.0"} 2.0' in lines
+        assert 'latency_seconds_bucket{route="/a",le="+Inf"} 3.0' in lines
+        assert 'latency_seconds_count{route="/a"} 3.0' in lines
+        assert 'latency_seconds_sum{route="/a"} 2.55' in lines
+
+    def test_wrong_labels_rejected(self):
+        """Updating with missing labels raises instead of silently mislabelling."""
+        with pytest.raises(ValueError):
+            Counter("x_total", "X", ("a",)).inc()
+
+
+class TestRequestMetrics:
+    """Tests for MetricsMiddleware and the /metrics route."""
+
+    @pytest.fixture
+    def client(self):
+        app = FastAPI()
+        app.add_middleware(
+            RateLimitMiddleware,
+            storage=MemoryStorage(cleanup_interval=None),
+            default_limit=2,
+            window_seconds=60,
+        )
+        app.add_middleware(MetricsMiddleware)
+        app.include_router(metrics_router)
+
+        @app.get("/items/{item_id}")
+        def read_item(item_id: str):
+            return {"id": item_id}
+
+        return TestClient(app)
+
+    def test_requests_labelled_by_route_template(self, client):
+        """Requests are counted per route template, and unmatched paths share one label."""
+        labels = {"method": "GET", "route": "/items/{item_id}", "status": "200"}
+        before = metrics.HTTP_REQUESTS.value(**labels)
+        unmatched_before = metrics.HTTP_REQUESTS.value(method="GET", route="unmatched", status="404")
+
+        client.get("/items/a")
+        client.get("/nothing-here")
+
+        assert metrics.HTTP_REQUESTS.value(**labels) == before + 1
+        assert metrics.HTTP_REQUESTS.value(
+            method="GET", route="unmatched", status="404"
+        ) == unmatched_before + 1
+        assert metrics.HTTP_IN_FLIGHT.value(method="GET") == 0
+
+    def test_rate_limit_rejections_counted(self, client):
+        """429 responses are counted by category and still reach request metrics."""
+        before = metrics.RATE_LIMIT_REJECTIONS.value(category="general")
+
+        statuses = [client.get("/items/a").status_code for _ in range(3)]
+
+        assert statuses == [200, 200, 429]
+        assert metrics.RATE_LIMIT_REJECTIONS.value(category="general") == before + 1
+
+    def test_metrics_endpoint(self, client, monkeypatch):
+        """GET /metrics serves the registry, including pool metrics."""
+        monkeypatch.setattr(settings, "METRICS_TOKEN", "scrape-secret")
+        client.get("/items/a")
+
+        response = client.get("/metrics", headers={"Authorization": "Bearer scrape-secret"})
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        assert 'pcf_http_requests_total{method="GET",route="/items/{item_id}"' in response.text
+        assert "# TYPE pcf_db_pool_checkout_wait_seconds histogram" in response.text
+        assert "pcf_emission_factor_cache_hit_ratio" in response.text
+
+    @pytest.mark.parametrize("headers", [{}, {"Authorization": "Bearer wrong"}])
+    def test_metrics_endpoint_rejects_missing_or_wrong_token(self, client, monkeypatch, headers):
+        """Without the configured scrape token /metrics is not served."""
+        monkeypatch.setattr(settings, "METRICS_TOKEN", "scrape-secret")
+
+        response = client.get("/metrics", headers=headers)
+
+        assert response.status_code == 401
+        assert "pcf_db_pool" not in response.text
+
+    def test_metrics_endpoint_requires_admin_without_token(self, client, monkeypatch):
+        """With no scrape token configured, anonymous requests are rejected."""
+        monkeypatch.setattr(settings, "METRICS_TOKEN", None)
+
+        response = client.get("/metrics")
+
+        assert response.status_code == 401
+
+
+class TestApplicationMetrics:
+    """Tests for metrics recorded outside the HTTP layer."""
+
+    @pytest.mark.asyncio
+    async def test_ef_cache_lookups_folded_per_request(self):
+        """get_ef_provider adds the request's cache hits/misses on teardown."""
+        hits = metrics.EF_CACHE_LOOKUPS.value(result="hit")
+        misses = metrics.EF_CACHE_LOOKUPS.value(result="miss")
+
+        dependency = dependencies.get_ef_provider(session=MagicMock())
+        provider = await dependency.__anext__()
+        provider._provider = MagicMock(get_by_category=AsyncMock(return_value=None))
+        await provider.get_by_category("steel")
+        await provider.get_by_category("steel")
+        with pytest.raises(StopAsyncIteration):
+            await dependency.__anext__()
+
+        assert metrics.EF_CACHE_LOOKUPS.value(result="hit") == hits + provider.hits
+        assert metrics.EF_CACHE_LOOKUPS.value(result="miss") == misses + provider.misses
+        assert provider.hits + provider.misses == 2
@@ -0,0 +1,252 @@
+"""
+Test suite for request profiling.
+
+This test suite validates:
+- QueryLog records statements, timings and errors only within its context
+- StackSampler attributes samples to the busy function
+- ProfileStore keeps the newest profiles and rejects unknown file names
+- ProfilingMiddleware honours X-Profile for admins only, grants cProfile to
+  whitelisted admins and profiles requests over the slow threshold
+- Admin profile routes list, return and download profiles
+
+Queries run against SQLite files so the tests need no PostgreSQL server.
+"""
+
+import pstats
+import threading
+import time
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, exc, text
+
+from backend.api.routes.admin.profiles import router as profiles_router
+from backend.auth.jwt import create_access_token
+from backend.middleware import ProfilingMiddleware
+from backend.utils.profiling import (
+    CPROFILE_FILE,
+    REPORT_FILE,
+    STACKS_FILE,
+    ProfileStore,
+    QueryLog,
+    StackSampler,
+    get_profile_store,
+    new_profile_id,
+)
+
+
+def _token(username: str, role: str) -> str:
+    return create_access_token({"user_id": 1, "username": username, "role": role})
+
+
+@pytest.fixture
+def engine(tmp_path):
+    """SQLite engine with a small table."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'profile.db'}")
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY)"))
+        conn.execute(text("INSERT INTO items (id) VALUES (1), (2), (3)"))
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def store(tmp_path):
+    """ProfileStore keeping three profiles."""
+    return ProfileStore(tmp_path / "profiles", max_profiles=3)
+
+
+class TestQueryLog:
+    """Tests for the per-request SQL query log."""
+
+    def test_records_statements_in_context_only(self, engine):
+        """Statements are counted, timed and grouped; none outside the context."""
+        with engine.connect() as conn:
+            with QueryLog() as log:
+                for item_id in (1, 2, 3):
+                    conn.execute(text("SELECT id FROM items WHERE id = :id"), {"id": item_id})
+                conn.execute(text("SELECT count(*) FROM items"))
+            conn.execute(text("SELECT 1"))
+
+        summary = log.summary()
+        assert log.count == 4
+        assert summary["distinct"] == 2
+        counts = {group["statement"]: group["count"] for group in summary["top"]}
+        assert counts["SELECT id FROM items WHERE id = ?"] == 3
+        assert all(entry["duration_ms"] >= 0 for entry in log.entries)
+        assert log.queries[-1] == "SELECT count(*) FROM items"
+
+    def test_failed_statement_recorded(self, engine):
+        """A failing statement is logged with its error type."""
+        with engine.connect() as conn, QueryLog() as log:
+            with pytest.raises(exc.OperationalError):
+                conn.execute(text("SELECT * FROM missing_table"))
+
+        assert log.count == 1
+        assert log.entries[0]["error"] == "OperationalError"
+
+    def test_entries_capped(self, engine):
+        """Beyond max_entries statements are counted but not kept."""
+        with engine.connect() as conn, QueryLog(max_entries=2) as log:
+            for _ in range(5):
+                conn.execute(text("SELECT 1"))
+
+        assert log.count == 5
+        assert len(log.entries) == 2
+        assert log.summary()["dropped"] == 3
+
+
+def busy_loop(stop: threading.Event) -> None:
+    while not stop.is_set():
+        sum(range(1000))
+
+
+class TestStackSampler:
+    """Tests for the sampling profiler."""
+
+    def test_busy_function_sampled(self):
+        """Samples of a busy thread include its function."""
+        stop = threading.Event()
+        worker = threading.Thread(target=busy_loop, args=(stop,), name="busy-worker")
+        worker.start()
+        sampler = StackSampler(interval=0.001)
+        sampler.start()
+        time.sleep(0.1)
+        sampler.stop()
+        stop.set()
+        worker.join()
+
+        assert sampler.samples > 0
+        busy = [line for line in sampler.folded().splitlines() if line.startswith("busy-worker;")]
+        assert busy and all("busy_loop" in line for line in busy)
+        assert "pcf-stack-sampler" not in sampler.folded()
+
+
+class TestProfileStore:
+    """Tests for profile artifact storage."""
+
+    def test_keeps_newest_profiles(self, store):
+        """Saving beyond max_profiles deletes the oldest profiles."""
+        ids = [f"2026010100000{i}-{i:08x}" for i in range(5)]
+        for profile_id in ids:
+            store.save(profile_id, {"id": profile_id, "queries": {"entries": []}})
+
+        listed = store.list()
+        assert [item["id"] for item in listed] == ids[:1:-1]
+        assert "entries" not in listed[0]["queries"]
+        assert store.report(ids[0]) is None
+
+    def test_path_rejects_unknown_names(self, store):
+        """Only known files of well-formed profile ids resolve."""
+        profile_id = new_profile_id()
+        store.save(profile_id, {"id": profile_id}, stacks="main;f 1\n")
+
+        assert store.path(profile_id, STACKS_FILE).read_text() == "main;f 1\n"
+        assert store.report(profile_id)["files"] == [REPORT_FILE, STACKS_FILE]
+        assert store.path(profile_id, CPROFILE_FILE) is None
+        assert store.path(profile_id, "../../etc/passwd") is None
+        assert store.path("../" + profile_id, REPORT_FILE) is None
+
+
+class TestProfilingMiddleware:
+    """Tests for ProfilingMiddleware triggers and the admin routes."""
+
+    @pytest.fixture
+    def make_client(self, engine, store):
+        def _make(**options):
+            app = FastAPI()
+            app.add_middleware(ProfilingMiddleware, store=store, **options)
+            app.include_router(profiles_router, prefix="/admin")
+            app.dependency_overrides[get_profile_store] = lambda: store
+
+            @app.get("/items/{item_id}")
+            def read_item(item_id: int, delay: float = 0.0):
+                time.sleep(delay)
+                with engine.connect() as conn:
+                    return {"id": conn.execute(
+                        text("SELECT id FROM items WHERE id = :id"), {"id": item_id}
+                    ).scalar()}
+
+            return TestClient(app)
+
+        return _make
+
+    def test_header_ignored_for_non_admins(self, make_client, store):
+        """X-Profile from anonymous or non-admin callers records nothing."""
+        client = make_client()
+
+        anonymous = client.get("/items/1", headers={"X-Profile": "1"})
+        user = client.get("/items/1", headers={
+            "X-Profile": "1", "Authorization": f"Bearer {_token('bob', 'user')}",
+        })
+
+        assert "X-Profile-Id" not in anonymous.headers
+        assert "X-Profile-Id" not in user.headers
+        assert store.list() == []
+
+    def test_admin_sample_profile(self, make_client, store):
+        """An admin's X-Profile request is stored with its SQL log and stacks."""
+        client = make_client()
+        headers = {"X-Profile": "sample", "Authorization": f"Bearer {_token('alice', 'admin')}"}
+
+        response = client.get("/items/2", params={"delay": 0.05}, headers=headers)
+        profile_id = response.headers["X-Profile-Id"]
+
+        detail = client.get(f"/admin/profiles/{profile_id}").json()
+        assert detail["trigger"] == "header"
+        assert detail["mode"] == "sample"
+        assert detail["route"] == "/items/{item_id}"
+        assert detail["user"] == "alice"
+        assert detail["status"] == 200
+        assert detail["queries"]["count"] == 1
+        assert detail["queries"]["entries"][0]["statement"].startswith("SELECT id FROM items")
+        assert detail["samples"] > 0
+        assert client.get("/admin/profiles").json()["items"][0]["id"] == profile_id
+
+        stacks = client.get(f"/admin/profiles/{profile_id}/files/{STACKS_FILE}")
+        assert stacks.status_code == 200
+        assert "attachment" in stacks.headers["content-disposition"]
+
+    def test_cprofile_only_for_whitelisted_admins(self, make_client, store):
+        """cProfile is granted to whitelisted admins; others get sampling."""
+        client = make_client(cprofile_admins=["alice"])
+
+        alice = client.get("/items/1", headers={
+            "X-Profile": "cprofile", "Authorization": f"Bearer {_token('alice', 'admin')}",
+        })
+        carol = client.get("/items/1", headers={
+            "X-Profile": "cprofile", "Authorization": f"Bearer {_token('carol', 'admin')}",
+        })
+
+        alice_profile = store.report(alice.headers["X-Profile-Id"])
+        carol_profile = store.report(carol.headers["X-Profile-Id"])
+        assert alice_profile["mode"] == "cprofile"
+        assert CPROFILE_FILE in alice_profile["files"]
+        pstats.Stats(str(store.path(alice_profile["id"], CPROFILE_FILE)))
+        assert carol_profile["mode"] == "sample"
+        assert CPROFILE_FILE not in carol_profile["files"]
+
+    def test_slow_requests_profiled(self, make_client, store):
+        """Without a header, only requests over the threshold are stored."""
+        client = make_client(slow_threshold_ms=100)
+
+        fast = client.get("/items/1")
+        slow = client.get("/items/3", params={"delay": 0.15})
+
+        assert "X-Profile-Id" not in fast.headers
+        assert "X-Profile-Id" not in slow.headers
+        [profile] = store.list()
+        assert profile["trigger"] == "slow"
+        assert profile["path"] == "/items/3"
+        assert profile["duration_ms"] >= 100
+        assert profile["queries"]["count"] == 1
+
+    def test_unknown_profile_404(self, make_client):
+        """Unknown profiles and files return 404."""
+        client = make_client()
+
+        assert client.get("/admin/profiles/20260101000000-00000000").status_code == 404
+        assert client.get(
+            f"/admin/profiles/20260101000000-00000000/files/{REPORT_FILE}"
+        ).status_code == 404
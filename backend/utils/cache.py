@@ -10,6 +10,9 @@ Provides both sync and async versions of cache operations:
 - Async: cache_response, get_cached_response, invalidate_pattern
 - Sync: cache_response_sync, get_cached_response_sync, invalidate_pattern_sync
 
+Lookups are counted as hit/miss/error in pcf_response_cache_lookups_total
+(see backend.utils.metrics).
+
 Cache Key Patterns:
 - products:list:{limit}:{offset}:{is_finished} - Product list endpoint
 - products:search:{query_hash} - Product search endpoint (MD5 hash of params)
@@ -58,6 +61,7 @@ from typing import Any, Optional
 import redis
 
 from backend.config import settings
+from backend.utils.metrics import RESPONSE_CACHE_LOOKUPS
 
 
 logger = logging.getLogger(__name__)
@@ -202,19 +206,24 @@ def get_cached_response_sync(key: str) -> Optional[Any]:
         raw_data = client.get(key)
         if raw_data is None:
             logger.debug(f"Cache miss for key: {key}")
+            RESPONSE_CACHE_LOOKUPS.inc(result="miss")
             return None
 
         data = json.loads(raw_data)
         logger.debug(f"Cache hit for key: {key}")
+        RESPONSE_CACHE_LOOKUPS.inc(result="hit")
         return data
     except (redis.ConnectionError, redis.TimeoutError, ConnectionError) as e:
         logger.warning(f"Failed to get cached response: {e}")
+        RESPONSE_CACHE_LOOKUPS.inc(result="error")
         return None
     except json.JSONDecodeError as e:
         logger.warning(f"Invalid JSON in cache for key {key}: {e}")
+        RESPONSE_CACHE_LOOKUPS.inc(result="error")
         return None
     except Exception as e:
         logger.error(f"Unexpected error getting cached response: {e}")
+        RESPONSE_CACHE_LOOKUPS.inc(result="error")
         return None
 
 
@@ -312,19 +321,24 @@ async def get_cached_response(key: str) -> Optional[Any]:
         raw_data = await client.get(key)
         if raw_data is None:
             logger.debug(f"Cache miss for key: {key}")
+            RESPONSE_CACHE_LOOKUPS.inc(result="miss")
             return None
 
         data = json.loads(raw_data)
         logger.debug(f"Cache hit for key: {key}")
+        RESPONSE_CACHE_LOOKUPS.inc(result="hit")
         return data
     except (redis.asyncio.ConnectionError, redis.asyncio.TimeoutError, ConnectionError) as e:
         logger.warning(f"Failed to get cached response: {e}")
+        RESPONSE_CACHE_LOOKUPS.inc(result="error")
         return None
     except json.JSONDecodeError as e:
         logger.warning(f"Invalid JSON in cache for key {key}: {e}")
+        RESPONSE_CACHE_LOOKUPS.inc(result="error")
         return None
     except Exception as e:
         logger.error(f"Unexpected error getting cached response: {e}")
+        RESPONSE_CACHE_LOOKUPS.inc(result="error")
         return None
 
 
@@ -0,0 +1,419 @@
+"""
+In-process application metrics in the Prometheus text exposition format.
+
+Counters, gauges and histograms are plain in-memory structures updated
+under a lock (a dict lookup and an add per update), so instrumenting hot
+paths costs well under a microsecond. GET /metrics renders REGISTRY.
+
+Metrics are per process: with several uvicorn workers each worker serves
+its own values, and work done in Celery workers is not included.
+
+Application metrics:
+- pcf_http_requests_total / pcf_http_request_duration_seconds: per method,
+  route template and status
+- pcf_http_requests_in_flight: requests being served, per method
+- pcf_calculation_phase_duration_seconds: calculation time per phase
+  (bom_fetch, ef_resolution, compute, persist)
+- pcf_calculations_total: finished calculations per status
+- pcf_emission_factor_cache_lookups_total: CachedEmissionFactorProvider
+  hits and misses (hit ratio exported as a gauge)
+- pcf_response_cache_lookups_total: Redis response cache hits, misses and
+  errors (hit ratio exported as a gauge)
+- pcf_rate_limit_rejections_total: 429 responses per limit category
+- pcf_ingestion_records_total: ingested records per connector and outcome
+  (throughput is rate() of this counter)
+
+Usage:
+    from backend.utils.metrics import CALCULATIONS, CALCULATION_PHASE_DURATION
+
+    with CALCULATION_PHASE_DURATION.time(phase="compute"):
+        totals = compute(...)
+    CALCULATIONS.inc(status="completed")
+
+    REGISTRY.render()  # text for GET /metrics
+"""
+
+import bisect
+import math
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Sequence, Tuple
+
+# Content type of the Prometheus text exposition format
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Request/phase latency buckets in seconds
+LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+LabelValues = Tuple[str, ...]
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    escaped = (
+        str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+        for value in values
+    )
+    return "{" + ",".join(f'{name}="{value}"' for name, value in zip(names, escaped)) + "}"
+
+
+class Histogram:
+    """
+    Thread-safe cumulative histogram with fixed bucket upper bounds.
+
+    Args:
+        buckets: Sorted bucket upper bounds (an implicit +Inf bucket is added)
+    """
+
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets = tuple(buckets)
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._sum = 0.0
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        """Record one observation."""
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += value
+            self._count += 1
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    def _state(self) -> Tuple[List[int], float, int]:
+        with self._lock:
+            return list(self._counts), self._sum, self._count
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate the q-quantile as the upper bound of its bucket.
+
+        Returns 0.0 without observations, and the largest finite bound when
+        the quantile falls in the +Inf bucket.
+        """
+        counts, _, total = self._state()
+        if total == 0:
+            return 0.0
+        rank = q * total
+        running = 0
+        for bound, count in zip(self.buckets, counts):
+            running += count
+            if running >= rank:
+                return bound
+        return self.buckets[-1]
+
+    def cumulative(self) -> Tuple[List[Tuple[float, int]], float, int]:
+        """(upper bound, cumulative count) pairs including +Inf, sum and count."""
+        counts, total_sum, total = self._state()
+        pairs = []
+        running = 0
+        for bound, count in zip(self.buckets, counts):
+            running += count
+            pairs.append((bound, running))
+        pairs.append((math.inf, total))
+        return pairs, total_sum, total
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Cumulative bucket counts, sum, count and p50/p95/p99 estimates."""
+        pairs, total_sum, total = self.cumulative()
+        return {
+            "count": total,
+            "sum": round(total_sum, 6),
+            "buckets": {
+                ("+Inf" if math.isinf(bound) else repr(bound)): count
+                for bound, count in pairs
+            },
+            "p50": self.quantile(0.50),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99),
+        }
+
+
+class _Metric:
+    """A named metric family with optional labels."""
+
+    type_name = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, Any]) -> LabelValues:
+        if len(labels) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def samples(self) -> Iterable[Tuple[str, Sequence[str], Sequence[str], float]]:
+        """(sample name, label names, label values, value) tuples."""
+        raise NotImplementedError
+
+    def render(self) -> str:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type_name}",
+        ]
+        for sample_name, names, values, value in self.samples():
+            lines.append(f"{sample_name}{_format_labels(names, values)} {_format_value(value)}")
+        return "\n".join(lines)
+
+
+class Counter(_Metric):
+    """Monotonically increasing value per label set."""
+
+    type_name = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        """Add `amount` (default 1) to the labelled value."""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: Any) -> float:
+        """Current labelled value (0 if never incremented)."""
+        return self._values.get(self._key(labels), 0.0)
+
+    def samples(self):
+        with self._lock:
+            items = sorted(self._values.items())
+        for values, value in items:
+            yield self.name, self.labelnames, values, value
+
+
+class Gauge(Counter):
+    """Value that can go up and down per label set."""
+
+    type_name = "gauge"
+
+    def dec(self, amount: float = 1.0, **labels: Any) -> None:
+        """Subtract `amount` (default 1) from the labelled value."""
+        self.inc(-amount, **labels)
+
+    def set(self, value: float, **labels: Any) -> None:
+        """Set the labelled value."""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+
+class HistogramFamily(_Metric):
+    """
+    Histograms per label set.
+
+    Args:
+        name: Metric name (without _bucket/_sum/_count)
+        documentation: HELP text
+        labelnames: Label names
+        buckets: Bucket upper bounds in seconds
+    """
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(buckets)
+        self._children: Dict[LabelValues, Histogram] = {}
+
+    def labels(self, **labels: Any) -> Histogram:
+        """Histogram for a label set (created on first use)."""
+        key = self._key(labels)
+        child = self._children.get(key)
+        if child is None:
+            with self._lock:
+                child = self._children.setdefault(key, Histogram(self.buckets))
+        return child
+
+    def add(self, histogram: Histogram, **labels: Any) -> None:
+        """Export an existing Histogram under a label set."""
+        with self._lock:
+            self._children[self._key(labels)] = histogram
+
+    def observe(self, value: float, **labels: Any) -> None:
+        """Record one observation for a label set."""
+        self.labels(**labels).observe(value)
+
+    @contextmanager
+    def time(self, **labels: Any) -> Iterator[None]:
+        """Observe the duration of the `with` block."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def samples(self):
+        with self._lock:
+            children = sorted(self._children.items())
+        bucket_names = self.labelnames + ("le",)
+        for values, histogram in children:
+            pairs, total_sum, total = histogram.cumulative()
+            for bound, count in pairs:
+                yield f"{self.name}_bucket", bucket_names, values + (_format_value(bound),), count
+            yield f"{self.name}_sum", self.labelnames, values, total_sum
+            yield f"{self.name}_count", self.labelnames, values, total
+
+
+class MetricsRegistry:
+    """
+    Metrics rendered by GET /metrics.
+
+    Besides registered metrics, collectors are called at render time to
+    export values owned elsewhere (e.g. pool statistics) as fresh metrics.
+    """
+
+    def __init__(self):
+        self._metrics: List[_Metric] = []
+        self._collectors: List[Callable[[], Iterable[_Metric]]] = []
+        self._lock = threading.Lock()
+
+    def register(self, metric: _Metric) -> _Metric:
+        """Add a metric; returns it for assignment at module level."""
+        with self._lock:
+            self._metrics.append(metric)
+        return metric
+
+    def add_collector(self, collector: Callable[[], Iterable[_Metric]]) -> None:
+        """Add a callable returning metrics built at render time."""
+        with self._lock:
+            self._collectors.append(collector)
+
+    def collect(self) -> List[_Metric]:
+        """Registered metrics followed by collector output."""
+        with self._lock:
+            metrics = list(self._metrics)
+            collectors = list(self._collectors)
+        for collector in collectors:
+            metrics.extend(collector())
+        return metrics
+
+    def render(self) -> str:
+        """All metrics in the Prometheus text exposition format."""
+        return "\n".join(metric.render() for metric in self.collect()) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+
+def hit_ratio(counter: Counter, name: str, documentation: str) -> Gauge:
+    """Gauge of hits / (hits + misses) from a lookup counter labelled by result."""
+    hits = counter.value(result="hit")
+    total = hits + counter.value(result="miss")
+    gauge = Gauge(name, documentation)
+    gauge.set(hits / total if total else 0.0)
+    return gauge
+
+
+# =============================================================================
+# Application metrics
+# =============================================================================
+
+HTTP_REQUESTS = REGISTRY.register(Counter(
+    "pcf_http_requests_total",
+    "HTTP requests by method, route template and status code",
+    ("method", "route", "status"),
+))
+HTTP_REQUEST_DURATION = REGISTRY.register(HistogramFamily(
+    "pcf_http_request_duration_seconds",
+    "HTTP request latency by method and route template",
+    ("method", "route"),
+))
+HTTP_IN_FLIGHT = REGISTRY.register(Gauge(
+    "pcf_http_requests_in_flight",
+    "HTTP requests currently being served",
+    ("method",),
+))
+CALCULATION_PHASE_DURATION = REGISTRY.register(HistogramFamily(
+    "pcf_calculation_phase_duration_seconds",
+    "PCF calculation time by phase (bom_fetch, ef_resolution, compute, persist)",
+    ("phase",),
+))
+CALCULATIONS = REGISTRY.register(Counter(
+    "pcf_calculations_total",
+    "Finished PCF calculations by status",
+    ("status",),
+))
+EF_CACHE_LOOKUPS = REGISTRY.register(Counter(
+    "pcf_emission_factor_cache_lookups_total",
+    "CachedEmissionFactorProvider lookups by result (hit, miss)",
+    ("result",),
+))
+RESPONSE_CACHE_LOOKUPS = REGISTRY.register(Counter(
+    "pcf_response_cache_lookups_total",
+    "Redis response cache lookups by result (hit, miss, error)",
+    ("result",),
+))
+RATE_LIMIT_REJECTIONS = REGISTRY.register(Counter(
+    "pcf_rate_limit_rejections_total",
+    "Requests rejected with 429 by rate limit category",
+    ("category",),
+))
+INGESTION_RECORDS = REGISTRY.register(Counter(
+    "pcf_ingestion_records_total",
+    "Ingested emission factor records by connector and outcome",
+    ("connector", "outcome"),
+))
+
+
+def _cache_ratios() -> List[_Metric]:
+    return [
+        hit_ratio(
+            EF_CACHE_LOOKUPS,
+            "pcf_emission_factor_cache_hit_ratio",
+            "Emission factor cache hits / lookups since start",
+        ),
+        hit_ratio(
+            RESPONSE_CACHE_LOOKUPS,
+            "pcf_response_cache_hit_ratio",
+            "Redis response cache hits / (hits + misses) since start",
+        ),
+    ]
+
+
+REGISTRY.add_collector(_cache_ratios)
+
+
+__all__ = [
+    'CALCULATIONS',
+    'CALCULATION_PHASE_DURATION',
+    'CONTENT_TYPE',
+    'Counter',
+    'EF_CACHE_LOOKUPS',
+    'Gauge',
+    'HTTP_IN_FLIGHT',
+    'HTTP_REQUESTS',
+    'HTTP_REQUEST_DURATION',
+    'Histogram',
+    'HistogramFamily',
+    'INGESTION_RECORDS',
+    'LATENCY_BUCKETS',
+    'MetricsRegistry',
+    'RATE_LIMIT_REJECTIONS',
+    'REGISTRY',
+    'RESPONSE_CACHE_LOOKUPS',
+    'hit_ratio',
+]
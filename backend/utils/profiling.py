@@ -0,0 +1,437 @@
+"""
+Request-scoped profiling: SQL query log, sampled stacks, cProfile, artifacts.
+
+Building blocks for ProfilingMiddleware (backend.middleware.profiling):
+- QueryLog: per-request SQL log with counts and timings. Generalises the
+  QueryCounter used by the BOM tree performance tests: listeners are
+  installed once on the Engine class (covering the primary, replica and
+  async engines) and record into the QueryLog bound to the current
+  context, so concurrent requests do not see each other's queries.
+- StackSampler: background thread sampling sys._current_frames() into
+  collapsed stacks ("folded" format for flamegraph.pl / speedscope).
+  Samples cover every busy thread in the process, so stacks of concurrent
+  requests show up too; each stack is rooted at its thread name.
+- ProfileStore: keeps the newest profiles on disk as downloadable files
+  (report.json, stacks.folded, cprofile.prof).
+
+Usage:
+    with QueryLog() as log:
+        tree = calculator._build_bom_tree_from_db(product_id, session)
+    assert log.count <= 5
+    log.summary()["top"]  # slowest statements with their call counts
+
+    sampler = StackSampler(interval=0.005)
+    sampler.start()
+    ...
+    sampler.stop()
+    sampler.folded()
+"""
+
+import cProfile
+import json
+import os
+import re
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from collections import Counter
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from backend.config import settings
+
+
+_current_log: ContextVar[Optional["QueryLog"]] = ContextVar(
+    "pcf_query_log", default=None
+)
+
+# conn.info key holding start times of the statements in flight
+_START_KEY = "pcf_query_log_start"
+
+# Leaf frames of threads blocked waiting for work (not worth sampling)
+_IDLE_MODULES = ("threading.py", "selectors.py", "queue.py")
+
+PROFILE_ID_PATTERN = re.compile(r"^\d{14}-[0-9a-f]{8}$")
+
+REPORT_FILE = "report.json"
+STACKS_FILE = "stacks.folded"
+CPROFILE_FILE = "cprofile.prof"
+PROFILE_FILES = (REPORT_FILE, STACKS_FILE, CPROFILE_FILE)
+
+
+# ============================================================================
+# SQL query log
+# ============================================================================
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current_log.get() is not None:
+        conn.info.setdefault(_START_KEY, []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    log = _current_log.get()
+    starts = conn.info.get(_START_KEY)
+    if log is not None and starts:
+        log.record(statement, time.perf_counter() - starts.pop(), executemany)
+
+
+def _handle_error(exception_context):
+    log = _current_log.get()
+    conn = exception_context.connection
+    starts = conn.info.get(_START_KEY) if conn is not None else None
+    if log is not None and starts:
+        log.record(
+            exception_context.statement or "",
+            time.perf_counter() - starts.pop(),
+            False,
+            error=type(exception_context.original_exception).__name__,
+        )
+
+
+def install_query_listeners() -> None:
+    """Register the QueryLog listeners on the Engine class (idempotent)."""
+    for name, listener in (
+        ("before_cursor_execute", _before_cursor_execute),
+        ("after_cursor_execute", _after_cursor_execute),
+        ("handle_error", _handle_error),
+    ):
+        if not event.contains(Engine, name, listener):
+            event.listen(Engine, name, listener)
+
+
+class QueryLog:
+    """
+    Context manager recording the SQL statements executed in its context.
+
+    The log is bound through a context variable, so it follows the request
+    into the threadpool (sync endpoints) and into async engine greenlets.
+
+    Attributes:
+        count: Number of statements executed
+        total_seconds: Time spent executing them
+        entries: Recorded statements (up to max_entries) with timings
+        dropped: Statements counted but not kept in entries
+    """
+
+    def __init__(self, max_entries: int = 1000):
+        self.max_entries = max_entries
+        self.count = 0
+        self.total_seconds = 0.0
+        self.entries: List[Dict[str, Any]] = []
+        self.dropped = 0
+        self._started = time.perf_counter()
+        self._lock = threading.Lock()
+        self._token = None
+
+    @property
+    def queries(self) -> List[str]:
+        """Recorded statements, in execution order (as QueryCounter.queries)."""
+        return [entry["statement"] for entry in self.entries]
+
+    def record(
+        self,
+        statement: str,
+        seconds: float,
+        executemany: bool,
+        error: Optional[str] = None,
+    ) -> None:
+        """Record one executed statement."""
+        entry = {
+            "statement": statement,
+            "offset_ms": round((time.perf_counter() - seconds - self._started) * 1000, 3),
+            "duration_ms": round(seconds * 1000, 3),
+            "executemany": executemany,
+        }
+        if error:
+            entry["error"] = error
+        with self._lock:
+            self.count += 1
+            self.total_seconds += seconds
+            if len(self.entries) < self.max_entries:
+                self.entries.append(entry)
+            else:
+                self.dropped += 1
+
+    def summary(self, top: int = 10) -> Dict[str, Any]:
+        """
+        Summarise the log.
+
+        Statements are grouped by their SQL text, so an N+1 pattern shows
+        up as one statement with a high count.
+
+        Args:
+            top: Number of statement groups to include, by total time
+
+        Returns:
+            Dict with count, total_ms, dropped and the top statement groups
+        """
+        groups: Dict[str, Dict[str, Any]] = {}
+        for entry in self.entries:
+            group = groups.setdefault(
+                entry["statement"],
+                {"statement": entry["statement"], "count": 0, "total_ms": 0.0},
+            )
+            group["count"] += 1
+            group["total_ms"] += entry["duration_ms"]
+
+        ranked = sorted(groups.values(), key=lambda g: g["total_ms"], reverse=True)
+        for group in ranked:
+            group["total_ms"] = round(group["total_ms"], 3)
+        return {
+            "count": self.count,
+            "total_ms": round(self.total_seconds * 1000, 3),
+            "distinct": len(groups),
+            "dropped": self.dropped,
+            "top": ranked[:top],
+        }
+
+    def __enter__(self) -> "QueryLog":
+        install_query_listeners()
+        self._started = time.perf_counter()
+        self._token = _current_log.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        _current_log.reset(self._token)
+        self._token = None
+
+
+# ============================================================================
+# Sampling profiler
+# ============================================================================
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+class StackSampler:
+    """
+    Sample the stacks of all busy threads at a fixed interval.
+
+    Args:
+        interval: Seconds between samples
+        max_depth: Innermost frames kept per stack
+    """
+
+    def __init__(self, interval: float = 0.005, max_depth: int = 64):
+        self.interval = interval
+        self.max_depth = max_depth
+        self.samples = 0
+        self.stacks: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start sampling in a daemon thread."""
+        self._thread = threading.Thread(
+            target=self._run, name="pcf-stack-sampler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop sampling and wait for the sampler thread."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _run(self) -> None:
+        own = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            self.sample(exclude=own)
+
+    def sample(self, exclude: Optional[int] = None) -> None:
+        """Take one sample of every busy thread except `exclude`."""
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        for ident, frame in sys._current_frames().items():
+            if ident == exclude:
+                continue
+            if os.path.basename(frame.f_code.co_filename) in _IDLE_MODULES:
+                continue
+
+            labels = []
+            while frame is not None and len(labels) < self.max_depth:
+                labels.append(_frame_label(frame))
+                frame = frame.f_back
+            labels.append(names.get(ident, str(ident)))
+            self.stacks[";".join(reversed(labels))] += 1
+        self.samples += 1
+
+    def folded(self) -> str:
+        """Collapsed stacks, one "frame;frame;... count" line per stack."""
+        return "".join(
+            f"{stack} {count}\n" for stack, count in self.stacks.most_common()
+        )
+
+    def top_frames(self, limit: int = 10) -> List[Dict[str, Any]]:
+        """Leaf frames with the most samples (where time was spent)."""
+        leaves: Counter = Counter()
+        for stack, count in self.stacks.items():
+            leaves[stack.rsplit(";", 1)[-1]] += count
+        return [
+            {"frame": frame, "samples": count}
+            for frame, count in leaves.most_common(limit)
+        ]
+
+
+# cProfile hooks the profiling thread's sys.setprofile; one request at a time
+_cprofile_lock = threading.Lock()
+
+
+def start_cprofile() -> Optional[cProfile.Profile]:
+    """
+    Start cProfile on the current thread unless another request holds it.
+
+    Returns:
+        Running profiler, or None if cProfile is already in use
+    """
+    if not _cprofile_lock.acquire(blocking=False):
+        return None
+    profiler = cProfile.Profile()
+    profiler.enable()
+    return profiler
+
+
+def stop_cprofile(profiler: cProfile.Profile) -> None:
+    """Stop a profiler returned by start_cprofile() and release cProfile."""
+    profiler.disable()
+    _cprofile_lock.release()
+
+
+# ============================================================================
+# Artifact storage
+# ============================================================================
+
+
+def new_profile_id() -> str:
+    """Create a time-sortable profile id (UTC timestamp plus random suffix)."""
+    return f"{time.strftime('%Y%m%d%H%M%S', time.gmtime())}-{uuid.uuid4().hex[:8]}"
+
+
+class ProfileStore:
+    """
+    Directory of profiles, one sub-directory per profile id.
+
+    Only the newest max_profiles profiles are kept.
+
+    Args:
+        directory: Root directory for profiles (created on first save)
+        max_profiles: Number of profiles to keep
+    """
+
+    def __init__(self, directory: Path, max_profiles: int = 200):
+        self.directory = Path(directory)
+        self.max_profiles = max_profiles
+
+    def save(
+        self,
+        profile_id: str,
+        report: Dict[str, Any],
+        stacks: Optional[str] = None,
+        profiler: Optional[cProfile.Profile] = None,
+    ) -> None:
+        """
+        Write a profile's files and prune old profiles.
+
+        Args:
+            profile_id: Id from new_profile_id()
+            report: JSON-serialisable report (summary plus SQL log)
+            stacks: Collapsed stacks from StackSampler.folded()
+            profiler: Stopped cProfile profiler
+        """
+        target = self.directory / profile_id
+        target.mkdir(parents=True, exist_ok=True)
+        if stacks:
+            (target / STACKS_FILE).write_text(stacks)
+        if profiler is not None:
+            profiler.dump_stats(str(target / CPROFILE_FILE))
+        files = [REPORT_FILE] + [
+            name for name in (STACKS_FILE, CPROFILE_FILE) if (target / name).exists()
+        ]
+        report = dict(report, files=files)
+        (target / REPORT_FILE).write_text(json.dumps(report, default=str))
+        self._prune()
+
+    def _profile_ids(self) -> List[str]:
+        if not self.directory.is_dir():
+            return []
+        return sorted(
+            (p.name for p in self.directory.iterdir()
+             if p.is_dir() and PROFILE_ID_PATTERN.match(p.name)),
+            reverse=True,
+        )
+
+    def _prune(self) -> None:
+        for profile_id in self._profile_ids()[self.max_profiles:]:
+            shutil.rmtree(self.directory / profile_id, ignore_errors=True)
+
+    def report(self, profile_id: str) -> Optional[Dict[str, Any]]:
+        """Load a profile's report, or None if it does not exist."""
+        path = self.path(profile_id, REPORT_FILE)
+        if path is None:
+            return None
+        try:
+            return json.loads(path.read_text())
+        except (OSError, ValueError):
+            return None
+
+    def list(self, limit: int = 50) -> List[Dict[str, Any]]:
+        """Reports of the newest profiles, without their SQL statement lists."""
+        items = []
+        for profile_id in self._profile_ids()[:limit]:
+            report = self.report(profile_id)
+            if report is not None:
+                report.get("queries", {}).pop("entries", None)
+                items.append(report)
+        return items
+
+    def path(self, profile_id: str, filename: str) -> Optional[Path]:
+        """
+        Resolve a profile file, rejecting unknown ids and file names.
+
+        Returns:
+            Path of an existing profile file, or None
+        """
+        if filename not in PROFILE_FILES or not PROFILE_ID_PATTERN.match(profile_id):
+            return None
+        path = self.directory / profile_id / filename
+        return path if path.is_file() else None
+
+
+_profile_store: Optional[ProfileStore] = None
+
+
+def get_profile_store() -> ProfileStore:
+    """Get the ProfileStore configured by PROFILING_DIR / PROFILING_MAX_PROFILES."""
+    global _profile_store
+    if _profile_store is None:
+        directory = settings.PROFILING_DIR or os.path.join(
+            tempfile.gettempdir(), "pcf-profiles"
+        )
+        _profile_store = ProfileStore(Path(directory), settings.PROFILING_MAX_PROFILES)
+    return _profile_store
+
+
+__all__ = [
+    'CPROFILE_FILE',
+    'PROFILE_FILES',
+    'ProfileStore',
+    'QueryLog',
+    'REPORT_FILE',
+    'STACKS_FILE',
+    'StackSampler',
+    'get_profile_store',
+    'install_query_listeners',
+    'new_profile_id',
+    'start_cprofile',
+    'stop_cprofile',
+]